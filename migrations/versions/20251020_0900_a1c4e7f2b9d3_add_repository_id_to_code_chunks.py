@@ -0,0 +1,48 @@
+"""add repository_id to code_chunks
+
+Denormalizes the owning repository onto code_chunks so repository-scoped
+searches can filter chunks directly (and, with the partitioned layout from
+scripts/partition_code_chunks.sql, prune to a single partition).
+
+Revision ID: a1c4e7f2b9d3
+Revises: 3671202597ca
+Create Date: 2025-10-20 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e7f2b9d3'
+down_revision: Union[str, None] = '3671202597ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add code_chunks.repository_id, backfill it from code_files, and index it.
+
+    The column is NOT NULL once backfilled, as in the partitioned layout where
+    it is part of the primary key.
+    """
+    op.add_column('code_chunks', sa.Column('repository_id', sa.UUID(), nullable=True))
+    op.execute(
+        """
+        UPDATE code_chunks c
+        SET repository_id = f.repository_id
+        FROM code_files f
+        WHERE c.code_file_id = f.id
+        """
+    )
+    op.alter_column('code_chunks', 'repository_id', nullable=False)
+    op.create_index(
+        'idx_code_chunks_repository', 'code_chunks', ['repository_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop code_chunks.repository_id and its index."""
+    op.drop_index('idx_code_chunks_repository', table_name='code_chunks')
+    op.drop_column('code_chunks', 'repository_id')
@@ -0,0 +1,57 @@
+"""add embedding_queue
+
+Chunks whose embedding has not been generated yet (deferred embedding mode, or
+a failed embedding batch) are recorded in embedding_queue and backfilled by
+embedding queue workers, instead of staying NULL forever.
+
+Revision ID: b7e2d4a91c05
+Revises: a1c4e7f2b9d3
+Create Date: 2025-10-21 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a91c05'
+down_revision: Union[str, None] = 'a1c4e7f2b9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create embedding_queue and enqueue existing chunks without embeddings."""
+    op.create_table(
+        'embedding_queue',
+        sa.Column('chunk_id', sa.UUID(), nullable=False),
+        sa.Column('project_id', sa.String(length=50), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'available_at', sa.DateTime(timezone=True), nullable=False,
+            server_default=sa.text('now()'),
+        ),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True), nullable=False,
+            server_default=sa.text('now()'),
+        ),
+        sa.PrimaryKeyConstraint('chunk_id'),
+    )
+    op.create_index(
+        'idx_embedding_queue_available', 'embedding_queue', ['available_at'], unique=False
+    )
+    op.execute(
+        """
+        INSERT INTO embedding_queue (chunk_id, project_id)
+        SELECT id, project_id FROM code_chunks WHERE embedding IS NULL
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop embedding_queue."""
+    op.drop_index('idx_embedding_queue_available', table_name='embedding_queue')
+    op.drop_table('embedding_queue')
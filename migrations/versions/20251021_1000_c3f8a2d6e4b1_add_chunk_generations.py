@@ -0,0 +1,44 @@
+"""add chunk generations
+
+Adds repositories.active_generation and code_chunks.generation. A full
+reindex writes its chunks as the next generation while search keeps serving
+the active one, then switches the pointer and garbage-collects the old
+generation in the background.
+
+Revision ID: c3f8a2d6e4b1
+Revises: b7e2d4a91c05
+Create Date: 2025-10-21 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a2d6e4b1'
+down_revision: Union[str, None] = 'b7e2d4a91c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add generation columns (existing rows become generation 0)."""
+    op.add_column(
+        'repositories',
+        sa.Column('active_generation', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column(
+        'code_chunks',
+        sa.Column('generation', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_index(
+        'idx_code_chunks_generation', 'code_chunks', ['repository_id', 'generation'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop generation columns and index."""
+    op.drop_index('idx_code_chunks_generation', table_name='code_chunks')
+    op.drop_column('code_chunks', 'generation')
+    op.drop_column('repositories', 'active_generation')
@@ -0,0 +1,41 @@
+"""add checkpoints to indexing_jobs
+
+Indexing commits file batches one at a time; the background worker records
+progress after each batch so failed or interrupted jobs can be resumed
+instead of restarting from scratch.
+
+Revision ID: d9a4c7e1f3b2
+Revises: c3f8a2d6e4b1
+Create Date: 2025-10-21 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a4c7e1f3b2'
+down_revision: Union[str, None] = 'c3f8a2d6e4b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add files_total, checkpoint and checkpoint_at to indexing_jobs."""
+    op.add_column('indexing_jobs', sa.Column('files_total', sa.Integer(), nullable=True))
+    op.add_column(
+        'indexing_jobs',
+        sa.Column('checkpoint', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column(
+        'indexing_jobs', sa.Column('checkpoint_at', sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Drop checkpoint columns from indexing_jobs."""
+    op.drop_column('indexing_jobs', 'checkpoint_at')
+    op.drop_column('indexing_jobs', 'checkpoint')
+    op.drop_column('indexing_jobs', 'files_total')
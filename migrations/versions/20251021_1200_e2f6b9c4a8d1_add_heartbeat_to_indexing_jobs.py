@@ -0,0 +1,39 @@
+"""add heartbeat to indexing_jobs
+
+Background workers refresh heartbeat_at while a job runs. At startup the
+server recovers pending/running jobs whose heartbeat went stale (their
+process exited): they are resumed from their checkpoint, or marked failed
+once recovery_count reaches the configured limit.
+
+Revision ID: e2f6b9c4a8d1
+Revises: d9a4c7e1f3b2
+Create Date: 2025-10-21 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f6b9c4a8d1'
+down_revision: Union[str, None] = 'd9a4c7e1f3b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add heartbeat_at and recovery_count to indexing_jobs."""
+    op.add_column(
+        'indexing_jobs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column(
+        'indexing_jobs',
+        sa.Column('recovery_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    """Drop heartbeat columns from indexing_jobs."""
+    op.drop_column('indexing_jobs', 'recovery_count')
+    op.drop_column('indexing_jobs', 'heartbeat_at')
@@ -0,0 +1,55 @@
+"""allow one active indexing job per repository
+
+Requests to index a repository that already has a pending or running job are
+coalesced into that job. A unique partial index enforces it, so concurrent
+requests cannot both insert. Existing duplicate active jobs (only the oldest
+is kept) are marked failed first.
+
+Revision ID: f4a1d7e3c9b5
+Revises: e2f6b9c4a8d1
+Create Date: 2025-10-21 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a1d7e3c9b5'
+down_revision: Union[str, None] = 'e2f6b9c4a8d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Fail duplicate active jobs and add uq_indexing_jobs_active_repo."""
+    op.execute(
+        """
+        UPDATE indexing_jobs
+        SET status = 'failed',
+            error_message = 'Superseded by an older active job for the same repository',
+            completed_at = now()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY project_id, repo_path ORDER BY created_at
+                ) AS position
+                FROM indexing_jobs
+                WHERE status IN ('pending', 'running')
+            ) AS active
+            WHERE position > 1
+        )
+        """
+    )
+    op.create_index(
+        'uq_indexing_jobs_active_repo',
+        'indexing_jobs',
+        ['project_id', 'repo_path'],
+        unique=True,
+        postgresql_where="status IN ('pending', 'running')",
+    )
+
+
+def downgrade() -> None:
+    """Drop uq_indexing_jobs_active_repo."""
+    op.drop_index('uq_indexing_jobs_active_repo', table_name='indexing_jobs')
@@ -0,0 +1,31 @@
+"""add config_path to indexing_jobs
+
+Standalone indexing workers claim jobs from indexing_jobs instead of
+receiving them in-process, so the .codebase-mcp/config.json path the server
+captured (used to auto-create the project database) is stored on the job.
+
+Revision ID: a8c3e5f1d2b7
+Revises: f4a1d7e3c9b5
+Create Date: 2025-10-21 14:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c3e5f1d2b7'
+down_revision: Union[str, None] = 'f4a1d7e3c9b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add config_path to indexing_jobs."""
+    op.add_column('indexing_jobs', sa.Column('config_path', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop config_path from indexing_jobs."""
+    op.drop_column('indexing_jobs', 'config_path')
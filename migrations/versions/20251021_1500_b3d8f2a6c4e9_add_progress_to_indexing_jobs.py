@@ -0,0 +1,40 @@
+"""add progress to indexing_jobs
+
+Running jobs report live progress (files chunked, chunks embedded and
+persisted, rate, ETA) every few seconds, and finished jobs record how long
+each indexing stage took.
+
+Revision ID: b3d8f2a6c4e9
+Revises: a8c3e5f1d2b7
+Create Date: 2025-10-21 15:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d8f2a6c4e9'
+down_revision: Union[str, None] = 'a8c3e5f1d2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add progress and stage_durations to indexing_jobs."""
+    op.add_column(
+        'indexing_jobs',
+        sa.Column('progress', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column(
+        'indexing_jobs',
+        sa.Column('stage_durations', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop progress columns from indexing_jobs."""
+    op.drop_column('indexing_jobs', 'stage_durations')
+    op.drop_column('indexing_jobs', 'progress')
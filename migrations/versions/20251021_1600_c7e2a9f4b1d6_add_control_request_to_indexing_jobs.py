@@ -0,0 +1,53 @@
+"""add control_request to indexing_jobs
+
+cancel_indexing_job and pause_indexing_job record their request on the job
+row, where the worker running it (in the server or a standalone worker)
+picks it up and stops at the next file batch boundary. The jobs it stops
+end as paused or cancelled, so ck_indexing_jobs_status (migration 008) is
+widened to accept both states.
+
+Revision ID: c7e2a9f4b1d6
+Revises: b3d8f2a6c4e9
+Create Date: 2025-10-21 16:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9f4b1d6'
+down_revision: Union[str, None] = 'b3d8f2a6c4e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add control_request and allow the paused and cancelled statuses."""
+    op.add_column(
+        'indexing_jobs', sa.Column('control_request', sa.String(length=20), nullable=True)
+    )
+    op.drop_constraint('ck_indexing_jobs_status', 'indexing_jobs', type_='check')
+    op.create_check_constraint(
+        'ck_indexing_jobs_status',
+        'indexing_jobs',
+        "status IN ('pending', 'running', 'paused', 'completed', 'failed', 'cancelled')",
+    )
+
+
+def downgrade() -> None:
+    """Restore the four-state status constraint and drop control_request.
+
+    Paused and cancelled jobs become failed (their checkpoints are kept).
+    """
+    op.execute(
+        "UPDATE indexing_jobs SET status = 'failed' WHERE status IN ('paused', 'cancelled')"
+    )
+    op.drop_constraint('ck_indexing_jobs_status', 'indexing_jobs', type_='check')
+    op.create_check_constraint(
+        'ck_indexing_jobs_status',
+        'indexing_jobs',
+        "status IN ('pending', 'running', 'completed', 'failed')",
+    )
+    op.drop_column('indexing_jobs', 'control_request')
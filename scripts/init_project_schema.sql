@@ -33,10 +33,16 @@ CREATE TABLE IF NOT EXISTS repositories (
     -- Active flag (for soft delete)
     is_active BOOLEAN NOT NULL DEFAULT true,
 
+    -- Chunk generation served by search (switched after a full reindex)
+    active_generation INTEGER NOT NULL DEFAULT 0,
+
     -- Creation timestamp
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- Upgrade path for databases created before generations existed
+ALTER TABLE repositories ADD COLUMN IF NOT EXISTS active_generation INTEGER NOT NULL DEFAULT 0;
+
 -- Fast lookup by path
 CREATE INDEX IF NOT EXISTS idx_repositories_path ON repositories(path);
 
@@ -108,6 +114,10 @@ CREATE TABLE IF NOT EXISTS code_chunks (
     -- Code file relationship
     code_file_id UUID NOT NULL REFERENCES code_files(id) ON DELETE CASCADE,
 
+    -- Owning repository (denormalized from code_files for scoped search and
+    -- as the partition key of the partitioned layout)
+    repository_id UUID NOT NULL,
+
     -- Project isolation field (multi-tenant support)
     project_id VARCHAR(50) NOT NULL,
 
@@ -121,6 +131,9 @@ CREATE TABLE IF NOT EXISTS code_chunks (
     -- Chunk type (function, class, module, etc.)
     chunk_type VARCHAR NOT NULL,
 
+    -- Index build generation (search serves repositories.active_generation)
+    generation INTEGER NOT NULL DEFAULT 0,
+
     -- Semantic embedding vector (768-dimensional for nomic-embed-text)
     embedding vector(768),
 
@@ -131,6 +144,18 @@ CREATE TABLE IF NOT EXISTS code_chunks (
     CONSTRAINT valid_line_range CHECK (start_line > 0 AND end_line >= start_line)
 );
 
+-- Upgrade path for databases created before code_chunks.repository_id existed
+ALTER TABLE code_chunks ADD COLUMN IF NOT EXISTS repository_id UUID;
+ALTER TABLE code_chunks ADD COLUMN IF NOT EXISTS generation INTEGER NOT NULL DEFAULT 0;
+
+UPDATE code_chunks c
+SET repository_id = f.repository_id
+FROM code_files f
+WHERE c.code_file_id = f.id
+  AND c.repository_id IS NULL;
+
+ALTER TABLE code_chunks ALTER COLUMN repository_id SET NOT NULL;
+
 -- HNSW index for fast cosine similarity search (pgvector)
 -- m=16: number of bi-directional links per node
 -- ef_construction=64: exploration depth during index build
@@ -142,12 +167,54 @@ CREATE INDEX IF NOT EXISTS idx_code_chunks_embedding_cosine
 -- Fast lookup by file
 CREATE INDEX IF NOT EXISTS idx_code_chunks_file ON code_chunks(code_file_id);
 
+-- Fast lookup by repository (scoped search)
+CREATE INDEX IF NOT EXISTS idx_code_chunks_repository ON code_chunks(repository_id);
+
+-- Generation lookup (shadow builds and garbage collection)
+CREATE INDEX IF NOT EXISTS idx_code_chunks_generation ON code_chunks(repository_id, generation);
+
 -- Fast lookup by project (multi-tenant isolation)
 CREATE INDEX IF NOT EXISTS idx_code_chunks_project ON code_chunks(project_id);
 
 -- Fast lookup by chunk type
 CREATE INDEX IF NOT EXISTS idx_code_chunks_type ON code_chunks(chunk_type);
 
+-- ============================================================================
+-- Embedding Queue (deferred and retried embedding work)
+-- ============================================================================
+
+-- Created once; the backfill runs only then, so later schema inits neither
+-- rescan code_chunks nor re-queue rows workers removed from the queue
+DO $$
+BEGIN
+    IF to_regclass('embedding_queue') IS NULL THEN
+        CREATE TABLE embedding_queue (
+            -- Chunk awaiting an embedding (no FK: partitioned code_chunks ids are
+            -- unique only per repository; workers drop rows of deleted chunks)
+            chunk_id UUID PRIMARY KEY,
+
+            -- Project isolation field (multi-tenant support)
+            project_id VARCHAR(50) NOT NULL,
+
+            -- Retry tracking (rows with attempts >= max attempts are parked)
+            attempts INTEGER NOT NULL DEFAULT 0,
+            available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            last_error TEXT,
+
+            -- Creation timestamp
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+
+        -- Upgrade path: queue chunks left without embeddings before the queue existed
+        INSERT INTO embedding_queue (chunk_id, project_id)
+        SELECT id, project_id FROM code_chunks WHERE embedding IS NULL
+        ON CONFLICT DO NOTHING;
+    END IF;
+END $$;
+
+-- Ready-row scan for workers (FOR UPDATE SKIP LOCKED claims)
+CREATE INDEX IF NOT EXISTS idx_embedding_queue_available ON embedding_queue(available_at);
+
 -- ============================================================================
 -- Comments for Documentation
 -- ============================================================================
@@ -156,8 +223,11 @@ COMMENT ON TABLE repositories IS 'Indexed code repositories';
 COMMENT ON TABLE code_files IS 'Individual code files within repositories';
 COMMENT ON TABLE code_chunks IS 'Semantic code chunks with vector embeddings';
 
+COMMENT ON COLUMN code_chunks.repository_id IS 'Owning repository (denormalized from code_files)';
+COMMENT ON COLUMN code_chunks.generation IS 'Index build generation (search serves repositories.active_generation)';
 COMMENT ON COLUMN code_chunks.embedding IS '768-dim vector for semantic search (nomic-embed-text)';
 COMMENT ON INDEX idx_code_chunks_embedding_cosine IS 'HNSW index for fast cosine similarity search';
+COMMENT ON TABLE embedding_queue IS 'Chunks awaiting embeddings (claimed with FOR UPDATE SKIP LOCKED)';
 
 -- ============================================================================
 -- Initial Status Report
@@ -172,6 +242,7 @@ BEGIN
     RAISE NOTICE '  - repositories';
     RAISE NOTICE '  - code_files';
     RAISE NOTICE '  - code_chunks (with vector embeddings)';
+    RAISE NOTICE '  - embedding_queue';
     RAISE NOTICE '';
     RAISE NOTICE 'Extensions enabled:';
     RAISE NOTICE '  - pgvector (for semantic search)';
@@ -0,0 +1,167 @@
+-- Partitioned code_chunks Layout for Codebase MCP
+--
+-- Converts code_chunks in a project database (cb_proj_*) into a table that is
+-- LIST-partitioned by repository_id, with one partition (and therefore one
+-- HNSW index) per repository.
+--
+-- Why:
+--   - Repository-scoped searches prune to a single partition, so the HNSW
+--     walk only visits vectors of that repository instead of the whole project
+--   - Removing a repository drops its partition instead of running a large
+--     DELETE that leaves a bloated, degraded HNSW graph behind
+--
+-- Applied after init_project_schema.sql. The script is idempotent:
+--   - Fresh databases: the (empty) flat table is swapped for the partitioned one
+--   - Existing databases: rows are copied into per-repository partitions
+--   - Already partitioned databases: only the helper functions/triggers are
+--     (re)created
+--
+-- Run this automatically via database provisioning (CODE_CHUNKS_LAYOUT=partitioned):
+--   Used by: src/database/provisioning.py initialize_project_schema()
+--            src/database/provisioning.py partition_code_chunks()
+
+-- ============================================================================
+-- Partition Management Functions
+-- ============================================================================
+
+-- Partition name for a repository: code_chunks_r_<uuid without hyphens>
+CREATE OR REPLACE FUNCTION code_chunks_partition_name(repo_id UUID)
+RETURNS TEXT AS $$
+    SELECT 'code_chunks_r_' || replace(repo_id::text, '-', '');
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Create the partition for a repository (indexes are inherited from the parent)
+CREATE OR REPLACE FUNCTION create_code_chunks_partition(repo_id UUID)
+RETURNS TEXT AS $$
+DECLARE
+    partition_name TEXT := code_chunks_partition_name(repo_id);
+BEGIN
+    IF to_regclass(partition_name) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF code_chunks FOR VALUES IN (%L)',
+            partition_name,
+            repo_id
+        );
+    END IF;
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop the partition for a repository (removes its chunks and HNSW index)
+CREATE OR REPLACE FUNCTION drop_code_chunks_partition(repo_id UUID)
+RETURNS VOID AS $$
+BEGIN
+    EXECUTE format('DROP TABLE IF EXISTS %I', code_chunks_partition_name(repo_id));
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- Table Conversion
+-- ============================================================================
+
+DO $$
+BEGIN
+    -- Already partitioned: nothing to convert
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = to_regclass('code_chunks')
+    ) THEN
+        RAISE NOTICE 'code_chunks is already partitioned by repository_id';
+        RETURN;
+    END IF;
+
+    -- Free index and constraint names held by the flat table
+    DROP INDEX IF EXISTS idx_code_chunks_embedding_cosine;
+    DROP INDEX IF EXISTS idx_code_chunks_file;
+    DROP INDEX IF EXISTS idx_code_chunks_repository;
+    DROP INDEX IF EXISTS idx_code_chunks_generation;
+    DROP INDEX IF EXISTS idx_code_chunks_project;
+    DROP INDEX IF EXISTS idx_code_chunks_type;
+    ALTER TABLE code_chunks RENAME TO code_chunks_flat;
+    ALTER TABLE code_chunks_flat RENAME CONSTRAINT code_chunks_pkey TO code_chunks_flat_pkey;
+
+    CREATE TABLE code_chunks (
+        id UUID NOT NULL DEFAULT gen_random_uuid(),
+        code_file_id UUID NOT NULL REFERENCES code_files(id) ON DELETE CASCADE,
+        -- Partition key (must be part of the primary key)
+        repository_id UUID NOT NULL,
+        project_id VARCHAR(50) NOT NULL,
+        content TEXT NOT NULL,
+        start_line INTEGER NOT NULL,
+        end_line INTEGER NOT NULL,
+        chunk_type VARCHAR NOT NULL,
+        generation INTEGER NOT NULL DEFAULT 0,
+        embedding vector(768),
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, repository_id),
+        CONSTRAINT valid_line_range CHECK (start_line > 0 AND end_line >= start_line)
+    ) PARTITION BY LIST (repository_id);
+
+    -- Partitioned indexes: every partition gets its own copy, so each
+    -- repository has an independent HNSW graph
+    CREATE INDEX idx_code_chunks_embedding_cosine
+        ON code_chunks
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64);
+    CREATE INDEX idx_code_chunks_file ON code_chunks(code_file_id);
+    CREATE INDEX idx_code_chunks_repository ON code_chunks(repository_id);
+    CREATE INDEX idx_code_chunks_generation ON code_chunks(repository_id, generation);
+    CREATE INDEX idx_code_chunks_project ON code_chunks(project_id);
+    CREATE INDEX idx_code_chunks_type ON code_chunks(chunk_type);
+
+    PERFORM create_code_chunks_partition(id) FROM repositories;
+
+    -- Move existing rows (repository_id is re-derived from code_files)
+    INSERT INTO code_chunks (
+        id, code_file_id, repository_id, project_id, content,
+        start_line, end_line, chunk_type, generation, embedding, created_at
+    )
+    SELECT
+        c.id, c.code_file_id, f.repository_id, c.project_id, c.content,
+        c.start_line, c.end_line, c.chunk_type, c.generation, c.embedding, c.created_at
+    FROM code_chunks_flat c
+    JOIN code_files f ON f.id = c.code_file_id;
+
+    DROP TABLE code_chunks_flat;
+
+    RAISE NOTICE 'code_chunks converted to per-repository partitions';
+END $$;
+
+-- ============================================================================
+-- Repository Lifecycle Triggers
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION code_chunks_partition_on_repository_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM create_code_chunks_partition(NEW.id);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION code_chunks_partition_on_repository_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM drop_code_chunks_partition(OLD.id);
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_repositories_create_chunk_partition ON repositories;
+CREATE TRIGGER trg_repositories_create_chunk_partition
+    AFTER INSERT ON repositories
+    FOR EACH ROW EXECUTE FUNCTION code_chunks_partition_on_repository_insert();
+
+-- BEFORE DELETE: the partition is dropped before the code_files cascade runs,
+-- so removing a repository never deletes chunk rows one by one
+DROP TRIGGER IF EXISTS trg_repositories_drop_chunk_partition ON repositories;
+CREATE TRIGGER trg_repositories_drop_chunk_partition
+    BEFORE DELETE ON repositories
+    FOR EACH ROW EXECUTE FUNCTION code_chunks_partition_on_repository_delete();
+
+-- ============================================================================
+-- Comments for Documentation
+-- ============================================================================
+
+COMMENT ON TABLE code_chunks IS 'Semantic code chunks with vector embeddings (partitioned by repository_id)';
+COMMENT ON INDEX idx_code_chunks_embedding_cosine IS 'HNSW index for fast cosine similarity search (one per repository partition)';
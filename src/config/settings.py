@@ -12,7 +12,7 @@ Validation errors halt server startup with actionable error messages.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Literal
 import warnings
 
 from pydantic import (
@@ -45,6 +45,35 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+class ChunkSizeUnit(str, Enum):
+    """Units for chunk size limits."""
+
+    TOKENS = "tokens"
+    CHARS = "chars"
+
+
+class EmbeddingBackendName(str, Enum):
+    """Embedding backends selectable through EMBEDDING_BACKEND."""
+
+    OLLAMA = "ollama"
+    HASH = "hash"
+    REPLAY = "replay"
+
+
+class LongChunkStrategy(str, Enum):
+    """How chunks longer than the embedding context are embedded."""
+
+    POOL = "pool"
+    SPLIT = "split"
+
+
+class EmbeddingMode(str, Enum):
+    """When chunk embeddings are generated during indexing."""
+
+    INLINE = "inline"
+    DEFERRED = "deferred"
+
+
 class Settings(BaseSettings):
     """
     Application settings with environment variable parsing and validation.
@@ -194,6 +223,18 @@ class Settings(BaseSettings):
         ),
     ]
 
+    code_chunks_layout: Annotated[
+        Literal["flat", "partitioned"],
+        Field(
+            default="flat",
+            description=(
+                "Physical layout of code_chunks in new project databases. "
+                "flat: single table with one HNSW index. "
+                "partitioned: LIST partitions per repository, one HNSW index each"
+            ),
+        ),
+    ] = "flat"
+
     # ============================================================================
     # Ollama Configuration
     # ============================================================================
@@ -221,6 +262,112 @@ class Settings(BaseSettings):
         ),
     ]
 
+    ollama_base_urls: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description=(
+                "Comma-separated Ollama base URLs for load-balanced embedding "
+                "(overrides OLLAMA_BASE_URL), e.g. http://gpu1:11434,http://gpu2:11434"
+            ),
+        ),
+    ] = None
+
+    ollama_eject_seconds: Annotated[
+        float,
+        Field(
+            default=30.0,
+            ge=1.0,
+            le=3600.0,
+            description=(
+                "Seconds a failing Ollama endpoint is taken out of rotation. "
+                "Range: 1-3600"
+            ),
+        ),
+    ] = 30.0
+
+    ollama_failure_threshold: Annotated[
+        int,
+        Field(
+            default=2,
+            ge=1,
+            le=20,
+            description=(
+                "Consecutive failures before an Ollama endpoint is ejected. Range: 1-20"
+            ),
+        ),
+    ] = 2
+
+    ollama_health_check_interval: Annotated[
+        float,
+        Field(
+            default=10.0,
+            ge=1.0,
+            le=600.0,
+            description=(
+                "Seconds between health checks of Ollama endpoints "
+                "(multi-endpoint only). Range: 1-600"
+            ),
+        ),
+    ] = 10.0
+
+    ollama_keep_alive: Annotated[
+        str,
+        Field(
+            default="30m",
+            pattern=r"^-?\d+$|^-?(\d+(\.\d+)?(ns|us|ms|s|m|h))+$",
+            description=(
+                "How long Ollama keeps the embedding model loaded after a request "
+                "(sent as keep_alive). Duration such as 30m or 1h, seconds, or -1 "
+                "to keep it loaded indefinitely"
+            ),
+        ),
+    ] = "30m"
+
+    ollama_keep_warm_interval: Annotated[
+        float,
+        Field(
+            default=300.0,
+            ge=0.0,
+            le=86400.0,
+            description=(
+                "Seconds between keep-warm requests that stop Ollama from unloading "
+                "the model (0 disables; should be below OLLAMA_KEEP_ALIVE). "
+                "Range: 0-86400"
+            ),
+        ),
+    ] = 300.0
+
+    embedding_backend: Annotated[
+        EmbeddingBackendName,
+        Field(
+            default=EmbeddingBackendName.OLLAMA,
+            description=(
+                "Embedding backend. Valid values: ollama (HTTP API), "
+                "hash (deterministic offline vectors), replay (EMBEDDING_REPLAY_FILE)"
+            ),
+        ),
+    ] = EmbeddingBackendName.OLLAMA
+
+    embedding_replay_file: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description="JSONL file of recorded embeddings served by the replay backend",
+        ),
+    ] = None
+
+    embedding_record_file: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description=(
+                "Append every embedding produced by the ollama backend to this JSONL "
+                "file (input for the replay backend)"
+            ),
+        ),
+    ] = None
+
     # ============================================================================
     # Performance Tuning
     # ============================================================================
@@ -253,6 +400,274 @@ class Settings(BaseSettings):
         ),
     ]
 
+    embedding_max_concurrency: Annotated[
+        int,
+        Field(
+            default=16,
+            ge=1,
+            le=200,
+            description=(
+                "Maximum concurrent embedding requests per Ollama endpoint. "
+                "Excess requests wait in priority order (search queries ahead "
+                "of indexing). Range: 1-200"
+            ),
+        ),
+    ]
+
+    embedding_interactive_slots: Annotated[
+        int,
+        Field(
+            default=2,
+            ge=0,
+            le=50,
+            description=(
+                "Embedding request slots reserved for interactive work (search "
+                "queries); indexing never uses them. Range: 0-50"
+            ),
+        ),
+    ]
+
+    # ============================================================================
+    # Chunking Configuration
+    # ============================================================================
+
+    chunk_size_unit: Annotated[
+        ChunkSizeUnit,
+        Field(
+            default=ChunkSizeUnit.TOKENS,
+            description=(
+                "Unit for CHUNK_MAX_SIZE/CHUNK_MIN_SIZE. "
+                "Valid values: tokens (estimated), chars"
+            ),
+        ),
+    ] = ChunkSizeUnit.TOKENS
+
+    chunk_max_size: Annotated[
+        int,
+        Field(
+            default=1024,
+            ge=64,
+            le=65536,
+            description=(
+                "Maximum chunk size. Larger AST nodes are split at child boundaries. "
+                "Range: 64-65536"
+            ),
+        ),
+    ] = 1024
+
+    chunk_min_size: Annotated[
+        int,
+        Field(
+            default=64,
+            ge=0,
+            le=8192,
+            description=(
+                "Chunks smaller than this are merged with adjacent siblings "
+                "(0 disables merging). Range: 0-8192"
+            ),
+        ),
+    ] = 64
+
+    # ============================================================================
+    # Embedding Context Configuration
+    # ============================================================================
+
+    embedding_context_tokens: Annotated[
+        int,
+        Field(
+            default=2048,
+            ge=128,
+            le=32768,
+            description=(
+                "Maximum tokens per embedding input (model context window). "
+                "Longer chunks are split into overlapping windows. Range: 128-32768"
+            ),
+        ),
+    ] = 2048
+
+    embedding_window_overlap_tokens: Annotated[
+        int,
+        Field(
+            default=128,
+            ge=0,
+            le=4096,
+            description=(
+                "Tokens shared between consecutive windows of a long chunk. "
+                "Range: 0-4096"
+            ),
+        ),
+    ] = 128
+
+    embedding_long_chunk_strategy: Annotated[
+        LongChunkStrategy,
+        Field(
+            default=LongChunkStrategy.POOL,
+            description=(
+                "Handling of chunks longer than EMBEDDING_CONTEXT_TOKENS. "
+                "Valid values: pool (one mean-pooled vector), split (sub-chunks)"
+            ),
+        ),
+    ] = LongChunkStrategy.POOL
+
+    embedding_tokenizer_file: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description=(
+                "Optional tokenizer.json of the embedding model for exact token "
+                "counts (requires the 'tokenizers' package). Default: estimate"
+            ),
+        ),
+    ] = None
+
+    # ============================================================================
+    # Embedding Queue Configuration
+    # ============================================================================
+
+    embedding_mode: Annotated[
+        EmbeddingMode,
+        Field(
+            default=EmbeddingMode.INLINE,
+            description=(
+                "inline: embed while indexing (failed batches are queued for retry); "
+                "deferred: store chunks first and let queue workers embed them"
+            ),
+        ),
+    ] = EmbeddingMode.INLINE
+
+    embedding_queue_workers: Annotated[
+        int,
+        Field(
+            default=2,
+            ge=0,
+            le=64,
+            description=(
+                "Embedding queue workers per server process (0 disables "
+                "in-process backfill). Range: 0-64"
+            ),
+        ),
+    ] = 2
+
+    embedding_queue_batch_size: Annotated[
+        int,
+        Field(
+            default=32,
+            ge=1,
+            le=1000,
+            description="Queued chunks claimed per worker iteration. Range: 1-1000",
+        ),
+    ] = 32
+
+    embedding_queue_max_attempts: Annotated[
+        int,
+        Field(
+            default=5,
+            ge=1,
+            le=100,
+            description=(
+                "Attempts before a queued chunk is parked as failed "
+                "(retries back off exponentially). Range: 1-100"
+            ),
+        ),
+    ] = 5
+
+    embedding_queue_poll_interval: Annotated[
+        float,
+        Field(
+            default=2.0,
+            gt=0,
+            le=300,
+            description="Seconds an idle queue worker waits before polling again",
+        ),
+    ] = 2.0
+
+    # ============================================================================
+    # Background Job Configuration
+    # ============================================================================
+
+    indexing_max_concurrent_jobs: Annotated[
+        int,
+        Field(
+            default=2,
+            ge=1,
+            le=32,
+            description=(
+                "Indexing jobs run concurrently per server process; further "
+                "jobs wait in a priority queue. Range: 1-32"
+            ),
+        ),
+    ] = 2
+
+    indexing_enqueue_only: Annotated[
+        bool,
+        Field(
+            default=False,
+            description=(
+                "Only record indexing jobs; standalone workers "
+                "(python -m src.services.indexing_worker) claim and run them"
+            ),
+        ),
+    ] = False
+
+    indexing_worker_poll_interval: Annotated[
+        float,
+        Field(
+            default=2.0,
+            gt=0,
+            le=300,
+            description="Seconds an idle standalone indexing worker waits before polling again",
+        ),
+    ] = 2.0
+
+    job_heartbeat_interval: Annotated[
+        float,
+        Field(
+            default=15.0,
+            gt=0,
+            le=600,
+            description="Seconds between heartbeats of a running indexing job",
+        ),
+    ] = 15.0
+
+    job_stale_after: Annotated[
+        float,
+        Field(
+            default=120.0,
+            gt=0,
+            le=86400,
+            description=(
+                "Seconds without a heartbeat after which a pending/running "
+                "indexing job is considered orphaned and recovered (at startup "
+                "and periodically)"
+            ),
+        ),
+    ] = 120.0
+
+    job_max_recoveries: Annotated[
+        int,
+        Field(
+            default=3,
+            ge=0,
+            le=100,
+            description=(
+                "Times an orphaned job is re-queued before it is marked failed "
+                "(0 fails orphaned jobs immediately). Range: 0-100"
+            ),
+        ),
+    ] = 3
+    job_status_flush_interval: Annotated[
+        float,
+        Field(
+            default=1.0,
+            gt=0,
+            le=60,
+            description=(
+                "Seconds between batched writes of job progress to indexing_jobs "
+                "(status changes are written immediately). Range: 0-60"
+            ),
+        ),
+    ] = 1.0
+
     # ============================================================================
     # Logging Configuration
     # ============================================================================
@@ -394,6 +809,28 @@ class Settings(BaseSettings):
         # Additional checks can be added here if needed
         return v
 
+    @field_validator("ollama_base_urls")
+    @classmethod
+    def validate_ollama_urls(cls, v: str | None) -> str | None:
+        """
+        Ensure every comma-separated Ollama URL uses HTTP/HTTPS.
+
+        Args:
+            v: Comma-separated Ollama base URLs
+
+        Returns:
+            Validated URLs (None when empty)
+
+        Raises:
+            ValueError: If any URL is not http(s)
+        """
+        if v is None or not v.strip():
+            return None
+        for url in v.split(","):
+            if not url.strip().startswith(("http://", "https://")):
+                raise ValueError(f"OLLAMA_BASE_URLS entry must be an http(s) URL: {url!r}")
+        return v
+
     @field_validator("db_pool_size", "db_max_overflow")
     @classmethod
     def validate_pool_configuration(cls, v: int) -> int:
@@ -437,6 +874,61 @@ class Settings(BaseSettings):
             )
         return v
 
+    @model_validator(mode="after")
+    def validate_chunk_sizes(self) -> "Settings":
+        """
+        Ensure the chunk merge threshold is below the chunk size limit.
+
+        Returns:
+            Validated Settings instance
+
+        Raises:
+            ValueError: If CHUNK_MIN_SIZE >= CHUNK_MAX_SIZE
+        """
+        if self.chunk_min_size >= self.chunk_max_size:
+            raise ValueError(
+                f"CHUNK_MIN_SIZE ({self.chunk_min_size}) must be smaller than "
+                f"CHUNK_MAX_SIZE ({self.chunk_max_size})"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_embedding_backend(self) -> "Settings":
+        """
+        Ensure the replay backend has a recording to replay.
+
+        Returns:
+            Validated Settings instance
+
+        Raises:
+            ValueError: If EMBEDDING_BACKEND=replay without EMBEDDING_REPLAY_FILE
+        """
+        if (
+            self.embedding_backend == EmbeddingBackendName.REPLAY
+            and not self.embedding_replay_file
+        ):
+            raise ValueError("EMBEDDING_BACKEND=replay requires EMBEDDING_REPLAY_FILE")
+        return self
+
+    @model_validator(mode="after")
+    def validate_embedding_window(self) -> "Settings":
+        """
+        Ensure window overlap leaves room for progress between windows.
+
+        Returns:
+            Validated Settings instance
+
+        Raises:
+            ValueError: If overlap is not below half of EMBEDDING_CONTEXT_TOKENS
+        """
+        if self.embedding_window_overlap_tokens >= self.embedding_context_tokens // 2:
+            raise ValueError(
+                f"EMBEDDING_WINDOW_OVERLAP_TOKENS ({self.embedding_window_overlap_tokens}) "
+                f"must be less than half of EMBEDDING_CONTEXT_TOKENS "
+                f"({self.embedding_context_tokens})"
+            )
+        return self
+
     @model_validator(mode="after")
     def initialize_pool_config(self) -> "Settings":
         """
@@ -494,6 +986,19 @@ class Settings(BaseSettings):
 
         return self
 
+    @property
+    def ollama_endpoints(self) -> list[str]:
+        """
+        Ollama base URLs to load-balance across.
+
+        Returns:
+            OLLAMA_BASE_URLS entries (deduplicated, without trailing slash), or
+            [OLLAMA_BASE_URL] when OLLAMA_BASE_URLS is not set
+        """
+        urls = self.ollama_base_urls.split(",") if self.ollama_base_urls else []
+        endpoints = list(dict.fromkeys(u.strip().rstrip("/") for u in urls if u.strip()))
+        return endpoints or [str(self.ollama_base_url).rstrip("/")]
+
 
 # ============================================================================
 # Singleton Instance
@@ -544,7 +1049,11 @@ except Exception:
 # ============================================================================
 
 __all__ = [
+    "ChunkSizeUnit",
+    "EmbeddingBackendName",
+    "EmbeddingMode",
     "LogLevel",
+    "LongChunkStrategy",
     "PoolConfig",
     "Settings",
     "get_settings",
@@ -5,6 +5,7 @@ This module provides production-grade database connection pool management with:
 - Automatic reconnection with exponential backoff
 - Real-time pool statistics and health monitoring
 - Graceful connection lifecycle management
+- Priority admission (interactive work ahead of bulk work)
 - Structured JSON logging to /tmp/codebase-mcp.log
 
 Constitutional Compliance:
@@ -60,6 +61,12 @@ from src.connection_pool.config import PoolConfig
 from src.connection_pool.manager import ConnectionPoolManager, PoolState
 from src.connection_pool.health import PoolHealthStatus, HealthStatus
 from src.connection_pool.statistics import PoolStatistics
+from src.connection_pool.priority import (
+    PrioritySlots,
+    WorkPriority,
+    current_priority,
+    priority_scope,
+)
 from src.connection_pool.exceptions import (
     ConnectionPoolError,
     PoolConfigurationError,
@@ -92,4 +99,9 @@ __all__ = [
     "PoolTimeoutError",
     "ConnectionValidationError",
     "PoolClosedError",
+    # Priority admission
+    "PrioritySlots",
+    "WorkPriority",
+    "current_priority",
+    "priority_scope",
 ]
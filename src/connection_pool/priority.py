@@ -0,0 +1,168 @@
+"""Priority admission for shared connections (interactive before bulk work).
+
+Bulk indexing and interactive search share the same Ollama client and the same
+project databases. Without arbitration a query embedding waits behind hundreds
+of chunk embeddings already queued by an indexing run. PrioritySlots limits
+concurrent use of a resource and admits waiters by priority:
+
+- Interactive waiters always go ahead of bulk waiters (FIFO within a priority)
+- A number of slots is reserved for interactive work, so bulk work can never
+  occupy the whole resource
+
+The priority of the running code is ambient (a ContextVar): entry points of
+bulk work (indexing workers, embedding queue, garbage collection) run inside
+priority_scope(WorkPriority.BULK), and everything they call - including tasks
+they create - inherits it. Everything else is interactive.
+
+Constitutional Compliance:
+- Principle IV: Performance (search latency independent of indexing load)
+- Principle V: Production quality (cancelled waiters never leak slots)
+- Principle VIII: Type safety (full mypy --strict compliance)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import AsyncIterator, Iterator
+
+
+class WorkPriority(IntEnum):
+    """Priority of work competing for shared connections (lower goes first)."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+_current_priority: ContextVar[WorkPriority] = ContextVar(
+    "work_priority", default=WorkPriority.INTERACTIVE
+)
+
+
+def current_priority() -> WorkPriority:
+    """Priority of the running code (INTERACTIVE unless in a bulk scope)."""
+    return _current_priority.get()
+
+
+@contextmanager
+def priority_scope(priority: WorkPriority) -> Iterator[None]:
+    """Run the enclosed code (and tasks it creates) at the given priority."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class PrioritySlots:
+    """Counting semaphore that admits waiters by priority.
+
+    Bulk work may hold at most limit - reserved slots; the reserved slots
+    are kept free for interactive work.
+    """
+
+    def __init__(self, limit: int, reserved: int = 0) -> None:
+        """Initialize slots.
+
+        Args:
+            limit: Maximum concurrent holders
+            reserved: Slots only interactive work may use (capped at limit - 1)
+
+        Raises:
+            ValueError: If limit is less than 1 or reserved is negative
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        if reserved < 0:
+            raise ValueError(f"reserved must not be negative, got {reserved}")
+        self.limit = limit
+        self.reserved = min(reserved, limit - 1)
+        self._requested_reserved = reserved
+        self.in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of waiters not yet admitted."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def resize(self, limit: int) -> None:
+        """Change the number of slots (holders above a lower limit keep theirs).
+
+        Args:
+            limit: New maximum concurrent holders (at least 1)
+        """
+        self.limit = max(limit, 1)
+        self.reserved = min(self._requested_reserved, self.limit - 1)
+        self._admit_waiters()
+
+    def _admits(self, priority: WorkPriority) -> bool:
+        """Whether a slot is free for work of this priority."""
+        if priority == WorkPriority.INTERACTIVE:
+            return self.in_use < self.limit
+        return self.in_use < self.limit - self.reserved
+
+    def _queued_ahead(self, priority: WorkPriority) -> bool:
+        """Whether a waiter of the same or a higher priority is queued."""
+        return any(
+            waiter_priority <= priority and not future.done()
+            for waiter_priority, _, future in self._waiters
+        )
+
+    @asynccontextmanager
+    async def acquire(self, priority: WorkPriority | None = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block.
+
+        Args:
+            priority: Priority of the request (default: current_priority())
+        """
+        if priority is None:
+            priority = current_priority()
+
+        if self._admits(priority) and not self._queued_ahead(priority):
+            self.in_use += 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._sequence += 1
+            heapq.heappush(self._waiters, (int(priority), self._sequence, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._release()  # Admitted just as the waiter was cancelled
+                raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Free a slot and admit waiters in priority order."""
+        self.in_use -= 1
+        self._admit_waiters()
+
+    def _admit_waiters(self) -> None:
+        """Admit waiters in priority order while slots are free."""
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)  # Cancelled while waiting
+                continue
+            if not self._admits(WorkPriority(priority)):
+                break
+            heapq.heappop(self._waiters)
+            self.in_use += 1
+            future.set_result(None)
+
+
+__all__ = [
+    "PrioritySlots",
+    "WorkPriority",
+    "current_priority",
+    "priority_scope",
+]
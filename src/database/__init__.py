@@ -44,6 +44,7 @@ from src.database.provisioning import (
     create_pool,
     create_project_database,
     generate_database_name,
+    partition_code_chunks,
 )
 from src.database.session import (
     DATABASE_URL,
@@ -72,6 +73,7 @@ __all__ = [
     "create_project_database",
     "create_pool",
     "generate_database_name",
+    "partition_code_chunks",
     # Project registry
     "Project",
     "ProjectRegistry",
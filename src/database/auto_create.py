@@ -34,6 +34,7 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 from src.auto_switch.validation import validate_config_syntax
+from src.database.project_cache import notify_project_change
 from src.database.provisioning import (
     create_project_database,
     generate_database_name,
@@ -367,6 +368,7 @@ async def get_or_create_project_from_config(
                         "DELETE FROM projects WHERE id = $1",
                         existing.project_id
                     )
+                    await notify_project_change(conn, existing.project_id, project_name)
 
                 logger.info(f"Removed old project {existing.project_id} from all registries")
             except Exception as e:
@@ -438,6 +440,7 @@ async def get_or_create_project_from_config(
                             database_name_override,
                             row['id']
                         )
+                        await notify_project_change(conn, row['id'], row['name'])
 
                         database_name = database_name_override
                     else:
@@ -685,6 +688,7 @@ async def get_or_create_project_from_config(
                 database_name,
                 json.dumps({}),  # metadata as JSON string
             )
+            await notify_project_change(conn, project_id, project_name)
 
         logger.debug(
             f"✓ Registry sync successful for {project_id}",
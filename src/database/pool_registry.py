@@ -0,0 +1,313 @@
+"""Project database pools under a global connection budget.
+
+Every project database touched by get_session() gets a pooled engine. Left
+unchecked, each keeps connections open for as long as the server runs, and
+with dozens of workspaces the server exhausts Postgres max_connections. The
+registry bounds the total:
+
+- Sessions in use across all projects never exceed the budget
+  (POOL_CONNECTION_BUDGET), admitted by priority (see
+  src.connection_pool.priority)
+- Active projects share the budget fairly: each may hold at most
+  budget / active projects sessions (capped at POOL_MAX_SIZE)
+- When open connections reach the budget, the least recently used idle
+  project pools are closed to make room (LRU eviction)
+- Project pools unused for POOL_IDLE_TIMEOUT seconds are closed
+- Pools with checked-out connections are never closed, including those of
+  sessions opened outside the budget (get_project_session_factory())
+
+Closed pools are recreated on the next session for their project.
+
+Constitutional Compliance:
+- Principle IV: Performance (warm pools for active projects, bounded total)
+- Principle V: Production quality (no connection exhaustion with many projects)
+- Principle VIII: Type safety (full mypy --strict compliance)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.connection_pool.priority import PrioritySlots
+from src.mcp.mcp_logging import get_logger
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+
+# ==============================================================================
+# Registry
+# ==============================================================================
+
+
+@dataclass
+class ProjectPool:
+    """Pooled engine of one project database and its session admission."""
+
+    database_name: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    slots: PrioritySlots
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def busy(self) -> bool:
+        """Whether sessions are in use or waiting, or connections are checked out.
+
+        Sessions opened on session_factory directly (not through acquire())
+        hold no slot; their checked-out connections still keep the pool open.
+        """
+        return (
+            self.slots.in_use > 0
+            or self.slots.waiting > 0
+            or int(self.engine.pool.checkedout()) > 0  # type: ignore[attr-defined]
+        )
+
+    @property
+    def open_connections(self) -> int:
+        """Connections currently open (idle in the pool or checked out)."""
+        pool = self.engine.pool
+        return int(pool.checkedin()) + int(pool.checkedout())  # type: ignore[attr-defined]
+
+
+class ProjectPoolRegistry:
+    """Per-project pooled engines sharing one connection budget.
+
+    Lifecycle:
+        1. acquire(database_name) creates the project's engine on first use
+           and admits the session (project share, then global budget)
+        2. Idle project pools are closed after idle_timeout seconds, or
+           earlier (least recently used first) when the budget is reached
+        3. close() disposes every engine (FastMCP lifespan shutdown)
+    """
+
+    def __init__(
+        self,
+        create_engine: Callable[[str], AsyncEngine],
+        budget: int,
+        max_per_project: int,
+        reserved: int = 0,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        """Initialize registry.
+
+        Args:
+            create_engine: Creates the pooled engine of a project database
+            budget: Maximum connections across all project databases
+            max_per_project: Maximum sessions of one project database
+            reserved: Sessions kept free for interactive work (per project
+                and in the global budget)
+            idle_timeout: Seconds after which an unused project pool is closed
+        """
+        self._create_engine = create_engine
+        self.budget = max(budget, 1)
+        self.max_per_project = max(min(max_per_project, self.budget), 1)
+        self.reserved = reserved
+        self.idle_timeout = idle_timeout
+        self.evictions = 0
+        self._pools: OrderedDict[str, ProjectPool] = OrderedDict()
+        self._sessions = PrioritySlots(self.budget, reserved=reserved)
+        self._reaper: asyncio.Task[None] | None = None
+
+    def __contains__(self, database_name: str) -> bool:
+        """Whether the project's pool is open."""
+        return database_name in self._pools
+
+    def get(self, database_name: str) -> ProjectPool:
+        """Get the project's pool, creating it on first use.
+
+        Args:
+            database_name: Project database name (cb_proj_*)
+
+        Returns:
+            The project's pool (marked most recently used)
+        """
+        pool = self._pools.get(database_name)
+        if pool is not None:
+            self._pools.move_to_end(database_name)
+            return pool
+
+        engine = self._create_engine(database_name)
+        pool = ProjectPool(
+            database_name=database_name,
+            engine=engine,
+            session_factory=async_sessionmaker(
+                engine, class_=AsyncSession, expire_on_commit=False
+            ),
+            slots=PrioritySlots(self.max_per_project, reserved=self.reserved),
+        )
+        self._pools[database_name] = pool
+        logger.info(
+            f"Opened pool for database: {database_name}",
+            extra={
+                "context": {
+                    "operation": "project_pool_open",
+                    "database_name": database_name,
+                    "open_pools": len(self._pools),
+                    "open_connections": self.open_connections(),
+                    "budget": self.budget,
+                }
+            },
+        )
+        return pool
+
+    def open_connections(self) -> int:
+        """Connections open across all project pools."""
+        return sum(pool.open_connections for pool in self._pools.values())
+
+    def sessions_in_use(self) -> int:
+        """Sessions in use across all project pools."""
+        return self._sessions.in_use
+
+    @asynccontextmanager
+    async def acquire(self, database_name: str) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+        """Admit one session of a project database.
+
+        Waits (by the caller's priority) for the project's fair share and a
+        slot in the global budget, closing idle pools of other projects if
+        a new connection would exceed the budget.
+
+        Args:
+            database_name: Project database name (cb_proj_*)
+
+        Yields:
+            Session factory of the project's pooled engine
+        """
+        pool = self.get(database_name)
+        self._ensure_reaper()
+        self._rebalance(pool)
+        try:
+            async with pool.slots.acquire(), self._sessions.acquire():
+                if pool.engine.pool.checkedin() == 0:  # type: ignore[attr-defined]
+                    await self._make_room(database_name)
+                pool.last_used = time.monotonic()
+                try:
+                    yield pool.session_factory
+                finally:
+                    pool.last_used = time.monotonic()
+        finally:
+            self._rebalance()
+
+    def _rebalance(self, joining: ProjectPool | None = None) -> None:
+        """Give every active project an equal share of the budget."""
+        active = [pool for pool in self._pools.values() if pool.busy or pool is joining]
+        if not active:
+            return
+        share = max(min(self.budget // len(active), self.max_per_project), 1)
+        for pool in active:
+            if pool.slots.limit != share:
+                pool.slots.resize(share)
+
+    async def _make_room(self, database_name: str) -> None:
+        """Close least recently used idle pools while the budget is reached."""
+        while self.open_connections() >= self.budget:
+            victim = next(
+                (
+                    pool
+                    for name, pool in self._pools.items()
+                    if name != database_name and not pool.busy
+                ),
+                None,
+            )
+            if victim is None:
+                return  # Every open connection is in use (sessions are capped)
+            self.evictions += 1
+            await self._close(victim, reason="budget")
+
+    async def reap_idle(self) -> int:
+        """Close pools unused for idle_timeout seconds.
+
+        Returns:
+            Number of pools closed
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [
+            pool for pool in self._pools.values() if not pool.busy and pool.last_used <= cutoff
+        ]
+        for pool in idle:
+            await self._close(pool, reason="idle")
+        return len(idle)
+
+    async def _close(self, pool: ProjectPool, reason: str) -> None:
+        """Forget a pool and close its connections."""
+        if self._pools.get(pool.database_name) is pool:
+            del self._pools[pool.database_name]
+        try:
+            await pool.engine.dispose()
+        except Exception as e:
+            logger.error(
+                f"Error closing pool for database: {pool.database_name}",
+                extra={
+                    "context": {
+                        "operation": "project_pool_close",
+                        "database_name": pool.database_name,
+                        "error": str(e),
+                    }
+                },
+            )
+            return
+        logger.info(
+            f"Closed pool for database: {pool.database_name} ({reason})",
+            extra={
+                "context": {
+                    "operation": "project_pool_close",
+                    "database_name": pool.database_name,
+                    "reason": reason,
+                    "open_pools": len(self._pools),
+                }
+            },
+        )
+
+    def _ensure_reaper(self) -> None:
+        """Start the idle pool reaper on first use."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        """Close idle pools every idle_timeout / 2 seconds."""
+        while True:
+            try:
+                await asyncio.sleep(max(self.idle_timeout / 2, 1.0))
+                await self.reap_idle()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(
+                    f"Failed to close idle project pools: {e}",
+                    extra={"context": {"open_pools": len(self._pools), "error": str(e)}},
+                )
+
+    async def close(self) -> None:
+        """Stop the reaper and close every pool.
+
+        Idempotent - safe to call multiple times.
+        """
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+        for pool in list(self._pools.values()):
+            await self._close(pool, reason="shutdown")
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "ProjectPool",
+    "ProjectPoolRegistry",
+]
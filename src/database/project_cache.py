@@ -0,0 +1,332 @@
+"""In-process cache of registry lookups (project id/name → database_name).
+
+Every tool call with an explicit project_id resolves it against the registry
+database before a session is opened. The mapping changes only when a
+project is created, renamed or deleted, so resolve_project_id() keeps the
+rows it looked up in memory and a warm lookup costs a dict access instead
+of a registry round trip.
+
+Entries are invalidated:
+- By every registry write of this process (ProjectRegistry, auto-creation):
+  writers call notify_project_change() next to the write
+- By writes of other processes: notify_project_change() also sends
+  NOTIFY project_registry_changes, received on one dedicated LISTEN
+  connection to the registry database (opened outside the registry pool, so
+  it never takes a slot from lookups)
+- After PROJECT_CACHE_TTL seconds, which bounds staleness when LISTEN is
+  unavailable or notifications were missed while reconnecting
+
+Every invalidation advances a generation counter. A lookup records the
+generation before querying the registry and passes it to put(); a row read
+before a concurrent invalidation is then not stored.
+
+Constitutional Compliance:
+- Principle IV: Performance (project resolution without a registry query)
+- Principle V: Production quality (TTL fallback without LISTEN)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Payload:
+    {"project_id": "<uuid>", "name": "<name or null>"}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Final
+
+import asyncpg
+
+from src.mcp.mcp_logging import get_logger
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+PROJECT_REGISTRY_CHANNEL: Final[str] = "project_registry_changes"
+
+# Seconds a looked-up project is served from memory (0 disables the cache)
+PROJECT_CACHE_TTL: Final[float] = float(os.getenv("PROJECT_CACHE_TTL", "60"))
+
+# Seconds before connecting the listener is retried after a failure
+RECONNECT_BACKOFF_SECONDS: Final[float] = 30.0
+
+
+# ==============================================================================
+# Cache
+# ==============================================================================
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """One registry row as returned by resolve_project_id()."""
+
+    project_id: Any
+    name: str | None
+    database_name: str
+    expires_at: float
+
+
+class ProjectLookupCache:
+    """Registry rows by project id and by name, with TTL.
+
+    Lifecycle:
+        1. put() stores a row looked up in the registry under its id and name,
+           unless an invalidation happened since the lookup began
+        2. get() serves it until the TTL expires or a write invalidates it
+        3. listen() subscribes to registry changes of other processes
+           (idempotent, retried on cache misses after a failure)
+        4. stop() closes the LISTEN connection (server shutdown)
+    """
+
+    def __init__(self, ttl: float = PROJECT_CACHE_TTL) -> None:
+        """Initialize cache (not listening).
+
+        Args:
+            ttl: Seconds an entry is served (0 disables caching)
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, _Entry] = {}
+        self._generation = 0
+        self._connection: Any = None
+        self._lock = asyncio.Lock()
+        self._failed_at: float | None = None
+
+    def get(self, identifier: str) -> tuple[Any, str] | None:
+        """Look up a project by id or name.
+
+        Args:
+            identifier: Project UUID (as text) or project name
+
+        Returns:
+            (project_id, database_name), or None if not cached or expired
+        """
+        entry = self._entries.get(identifier)
+        if entry is None or entry.expires_at <= time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return (entry.project_id, entry.database_name)
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; read it before querying the registry."""
+        return self._generation
+
+    def put(
+        self,
+        project_id: Any,
+        name: str | None,
+        database_name: str,
+        generation: int | None = None,
+    ) -> None:
+        """Store a registry row under its id and its name.
+
+        Args:
+            project_id: Project UUID as returned by the registry
+            name: Project name
+            database_name: Physical database name (cb_proj_*)
+            generation: Value of generation when the lookup began; the row is
+                dropped if an invalidation happened since (it may be stale)
+        """
+        if self.ttl <= 0:
+            return
+        if generation is not None and generation != self._generation:
+            return
+        entry = _Entry(project_id, name, database_name, time.monotonic() + self.ttl)
+        self._entries[str(project_id)] = entry
+        if name is not None:
+            self._entries[name] = entry
+
+    def invalidate(self, project_id: Any = None, name: str | None = None) -> None:
+        """Forget every entry of a project (by id, by name, or both).
+
+        Args:
+            project_id: Project UUID whose entries are dropped
+            name: Project name whose entries are dropped
+        """
+        self._generation += 1
+        ids = {str(project_id)} if project_id is not None else set()
+        names = {name} if name is not None else set()
+        for key, entry in list(self._entries.items()):
+            if (
+                key in ids
+                or key in names
+                or str(entry.project_id) in ids
+                or (entry.name is not None and entry.name in names)
+            ):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        self._generation += 1
+        self._entries.clear()
+
+    # --------------------------------------------------------------------------
+    # Invalidation by other processes
+    # --------------------------------------------------------------------------
+
+    @property
+    def listening(self) -> bool:
+        """Whether registry change notifications are currently being received."""
+        return self._is_listening()
+
+    def _is_listening(self) -> bool:
+        """listening, as a call (re-checked under the lock without type narrowing)."""
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def listen(self, connect: Callable[[], Awaitable[asyncpg.Connection]]) -> bool:
+        """Open a dedicated registry connection and LISTEN (no-op when already listening).
+
+        The connection is not taken from the registry pool: it is held for the
+        lifetime of the server and would otherwise permanently reduce the
+        pool's capacity for lookups.
+
+        Args:
+            connect: Opens a new connection to the registry database
+
+        Returns:
+            True if notifications are being received; False if LISTEN is
+            unavailable (entries then expire by TTL only)
+        """
+        if self._is_listening():
+            return True
+
+        async with self._lock:
+            if self._is_listening():
+                return True
+            if (
+                self._failed_at is not None
+                and time.monotonic() - self._failed_at < RECONNECT_BACKOFF_SECONDS
+            ):
+                return False
+
+            await self._close()
+            try:
+                self._connection = await connect()
+                await self._connection.add_listener(
+                    PROJECT_REGISTRY_CHANNEL, self._on_notification
+                )
+                self._connection.add_termination_listener(self._on_termination)
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                await self._close()
+                logger.warning(
+                    f"Project registry listener unavailable, cache entries expire by TTL: {e}",
+                    extra={
+                        "context": {"channel": PROJECT_REGISTRY_CHANNEL, "error": str(e)}
+                    },
+                )
+                return False
+
+            # Changes made before LISTEN took effect were not received
+            self.clear()
+            self._failed_at = None
+            logger.info(
+                "Listening for project registry changes",
+                extra={
+                    "context": {"channel": PROJECT_REGISTRY_CHANNEL, "ttl": self.ttl}
+                },
+            )
+            return True
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection.
+
+        Idempotent - safe to call multiple times.
+        """
+        async with self._lock:
+            await self._close()
+
+    async def _close(self) -> None:
+        """Close the connection, ignoring errors of a broken connection."""
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            await connection.remove_listener(PROJECT_REGISTRY_CHANNEL, self._on_notification)
+        except Exception:
+            pass
+        try:
+            await connection.close()
+        except Exception:
+            connection.terminate()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg listener callback: drop the entries of the changed project."""
+        try:
+            change = json.loads(payload)
+            self.invalidate(change["project_id"], change.get("name"))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.debug(f"Malformed project registry payload, clearing cache: {payload!r}")
+            self.clear()
+
+    def _on_termination(self, connection: Any) -> None:
+        """asyncpg termination callback: changes may be missed until reconnected."""
+        self.clear()
+
+
+# ==============================================================================
+# Sending
+# ==============================================================================
+
+
+async def notify_project_change(
+    conn: asyncpg.Connection, project_id: Any, name: str | None = None
+) -> None:
+    """Invalidate a project in this process and announce the change.
+
+    Call on the registry connection that wrote the change; inside a
+    transaction, other processes receive the notification on commit.
+
+    Args:
+        conn: Registry database connection that changed the project
+        project_id: UUID of the changed projects row
+        name: Project name (if known)
+    """
+    get_project_cache().invalidate(project_id, name)
+    payload = json.dumps({"project_id": str(project_id), "name": name})
+    await conn.execute("SELECT pg_notify($1, $2)", PROJECT_REGISTRY_CHANNEL, payload)
+
+
+# ==============================================================================
+# Global Instance
+# ==============================================================================
+
+# Global singleton (listening from the first registry lookup, stopped on shutdown)
+_project_cache: ProjectLookupCache | None = None
+
+
+def get_project_cache() -> ProjectLookupCache:
+    """Get global project lookup cache.
+
+    Creates singleton on first call.
+
+    Returns:
+        Global ProjectLookupCache instance
+    """
+    global _project_cache
+    if _project_cache is None:
+        _project_cache = ProjectLookupCache()
+    return _project_cache
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "PROJECT_CACHE_TTL",
+    "PROJECT_REGISTRY_CHANNEL",
+    "ProjectLookupCache",
+    "get_project_cache",
+    "notify_project_change",
+]
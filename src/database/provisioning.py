@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import asyncpg
+from src.config.settings import get_settings
 from src.mcp.mcp_logging import get_logger
 
 if TYPE_CHECKING:
@@ -192,6 +193,8 @@ async def initialize_project_schema(database_name: str, db_user: str | None = No
 
     Executes scripts/init_project_schema.sql in the specified database.
     Creates tables: repositories, code_files, code_chunks with pgvector support.
+    When CODE_CHUNKS_LAYOUT=partitioned, scripts/partition_code_chunks.sql is
+    applied afterwards to partition code_chunks by repository.
 
     Args:
         database_name: Target database name
@@ -207,6 +210,8 @@ async def initialize_project_schema(database_name: str, db_user: str | None = No
     if db_user is None:
         db_user = _DB_USER
 
+    code_chunks_layout = get_settings().code_chunks_layout
+
     # Resolve SQL file path
     sql_file = _PROJECT_ROOT / "scripts" / "init_project_schema.sql"
     if not sql_file.exists():
@@ -242,6 +247,8 @@ async def initialize_project_schema(database_name: str, db_user: str | None = No
         conn = await asyncpg.connect(dsn)
         try:
             await conn.execute(sql)
+            if code_chunks_layout == "partitioned":
+                await _apply_partitioned_chunks_layout(conn)
             logger.info(
                 f"✓ Schema initialized successfully: {database_name}",
                 extra={
@@ -249,6 +256,7 @@ async def initialize_project_schema(database_name: str, db_user: str | None = No
                         "operation": "initialize_schema",
                         "database_name": database_name,
                         "tables": ["repositories", "code_files", "code_chunks"],
+                        "code_chunks_layout": code_chunks_layout,
                     }
                 },
             )
@@ -275,6 +283,89 @@ async def initialize_project_schema(database_name: str, db_user: str | None = No
         raise
 
 
+async def _apply_partitioned_chunks_layout(conn: asyncpg.Connection) -> None:
+    """Apply scripts/partition_code_chunks.sql on an open connection.
+
+    The script is idempotent: it converts a flat code_chunks table (moving
+    existing rows into per-repository partitions) and is a no-op for the
+    table itself when code_chunks is already partitioned.
+
+    Args:
+        conn: Connection to the project database
+
+    Raises:
+        FileNotFoundError: If partition_code_chunks.sql not found
+        asyncpg.PostgresError: If the conversion fails
+    """
+    sql_file = _PROJECT_ROOT / "scripts" / "partition_code_chunks.sql"
+    if not sql_file.exists():
+        raise FileNotFoundError(f"Schema file not found: {sql_file}")
+
+    with open(sql_file) as f:
+        sql = f.read()
+
+    # Single transaction: a failed conversion leaves the flat table untouched
+    async with conn.transaction():
+        await conn.execute(sql)
+
+
+async def partition_code_chunks(database_name: str, db_user: str | None = None) -> None:
+    """Migrate an existing project database to the partitioned code_chunks layout.
+
+    Migration path for databases created with the flat layout: ensures the
+    repository_id column is present and backfilled (by re-applying
+    init_project_schema.sql), then converts code_chunks to LIST partitions
+    per repository with a partition-local HNSW index.
+
+    Args:
+        database_name: Target database name
+        db_user: Database user (defaults to environment or current user)
+
+    Raises:
+        FileNotFoundError: If a schema file is not found
+        asyncpg.PostgresError: If the migration fails
+
+    Example:
+        >>> await partition_code_chunks("cb_proj_my_project_abc123de")
+    """
+    sql_file = _PROJECT_ROOT / "scripts" / "init_project_schema.sql"
+    if not sql_file.exists():
+        raise FileNotFoundError(f"Schema file not found: {sql_file}")
+
+    with open(sql_file) as f:
+        sql = f.read()
+
+    logger.info(
+        f"Partitioning code_chunks by repository: {database_name}",
+        extra={"context": {"operation": "partition_code_chunks", "database_name": database_name}},
+    )
+
+    conn = await create_connection(database_name, db_user)
+    try:
+        await conn.execute(sql)
+        await _apply_partitioned_chunks_layout(conn)
+    except asyncpg.PostgresError as e:
+        logger.error(
+            f"Failed to partition code_chunks: {database_name}",
+            extra={
+                "context": {
+                    "operation": "partition_code_chunks",
+                    "database_name": database_name,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                }
+            },
+        )
+        raise
+    finally:
+        await conn.close()
+
+    logger.info(
+        f"✓ code_chunks partitioned by repository: {database_name}",
+        extra={"context": {"operation": "partition_code_chunks", "database_name": database_name}},
+    )
+
+
 async def create_project_database(
     project_name: str,
     project_uuid: str,
@@ -46,6 +46,7 @@ from typing import Any
 import asyncpg
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from src.database.project_cache import notify_project_change
 from src.database.provisioning import create_project_database, generate_database_name
 from src.mcp.mcp_logging import get_logger
 
@@ -364,6 +365,8 @@ class ProjectRegistry:
                 if row is None:
                     raise RuntimeError(f"Failed to insert project record: {name}")
 
+                await notify_project_change(conn, row["id"], row["name"])
+
                 project = Project(
                     id=str(row["id"]),
                     name=row["name"],
@@ -605,6 +608,8 @@ class ProjectRegistry:
             if result == "DELETE 0":
                 raise ValueError(f"Project not found: {project_id}")
 
+            await notify_project_change(conn, project_id, project.name)
+
             logger.warning(
                 f"✓ Project deleted from registry: {project.name}",
                 extra={
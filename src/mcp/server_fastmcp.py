@@ -200,8 +200,15 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[None, None]:
     from src.config.settings import get_settings
     from src.connection_pool.config import PoolConfig
     from src.connection_pool.manager import ConnectionPoolManager
+    from src.database.session import close_db_connection
+    from src.services.embedder import OllamaEmbedder
+    from src.services.embedding_queue import get_embedding_queue_pool
     from src.services.health_service import HealthService
-    from src.services.metrics_service import MetricsService
+    from src.services.job_events import get_job_event_listener
+    from src.services.job_scheduler import get_indexing_scheduler
+    from src.services.job_store import get_job_store
+    from src.services.metrics_service import get_metrics_service as get_metrics_singleton
+    from src.services.model_residency import get_model_residency_manager
 
     # Create connection pool manager instance
     pool_manager = ConnectionPoolManager()
@@ -258,9 +265,24 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[None, None]:
 
         # Initialize metrics service
         logger.info("Initializing metrics service...")
-        _metrics_service = MetricsService()
+        # Shared instance: services record metrics into the same store
+        _metrics_service = get_metrics_singleton()
         logger.info("✓ Metrics service initialized successfully")
 
+        # Health-check Ollama endpoints (only when OLLAMA_BASE_URLS lists several)
+        await OllamaEmbedder().start_health_checks()
+
+        # Load the embedding model in the background and keep it resident
+        await get_model_residency_manager().start()
+
+        # Backfill queued chunk embeddings (deferred mode and failed batches)
+        await get_embedding_queue_pool().start()
+
+        # Resume (or fail) indexing jobs orphaned by a previous process, now
+        # and every JOB_STALE_AFTER seconds (best effort: a missing jobs
+        # table must not prevent serving searches)
+        await get_indexing_scheduler().start()
+
         logger.info("✓ All services initialized successfully")
         logger.info("Server startup complete")
         sys.stderr.write("INFO: All services initialized successfully\n")
@@ -288,6 +310,20 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[None, None]:
         await pool_manager.shutdown(timeout=30.0)
         logger.info("Connection pool closed successfully")
 
+        # Stop indexing jobs (released to pending for recovery to resume), write
+        # their buffered progress, then stop the job event listener, queue
+        # workers, keep-warm, endpoint health checks and the embedder HTTP client
+        await get_indexing_scheduler().stop()
+        await get_job_store().stop()
+        await get_job_event_listener().stop()
+        await get_embedding_queue_pool().stop()
+        await get_model_residency_manager().stop()
+        await OllamaEmbedder().close()
+
+        # Close project pools (and their reaper), the project cache's LISTEN
+        # connection, the registry pool and the indexing_jobs engine
+        await close_db_connection()
+
         # Stop session manager
         await session_mgr.stop()
         logger.info("Session manager stopped")
@@ -368,7 +404,10 @@ def main() -> None:
 
         # List expected tools and resources for diagnostics
         expected_tools = [
+            "cancel_indexing_job",
             "get_indexing_status",
+            "pause_indexing_job",
+            "resume_indexing_job",
             "search_code",
             "start_indexing_background",
         ]
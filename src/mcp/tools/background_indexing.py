@@ -12,8 +12,20 @@ Constitutional Compliance:
 - Principle XI: FastMCP Foundation (@mcp.tool() decorator)
 
 MCP Tool Responsibilities:
-- start_indexing_background(): Create job record, spawn worker
-- get_indexing_status(): Query job status from database
+- start_indexing_background(): Create job record (or reuse the repository's
+  active job), queue it on the indexing scheduler
+- get_indexing_status(): Query job status from database, optionally
+  long-polling for the next progress/completion event (LISTEN/NOTIFY)
+- resume_indexing_job(): Restart a failed/interrupted/paused job from its
+  checkpoint
+- cancel_indexing_job() / pause_indexing_job(): Stop a job; queued jobs stop
+  at once, running jobs at their next file batch boundary
+
+Scheduling (in job_scheduler.py):
+- At most INDEXING_MAX_CONCURRENT_JOBS jobs run at once
+- Incremental jobs are queued ahead of full reindexes
+- With INDEXING_ENQUEUE_ONLY=true jobs are only recorded; standalone
+  workers (indexing_worker.py) claim them from indexing_jobs
 
 Worker Responsibilities (in background_worker.py):
 - Update job status through state machine
@@ -24,22 +36,58 @@ Worker Responsibilities (in background_worker.py):
 from __future__ import annotations
 
 import asyncio
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from fastmcp import Context
 
-from src.database.session import get_session, resolve_project_id, engine
+from src.config.settings import get_settings
+from src.database.session import JobsSessionLocal, get_session, resolve_project_id
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.mcp.mcp_logging import get_logger
 from src.mcp.server_fastmcp import mcp
 from src.models.indexing_job import IndexingJob, IndexingJobCreate
-from src.services.background_worker import _background_indexing_worker
+from src.services.background_worker import is_job_active, request_control
+from src.services.job_events import (
+    FALLBACK_POLL_INTERVAL,
+    MAX_WAIT_SECONDS,
+    TERMINAL_STATES,
+    get_job_event_listener,
+    notify_job_event,
+)
+from src.services.job_recovery import heartbeat_stale
+from src.services.job_scheduler import ScheduledJob, get_indexing_scheduler
+from src.services.job_store import get_job_store
 
 logger = get_logger(__name__)
 
 
+async def _find_active_job(
+    session: AsyncSession, project_id: str, repo_path: str
+) -> IndexingJob | None:
+    """Return the pending/running job of a repository, if any."""
+    result = await session.execute(
+        select(IndexingJob).where(
+            IndexingJob.project_id == project_id,
+            IndexingJob.repo_path == repo_path,
+            IndexingJob.status.in_(("pending", "running")),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+def _dispatch(job: ScheduledJob) -> None:
+    """Queue job on this server, unless standalone workers run jobs."""
+    if get_settings().indexing_enqueue_only:
+        return  # Pending row is claimed by python -m src.services.indexing_worker
+    get_indexing_scheduler().submit(job)
+
+
 @mcp.tool()
 async def start_indexing_background(
     repo_path: str,
@@ -50,6 +98,11 @@ async def start_indexing_background(
     """Start repository indexing in the background (non-blocking).
 
     Returns immediately with job_id. Use get_indexing_status(job_id) to poll progress.
+    If the repository already has a pending or running job, no new job is
+    created and that job's id is returned ("coalesced": true). "force_reindex"
+    then reports the active job's mode: a force_reindex request merged into an
+    incremental job is not upgraded, returns false and says so in "message".
+    Jobs wait in a queue while INDEXING_MAX_CONCURRENT_JOBS others are running.
 
     Args:
         repo_path: Absolute path to repository (validated for path traversal)
@@ -63,6 +116,7 @@ async def start_indexing_background(
             "status": "pending",
             "message": "Indexing job started",
             "force_reindex": false,
+            "coalesced": false,
             "project_id": "resolved_project_id",
             "database_name": "cb_proj_xxx"
         }
@@ -133,25 +187,69 @@ async def start_indexing_background(
         project_id=resolved_id,
     )
 
-    # Create job record in main database (status=pending)
+    # Create job record in main database (status=pending), unless the
+    # repository already has an active job (unique partial index
+    # uq_indexing_jobs_active_repo makes concurrent requests coalesce too)
     # Note: indexing_jobs table lives in main codebase_mcp database, not project databases
-    async with AsyncSession(engine) as session:
-        job = IndexingJob(
-            repo_path=job_input.repo_path,
-            project_id=resolved_id,
-            status="pending",
-            force_reindex=force_reindex,
-        )
-        session.add(job)
-        await session.commit()
-        await session.refresh(job)
-        job_id = job.id
+    normalized_path = str(Path(job_input.repo_path))
+    async with JobsSessionLocal() as session:
+        existing = await _find_active_job(session, resolved_id, normalized_path)
+        if existing is None:
+            job = IndexingJob(
+                repo_path=normalized_path,
+                project_id=resolved_id,
+                config_path=str(config_path) if config_path else None,
+                status="pending",
+                force_reindex=force_reindex,
+            )
+            session.add(job)
+            try:
+                await session.commit()
+            except IntegrityError:
+                # A concurrent request created the active job first
+                await session.rollback()
+                existing = await _find_active_job(session, resolved_id, normalized_path)
+                if existing is None:
+                    raise
+            else:
+                await session.refresh(job)
+                job_id = job.id
+
+        if existing is not None:
+            message = "Indexing already in progress for this repository"
+            if force_reindex and not existing.force_reindex:
+                message = (
+                    f"Merged into incremental indexing job {existing.id} already in "
+                    "progress; force_reindex was not applied. Request it again once "
+                    "that job has finished."
+                )
+            logger.info(
+                f"Indexing request coalesced into active job {existing.id}",
+                extra={
+                    "context": {
+                        "job_id": str(existing.id),
+                        "project_id": resolved_id,
+                        "repo_path": normalized_path,
+                        "force_reindex_requested": force_reindex,
+                        "force_reindex": existing.force_reindex,
+                    }
+                },
+            )
+            return {
+                "job_id": str(existing.id),
+                "status": existing.status,
+                "message": message,
+                "force_reindex": existing.force_reindex,
+                "coalesced": True,
+                "project_id": resolved_id,
+                "database_name": database_name,
+            }
 
-    # Start background worker (non-blocking)
-    asyncio.create_task(
-        _background_indexing_worker(
+    # Queue on the bounded scheduler (non-blocking)
+    _dispatch(
+        ScheduledJob(
             job_id=job_id,
-            repo_path=job_input.repo_path,
+            repo_path=normalized_path,
             project_id=resolved_id,
             config_path=config_path,  # Pass config path, not ctx (Bug 2 fix)
             force_reindex=force_reindex,
@@ -164,7 +262,7 @@ async def start_indexing_background(
             "context": {
                 "job_id": str(job_id),
                 "project_id": resolved_id,
-                "repo_path": job_input.repo_path,
+                "repo_path": normalized_path,
             }
         },
     )
@@ -177,38 +275,111 @@ async def start_indexing_background(
         "status": "pending",
         "message": "Indexing job started",
         "force_reindex": force_reindex,
+        "coalesced": False,
         "project_id": resolved_id,
         "database_name": database_name,
     }
 
 
+async def _read_job_status(job_uuid: UUID, resolved_id: str) -> dict[str, Any]:
+    """Read a job's status dict (from memory for jobs running in this process).
+
+    Raises:
+        ValueError: If the job does not exist
+    """
+    job_id = str(job_uuid)
+    # Note: indexing_jobs table lives in main codebase_mcp database, not project databases
+    job = await get_job_store().load(job_uuid)
+
+    if job is None:
+        logger.warning(
+            f"Job not found: {job_id}",
+            extra={
+                "context": {
+                    "operation": "get_indexing_status",
+                    "job_id": job_id,
+                    "project_id": resolved_id,
+                }
+            },
+        )
+        raise ValueError(f"Job not found: {job_id}")
+
+    def _iso(column: str) -> str | None:
+        value = job.get(column)
+        return value.isoformat() if value else None
+
+    # Convert to dict
+    return {
+        "job_id": str(job["id"]),
+        "status": job["status"],
+        "status_message": job["status_message"],
+        "repo_path": job["repo_path"],
+        "project_id": job["project_id"],
+        "files_indexed": job["files_indexed"],
+        "files_total": job["files_total"],
+        "chunks_created": job["chunks_created"],
+        "force_reindex": job["force_reindex"],
+        "error_message": job["error_message"],
+        "progress": job.get("progress"),
+        "stage_durations": job.get("stage_durations"),
+        "created_at": _iso("created_at"),
+        "started_at": _iso("started_at"),
+        "checkpoint_at": _iso("checkpoint_at"),
+        "heartbeat_at": _iso("heartbeat_at"),
+        "completed_at": _iso("completed_at"),
+    }
+
+
 @mcp.tool()
 async def get_indexing_status(
     job_id: str,
     project_id: str | None = None,
+    wait_seconds: float = 0.0,
     ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Get status of a background indexing job.
 
-    Queries PostgreSQL for current job state. Read-only operation for polling.
+    Reads current job state (served from memory while this server runs the
+    job, from PostgreSQL otherwise). Read-only operation.
+
+    With wait_seconds > 0 the call long-polls: it returns as soon as the job
+    reports progress or finishes (pushed by the worker via LISTEN/NOTIFY), or
+    after wait_seconds (capped at 60) with the unchanged status. Finished
+    jobs are returned immediately. Prefer this over polling in a loop.
 
     Args:
         job_id: UUID of the indexing job
         project_id: Optional project identifier (resolved via 4-tier chain)
+        wait_seconds: Seconds to wait for the next progress update or
+            completion (default: 0, return immediately)
         ctx: FastMCP Context for session-based project resolution
 
     Returns:
         {
             "job_id": "uuid",
-            "status": "running",  # pending/running/completed/failed
+            "status": "running",  # pending/running/paused/completed/failed/cancelled
             "status_message": "Indexing in progress: 2500 files processed",
             "repo_path": "/path/to/repo",
             "files_indexed": 5000,
+            "files_total": 12000,
             "chunks_created": 45000,
             "force_reindex": false,
             "error_message": null,
+            "progress": {  # live progress of a running job (null until reported)
+                "stage": "embed",
+                "files_chunked": 5100,
+                "files_done": 5000,
+                "chunks_embedded": 45600,
+                "chunks_persisted": 45000,
+                "files_per_second": 7.6,
+                "eta_seconds": 921.0,
+                ...
+            },
+            "stage_durations": null,  # seconds per stage, set when finished
             "created_at": "2025-10-17T10:30:00Z",
             "started_at": "2025-10-17T10:30:01Z",
+            "checkpoint_at": "2025-10-17T10:41:12Z",
+            "heartbeat_at": "2025-10-17T10:41:20Z",
             "completed_at": null
         }
 
@@ -221,7 +392,7 @@ async def get_indexing_status(
         - Principle XI: FastMCP Foundation (@mcp.tool() decorator)
 
     Example:
-        >>> status = await get_indexing_status(job_id="550e8400-...")
+        >>> status = await get_indexing_status(job_id="550e8400-...", wait_seconds=30)
         >>> if status["status"] == "completed":
         ...     print(f"Indexed {status['files_indexed']} files!")
         >>> if status["force_reindex"]:
@@ -249,42 +420,287 @@ async def get_indexing_status(
         )
         raise ValueError(f"Invalid job_id format: {job_id}") from e
 
-    # Query job from main database
-    # Note: indexing_jobs table lives in main codebase_mcp database, not project databases
-    async with AsyncSession(engine) as session:
-        job = await session.get(IndexingJob, job_uuid)
+    # Long-poll: subscribe before reading so an update in between is not missed
+    wait = min(max(wait_seconds, 0.0), MAX_WAIT_SECONDS)
+    listener = get_job_event_listener()
+    listening = await listener.start() if wait > 0 else False
+
+    with listener.subscription(job_uuid) as notified:
+        status = await _read_job_status(job_uuid, resolved_id)
+        deadline = time.monotonic() + wait
+        while status["status"] not in TERMINAL_STATES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if listening:
+                try:
+                    await asyncio.wait_for(notified.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+                return await _read_job_status(job_uuid, resolved_id)
+
+            # No LISTEN connection: poll until the job changes
+            await asyncio.sleep(min(FALLBACK_POLL_INTERVAL, remaining))
+            latest = await _read_job_status(job_uuid, resolved_id)
+            if (latest["status"], latest["files_indexed"], latest.get("progress")) != (
+                status["status"], status["files_indexed"], status.get("progress")
+            ):
+                return latest
+            status = latest
+
+    return status
+
+
+@mcp.tool()
+async def resume_indexing_job(
+    job_id: str,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Resume a failed, interrupted or paused background indexing job.
+
+    Work committed before the interruption is kept: incremental jobs skip
+    files that were already indexed, and a force re-index continues building
+    the chunk generation recorded in the job's checkpoint (search keeps
+    serving the previous index until it completes).
+
+    Args:
+        job_id: UUID of the indexing job
+        ctx: FastMCP Context for logging
+
+    Returns:
+        {
+            "job_id": "uuid",
+            "status": "pending",
+            "message": "Indexing job resumed",
+            "files_indexed": 2500,
+            "files_total": 12000
+        }
 
+    Raises:
+        ValueError: If job_id is invalid, not found, completed, cancelled or
+            still running (here or in a worker whose heartbeat is fresh), or
+            another job is active for the same repository
+
+    Constitutional Compliance:
+        - Principle IV: Performance (no repeated work after interruptions)
+        - Principle V: Production Quality (validation, error handling)
+        - Principle XI: FastMCP Foundation (@mcp.tool() decorator)
+    """
+    try:
+        job_uuid = UUID(job_id)
+    except ValueError as e:
+        raise ValueError(f"Invalid job_id format: {job_id}") from e
+
+    # Row lock: the liveness check and the reset to pending are atomic with
+    # respect to workers claiming or recovering the job
+    async with JobsSessionLocal() as session:
+        job = await session.get(IndexingJob, job_uuid, with_for_update=True)
         if job is None:
-            logger.warning(
-                f"Job not found: {job_id}",
-                extra={
-                    "context": {
-                        "operation": "get_indexing_status",
-                        "job_id": job_id,
-                        "project_id": resolved_id,
-                    }
-                },
+            raise ValueError(f"Job not found: {job_id}")
+        if job.status == "completed":
+            raise ValueError(f"Job already completed: {job_id}")
+        if job.status == "cancelled":
+            raise ValueError(f"Job was cancelled: {job_id}; start a new indexing job instead")
+        if is_job_active(job_uuid) or (
+            # Running in another process unless its heartbeat went stale
+            job.status == "running"
+            and not await session.scalar(
+                select(heartbeat_stale(get_settings().job_stale_after)).where(
+                    IndexingJob.id == job_uuid
+                )
             )
+        ):
+            raise ValueError(f"Job is still running: {job_id}")
+
+        repo_path, project_id, force_reindex = job.repo_path, job.project_id, job.force_reindex
+        files_indexed, files_total = job.files_indexed, job.files_total
+        config_path = Path(job.config_path) if job.config_path else None
+        job.status = "pending"
+        job.error_message = None
+        job.control_request = None
+        await notify_job_event(session, job_uuid, "pending")
+        try:
+            await session.commit()
+        except IntegrityError as e:
+            raise ValueError(
+                f"Another indexing job is active for {repo_path}; "
+                "wait for it to finish before resuming"
+            ) from e
+
+    _dispatch(
+        ScheduledJob(
+            job_id=job_uuid,
+            repo_path=repo_path,
+            project_id=project_id,
+            config_path=config_path,
+            force_reindex=force_reindex,
+            resume=True,
+        )
+    )
+
+    logger.info(
+        f"Indexing job resumed: {job_id}",
+        extra={
+            "context": {
+                "job_id": job_id,
+                "project_id": project_id,
+                "files_indexed": files_indexed,
+                "files_total": files_total,
+            }
+        },
+    )
+
+    if ctx:
+        await ctx.info(f"Indexing job {job_id} resumed from checkpoint")
+
+    return {
+        "job_id": job_id,
+        "status": "pending",
+        "message": "Indexing job resumed",
+        "files_indexed": files_indexed,
+        "files_total": files_total,
+    }
+
+
+async def _stop_job(job_id: str, action: Literal["cancel", "pause"]) -> dict[str, Any]:
+    """Cancel or pause a job; running jobs stop at their next batch boundary.
+
+    Raises:
+        ValueError: If job_id is invalid, not found or already finished
+    """
+    try:
+        job_uuid = UUID(job_id)
+    except ValueError as e:
+        raise ValueError(f"Invalid job_id format: {job_id}") from e
+
+    stopped_status = "cancelled" if action == "cancel" else "paused"
+    # Row lock: a standalone worker claiming the job concurrently either
+    # finishes its claim first (job is running) or sees the new status
+    async with JobsSessionLocal() as session:
+        job = await session.get(IndexingJob, job_uuid, with_for_update=True)
+        if job is None:
             raise ValueError(f"Job not found: {job_id}")
+        if job.status in TERMINAL_STATES:
+            raise ValueError(f"Job already {job.status}: {job_id}")
+        if job.status == "paused" and action == "pause":
+            raise ValueError(f"Job already paused: {job_id}")
+
+        if job.status == "running":
+            # The worker running the job stops after its current batch
+            job.control_request = action
+            status, message = "running", (
+                f"{action.capitalize()} requested; the job stops after its current file batch"
+            )
+        else:
+            # Pending (queued) or paused: nothing is running, stop right away
+            get_indexing_scheduler().withdraw(job_uuid)
+            job.status = stopped_status
+            job.control_request = None
+            if action == "cancel":
+                job.checkpoint = None
+                job.completed_at = datetime.now()
+            job.status_message = (
+                f"{stopped_status.capitalize()} before indexing "
+                f"{'started' if job.started_at is None else 'resumed'}"
+            )
+            status, message = stopped_status, f"Indexing job {stopped_status}"
+        await notify_job_event(session, job_uuid, job.status)
+        await session.commit()
+
+    # Jobs running in this process are told at once (others via heartbeat);
+    # a job dequeued just before withdraw() is caught at its first batch
+    request_control(job_uuid, action)
+
+    logger.info(
+        f"Indexing job {action} requested: {job_id}",
+        extra={"context": {"job_id": job_id, "action": action, "status": status}},
+    )
+    return {"job_id": job_id, "status": status, "message": message}
+
+
+@mcp.tool()
+async def cancel_indexing_job(
+    job_id: str,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Cancel a background indexing job.
 
-        # Convert to dict
-        return {
-            "job_id": str(job.id),
-            "status": job.status,
-            "status_message": job.status_message,
-            "repo_path": job.repo_path,
-            "project_id": job.project_id,
-            "files_indexed": job.files_indexed,
-            "chunks_created": job.chunks_created,
-            "force_reindex": job.force_reindex,
-            "error_message": job.error_message,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
-            "started_at": job.started_at.isoformat() if job.started_at else None,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+    Queued and paused jobs are cancelled immediately. A running job finishes
+    its current file batch (at most FILE_BATCH_SIZE files), then releases its
+    database session and stops sending embedding requests; its status
+    becomes "cancelled". Batches committed before that stay indexed; an
+    unfinished force re-index never replaces the live index.
+
+    Args:
+        job_id: UUID of the indexing job
+        ctx: FastMCP Context for logging
+
+    Returns:
+        {
+            "job_id": "uuid",
+            "status": "running",  # "cancelled" if it was not running
+            "message": "Cancel requested; the job stops after its current file batch"
+        }
+
+    Raises:
+        ValueError: If job_id is invalid, not found or already finished
+
+    Constitutional Compliance:
+        - Principle V: Production Quality (cooperative stop, no partial batches)
+        - Principle XI: FastMCP Foundation (@mcp.tool() decorator)
+
+    Example:
+        >>> await cancel_indexing_job(job_id="550e8400-...")
+        >>> status = await get_indexing_status(job_id="550e8400-...", wait_seconds=30)
+        >>> status["status"]
+        'cancelled'
+    """
+    result = await _stop_job(job_id, "cancel")
+    if ctx:
+        await ctx.info(result["message"])
+    return result
+
+
+@mcp.tool()
+async def pause_indexing_job(
+    job_id: str,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Pause a background indexing job (resume it with resume_indexing_job).
+
+    Queued jobs are paused immediately. A running job finishes its current
+    file batch, then releases its database session and embedding capacity;
+    its status becomes "paused" and its checkpoint is kept, so resuming
+    continues where it stopped.
+
+    Args:
+        job_id: UUID of the indexing job
+        ctx: FastMCP Context for logging
+
+    Returns:
+        {
+            "job_id": "uuid",
+            "status": "running",  # "paused" if it was not running
+            "message": "Pause requested; the job stops after its current file batch"
         }
 
+    Raises:
+        ValueError: If job_id is invalid, not found, finished or already paused
+
+    Constitutional Compliance:
+        - Principle V: Production Quality (cooperative stop, resumable)
+        - Principle XI: FastMCP Foundation (@mcp.tool() decorator)
+    """
+    result = await _stop_job(job_id, "pause")
+    if ctx:
+        await ctx.info(result["message"])
+    return result
+
 
 __all__ = [
     "start_indexing_background",
     "get_indexing_status",
+    "resume_indexing_job",
+    "cancel_indexing_job",
+    "pause_indexing_job",
 ]
@@ -8,6 +8,7 @@ Model Organization:
 - repository: Repository entity and schemas
 - code_file: CodeFile entity and schemas
 - code_chunk: CodeChunk entity with pgvector embeddings and schemas
+- embedding_queue: EmbeddingQueueItem (chunks awaiting embeddings)
 - project_identifier: Validated project identifier for multi-workspace support
 - workflow_context: WorkflowIntegrationContext for workflow-mcp integration
 - health: Health check response and connection pool statistics models
@@ -40,6 +41,8 @@ from .code_file import CodeFile, CodeFileResponse
 # CodeChunk models and schemas with pgvector
 from .code_chunk import CodeChunk, CodeChunkCreate, CodeChunkResponse
 
+from .embedding_queue import EmbeddingQueueItem
+
 # Analytics models (non-essential tracking)
 from .analytics import ChangeEvent, EmbeddingMetadata
 
@@ -83,6 +86,7 @@ __all__ = [
     "CodeChunk",
     "CodeChunkCreate",
     "CodeChunkResponse",
+    "EmbeddingQueueItem",
     # Analytics
     "ChangeEvent",
     "EmbeddingMetadata",
@@ -41,7 +41,13 @@ class CodeChunk(Base):
     Relationships:
         - code_file: Many-to-one with CodeFile
 
+    Partitioning:
+        - repository_id is denormalized from code_files so that the optional
+          partitioned layout (LIST partitions per repository) can prune
+          repository-scoped searches to a single partition and HNSW index
+
     Indexes:
+        - repository_id: B-tree index for repository-scoped search
         - embedding: HNSW index for fast similarity search
             - Distance: Cosine (vector_cosine_ops)
             - Parameters: m=16, ef_construction=64
@@ -52,6 +58,11 @@ class CodeChunk(Base):
         - class: Class definition
         - block: Logical code block (if/for/try, etc.)
 
+    Generations:
+        - generation: Index build the chunk belongs to; search only returns
+          chunks of the repository's active_generation, so a full reindex
+          can build the next generation without disturbing live results
+
     Embedding:
         - Model: nomic-embed-text (Ollama)
         - Dimensions: 768
@@ -70,6 +81,10 @@ class CodeChunk(Base):
         UUID(as_uuid=True), ForeignKey("code_files.id"), nullable=False
     )
 
+    # Owning repository (denormalized from code_files; LIST partition key when
+    # code_chunks uses the partitioned layout)
+    repository_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+
     # Project isolation field
     project_id: Mapped[str] = mapped_column(String(50), nullable=False)
 
@@ -81,6 +96,11 @@ class CodeChunk(Base):
         String, nullable=False
     )  # function|class|block
 
+    # Index build generation (see Repository.active_generation)
+    generation: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+
     # Vector embedding (768 dimensions for nomic-embed-text)
     embedding: Mapped[Vector | None] = mapped_column(Vector(768), nullable=True)
 
@@ -94,6 +114,7 @@ class CodeChunk(Base):
 
     # Table-level constraints
     __table_args__ = (
+        Index("idx_code_chunks_repository", "repository_id"),
         Index(
             "ix_chunks_embedding_cosine",
             "embedding",
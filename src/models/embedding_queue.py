@@ -0,0 +1,68 @@
+"""EmbeddingQueueItem model for deferred and retried embedding work.
+
+Represents one code chunk whose embedding still has to be generated. Rows are
+written by the indexer (every chunk in deferred mode, failed batches in inline
+mode) and consumed by embedding queue workers.
+
+Entity Responsibilities:
+- Record chunks awaiting an embedding (one row per chunk)
+- Track retry attempts, backoff (available_at) and the last error
+- Disappear once the chunk's embedding has been written
+
+Queue States (derived, no status column):
+- ready: attempts < max attempts and available_at <= now()
+- backing off: attempts < max attempts and available_at > now()
+- parked: attempts >= max attempts (kept for inspection, never claimed)
+
+Constitutional Compliance:
+- Principle V: Production quality (no silently missing embeddings)
+- Principle VIII: Type safety (full Mapped[] annotations)
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .database import Base
+
+
+class EmbeddingQueueItem(Base):
+    """SQLAlchemy model for pending chunk embeddings.
+
+    Table: embedding_queue
+
+    Claiming:
+        Workers select ready rows with FOR UPDATE SKIP LOCKED, so any number
+        of workers (in any number of processes) share the queue without
+        double-processing a chunk. A worker that dies releases its rows when
+        its transaction rolls back.
+
+    Notes:
+        - chunk_id is not a foreign key: with the partitioned code_chunks
+          layout, chunk ids are unique only together with repository_id.
+          Workers delete rows whose chunk no longer exists.
+    """
+
+    __tablename__ = "embedding_queue"
+
+    # Chunk awaiting an embedding (primary key: at most one row per chunk)
+    chunk_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    project_id: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    # Retry tracking
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (Index("idx_embedding_queue_available", "available_at"),)
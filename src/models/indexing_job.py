@@ -6,13 +6,18 @@ Entity Responsibilities:
 - Track background indexing job status and progress
 - Store job metadata (repo path, project ID, error messages)
 - Record indexing metrics (files indexed, chunks created)
+- Record per-batch checkpoints so interrupted jobs can be resumed
+- Record live progress (rate, ETA) and per-stage durations
+- Record worker heartbeats so orphaned jobs can be recovered
 - Maintain job lifecycle timestamps (started, completed)
 
 Job Status States:
 - pending: Job created but not started
 - running: Job actively processing
+- paused: Job stopped on request, resumable from its checkpoint
 - completed: Job finished successfully
 - failed: Job encountered error and stopped
+- cancelled: Job stopped on request
 
 Constitutional Compliance:
 - Principle V: Production quality (path validation, error handling)
@@ -25,10 +30,11 @@ import os
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, CheckConstraint, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
@@ -41,16 +47,41 @@ class IndexingJob(Base):
 
     Constraints:
         - id: Primary key (UUID)
-        - status: Must be one of: pending, running, completed, failed
+        - status: Must be one of: pending, running, paused, completed,
+          failed, cancelled
+        - At most one pending/running job per (project_id, repo_path);
+          duplicate requests are coalesced into the active job
 
     Lifecycle:
         1. pending: Job created, not started
         2. running: Worker processing repository
-        3. completed/failed: Terminal states with metrics
+        3. completed/failed/cancelled: Terminal states with metrics
+        (paused: stopped on request until resume_indexing_job)
+
+    Controls:
+        - control_request: "cancel" or "pause" requested for a running job;
+          the worker stops at the next file batch boundary
 
     Metrics:
         - files_indexed: Number of files processed
         - chunks_created: Number of code chunks created
+
+    Checkpoints:
+        - checkpoint: Last IndexCheckpoint (repository, generation, files
+          done/total, batches done), written after every committed batch
+        - A failed or interrupted job is resumed from its checkpoint
+
+    Progress:
+        - progress: Last IndexProgress (files chunked, chunks embedded and
+          persisted, rate, ETA), reported every few seconds while running
+        - stage_durations: Seconds spent per indexing stage, written when
+          the job finishes
+
+    Heartbeats:
+        - heartbeat_at: Refreshed periodically by the worker running the job
+        - recovery_count: Times the job was re-queued after its worker died
+        - Pending/running jobs without a recent heartbeat are recovered at
+          server startup (see src.services.job_recovery)
     """
 
     __tablename__ = "indexing_jobs"
@@ -63,6 +94,7 @@ class IndexingJob(Base):
     # Core fields
     repo_path: Mapped[str] = mapped_column(Text, nullable=False)
     project_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    config_path: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Job status and error tracking
     status: Mapped[str] = mapped_column(
@@ -70,11 +102,29 @@ class IndexingJob(Base):
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     status_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    control_request: Mapped[str | None] = mapped_column(String(20), nullable=True)
 
     # Indexing metrics
     files_indexed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     chunks_created: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
+    # Progress checkpoint (updated after every committed file batch)
+    files_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    checkpoint: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    checkpoint_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Live progress and timing breakdown
+    progress: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    stage_durations: Mapped[dict[str, float] | None] = mapped_column(JSONB, nullable=True)
+
+    # Liveness (refreshed by the worker while the job runs)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    recovery_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
     # Force reindex flag
     force_reindex: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
@@ -89,6 +139,21 @@ class IndexingJob(Base):
         DateTime(timezone=True), default=datetime.utcnow, nullable=False
     )
 
+    # Table-level constraints
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'running', 'paused', 'completed', 'failed', 'cancelled')",
+            name="ck_indexing_jobs_status",
+        ),
+        Index(
+            "uq_indexing_jobs_active_repo",
+            "project_id",
+            "repo_path",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
 
 # Pydantic Schemas
 
@@ -167,13 +232,26 @@ class IndexingJobResponse(BaseModel):
     """
 
     job_id: uuid.UUID = Field(alias="id", description="Unique job identifier")
-    status: str = Field(description="Job status: pending, running, completed, failed")
+    status: str = Field(
+        description="Job status: pending, running, paused, completed, failed, cancelled"
+    )
     repo_path: str = Field(description="Repository path being indexed")
     project_id: str = Field(description="Project workspace identifier")
     error_message: str | None = Field(None, description="Error message if failed")
     status_message: str | None = Field(None, description="Human-readable status message")
+    control_request: str | None = Field(
+        None, description="Pending cancel/pause request of a running job"
+    )
     files_indexed: int = Field(0, description="Number of files processed")
     chunks_created: int = Field(0, description="Number of code chunks created")
+    files_total: int | None = Field(None, description="Files to index (known after scanning)")
+    checkpoint_at: datetime | None = Field(None, description="Last checkpoint timestamp")
+    progress: dict[str, Any] | None = Field(None, description="Live progress (rate, ETA)")
+    stage_durations: dict[str, float] | None = Field(
+        None, description="Seconds spent per indexing stage"
+    )
+    heartbeat_at: datetime | None = Field(None, description="Last worker heartbeat timestamp")
+    recovery_count: int = Field(0, description="Times the job was recovered after a crash")
     force_reindex: bool = Field(False, description="Whether full re-index was requested")
     started_at: datetime | None = Field(None, description="Job start timestamp")
     completed_at: datetime | None = Field(None, description="Job completion timestamp")
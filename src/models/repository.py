@@ -19,7 +19,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -46,6 +46,9 @@ class Repository(Base):
     State Management:
         - is_active: Controls whether repository is included in indexing
         - last_indexed_at: Timestamp of most recent successful indexing run
+        - active_generation: Chunk generation served by search; a full
+          reindex builds generation + 1 alongside it and switches this
+          pointer when the build is complete
     """
 
     __tablename__ = "repositories"
@@ -66,6 +69,9 @@ class Repository(Base):
         DateTime, nullable=True
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    active_generation: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
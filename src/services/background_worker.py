@@ -1,16 +1,23 @@
 """Background indexing worker for non-blocking repository indexing.
 
 Simple state machine: pending → running → completed/failed
-No progress callbacks - binary state only.
+Running jobs record a checkpoint after every committed file batch, so a
+failed or interrupted job can be resumed where it stopped, and refresh a
+heartbeat so jobs orphaned by a dead process can be recovered at startup.
+Jobs run on the server's scheduler (job_scheduler.py) or, with
+INDEXING_ENQUEUE_ONLY, in standalone worker processes (indexing_worker.py).
 
 Constitutional Compliance:
-- Principle I: Simplicity (reuses existing indexer, no callbacks)
+- Principle I: Simplicity (reuses existing indexer)
 - Principle V: Production Quality (error handling, logging)
 - Principle VIII: Type Safety (full type hints)
 
 Worker Responsibilities:
 - Update job status through state machine
-- Call existing index_repository service (NO modifications)
+- Call existing index_repository service
+- Record per-batch checkpoints (files done/total, chunk generation)
+- Refresh the job heartbeat while indexing runs
+- Notify long-polling clients of every job update (LISTEN/NOTIFY)
 - Capture errors and update job status
 - Use structured logging with context
 - Handle all exception types gracefully
@@ -19,6 +26,7 @@ State Machine:
 1. pending → running: Job starts processing
 2. running → completed: Indexing succeeds
 3. running → failed: Indexing encounters error
+4. failed/interrupted → pending → running: Job resumed from its checkpoint
 
 Error Handling:
 - Catch ALL exceptions (never crash)
@@ -29,6 +37,7 @@ Error Handling:
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import datetime
 from pathlib import Path
@@ -37,23 +46,61 @@ from uuid import UUID
 
 from fastmcp import Context
 
-from src.database.session import get_session, engine
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.database.session import JobsSessionLocal, get_session
+from sqlalchemy import select, func, update
 from src.mcp.mcp_logging import get_logger
 from src.models.indexing_job import IndexingJob
 from src.models.code_file import CodeFile
 from src.models.repository import Repository
-from src.services.indexer import index_repository
+from src.services.indexer import IndexCheckpoint, IndexProgress, IndexResult, index_repository
+from src.services.job_store import get_job_store
 
 logger = get_logger(__name__)
 
+# Jobs executing in this process (anything else marked running was interrupted)
+_active_jobs: set[UUID] = set()
+
+# Cancel/pause requests of jobs executing in this process (job_id -> action)
+_control_requests: dict[UUID, str] = {}
+
+
+def is_job_active(job_id: UUID) -> bool:
+    """Check whether job_id is being executed by a worker in this process."""
+    return job_id in _active_jobs
+
+
+def request_control(job_id: UUID, action: str) -> bool:
+    """Ask a job running in this process to stop at the next batch boundary.
+
+    Jobs running elsewhere pick up indexing_jobs.control_request with their
+    next heartbeat instead.
+
+    Args:
+        job_id: UUID of indexing_jobs row
+        action: "cancel" or "pause"
+
+    Returns:
+        True if the job is running in this process
+    """
+    if job_id not in _active_jobs:
+        return False
+    # A cancel overrides an earlier pause, never the other way round
+    if _control_requests.get(job_id) != "cancel":
+        _control_requests[job_id] = action
+    return True
+
 
 async def update_job(
     job_id: UUID,
     **updates: Any,
 ) -> None:
-    """Update job fields atomically in main database.
+    """Update job fields through the write-behind job status store.
+
+    Status changes are written immediately; progress-only updates are
+    buffered and written in batches (JOB_STATUS_FLUSH_INTERVAL). Every write
+    sends a job event (NOTIFY) in the same transaction, waking clients that
+    long-poll get_indexing_status.
 
     Args:
         job_id: UUID of indexing_jobs row
@@ -68,20 +115,112 @@ async def update_job(
         ...     completed_at=datetime.now()
         ... )
     """
-    async with AsyncSession(engine) as session:
-        job = await session.get(IndexingJob, job_id)
-        if job is None:
-            logger.warning(f"Job {job_id} not found for update")
-            return
+    await get_job_store().update(job_id, **updates)
+
+
+async def record_checkpoint(job_id: UUID, checkpoint: IndexCheckpoint) -> None:
+    """Persist indexing progress after a committed file batch.
+
+    Failures are logged, not raised: a missed checkpoint only means a
+    resumed job repeats a little more work.
+
+    Args:
+        job_id: UUID of indexing_jobs row
+        checkpoint: Progress reported by index_repository
+    """
+    try:
+        await update_job(
+            job_id=job_id,
+            files_indexed=checkpoint.files_done,
+            files_total=checkpoint.files_total,
+            chunks_created=checkpoint.chunks_created,
+            checkpoint=checkpoint.model_dump(mode="json"),
+            checkpoint_at=datetime.now(),
+            status_message=(
+                f"Indexing in progress: {checkpoint.files_done}/{checkpoint.files_total} "
+                f"files, {checkpoint.chunks_created} chunks"
+            ),
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to record checkpoint for job {job_id}",
+            extra={"context": {"job_id": str(job_id), "error": str(e)}},
+        )
+
+
+def _format_progress(progress: IndexProgress) -> str:
+    """Human-readable progress line (status_message of a running job)."""
+    message = (
+        f"Indexing in progress ({progress.stage}): {progress.files_done}/"
+        f"{progress.files_total} files, {progress.chunks_persisted} chunks, "
+        f"{progress.files_per_second:.1f} files/s"
+    )
+    if progress.eta_seconds is not None:
+        minutes, seconds = divmod(int(progress.eta_seconds), 60)
+        message += f", ETA {minutes}m {seconds:02d}s"
+    return message
 
-        # Apply updates
-        for key, value in updates.items():
-            if hasattr(job, key):
-                setattr(job, key, value)
-            else:
-                logger.warning(f"Invalid field for job update: {key}")
 
+async def record_progress(job_id: UUID, progress: IndexProgress) -> None:
+    """Report live indexing progress (buffered by the job status store).
+
+    Failures are logged, not raised: progress is informational only.
+
+    Args:
+        job_id: UUID of indexing_jobs row
+        progress: Progress reported by index_repository
+    """
+    try:
+        await update_job(
+            job_id=job_id,
+            files_total=progress.files_total,
+            progress=progress.model_dump(mode="json"),
+            status_message=_format_progress(progress),
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to record progress for job {job_id}",
+            extra={"context": {"job_id": str(job_id), "error": str(e)}},
+        )
+
+
+async def send_heartbeat(job_id: UUID) -> str | None:
+    """Mark a running job as alive (database clock, so hosts can differ).
+
+    Args:
+        job_id: UUID of indexing_jobs row
+
+    Returns:
+        Cancel/pause request recorded for the job, if any
+    """
+    async with JobsSessionLocal() as session:
+        result = await session.execute(
+            update(IndexingJob)
+            .where(IndexingJob.id == job_id, IndexingJob.status == "running")
+            .values(heartbeat_at=func.now())
+            .returning(IndexingJob.control_request)
+        )
         await session.commit()
+        return result.scalar_one_or_none()
+
+
+async def _heartbeat_loop(job_id: UUID, interval: float) -> None:
+    """Send heartbeats until cancelled; failures are logged and retried.
+
+    Control requests returned by the heartbeat reach jobs whose cancel/pause
+    was requested through another process.
+    """
+    while True:
+        try:
+            action = await send_heartbeat(job_id)
+            if action in ("cancel", "pause"):
+                request_control(job_id, action)
+        except Exception as e:
+            logger.warning(
+                f"Failed to send heartbeat for job {job_id}",
+                extra={"context": {"job_id": str(job_id), "error": str(e)}},
+            )
+        await asyncio.sleep(interval)
 
 
 async def get_available_databases(prefix: str = "cb_proj_") -> list[str]:
@@ -171,17 +310,61 @@ async def generate_database_suggestion(error_message: str, project_id: str | Non
     return msg
 
 
+async def _finish_stopped_job(job_id: UUID, action: str, result: IndexResult) -> None:
+    """Record a job that stopped at a batch boundary on request.
+
+    Paused jobs keep their checkpoint (resume_indexing_job continues them);
+    cancelled jobs drop it.
+
+    Args:
+        job_id: UUID of indexing_jobs row
+        action: "cancel" or "pause"
+        result: Result of the stopped index_repository run
+    """
+    progress = f"{result.files_indexed} files, {result.chunks_created} chunks"
+    if action == "pause":
+        await update_job(
+            job_id=job_id,
+            status="paused",
+            control_request=None,
+            status_message=f"Paused after {progress}; resume with resume_indexing_job",
+            stage_durations=result.stage_seconds,
+        )
+    else:
+        await update_job(
+            job_id=job_id,
+            status="cancelled",
+            control_request=None,
+            checkpoint=None,
+            status_message=f"Cancelled after {progress}",
+            stage_durations=result.stage_seconds,
+            completed_at=datetime.now(),
+        )
+    logger.info(
+        f"Job {job_id} stopped on request ({action})",
+        extra={
+            "context": {
+                "job_id": str(job_id),
+                "action": action,
+                "files_indexed": result.files_indexed,
+            }
+        },
+    )
+
+
 async def _background_indexing_worker(
     job_id: UUID,
     repo_path: str,
     project_id: str,
     config_path: Path | None = None,
     force_reindex: bool = False,
+    resume: bool = False,
 ) -> None:
     """Background worker that executes indexing and updates PostgreSQL.
 
     Simple state machine: pending → running → completed/failed
-    No progress callbacks - binary state only.
+    (paused/cancelled when stopped on request at a file batch boundary)
+    Progress is checkpointed after every committed file batch.
 
     Args:
         job_id: UUID of indexing_jobs row
@@ -191,6 +374,9 @@ async def _background_indexing_worker(
                      If provided, worker will attempt to auto-create project database.
                      If None, worker uses existing database or default database.
         force_reindex: If True, re-index all files regardless of changes (default: False)
+        resume: Continue from the job's last checkpoint. Incremental jobs skip
+                files committed before the interruption (they are no longer
+                changed); a full reindex continues its chunk generation.
 
     Bug Fix:
         Resolves Bug 2 - Background indexing auto-creation failure.
@@ -217,16 +403,33 @@ async def _background_indexing_worker(
                 "job_id": str(job_id),
                 "project_id": project_id,
                 "force_reindex": force_reindex,
+                "resume": resume,
             }
         },
     )
 
+    _active_jobs.add(job_id)
+    heartbeat: asyncio.Task[None] | None = None
     try:
-        # 1. Update status to running
-        await update_job(
-            job_id=job_id,
-            status="running",
-            started_at=datetime.now(),
+        # 1. Update status to running (a resumed job keeps its started_at)
+        resume_generation: int | None = None
+        if resume:
+            # Through the store: a checkpoint still buffered here is the latest
+            job_values = await get_job_store().load(job_id)
+            checkpoint = job_values.get("checkpoint") if job_values else None
+            if checkpoint:
+                resume_generation = checkpoint.get("generation")
+            await update_job(
+                job_id=job_id, status="running", error_message=None, completed_at=None
+            )
+        else:
+            await update_job(
+                job_id=job_id,
+                status="running",
+                started_at=datetime.now(),
+            )
+        heartbeat = asyncio.create_task(
+            _heartbeat_loop(job_id, get_settings().job_heartbeat_interval)
         )
 
         # 1.5. Auto-create project database if config provided (Bug 2 fix)
@@ -239,7 +442,14 @@ async def _background_indexing_worker(
                 logger.warning(f"Auto-creation failed: {e}, attempting indexing anyway")
                 # Continue - database might exist, or get_session will fail below
 
-        # 2. Run existing indexer (NO MODIFICATIONS to indexer.py!)
+        # 2. Run indexer (checkpointing after every committed batch,
+        # reporting progress every few seconds)
+        async def on_checkpoint(checkpoint: IndexCheckpoint) -> None:
+            await record_checkpoint(job_id, checkpoint)
+
+        async def on_progress(progress: IndexProgress) -> None:
+            await record_progress(job_id, progress)
+
         async with get_session(project_id=project_id, ctx=None) as session:
             result = await index_repository(
                 repo_path=Path(repo_path),
@@ -247,8 +457,20 @@ async def _background_indexing_worker(
                 db=session,
                 project_id=project_id,
                 force_reindex=force_reindex,
+                resume_generation=resume_generation,
+                on_checkpoint=on_checkpoint,
+                on_progress=on_progress,
+                should_stop=lambda: job_id in _control_requests,
             )
 
+        # 2.5. Stopped on request (cancel/pause): resources are released here,
+        # the session is closed and no further batches are started
+        if result.status == "stopped":
+            await _finish_stopped_job(
+                job_id, _control_requests.get(job_id, "cancel"), result
+            )
+            return
+
         # 3. Check if indexing succeeded by inspecting result.status
         if result.status == "failed":
             # Indexer reported failure - extract error message
@@ -269,6 +491,7 @@ async def _background_indexing_worker(
                 job_id=job_id,
                 status="failed",
                 error_message=error_message,
+                stage_durations=result.stage_seconds,
                 completed_at=datetime.now(),
             )
             return  # Exit early - do not proceed to "completed" update
@@ -311,6 +534,9 @@ async def _background_indexing_worker(
                 # Incremental update - some files changed
                 status_message = f"Incremental update completed: {result.files_indexed} files updated"
 
+        if result.embeddings_queued:
+            status_message += f" ({result.embeddings_queued} chunk embeddings queued)"
+
         # 6. Update to completed with results and status message
         await update_job(
             job_id=job_id,
@@ -318,6 +544,7 @@ async def _background_indexing_worker(
             files_indexed=result.files_indexed,
             chunks_created=result.chunks_created,
             status_message=status_message,
+            stage_durations=result.stage_seconds,
             completed_at=datetime.now(),
         )
 
@@ -329,6 +556,7 @@ async def _background_indexing_worker(
                     "files_indexed": result.files_indexed,
                     "chunks_created": result.chunks_created,
                     "status_message": status_message,
+                    "stage_seconds": result.stage_seconds,
                     "force_reindex": force_reindex,
                 }
             },
@@ -398,10 +626,32 @@ async def _background_indexing_worker(
                 extra={"context": {"error": str(update_error)}},
             )
 
+    finally:
+        if heartbeat is not None:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+        _active_jobs.discard(job_id)
+        _control_requests.pop(job_id, None)
+
 
 __all__ = [
     "_background_indexing_worker",
+    "is_job_active",
+    "record_checkpoint",
+    "record_progress",
+    "request_control",
+    "send_heartbeat",
     "update_job",
     "get_available_databases",
     "generate_database_suggestion",
 ]
+
+
+if __name__ == "__main__":
+    # Standalone worker: python -m src.services.background_worker
+    from src.services.indexing_worker import main
+
+    main()
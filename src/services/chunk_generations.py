@@ -0,0 +1,185 @@
+"""Chunk generations for atomic full reindexes.
+
+A full reindex (force_reindex=True) writes its chunks as generation
+active_generation + 1 next to the live chunks instead of deleting them first.
+Search only returns chunks of the repository's active_generation, so it keeps
+serving the previous index at full speed while the new one is built. The
+indexer switches repositories.active_generation in the transaction that
+stores the last chunk, then the superseded generation is deleted in small
+batches in the background.
+
+Constitutional Compliance:
+- Principle IV: Performance (no large DELETE on the search path)
+- Principle V: Production quality (consistent search results during reindex)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Generation States:
+- generation == active_generation: live, returned by search
+- generation > active_generation: build in progress (or interrupted build,
+  discarded when the next full reindex or incremental run starts)
+- generation < active_generation: superseded, garbage-collected
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any, Final, cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.connection_pool.priority import WorkPriority, priority_scope
+from src.database.session import get_session
+from src.mcp.mcp_logging import get_logger
+from src.models import CodeChunk, CodeFile, Repository
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Chunks deleted per garbage collection transaction (keeps locks short)
+GC_BATCH_SIZE: Final[int] = 5000
+
+# modified_at of files whose stored chunks are not current (re-detected as modified)
+STALE_MODIFIED_AT: Final[datetime] = datetime(1970, 1, 1)
+
+# Running garbage collection tasks (strong references until they finish)
+_gc_tasks: set[asyncio.Task[int]] = set()
+
+
+# ==============================================================================
+# Generation Management
+# ==============================================================================
+
+
+async def discard_unfinished_generations(db: AsyncSession, repository: Repository) -> int:
+    """Delete chunks of interrupted builds (generation above the active one).
+
+    An interrupted build has already stored the file metadata of its
+    committed batches, so those files would look unchanged to the next
+    incremental run while search still serves their previous chunks (or,
+    for files new in that build, none). Files indexed since the last
+    finished run are therefore marked stale along with the discard, and
+    the next change detection picks them up again.
+
+    Args:
+        db: Session of the project database (caller commits)
+        repository: Repository about to start a new build or incremental run
+
+    Returns:
+        Number of chunks deleted
+    """
+    result = cast(
+        CursorResult[Any],
+        await db.execute(
+            delete(CodeChunk).where(
+                CodeChunk.repository_id == repository.id,
+                CodeChunk.generation > repository.active_generation,
+            )
+        ),
+    )
+    discarded = result.rowcount or 0
+    if discarded:
+        touched = [CodeFile.repository_id == repository.id]
+        if repository.last_indexed_at is not None:
+            touched.append(CodeFile.indexed_at > repository.last_indexed_at)
+        await db.execute(update(CodeFile).where(*touched).values(modified_at=STALE_MODIFIED_AT))
+        logger.info(
+            f"Discarded {discarded} chunks of an unfinished index build",
+            extra={"context": {"repository_id": str(repository.id), "chunk_count": discarded}},
+        )
+    return discarded
+
+
+async def collect_stale_generations(
+    project_id: str, repository_id: UUID, batch_size: int = GC_BATCH_SIZE
+) -> int:
+    """Delete chunks of superseded generations, one batch per transaction.
+
+    Args:
+        project_id: Project workspace identifier
+        repository_id: Repository whose old generations are removed
+        batch_size: Chunks deleted per transaction
+
+    Returns:
+        Number of chunks deleted
+    """
+    active = (
+        select(Repository.active_generation)
+        .where(Repository.id == repository_id)
+        .scalar_subquery()
+    )
+    stale_ids = (
+        select(CodeChunk.id)
+        .where(CodeChunk.repository_id == repository_id, CodeChunk.generation < active)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+
+    total = 0
+    while True:
+        async with get_session(project_id=project_id) as db:
+            result = cast(
+                CursorResult[Any],
+                await db.execute(
+                    delete(CodeChunk).where(
+                        CodeChunk.repository_id == repository_id, CodeChunk.id.in_(stale_ids)
+                    )
+                ),
+            )
+        deleted = result.rowcount or 0
+        total += deleted
+        if deleted < batch_size:
+            break
+        await asyncio.sleep(0)  # Let searches and indexing interleave
+
+    logger.info(
+        f"Garbage-collected {total} chunks of superseded generations",
+        extra={"context": {"repository_id": str(repository_id), "chunk_count": total}},
+    )
+    return total
+
+
+async def _collect_logged(project_id: str, repository_id: UUID) -> int:
+    """Run collect_stale_generations (at bulk priority), logging instead of raising."""
+    try:
+        with priority_scope(WorkPriority.BULK):
+            return await collect_stale_generations(project_id, repository_id)
+    except Exception as e:
+        # Left-over chunks are invisible to search; the next GC removes them
+        logger.error(
+            f"Chunk generation garbage collection failed: {e}",
+            extra={"context": {"repository_id": str(repository_id), "error": str(e)}},
+        )
+        return 0
+
+
+def schedule_generation_gc(project_id: str, repository_id: UUID) -> asyncio.Task[int]:
+    """Garbage-collect superseded generations in the background.
+
+    Args:
+        project_id: Project workspace identifier
+        repository_id: Repository whose active generation was just switched
+
+    Returns:
+        The background task (callers need not await it)
+    """
+    task = asyncio.create_task(_collect_logged(project_id, repository_id))
+    _gc_tasks.add(task)
+    task.add_done_callback(_gc_tasks.discard)
+    return task
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "collect_stale_generations",
+    "discard_unfinished_generations",
+    "schedule_generation_gc",
+]
@@ -10,23 +10,25 @@ Constitutional Compliance:
 
 Key Features:
 - AST-based semantic chunking for supported languages
-- Dynamic language grammar loading based on file extension
+- Lazy grammar loading (optional TypeScript, Go, Rust and Java grammars)
 - Fallback to line-based chunking for unsupported languages
-- Parser caching for performance
-- Target chunk size: 100-500 lines
+- Parser and chunk query caching for performance
+- Size-bounded chunks (split oversized nodes, merge small siblings)
+- Declarative per-language chunk queries (queries/<language>.scm)
 """
 
 from __future__ import annotations
 
 import asyncio
+import importlib
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Final
+from typing import Final, Union
 
-from tree_sitter import Language, Node, Parser, Tree
-import tree_sitter_python
-import tree_sitter_javascript
+from tree_sitter import Language, Node, Parser, Query, QueryCursor, Tree
 
+from src.config.settings import get_settings
 from src.mcp.mcp_logging import get_logger
 from src.models import CodeChunkCreate
 
@@ -37,21 +39,45 @@ from src.models import CodeChunkCreate
 logger = get_logger(__name__)
 
 # Language configurations
-# Note: TypeScript support can be added later with tree-sitter-typescript
 LANGUAGE_EXTENSIONS: Final[dict[str, str]] = {
     ".py": "python",
     ".js": "javascript",
     ".jsx": "javascript",
-    # ".ts": "typescript",  # TODO: Add when tree-sitter-typescript is available
-    # ".tsx": "tsx",        # TODO: Add when tree-sitter-typescript is available
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
 }
 
-# Node types to extract as chunks (by language)
+# Grammar registry: language -> (grammar module, language function).
+# Grammars are imported lazily on first use; python and javascript are core
+# dependencies, the others come with the optional "languages" extra. Files in
+# a language whose grammar is not installed use fallback line chunking.
+GRAMMAR_REGISTRY: Final[dict[str, tuple[str, str]]] = {
+    "python": ("tree_sitter_python", "language"),
+    "javascript": ("tree_sitter_javascript", "language"),
+    "typescript": ("tree_sitter_typescript", "language_typescript"),
+    "tsx": ("tree_sitter_typescript", "language_tsx"),
+    "go": ("tree_sitter_go", "language"),
+    "rust": ("tree_sitter_rust", "language"),
+    "java": ("tree_sitter_java", "language"),
+}
+
+# Directory holding per-language chunk queries (<language>.scm)
+QUERY_DIR: Final[Path] = Path(__file__).parent / "queries"
+
+# Node types to extract as chunks when no chunk query is available (by language)
 CHUNK_NODE_TYPES: Final[dict[str, set[str]]] = {
     "python": {"function_definition", "class_definition"},
     "javascript": {"function_declaration", "class_declaration", "method_definition"},
-    # "typescript": {"function_declaration", "class_declaration", "method_definition"},  # TODO
-    # "tsx": {"function_declaration", "class_declaration", "method_definition"},  # TODO
+    "typescript": {"function_declaration", "class_declaration", "method_definition"},
+    "tsx": {"function_declaration", "class_declaration", "method_definition"},
+    "go": {"function_declaration", "method_declaration"},
+    "rust": {"function_item", "impl_item"},
+    "java": {"class_declaration", "method_declaration", "constructor_declaration"},
 }
 
 # Fallback chunking parameters
@@ -59,6 +85,9 @@ FALLBACK_CHUNK_LINES: Final[int] = 500
 MIN_CHUNK_LINES: Final[int] = 10
 MAX_CHUNK_LINES: Final[int] = 1000
 
+# Approximate characters per token for source code (token-unit size limits)
+CHARS_PER_TOKEN: Final[int] = 4
+
 
 # ==============================================================================
 # Parser Cache
@@ -66,14 +95,19 @@ MAX_CHUNK_LINES: Final[int] = 1000
 
 
 class ParserCache:
-    """Caches Tree-sitter parsers for performance.
+    """Caches Tree-sitter grammars, parsers and compiled chunk queries.
 
-    Singleton pattern to avoid re-creating parsers for each file.
+    Singleton pattern to avoid re-creating parsers for each file. Grammars
+    from GRAMMAR_REGISTRY are imported on first use, so startup does not pay
+    for languages a repository never contains and optional grammars that are
+    not installed simply disable AST chunking for that language. Chunk
+    queries (queries/<language>.scm) are compiled once per language.
     """
 
     _instance: ParserCache | None = None
     _parsers: dict[str, Parser]
-    _languages: dict[str, Language]
+    _languages: dict[str, Language | None]
+    _queries: dict[str, Query | None]
 
     def __new__(cls) -> ParserCache:
         """Ensure singleton instance."""
@@ -81,33 +115,53 @@ class ParserCache:
             cls._instance = super().__new__(cls)
             cls._instance._parsers = {}
             cls._instance._languages = {}
-            cls._instance._initialize_languages()
+            cls._instance._queries = {}
         return cls._instance
 
-    def _initialize_languages(self) -> None:
-        """Initialize language grammars."""
-        try:
-            # Load Python grammar
-            self._languages["python"] = Language(tree_sitter_python.language())
-            logger.debug("Loaded Python grammar")
+    def get_language(self, language: str) -> Language | None:
+        """Get the grammar for language, loading it on first use.
 
-            # Load JavaScript grammar
-            self._languages["javascript"] = Language(tree_sitter_javascript.language())
-            logger.debug("Loaded JavaScript grammar")
+        The outcome is cached either way, so a missing grammar is imported
+        (and logged) only once.
 
-            # TODO: Add TypeScript support when tree-sitter-typescript is available
-            # self._languages["typescript"] = Language(
-            #     tree_sitter_typescript.language_typescript()
-            # )
-            # self._languages["tsx"] = Language(tree_sitter_typescript.language_tsx())
-            # logger.debug("Loaded TypeScript and TSX grammars")
+        Args:
+            language: Language name (e.g., "python", "go")
+
+        Returns:
+            Language instance or None if unknown or grammar not installed
+        """
+        if language in self._languages:
+            return self._languages[language]
+
+        entry = GRAMMAR_REGISTRY.get(language)
+        if entry is None:
+            return None
 
+        module_name, function_name = entry
+        grammar: Language | None = None
+        try:
+            module = importlib.import_module(module_name)
+            grammar = Language(getattr(module, function_name)())
+            logger.debug(f"Loaded {language} grammar")
+        except ImportError:
+            logger.info(
+                f"Grammar for {language} not installed, using fallback chunking",
+                extra={"context": {"language": language, "module": module_name}},
+            )
         except Exception as e:
             logger.error(
-                "Failed to initialize language grammars",
-                extra={"context": {"error": str(e)}},
+                f"Failed to load {language} grammar",
+                extra={
+                    "context": {
+                        "language": language,
+                        "module": module_name,
+                        "error": str(e),
+                    }
+                },
             )
-            raise
+
+        self._languages[language] = grammar
+        return grammar
 
     def get_parser(self, language: str) -> Parser | None:
         """Get parser for language.
@@ -122,20 +176,350 @@ class ParserCache:
         if language in self._parsers:
             return self._parsers[language]
 
-        # Create new parser if language is supported
-        if language not in self._languages:
+        # Create new parser if the grammar is available
+        grammar = self.get_language(language)
+        if grammar is None:
             return None
 
         parser = Parser()
-        parser.language = self._languages[language]
+        parser.language = grammar
         self._parsers[language] = parser
 
         logger.debug(f"Created parser for {language}")
         return parser
 
+    def get_query(self, language: str) -> Query | None:
+        """Get the compiled chunk query for language.
+
+        Compiles queries/<language>.scm on first use and caches the result
+        (including a missing or invalid query, so it is reported only once).
+
+        Args:
+            language: Language name (e.g., "python", "javascript")
+
+        Returns:
+            Compiled Query or None if no usable query exists for the language
+        """
+        if language in self._queries:
+            return self._queries[language]
+
+        query: Query | None = None
+        query_file = QUERY_DIR / f"{language}.scm"
+        grammar = self.get_language(language)
+        if grammar is not None and query_file.exists():
+            try:
+                query = Query(grammar, query_file.read_text())
+                logger.debug(f"Compiled chunk query for {language}")
+            except Exception as e:
+                logger.error(
+                    f"Failed to compile chunk query for {language}",
+                    extra={
+                        "context": {
+                            "language": language,
+                            "query_file": str(query_file),
+                            "error": str(e),
+                        }
+                    },
+                )
+
+        self._queries[language] = query
+        return query
+
     def clear(self) -> None:
-        """Clear parser cache (useful for testing)."""
+        """Clear grammar, parser and query caches (useful for testing)."""
+        self._languages.clear()
         self._parsers.clear()
+        self._queries.clear()
+
+
+# ==============================================================================
+# Chunk Size Policy
+# ==============================================================================
+
+
+@dataclass(frozen=True)
+class ChunkSizePolicy:
+    """Size limits applied to AST chunks.
+
+    Sizes are measured on the UTF-8 source span. With unit="tokens" limits are
+    converted using CHARS_PER_TOKEN, a conservative estimate for code.
+
+    Attributes:
+        max_size: Maximum chunk size; larger nodes are split at child boundaries
+        min_size: Chunks smaller than this are merged with adjacent siblings
+            (0 disables merging)
+        unit: "tokens" or "chars"
+    """
+
+    max_size: int = 1024
+    min_size: int = 64
+    unit: str = "tokens"
+
+    def __post_init__(self) -> None:
+        """Validate limits."""
+        if self.unit not in ("tokens", "chars"):
+            raise ValueError(f"Invalid chunk size unit: {self.unit}")
+        if self.max_size <= 0 or self.min_size < 0 or self.min_size >= self.max_size:
+            raise ValueError(
+                f"Invalid chunk size limits: min_size={self.min_size}, max_size={self.max_size}"
+            )
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum chunk size in bytes of source."""
+        return self.max_size * (CHARS_PER_TOKEN if self.unit == "tokens" else 1)
+
+    @property
+    def min_bytes(self) -> int:
+        """Merge threshold in bytes of source."""
+        return self.min_size * (CHARS_PER_TOKEN if self.unit == "tokens" else 1)
+
+    @classmethod
+    def from_settings(cls) -> ChunkSizePolicy:
+        """Build the policy from CHUNK_MAX_SIZE, CHUNK_MIN_SIZE and CHUNK_SIZE_UNIT."""
+        settings = get_settings()
+        return cls(
+            max_size=settings.chunk_max_size,
+            min_size=settings.chunk_min_size,
+            unit=settings.chunk_size_unit.value,
+        )
+
+
+@dataclass
+class _Span:
+    """Byte/line range of a chunk produced by the size policy.
+
+    Attributes:
+        parent: (start_byte, end_byte) of the syntactic parent; only spans
+            with the same parent are merged
+        context_type: Chunk type used when merging spans of different types
+    """
+
+    start_byte: int
+    end_byte: int
+    start_line: int
+    end_line: int
+    chunk_type: str
+    parent: tuple[int, int] | None
+    context_type: str
+
+    @property
+    def size(self) -> int:
+        """Span size in bytes."""
+        return self.end_byte - self.start_byte
+
+
+def _node_key(node: Node | None) -> tuple[int, int] | None:
+    """Identify a node by its byte range."""
+    return None if node is None else (node.start_byte, node.end_byte)
+
+
+def _node_span(
+    node: Node, chunk_type: str, parent: tuple[int, int] | None, context_type: str
+) -> _Span:
+    """Span covering a whole node."""
+    return _Span(
+        start_byte=node.start_byte,
+        end_byte=node.end_byte,
+        start_line=node.start_point[0] + 1,
+        end_line=node.end_point[0] + 1,
+        chunk_type=chunk_type,
+        parent=parent,
+        context_type=context_type,
+    )
+
+
+def _split_leaf_lines(
+    node: Node,
+    content_bytes: bytes,
+    chunk_type: str,
+    parent: tuple[int, int] | None,
+    max_bytes: int,
+) -> list[_Span]:
+    """Split an oversized node without children (e.g. a huge literal) at line breaks.
+
+    Consecutive lines are packed up to max_bytes; a single longer line is
+    kept whole.
+    """
+    # (start_byte, end_byte) of each line in the node, newline included
+    lines: list[tuple[int, int]] = []
+    start = node.start_byte
+    while start < node.end_byte:
+        newline = content_bytes.find(b"\n", start, node.end_byte)
+        end = node.end_byte if newline == -1 else newline + 1
+        lines.append((start, end))
+        start = end
+
+    spans: list[_Span] = []
+    first_line = node.start_point[0] + 1
+    i = 0
+    while i < len(lines):
+        j = i + 1
+        while j < len(lines) and lines[j][1] - lines[i][0] <= max_bytes:
+            j += 1
+        spans.append(
+            _Span(
+                start_byte=lines[i][0],
+                end_byte=lines[j - 1][1],
+                start_line=first_line + i,
+                end_line=first_line + j - 1,
+                chunk_type=chunk_type,
+                parent=parent,
+                context_type=chunk_type,
+            )
+        )
+        i = j
+    return spans
+
+
+_FitItem = Union[
+    tuple[Node, str, str, Union[tuple[int, int], None], Union["_Span", None]], _Span
+]
+
+
+def _bounded_spans(
+    nodes: list[tuple[Node, str]], content_bytes: bytes, policy: ChunkSizePolicy
+) -> list[_Span]:
+    """Apply a size policy to chunk candidates.
+
+    - Outermost candidates that fit are emitted whole; candidates nested inside
+      an emitted chunk are skipped (no overlapping duplicates)
+    - Oversized nodes are split at child boundaries: consecutive children are
+      packed up to max size and oversized children are split recursively
+    - Small pieces in front of an oversized child (e.g. decorators and a class
+      header before the class body) are carried into its first slice, which
+      is packed with room for them
+    - Adjacent small sibling spans (including the pieces of a split node,
+      e.g. a class header and its first methods) are merged while the result
+      still fits
+
+    Traversal uses an explicit stack, so deep nesting cannot exhaust the
+    Python stack.
+
+    Args:
+        nodes: (node, chunk_type) candidates in source pre-order
+        content_bytes: UTF-8 source the tree was parsed from
+        policy: Size limits
+
+    Returns:
+        Spans in source order
+    """
+    max_bytes = policy.max_bytes
+    min_bytes = policy.min_bytes
+    captured = {(node.start_byte, node.end_byte): chunk_type for node, chunk_type in nodes}
+    spans: list[_Span] = []
+    covered_end = -1
+
+    for node, chunk_type in nodes:
+        if node.start_byte < covered_end:
+            continue
+        covered_end = node.end_byte
+        # Pieces of a split node are all siblings of each other for merging
+        root_key = _node_key(node)
+
+        stack: list[_FitItem] = [(node, chunk_type, "block", _node_key(node.parent), None)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, _Span):
+                spans.append(item)
+                continue
+
+            # lead: small pieces preceding this node, to be prepended to its first slice
+            current, current_type, context_type, parent, lead = item
+            if current.end_byte - current.start_byte <= max_bytes:
+                if lead is not None:
+                    spans.append(lead)
+                spans.append(_node_span(current, current_type, parent, context_type))
+                continue
+            if current.child_count == 0:
+                if lead is not None:
+                    spans.append(lead)
+                spans.extend(
+                    _split_leaf_lines(current, content_bytes, current_type, root_key, max_bytes)
+                )
+                continue
+
+            # Split at child boundaries (items collected in order, pushed reversed)
+            items: list[_FitItem] = []
+            group: list[Node] = []
+
+            def take() -> _Span | None:
+                nonlocal lead
+                if not group:
+                    pending, lead = lead, None
+                    return pending
+                first, last = group[0], group[-1]
+                group_type = current_type
+                if len(group) == 1 and _node_key(first) in captured:
+                    group_type = captured[(first.start_byte, first.end_byte)]
+                span = _Span(
+                    start_byte=first.start_byte if lead is None else lead.start_byte,
+                    end_byte=last.end_byte,
+                    start_line=first.start_point[0] + 1 if lead is None else lead.start_line,
+                    end_line=last.end_point[0] + 1,
+                    chunk_type=group_type,
+                    parent=root_key,
+                    context_type=current_type,
+                )
+                lead = None
+                group.clear()
+                return span
+
+            def flush() -> None:
+                span = take()
+                if span is not None:
+                    items.append(span)
+
+            for child in current.children:
+                if child.end_byte - child.start_byte > max_bytes:
+                    carried = take()
+                    if carried is not None and carried.size >= min_bytes:
+                        items.append(carried)
+                        carried = None
+                    child_type = captured.get((child.start_byte, child.end_byte), current_type)
+                    items.append((child, child_type, current_type, root_key, carried))
+                    continue
+                first = lead.start_byte if lead is not None else (group or [child])[0].start_byte
+                if child.end_byte - first > max_bytes:
+                    flush()
+                group.append(child)
+            flush()
+
+            stack.extend(reversed(items))
+
+    return _merge_small_spans(spans, policy)
+
+
+def _merge_small_spans(spans: list[_Span], policy: ChunkSizePolicy) -> list[_Span]:
+    """Merge adjacent sibling spans when either is below the minimum size.
+
+    Spans of the same type keep it. Mixed merges take the type of the larger
+    span when that one is not small itself, otherwise the enclosing context
+    type (e.g. "class" for slices of a split class, "block" at top level).
+    """
+    min_bytes = policy.min_bytes
+    if min_bytes <= 0:
+        return spans
+
+    merged: list[_Span] = []
+    for span in spans:
+        prev = merged[-1] if merged else None
+        if (
+            prev is not None
+            and prev.parent == span.parent
+            and (prev.size < min_bytes or span.size < min_bytes)
+            and span.end_byte - prev.start_byte <= policy.max_bytes
+        ):
+            if prev.chunk_type != span.chunk_type:
+                larger = prev if prev.size >= span.size else span
+                prev.chunk_type = (
+                    larger.chunk_type if larger.size >= min_bytes else prev.context_type
+                )
+            prev.end_byte = span.end_byte
+            prev.end_line = span.end_line
+        else:
+            merged.append(span)
+    return merged
 
 
 # ==============================================================================
@@ -170,67 +554,135 @@ def detect_language(file_path: Path) -> str | None:
 
 
 def extract_chunks_from_ast(
-    tree: Tree, language: str, content: str, file_id: uuid.UUID, project_id: str
+    tree: Tree,
+    language: str,
+    content: str,
+    file_id: uuid.UUID,
+    project_id: str,
+    content_bytes: bytes | None = None,
+    policy: ChunkSizePolicy | None = None,
 ) -> list[CodeChunkCreate]:
     """Extract semantic chunks from Tree-sitter AST.
 
+    Uses the language's precompiled chunk query when available (functions,
+    classes, methods, decorated and exported definitions); otherwise walks the
+    tree iteratively with a TreeCursor matching CHUNK_NODE_TYPES.
+
+    With a size policy, chunks are bounded: oversized nodes are split at child
+    boundaries, small adjacent siblings are merged and nested definitions are
+    not emitted separately from an enclosing chunk. Without one, every matched
+    node is returned whole (including nested ones).
+
     Args:
         tree: Parsed Tree-sitter AST
         language: Language name
         content: File content as string
         file_id: UUID of file in database
         project_id: Project workspace identifier
+        content_bytes: UTF-8 encoded content already handed to the parser
+            (encoded from content when omitted)
+        policy: Optional chunk size policy
 
     Returns:
-        List of CodeChunkCreate objects
+        List of CodeChunkCreate objects in source order
     """
-    chunks: list[CodeChunkCreate] = []
-    content_bytes = content.encode("utf-8")
+    query = ParserCache().get_query(language)
+    if query is not None:
+        nodes = _query_chunk_nodes(tree, query)
+    else:
+        chunk_types = CHUNK_NODE_TYPES.get(language, set())
+        if not chunk_types:
+            logger.warning(
+                f"No chunk types defined for language: {language}",
+                extra={"context": {"language": language}},
+            )
+            return []
+        nodes = _walk_chunk_nodes(tree, chunk_types)
 
-    # Get chunk node types for this language
-    chunk_types = CHUNK_NODE_TYPES.get(language, set())
-    if not chunk_types:
-        logger.warning(
-            f"No chunk types defined for language: {language}",
-            extra={"context": {"language": language}},
+    if content_bytes is None:
+        content_bytes = content.encode("utf-8")
+
+    if policy is None:
+        spans = [_node_span(node, chunk_type, None, chunk_type) for node, chunk_type in nodes]
+    else:
+        spans = _bounded_spans(nodes, content_bytes, policy)
+
+    return [
+        CodeChunkCreate(
+            code_file_id=file_id,
+            project_id=project_id,
+            content=content_bytes[span.start_byte : span.end_byte].decode("utf-8"),
+            start_line=span.start_line,  # 1-indexed
+            end_line=span.end_line,
+            chunk_type=span.chunk_type,
         )
-        return chunks
+        for span in spans
+    ]
 
-    # Traverse AST and extract chunks
-    def visit_node(node: Node) -> None:
-        """Recursively visit AST nodes."""
-        if node.type in chunk_types:
-            # Extract chunk content
-            start_byte = node.start_byte
-            end_byte = node.end_byte
-            chunk_content = content_bytes[start_byte:end_byte].decode("utf-8")
 
-            # Get line numbers (1-indexed)
-            start_line = node.start_point[0] + 1
-            end_line = node.end_point[0] + 1
+def _query_chunk_nodes(tree: Tree, query: Query) -> list[tuple[Node, str]]:
+    """Run a chunk query and return (node, chunk_type) pairs in source order.
 
-            # Determine chunk type (normalize to function/class/block)
-            chunk_type = _normalize_chunk_type(node.type)
+    The same node may be captured by several patterns (e.g. @method and
+    @function); it is emitted once. Wrapper captures (decorated definitions,
+    export statements) replace the definition they wrap, detected as a
+    captured child ending where its captured parent ends.
 
-            # Create chunk
-            chunk = CodeChunkCreate(
-                code_file_id=file_id,
-                project_id=project_id,
-                content=chunk_content,
-                start_line=start_line,
-                end_line=end_line,
-                chunk_type=chunk_type,
-            )
-            chunks.append(chunk)
+    Args:
+        tree: Parsed Tree-sitter AST
+        query: Compiled chunk query for the tree's language
 
-        # Visit children
-        for child in node.children:
-            visit_node(child)
+    Returns:
+        List of (node, normalized chunk type) tuples
+    """
+    captured: dict[tuple[int, int], tuple[Node, str]] = {}
+    for capture_name, nodes in QueryCursor(query).captures(tree.root_node).items():
+        chunk_type = _normalize_chunk_type(capture_name)
+        for node in nodes:
+            captured.setdefault((node.start_byte, node.end_byte), (node, chunk_type))
+
+    results: list[tuple[Node, str]] = []
+    for (start_byte, end_byte), (node, chunk_type) in sorted(
+        captured.items(), key=lambda item: (item[0][0], -item[0][1])
+    ):
+        parent = node.parent
+        if (
+            parent is not None
+            and parent.end_byte == end_byte
+            and (parent.start_byte, parent.end_byte) in captured
+        ):
+            continue
+        results.append((node, chunk_type))
+    return results
+
+
+def _walk_chunk_nodes(tree: Tree, chunk_types: set[str]) -> list[tuple[Node, str]]:
+    """Collect nodes of the given types with an iterative TreeCursor walk.
+
+    Pre-order traversal without recursion, so deeply nested or generated code
+    cannot hit Python's recursion limit.
 
-    # Start traversal from root
-    visit_node(tree.root_node)
+    Args:
+        tree: Parsed Tree-sitter AST
+        chunk_types: Node types to collect
 
-    return chunks
+    Returns:
+        List of (node, normalized chunk type) tuples in source order
+    """
+    results: list[tuple[Node, str]] = []
+    cursor = tree.walk()
+    while True:
+        node = cursor.node
+        if node is not None and node.type in chunk_types:
+            results.append((node, _normalize_chunk_type(node.type)))
+
+        # Pre-order advance: first child, else next sibling of the nearest
+        # ancestor that has one
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return results
 
 
 def _normalize_chunk_type(node_type: str) -> str:
@@ -312,7 +764,11 @@ def fallback_line_chunking(
 
 
 async def chunk_file(
-    file_path: Path, content: str, file_id: uuid.UUID, project_id: str
+    file_path: Path,
+    content: str,
+    file_id: uuid.UUID,
+    project_id: str,
+    policy: ChunkSizePolicy | None = None,
 ) -> list[CodeChunkCreate]:
     """Parse file and extract semantic chunks.
 
@@ -321,6 +777,7 @@ async def chunk_file(
         content: File content as string
         file_id: UUID of file in database
         project_id: Project workspace identifier
+        policy: Chunk size policy (defaults to ChunkSizePolicy.from_settings())
 
     Returns:
         List of CodeChunkCreate objects
@@ -351,8 +808,8 @@ async def chunk_file(
     parser = cache.get_parser(language)
 
     if parser is None:
-        # Parser not available, use fallback
-        logger.warning(
+        # Grammar not installed (reported once by ParserCache), use fallback
+        logger.debug(
             f"Parser not available for {language}, using fallback chunking",
             extra={"context": {"language": language, "file_path": str(file_path)}},
         )
@@ -364,7 +821,15 @@ async def chunk_file(
         tree = parser.parse(content_bytes)
 
         # Extract chunks from AST
-        chunks = extract_chunks_from_ast(tree, language, content, file_id, project_id)
+        chunks = extract_chunks_from_ast(
+            tree,
+            language,
+            content,
+            file_id,
+            project_id,
+            content_bytes=content_bytes,
+            policy=policy if policy is not None else ChunkSizePolicy.from_settings(),
+        )
 
         if not chunks:
             # No chunks extracted (e.g., file with no functions/classes)
@@ -445,6 +910,7 @@ async def chunk_files_batch(
 # ==============================================================================
 
 __all__ = [
+    "ChunkSizePolicy",
     "chunk_file",
     "chunk_files_batch",
     "detect_language",
@@ -15,18 +15,36 @@ Key Features:
 - Timeout handling (30s per request)
 - Model validation on startup
 - Connection pooling for performance
+- Pluggable backends (EMBEDDING_BACKEND=ollama|hash|replay) for offline
+  benchmarking, see src/services/embedding_backends.py
+- Single-flight coalescing: concurrent requests for the same (model, text)
+  share one in-flight embedding
+- Multiple Ollama endpoints (OLLAMA_BASE_URLS) with least-outstanding routing
+  and temporary ejection of failing endpoints
+- Prioritized requests: at most EMBEDDING_MAX_CONCURRENCY requests per
+  endpoint are in flight; single-text (query) embeddings go ahead of batch
+  (indexing) embeddings and EMBEDDING_INTERACTIVE_SLOTS are kept free for them
 """
 
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 from typing import Final, Sequence
 
 import httpx
 from pydantic import BaseModel, Field, field_validator
 
-from src.config.settings import get_settings
+from src.config.settings import EmbeddingBackendName, get_settings
+from src.connection_pool.priority import (
+    PrioritySlots,
+    WorkPriority,
+    current_priority,
+    priority_scope,
+)
 from src.mcp.mcp_logging import get_logger
+from src.services.embedding_backends import EmbeddingBackend, create_embedding_backend
+from src.services.ollama_endpoints import EndpointPool
 
 # ==============================================================================
 # Constants
@@ -58,10 +76,14 @@ class EmbeddingRequest(BaseModel):
     Attributes:
         model: Embedding model name (e.g., "nomic-embed-text")
         prompt: Text to embed
+        keep_alive: How long Ollama keeps the model loaded (duration or seconds)
     """
 
     model: str = Field(..., min_length=1, description="Embedding model name")
     prompt: str = Field(..., min_length=1, description="Text to embed")
+    keep_alive: str | int | None = Field(
+        default=None, description="Model residency after the request"
+    )
 
     model_config = {"frozen": True}
 
@@ -151,19 +173,75 @@ class OllamaValidationError(OllamaError):
     pass
 
 
+# ==============================================================================
+# Helper Functions
+# ==============================================================================
+
+
+def keep_alive_value(keep_alive: str) -> str | int:
+    """Convert OLLAMA_KEEP_ALIVE to the JSON value Ollama expects.
+
+    Ollama parses strings as Go durations (unit required), so bare numbers
+    such as "-1" or "3600" are sent as integer seconds.
+
+    Args:
+        keep_alive: Duration string ("30m") or seconds ("-1", "3600")
+
+    Returns:
+        Integer seconds or the duration string
+    """
+    try:
+        return int(keep_alive)
+    except ValueError:
+        return keep_alive
+
+
 # ==============================================================================
 # Embedder Client
 # ==============================================================================
 
 
+class _OllamaHttpBackend:
+    """EmbeddingBackend adapter for OllamaEmbedder's HTTP client."""
+
+    name = EmbeddingBackendName.OLLAMA.value
+
+    def __init__(self, embedder: OllamaEmbedder) -> None:
+        """Bind to the embedder owning the HTTP client."""
+        self._embedder = embedder
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts with parallel /api/embeddings requests."""
+        requests = [
+            EmbeddingRequest(
+                model=self._embedder.model, prompt=text, keep_alive=self._embedder.keep_alive
+            )
+            for text in texts
+        ]
+        # Process in parallel (Ollama can handle concurrent requests), at
+        # most embedding_max_concurrency per endpoint in priority order
+        tasks = [self._embedder._prioritized_request(req) for req in requests]
+        return list(await asyncio.gather(*tasks))
+
+    async def close(self) -> None:
+        """HTTP client is closed by OllamaEmbedder.close()."""
+
+
 class OllamaEmbedder:
     """Client for Ollama embedding generation with retry logic.
 
-    Singleton pattern with connection pooling for performance.
+    Singleton pattern with connection pooling for performance. Vectors are
+    produced by the backend selected through EMBEDDING_BACKEND (the Ollama
+    HTTP API by default).
     """
 
     _instance: OllamaEmbedder | None = None
     _client: httpx.AsyncClient | None = None
+    _backend: EmbeddingBackend | None = None
+
+    # Pending embeddings keyed by (model, text), shared by concurrent callers,
+    # with the priority the backend call runs at
+    _inflight: dict[tuple[str, str], tuple[asyncio.Future[list[float]], WorkPriority]]
 
     def __new__(cls) -> OllamaEmbedder:
         """Ensure singleton instance."""
@@ -173,34 +251,85 @@ class OllamaEmbedder:
 
     def __init__(self) -> None:
         """Initialize embedder with settings."""
-        if self._client is not None:
+        if self._backend is not None:
             return  # Already initialized
 
         settings = get_settings()
-        self.base_url = str(settings.ollama_base_url)
+        self.endpoints = EndpointPool(
+            settings.ollama_endpoints,
+            eject_seconds=settings.ollama_eject_seconds,
+            failure_threshold=settings.ollama_failure_threshold,
+        )
+        self.base_url = self.endpoints.endpoints[0].url
         self.model = settings.ollama_embedding_model
         self.batch_size = settings.embedding_batch_size
-
-        # Create async HTTP client with connection pooling
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECTION_TIMEOUT),
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        self.health_check_interval = settings.ollama_health_check_interval
+        self.keep_alive = keep_alive_value(settings.ollama_keep_alive)
+        self._inflight = {}
+        self.coalesced_count = 0
+
+        # Requests wait here rather than in httpx's FIFO connection queue,
+        # so queries are not stuck behind queued indexing requests
+        self.slots = PrioritySlots(
+            settings.embedding_max_concurrency * len(self.endpoints),
+            reserved=settings.embedding_interactive_slots,
         )
+        # Async HTTP client with connection pooling (kept if one was already
+        # created through the client property)
+        if self._client is None:
+            self._client = self._create_client()
+        self._backend = create_embedding_backend(settings, _OllamaHttpBackend(self))
 
         logger.info(
             "Ollama embedder initialized",
             extra={
                 "context": {
                     "base_url": self.base_url,
+                    "endpoints": [e.url for e in self.endpoints.endpoints],
                     "model": self.model,
                     "batch_size": self.batch_size,
+                    "max_concurrency": self.slots.limit,
+                    "interactive_slots": self.slots.reserved,
+                    "backend": self._backend.name,
                 }
             },
         )
 
+    def _create_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by all endpoints (limits scale with the endpoint count)."""
+        endpoint_count = len(self.endpoints)
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECTION_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=20 * endpoint_count,
+                max_keepalive_connections=10 * endpoint_count,
+            ),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for Ollama API calls other than embeddings (e.g. /api/ps).
+
+        Created on first use after close(), so callers never get None.
+        """
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    async def start_health_checks(self) -> None:
+        """Start periodic endpoint health checks (multiple endpoints only)."""
+        if self._client is None or len(self.endpoints) < 2:
+            return
+        await self.endpoints.start_health_checks(self._client, self.health_check_interval)
+
     async def close(self) -> None:
-        """Close HTTP client and cleanup resources."""
+        """Close backend and HTTP client and cleanup resources."""
+        if self._client is not None:
+            await self.endpoints.stop_health_checks()
+        if self._backend is not None:
+            await self._backend.close()
+            self._backend = None
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -224,20 +353,28 @@ class OllamaEmbedder:
         if self._client is None:
             raise OllamaError("Client not initialized")
 
+        # Each attempt is routed independently (retries move off failing endpoints)
+        endpoint = self.endpoints.select()
+
         try:
-            response = await self._client.post(
-                "/api/embeddings", json=request.model_dump()
-            )
+            with self.endpoints.track(endpoint):
+                response = await self._client.post(
+                    f"{endpoint.url}/api/embeddings", json=request.model_dump(exclude_none=True)
+                )
             response.raise_for_status()
+            self.endpoints.record_success(endpoint)
 
             # Parse and validate response
             embedding_response = EmbeddingResponse(**response.json())
             return embedding_response.embedding
 
         except httpx.TimeoutException as e:
+            self.endpoints.record_failure(endpoint, "timeout")
             logger.warning(
                 f"Request timeout (attempt {attempt}/{MAX_RETRIES})",
-                extra={"context": {"attempt": attempt, "error": str(e)}},
+                extra={
+                    "context": {"attempt": attempt, "endpoint": endpoint.url, "error": str(e)}
+                },
             )
             if attempt >= MAX_RETRIES:
                 raise OllamaTimeoutError(
@@ -245,11 +382,14 @@ class OllamaEmbedder:
                 ) from e
 
         except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                self.endpoints.record_failure(endpoint, f"HTTP {e.response.status_code}")
             logger.warning(
                 f"HTTP error {e.response.status_code} (attempt {attempt}/{MAX_RETRIES})",
                 extra={
                     "context": {
                         "attempt": attempt,
+                        "endpoint": endpoint.url,
                         "status_code": e.response.status_code,
                         "error": str(e),
                     }
@@ -259,13 +399,16 @@ class OllamaEmbedder:
                 raise OllamaError(f"HTTP error: {e}") from e
 
         except httpx.ConnectError as e:
+            self.endpoints.record_failure(endpoint, "connection error")
             logger.warning(
                 f"Connection error (attempt {attempt}/{MAX_RETRIES})",
-                extra={"context": {"attempt": attempt, "error": str(e)}},
+                extra={
+                    "context": {"attempt": attempt, "endpoint": endpoint.url, "error": str(e)}
+                },
             )
             if attempt >= MAX_RETRIES:
                 raise OllamaConnectionError(
-                    f"Unable to connect to Ollama at {self.base_url}"
+                    f"Unable to connect to Ollama at {endpoint.url}"
                 ) from e
 
         except ValueError as e:
@@ -277,6 +420,7 @@ class OllamaEmbedder:
             raise OllamaValidationError(f"Invalid response format: {e}") from e
 
         except Exception as e:
+            self.endpoints.record_failure(endpoint, type(e).__name__)
             logger.error(
                 f"Unexpected error (attempt {attempt}/{MAX_RETRIES})",
                 extra={"context": {"attempt": attempt, "error": str(e)}},
@@ -295,6 +439,113 @@ class OllamaEmbedder:
         # Retry
         return await self._request_with_retry(request, attempt + 1)
 
+    async def _prioritized_request(self, request: EmbeddingRequest) -> list[float]:
+        """Make embedding request once a slot is free for the current priority.
+
+        Args:
+            request: Embedding request
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            OllamaError: If all retries fail
+        """
+        async with self.slots.acquire():
+            return await self._request_with_retry(request)
+
+    def _resolve_inflight(
+        self,
+        pending: dict[tuple[str, str], asyncio.Future[list[float]]],
+        task: asyncio.Future[list[list[float]]],
+    ) -> None:
+        """Deliver a finished backend call to the futures waiting on it.
+
+        Args:
+            pending: Futures created for the call, in input order
+            task: Completed backend embed() task
+        """
+        for key, future in pending.items():
+            entry = self._inflight.get(key)
+            if entry is not None and entry[0] is future:
+                del self._inflight[key]
+
+        if task.cancelled():
+            for future in pending.values():
+                future.cancel()
+            return
+
+        error = task.exception()
+        if error is not None:
+            for future in pending.values():
+                future.set_exception(error)
+                future.exception()  # Retrieved: callers may all have gone
+            return
+
+        for future, embedding in zip(pending.values(), task.result(), strict=True):
+            future.set_result(embedding)
+
+    async def _embed_coalesced(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts, sharing in-flight work for identical (model, text).
+
+        Texts already being embedded (by this or a concurrent caller) reuse
+        the pending future; the rest go to the backend in one call. The
+        backend call runs as its own task and callers await it through
+        asyncio.shield, so a cancelled caller never cancels work other
+        callers are waiting on.
+
+        Interactive callers do not wait on a bulk call, which queues behind
+        bulk admission: they embed the text again at interactive priority,
+        and later callers share that call instead.
+
+        Args:
+            texts: Non-empty texts to embed
+
+        Returns:
+            Embedding vectors in input order
+
+        Raises:
+            OllamaError: If the client is closed or embedding generation fails
+        """
+        if self._backend is None:
+            raise OllamaError("Client not initialized")
+
+        loop = asyncio.get_running_loop()
+        priority = current_priority()
+        futures: list[asyncio.Future[list[float]]] = []
+        pending: dict[tuple[str, str], asyncio.Future[list[float]]] = {}
+
+        for text in texts:
+            key = (self.model, text)
+            entry = self._inflight.get(key)
+            if entry is None or entry[1] > priority:
+                future = loop.create_future()
+                self._inflight[key] = (future, priority)
+                pending[key] = future
+            else:
+                future = entry[0]
+                if key not in pending:
+                    self.coalesced_count += 1
+            futures.append(future)
+
+        if pending:
+            task = asyncio.ensure_future(self._backend.embed([text for _, text in pending]))
+            task.add_done_callback(partial(self._resolve_inflight, pending))
+
+        if len(pending) < len(texts):
+            logger.debug(
+                f"Coalesced {len(texts) - len(pending)} embedding requests",
+                extra={
+                    "context": {
+                        "text_count": len(texts),
+                        "backend_count": len(pending),
+                        "coalesced_total": self.coalesced_count,
+                    }
+                },
+            )
+
+        return list(await asyncio.gather(*(asyncio.shield(f) for f in futures)))
+
     async def generate_embedding(self, text: str) -> list[float]:
         """Generate embedding for single text.
 
@@ -307,12 +558,16 @@ class OllamaEmbedder:
         Raises:
             ValueError: If text is empty
             OllamaError: If embedding generation fails
+
+        Performance:
+            Runs at the caller's priority (interactive unless called from
+            bulk work such as indexing)
         """
         if not text:
             raise ValueError("Text cannot be empty")
 
-        request = EmbeddingRequest(model=self.model, prompt=text)
-        return await self._request_with_retry(request)
+        embeddings = await self._embed_coalesced([text])
+        return embeddings[0]
 
     async def generate_embeddings(self, texts: Sequence[str]) -> list[list[float]]:
         """Generate embeddings for batch of texts.
@@ -330,6 +585,8 @@ class OllamaEmbedder:
         Performance:
             Uses asyncio.gather for parallel requests
             Processes texts in batches according to batch_size setting
+            Duplicate texts (in this batch or in flight elsewhere) are embedded once
+            Runs at bulk priority: queries never wait behind batches
         """
         if not texts:
             raise ValueError("Texts cannot be empty")
@@ -342,14 +599,14 @@ class OllamaEmbedder:
             extra={"context": {"text_count": len(texts)}},
         )
 
-        start_time = asyncio.get_event_loop().time()
+        if self._backend is None:
+            raise OllamaError("Client not initialized")
+        backend_name = self._backend.name
 
-        # Create requests for all texts
-        requests = [EmbeddingRequest(model=self.model, prompt=text) for text in texts]
+        start_time = asyncio.get_event_loop().time()
 
-        # Process in parallel (Ollama can handle concurrent requests)
-        tasks = [self._request_with_retry(req) for req in requests]
-        embeddings = await asyncio.gather(*tasks)
+        with priority_scope(WorkPriority.BULK):
+            embeddings = await self._embed_coalesced(texts)
 
         elapsed_ms = (asyncio.get_event_loop().time() - start_time) * 1000
 
@@ -361,6 +618,7 @@ class OllamaEmbedder:
                     "embedding_count": len(embeddings),
                     "duration_ms": elapsed_ms,
                     "avg_ms_per_embedding": elapsed_ms / len(embeddings),
+                    "backend": backend_name,
                 }
             },
         )
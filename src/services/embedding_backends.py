@@ -0,0 +1,265 @@
+"""Embedding backends for OllamaEmbedder.
+
+OllamaEmbedder delegates vector generation to a backend selected through
+EMBEDDING_BACKEND, so indexing throughput can be measured and load-tested
+without a running model:
+
+- ollama: HTTP calls to the Ollama API (default, implemented by OllamaEmbedder)
+- hash: deterministic hash-derived unit vectors (offline, no model)
+- replay: embeddings previously recorded to a JSONL file
+
+Setting EMBEDDING_RECORD_FILE with the ollama backend records every produced
+embedding, which the replay backend can serve later.
+
+Constitutional Compliance:
+- Principle II: Local-first (offline backends for benchmarks and tests)
+- Principle IV: Performance (repeatable throughput measurements)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Recording Format (one JSON object per line):
+    {"model": "nomic-embed-text", "text_sha256": "<hex>", "embedding": [...]}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Final, Protocol, Sequence
+
+from src.config.settings import EmbeddingBackendName, Settings
+from src.mcp.mcp_logging import get_logger
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Default vector size (matches nomic-embed-text and the vector(768) column)
+DEFAULT_DIMENSIONS: Final[int] = 768
+
+
+# ==============================================================================
+# Backend Protocol
+# ==============================================================================
+
+
+class EmbeddingBackend(Protocol):
+    """Produces one embedding per input text."""
+
+    name: str
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts, returning vectors in input order."""
+        ...
+
+    async def close(self) -> None:
+        """Release resources held by the backend."""
+        ...
+
+
+class EmbeddingReplayMissError(LookupError):
+    """Raised when the replay backend has no recording for a text."""
+
+    pass
+
+
+# ==============================================================================
+# Hash Backend
+# ==============================================================================
+
+
+def text_digest(text: str) -> str:
+    """SHA-256 hex digest of text (recording key)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_embedding(text: str, model: str, dimensions: int = DEFAULT_DIMENSIONS) -> list[float]:
+    """Deterministic unit vector derived from (model, text).
+
+    Identical inputs always map to the same vector; different inputs map to
+    (nearly) orthogonal vectors. There is no semantic similarity.
+
+    Args:
+        text: Text to embed
+        model: Model name mixed into the hash
+        dimensions: Vector size
+
+    Returns:
+        L2-normalized vector with values derived from SHAKE-256
+    """
+    digest = hashlib.shake_256(f"{model}\0{text}".encode()).digest(dimensions * 2)
+    values = [
+        int.from_bytes(digest[i : i + 2], "little") / 32767.5 - 1.0
+        for i in range(0, dimensions * 2, 2)
+    ]
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+class HashEmbeddingBackend:
+    """Offline backend returning hash-derived vectors."""
+
+    name = EmbeddingBackendName.HASH.value
+
+    def __init__(self, model: str, dimensions: int = DEFAULT_DIMENSIONS) -> None:
+        """Initialize with the model name used as hash salt."""
+        self.model = model
+        self.dimensions = dimensions
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts with hash_embedding."""
+        return [hash_embedding(text, self.model, self.dimensions) for text in texts]
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+# ==============================================================================
+# Record / Replay Backends
+# ==============================================================================
+
+
+class ReplayEmbeddingBackend:
+    """Serves embeddings recorded by RecordingEmbeddingBackend."""
+
+    name = EmbeddingBackendName.REPLAY.value
+
+    def __init__(self, path: str | Path, model: str) -> None:
+        """Load recorded embeddings for model from a JSONL file.
+
+        Raises:
+            FileNotFoundError: If the recording does not exist
+        """
+        self.path = Path(path)
+        self.model = model
+        self._embeddings: dict[str, list[float]] = {}
+
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record["model"] == model:
+                    self._embeddings[record["text_sha256"]] = record["embedding"]
+
+        logger.info(
+            "Loaded recorded embeddings",
+            extra={
+                "context": {
+                    "path": str(self.path),
+                    "model": model,
+                    "embedding_count": len(self._embeddings),
+                }
+            },
+        )
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Look up recorded embeddings.
+
+        Raises:
+            EmbeddingReplayMissError: If any text was not recorded
+        """
+        embeddings: list[list[float]] = []
+        for text in texts:
+            embedding = self._embeddings.get(text_digest(text))
+            if embedding is None:
+                raise EmbeddingReplayMissError(
+                    f"No recorded embedding for text (sha256={text_digest(text)}) "
+                    f"in {self.path}"
+                )
+            embeddings.append(embedding)
+        return embeddings
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class RecordingEmbeddingBackend:
+    """Wraps a backend and appends every produced embedding to a JSONL file."""
+
+    def __init__(self, inner: EmbeddingBackend, path: str | Path, model: str) -> None:
+        """Initialize recording around inner."""
+        self.inner = inner
+        self.name = inner.name
+        self.path = Path(path)
+        self.model = model
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed with the inner backend and record the results."""
+        embeddings = await self.inner.embed(texts)
+        with self.path.open("a", encoding="utf-8") as f:
+            for text, embedding in zip(texts, embeddings, strict=True):
+                record = {
+                    "model": self.model,
+                    "text_sha256": text_digest(text),
+                    "embedding": embedding,
+                }
+                f.write(json.dumps(record) + "\n")
+        return embeddings
+
+    async def close(self) -> None:
+        """Close the inner backend."""
+        await self.inner.close()
+
+
+# ==============================================================================
+# Factory
+# ==============================================================================
+
+
+def create_embedding_backend(
+    settings: Settings, http_backend: EmbeddingBackend
+) -> EmbeddingBackend:
+    """Create the backend selected by EMBEDDING_BACKEND.
+
+    Args:
+        settings: Application settings
+        http_backend: Ollama HTTP backend (owned by OllamaEmbedder)
+
+    Returns:
+        Configured backend
+    """
+    model = settings.ollama_embedding_model
+    backend: EmbeddingBackend
+    if settings.embedding_backend == EmbeddingBackendName.HASH:
+        backend = HashEmbeddingBackend(model)
+    elif settings.embedding_backend == EmbeddingBackendName.REPLAY:
+        assert settings.embedding_replay_file is not None  # enforced by Settings
+        backend = ReplayEmbeddingBackend(settings.embedding_replay_file, model)
+    else:
+        backend = http_backend
+        if settings.embedding_record_file:
+            backend = RecordingEmbeddingBackend(
+                backend, settings.embedding_record_file, model
+            )
+
+    logger.info(
+        f"Using {backend.name} embedding backend",
+        extra={
+            "context": {
+                "backend": backend.name,
+                "recording": isinstance(backend, RecordingEmbeddingBackend),
+            }
+        },
+    )
+    return backend
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "DEFAULT_DIMENSIONS",
+    "EmbeddingBackend",
+    "EmbeddingReplayMissError",
+    "HashEmbeddingBackend",
+    "RecordingEmbeddingBackend",
+    "ReplayEmbeddingBackend",
+    "create_embedding_backend",
+    "hash_embedding",
+    "text_digest",
+]
@@ -0,0 +1,430 @@
+"""Embedding backfill queue and worker pool.
+
+Decouples embedding generation from indexing: the indexer stores chunks and
+records the ones still lacking an embedding in embedding_queue (every chunk in
+deferred mode, failed batches in inline mode). Workers claim queued chunks
+with SELECT ... FOR UPDATE SKIP LOCKED, embed them and write the vectors, so
+any number of workers - in this process or others - share the backlog and a
+failed batch is retried instead of leaving NULL embeddings behind.
+
+Constitutional Compliance:
+- Principle IV: Performance (chunks searchable before all embeddings finish,
+  embedding scales across workers and processes)
+- Principle V: Production quality (retries with backoff, no lost work)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Retry Policy:
+- A failed batch increments attempts and backs off exponentially
+  (RETRY_BASE_SECONDS * 2^attempts, capped at RETRY_MAX_SECONDS)
+- Rows reaching EMBEDDING_QUEUE_MAX_ATTEMPTS are parked (kept with their
+  last_error, never claimed again)
+- Rows whose chunk was deleted (e.g. file re-indexed) are dropped
+
+Metrics (MetricsService):
+- codebase_mcp_embedding_queue_embedded_total: chunks backfilled by workers
+- codebase_mcp_embedding_queue_failures_total: chunks whose attempt failed
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Final, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import get_settings
+from src.connection_pool.priority import WorkPriority, priority_scope
+from src.database.session import get_session
+from src.mcp.mcp_logging import get_logger
+from src.models import CodeChunk, EmbeddingQueueItem
+from src.services.embedder import generate_embeddings
+from src.services.embedding_windows import WindowPolicy, pool_embeddings, split_into_windows
+from src.services.metrics_service import get_metrics_service
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Retry backoff (seconds) for failed batches
+RETRY_BASE_SECONDS: Final[float] = 5.0
+RETRY_MAX_SECONDS: Final[float] = 900.0
+
+# Rows per INSERT when enqueueing
+ENQUEUE_BATCH_SIZE: Final[int] = 1000
+
+# Stored error messages are truncated to this length
+MAX_ERROR_LENGTH: Final[int] = 1000
+
+EMBEDDED_METRIC: Final[str] = "codebase_mcp_embedding_queue_embedded_total"
+FAILURES_METRIC: Final[str] = "codebase_mcp_embedding_queue_failures_total"
+
+
+# ==============================================================================
+# Queue Operations
+# ==============================================================================
+
+
+@dataclass(frozen=True)
+class QueueBatchResult:
+    """Outcome of one claim-and-embed iteration.
+
+    Attributes:
+        claimed: Queue rows locked by this iteration
+        embedded: Chunks whose embedding was written
+        failed: Chunks whose attempt failed (rescheduled or parked)
+        dropped: Rows removed because their chunk no longer exists
+    """
+
+    claimed: int = 0
+    embedded: int = 0
+    failed: int = 0
+    dropped: int = 0
+
+
+async def enqueue_chunks(
+    db: AsyncSession, chunk_ids: Sequence[UUID], project_id: str
+) -> int:
+    """Record chunks that still need an embedding.
+
+    Already queued chunks are left untouched.
+
+    Args:
+        db: Session of the project database (caller commits)
+        chunk_ids: Chunks to queue (must be flushed to the database)
+        project_id: Project workspace identifier
+
+    Returns:
+        Number of chunk ids submitted
+    """
+    for start in range(0, len(chunk_ids), ENQUEUE_BATCH_SIZE):
+        rows = [
+            {"chunk_id": chunk_id, "project_id": project_id}
+            for chunk_id in chunk_ids[start : start + ENQUEUE_BATCH_SIZE]
+        ]
+        await db.execute(insert(EmbeddingQueueItem).values(rows).on_conflict_do_nothing())
+    return len(chunk_ids)
+
+
+async def _embed_texts(texts: Sequence[str]) -> list[list[float]]:
+    """Embed chunk texts, pooling the windows of chunks longer than the context."""
+    policy = WindowPolicy.from_settings()
+    chunk_windows = [split_into_windows(text, policy) for text in texts]
+    vectors = await generate_embeddings(
+        [window.text for windows in chunk_windows for window in windows]
+    )
+
+    embeddings: list[list[float]] = []
+    offset = 0
+    for windows in chunk_windows:
+        embeddings.append(
+            pool_embeddings(
+                vectors[offset : offset + len(windows)], [window.tokens for window in windows]
+            )
+        )
+        offset += len(windows)
+    return embeddings
+
+
+async def claim_and_embed(
+    db: AsyncSession, batch_size: int, max_attempts: int
+) -> QueueBatchResult:
+    """Claim up to batch_size ready chunks, embed them and write the vectors.
+
+    Rows stay locked (FOR UPDATE SKIP LOCKED) until the caller's transaction
+    ends, so concurrent workers skip them and a crashed worker's rows become
+    claimable again on rollback.
+
+    Args:
+        db: Session of the project database (caller commits)
+        batch_size: Maximum rows to claim
+        max_attempts: Rows with this many failed attempts are not claimed
+
+    Returns:
+        QueueBatchResult for this iteration
+    """
+    claim = (
+        select(EmbeddingQueueItem.chunk_id, CodeChunk.content)
+        .outerjoin(CodeChunk, CodeChunk.id == EmbeddingQueueItem.chunk_id)
+        .where(
+            EmbeddingQueueItem.available_at <= func.now(),
+            EmbeddingQueueItem.attempts < max_attempts,
+        )
+        .order_by(EmbeddingQueueItem.available_at)
+        .limit(batch_size)
+        .with_for_update(of=EmbeddingQueueItem, skip_locked=True)
+    )
+    rows = (await db.execute(claim)).all()
+    if not rows:
+        return QueueBatchResult()
+
+    # Chunks deleted since they were queued (re-indexed or removed files)
+    orphan_ids = [row.chunk_id for row in rows if row.content is None]
+    if orphan_ids:
+        await db.execute(
+            delete(EmbeddingQueueItem).where(EmbeddingQueueItem.chunk_id.in_(orphan_ids))
+        )
+
+    work = [(row.chunk_id, row.content) for row in rows if row.content is not None]
+    if not work:
+        return QueueBatchResult(claimed=len(rows), dropped=len(orphan_ids))
+
+    chunk_ids = [chunk_id for chunk_id, _ in work]
+    try:
+        embeddings = await _embed_texts([content for _, content in work])
+    except Exception as e:
+        await db.execute(
+            update(EmbeddingQueueItem)
+            .where(EmbeddingQueueItem.chunk_id.in_(chunk_ids))
+            .values(
+                attempts=EmbeddingQueueItem.attempts + 1,
+                last_error=str(e)[:MAX_ERROR_LENGTH],
+                available_at=func.now()
+                + func.least(
+                    RETRY_BASE_SECONDS * func.power(2, EmbeddingQueueItem.attempts),
+                    RETRY_MAX_SECONDS,
+                )
+                * literal_column("INTERVAL '1 second'"),
+            )
+        )
+        get_metrics_service().increment_counter(
+            FAILURES_METRIC, "Queued chunk embedding attempts that failed", len(work)
+        )
+        logger.warning(
+            f"Embedding queue batch failed, {len(work)} chunks rescheduled",
+            extra={"context": {"chunk_count": len(work), "error": str(e)}},
+        )
+        return QueueBatchResult(
+            claimed=len(rows), failed=len(work), dropped=len(orphan_ids)
+        )
+
+    await db.execute(
+        update(CodeChunk),
+        [
+            {"id": chunk_id, "embedding": embedding}
+            for chunk_id, embedding in zip(chunk_ids, embeddings, strict=True)
+        ],
+    )
+    await db.execute(
+        delete(EmbeddingQueueItem).where(EmbeddingQueueItem.chunk_id.in_(chunk_ids))
+    )
+    get_metrics_service().increment_counter(
+        EMBEDDED_METRIC, "Chunk embeddings backfilled by queue workers", len(work)
+    )
+    return QueueBatchResult(claimed=len(rows), embedded=len(work), dropped=len(orphan_ids))
+
+
+async def queue_depth(db: AsyncSession, max_attempts: int) -> dict[str, int]:
+    """Count queued chunks.
+
+    Args:
+        db: Session of the project database
+        max_attempts: Attempts at which a row counts as parked
+
+    Returns:
+        {"pending": rows still to be embedded, "parked": rows out of attempts}
+    """
+    parked = EmbeddingQueueItem.attempts >= max_attempts
+    result = await db.execute(
+        select(
+            func.count().filter(~parked).label("pending"),
+            func.count().filter(parked).label("parked"),
+        )
+    )
+    row = result.one()
+    return {"pending": row.pending or 0, "parked": row.parked or 0}
+
+
+# ==============================================================================
+# Worker Pool
+# ==============================================================================
+
+
+class EmbeddingQueueWorkerPool:
+    """Background workers draining embedding_queue of active projects.
+
+    The queue lives in each project database; the pool polls the projects it
+    has been notified about (by the indexer, or at startup) until their queue
+    is empty. Other processes may run their own pools against the same
+    databases - SKIP LOCKED keeps them from processing the same chunks.
+
+    Lifecycle:
+        1. Call start() from the server lifespan
+        2. notify(project_id) whenever chunks are queued for a project
+        3. Call stop() before shutdown (in-flight batches roll back)
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        batch_size: int | None = None,
+        max_attempts: int | None = None,
+        poll_interval: float | None = None,
+    ) -> None:
+        """Initialize pool (defaults come from EMBEDDING_QUEUE_* settings).
+
+        Args:
+            workers: Concurrent worker tasks (0 disables the pool)
+            batch_size: Chunks claimed per iteration
+            max_attempts: Attempts before a chunk is parked
+            poll_interval: Seconds an idle worker waits before polling again
+        """
+        settings = get_settings()
+        self.workers = settings.embedding_queue_workers if workers is None else workers
+        self.batch_size = settings.embedding_queue_batch_size if batch_size is None else batch_size
+        self.max_attempts = (
+            settings.embedding_queue_max_attempts if max_attempts is None else max_attempts
+        )
+        self.poll_interval = (
+            settings.embedding_queue_poll_interval if poll_interval is None else poll_interval
+        )
+        self.embedded_total = 0
+        self.failed_total = 0
+        self._projects: set[str] = set()
+        self._wake = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._running = False
+
+    def notify(self, project_id: str) -> None:
+        """Mark project_id as having queued work and wake idle workers."""
+        self._projects.add(project_id)
+        self._wake.set()
+
+    async def start(self) -> None:
+        """Start worker tasks.
+
+        Idempotent - safe to call multiple times.
+        """
+        if self._running or self.workers <= 0:
+            return
+
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(worker_id))
+            for worker_id in range(self.workers)
+        ]
+        logger.info(
+            "Embedding queue workers started",
+            extra={"context": {"workers": self.workers, "batch_size": self.batch_size}},
+        )
+
+    async def stop(self) -> None:
+        """Stop worker tasks.
+
+        Idempotent - safe to call multiple times.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        logger.info("Embedding queue workers stopped")
+
+    async def run_once(self, project_id: str) -> QueueBatchResult:
+        """Process one batch of project_id's queue in its own transaction."""
+        with priority_scope(WorkPriority.BULK):
+            async with get_session(project_id=project_id) as db:
+                result = await claim_and_embed(db, self.batch_size, self.max_attempts)
+        self.embedded_total += result.embedded
+        self.failed_total += result.failed
+        return result
+
+    async def drain(self, project_id: str) -> int:
+        """Process project_id's ready chunks until none can be claimed.
+
+        Returns:
+            Number of chunks embedded
+        """
+        embedded = 0
+        while True:
+            result = await self.run_once(project_id)
+            embedded += result.embedded
+            if result.claimed == 0 or result.claimed == result.failed:
+                return embedded
+
+    async def _worker_loop(self, worker_id: int) -> None:
+        """Claim batches from active projects; sleep when there is nothing ready."""
+        while self._running:
+            try:
+                # Cleared before scanning so a notify() during the scan is not lost
+                self._wake.clear()
+                did_work = False
+                for project_id in list(self._projects):
+                    result = await self.run_once(project_id)
+                    if result.claimed:
+                        did_work = True
+                    else:
+                        await self._forget_if_empty(project_id)
+
+                if not did_work:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(
+                    f"Error in embedding queue worker {worker_id}: {e}",
+                    extra={"context": {"worker_id": worker_id, "error": str(e)}},
+                )
+                await asyncio.sleep(self.poll_interval)
+
+    async def _forget_if_empty(self, project_id: str) -> None:
+        """Stop polling project_id once nothing in its queue can be retried."""
+        async with get_session(project_id=project_id) as db:
+            depth = await queue_depth(db, self.max_attempts)
+        if depth["pending"] == 0:
+            self._projects.discard(project_id)
+            if depth["parked"]:
+                logger.warning(
+                    f"{depth['parked']} chunks in {project_id} exhausted embedding attempts",
+                    extra={"context": {"project_id": project_id, "parked": depth["parked"]}},
+                )
+
+
+# ==============================================================================
+# Global Instance
+# ==============================================================================
+
+# Global singleton (started in FastMCP lifespan)
+_embedding_queue_pool: EmbeddingQueueWorkerPool | None = None
+
+
+def get_embedding_queue_pool() -> EmbeddingQueueWorkerPool:
+    """Get global embedding queue worker pool.
+
+    Creates singleton on first call.
+
+    Returns:
+        Global EmbeddingQueueWorkerPool instance
+    """
+    global _embedding_queue_pool
+    if _embedding_queue_pool is None:
+        _embedding_queue_pool = EmbeddingQueueWorkerPool()
+    return _embedding_queue_pool
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "EMBEDDED_METRIC",
+    "FAILURES_METRIC",
+    "EmbeddingQueueWorkerPool",
+    "QueueBatchResult",
+    "claim_and_embed",
+    "enqueue_chunks",
+    "get_embedding_queue_pool",
+    "queue_depth",
+]
@@ -0,0 +1,303 @@
+"""Token-aware windowing of chunk text for the embedding model's context.
+
+Chunks produced by the chunker (especially fallback line chunks and large AST
+nodes) can exceed the embedding model's context window. Ollama silently
+truncates such inputs, and very long inputs dominate per-request latency.
+This module counts tokens, splits over-context texts into overlapping
+line-aligned windows, and pools window embeddings back into one vector.
+
+Constitutional Compliance:
+- Principle IV: Performance (bounded per-request input size)
+- Principle V: Production quality (no silent truncation of indexed code)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Key Features:
+- Token counting with an optional exact tokenizer (tokenizers package +
+  EMBEDDING_TOKENIZER_FILE), otherwise a conservative WordPiece-style estimate
+- Line-aligned overlapping windows (exact line ranges for sub-chunks)
+- Token-weighted mean pooling with L2 normalization
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Callable, Final, Sequence
+
+from src.config.settings import get_settings
+from src.mcp.mcp_logging import get_logger
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Word-ish runs and single punctuation characters (WordPiece-style pre-split)
+_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+# Average characters per sub-word piece for long identifiers
+_CHARS_PER_PIECE: Final[int] = 4
+
+# Long-chunk strategies
+LONG_CHUNK_STRATEGIES: Final[tuple[str, ...]] = ("pool", "split")
+
+
+# ==============================================================================
+# Token Counting
+# ==============================================================================
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text for a WordPiece-style tokenizer.
+
+    Each punctuation character counts as one token and each word or number as
+    one token per 4 characters. This overestimates slightly for prose and is
+    close for code, which keeps windows safely inside the context.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return sum(
+        -(-len(piece) // _CHARS_PER_PIECE) for piece in _TOKEN_PATTERN.findall(text)
+    )
+
+
+_token_counter: Callable[[str], int] | None = None
+
+
+def get_token_counter() -> Callable[[str], int]:
+    """Get the token counter for the configured embedding model.
+
+    Uses the Hugging Face tokenizer file from EMBEDDING_TOKENIZER_FILE when it
+    is set and the optional ``tokenizers`` package is installed; otherwise
+    falls back to estimate_tokens. The choice is cached.
+
+    Returns:
+        Callable returning the token count of a text
+    """
+    global _token_counter  # noqa: PLW0603 - module-level cache
+    if _token_counter is not None:
+        return _token_counter
+
+    counter: Callable[[str], int] = estimate_tokens
+    tokenizer_file = get_settings().embedding_tokenizer_file
+    if tokenizer_file:
+        try:
+            from tokenizers import Tokenizer  # type: ignore[import-not-found]
+
+            tokenizer = Tokenizer.from_file(tokenizer_file)
+            counter = lambda text: len(tokenizer.encode(text).ids)  # noqa: E731
+            logger.info(
+                "Using tokenizer file for embedding token counts",
+                extra={"context": {"tokenizer_file": tokenizer_file}},
+            )
+        except ImportError:
+            logger.warning(
+                "EMBEDDING_TOKENIZER_FILE set but 'tokenizers' is not installed, "
+                "using token estimate",
+                extra={"context": {"tokenizer_file": tokenizer_file}},
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to load tokenizer file, using token estimate",
+                extra={"context": {"tokenizer_file": tokenizer_file, "error": str(e)}},
+            )
+
+    _token_counter = counter
+    return counter
+
+
+# ==============================================================================
+# Windowing
+# ==============================================================================
+
+
+@dataclass(frozen=True)
+class WindowPolicy:
+    """Context window limits for embedding inputs.
+
+    Attributes:
+        max_tokens: Maximum tokens per embedding input
+        overlap_tokens: Tokens repeated between consecutive windows
+        strategy: "pool" (one pooled vector per chunk) or "split" (sub-chunks)
+    """
+
+    max_tokens: int = 2048
+    overlap_tokens: int = 128
+    strategy: str = "pool"
+
+    def __post_init__(self) -> None:
+        """Validate limits."""
+        if self.strategy not in LONG_CHUNK_STRATEGIES:
+            raise ValueError(f"Invalid long chunk strategy: {self.strategy}")
+        if self.max_tokens <= 0 or not 0 <= self.overlap_tokens < self.max_tokens // 2:
+            raise ValueError(
+                f"Invalid window limits: max_tokens={self.max_tokens}, "
+                f"overlap_tokens={self.overlap_tokens}"
+            )
+
+    @classmethod
+    def from_settings(cls) -> WindowPolicy:
+        """Build the policy from EMBEDDING_CONTEXT_TOKENS and related settings."""
+        settings = get_settings()
+        return cls(
+            max_tokens=settings.embedding_context_tokens,
+            overlap_tokens=settings.embedding_window_overlap_tokens,
+            strategy=settings.embedding_long_chunk_strategy.value,
+        )
+
+
+@dataclass(frozen=True)
+class TextWindow:
+    """A window of a longer text.
+
+    Attributes:
+        text: Window text
+        start_line: 0-based offset of the window's first line in the source text
+        end_line: 0-based offset of the window's last line in the source text
+        tokens: Token count of the window
+    """
+
+    text: str
+    start_line: int
+    end_line: int
+    tokens: int
+
+
+def split_into_windows(
+    text: str,
+    policy: WindowPolicy,
+    count_tokens: Callable[[str], int] | None = None,
+) -> list[TextWindow]:
+    """Split text into overlapping, line-aligned windows within the context.
+
+    Text that fits is returned as a single window. Otherwise whole lines are
+    packed up to max_tokens, and each following window starts with the last
+    lines of the previous one (up to overlap_tokens). A single line longer
+    than the context is cut into character slices.
+
+    Args:
+        text: Text to split
+        policy: Window limits
+        count_tokens: Token counter (defaults to get_token_counter())
+
+    Returns:
+        Windows in order (at least one)
+    """
+    count = count_tokens or get_token_counter()
+    total = count(text)
+    if total <= policy.max_tokens:
+        last_line = text.rstrip("\n").count("\n")
+        return [TextWindow(text, 0, last_line, total)]
+
+    # (line offset, text, tokens) pieces; over-long lines are pre-cut
+    pieces: list[tuple[int, str, int]] = []
+    for offset, line in enumerate(text.splitlines(keepends=True)):
+        tokens = count(line)
+        if tokens <= policy.max_tokens:
+            pieces.append((offset, line, tokens))
+            continue
+        slice_len = max(1, len(line) * policy.max_tokens // (tokens + 1))
+        position = 0
+        while position < len(line):
+            length = slice_len
+            part = line[position : position + length]
+            part_tokens = count(part)
+            # Token density varies along the line: shrink until the slice fits
+            while part_tokens > policy.max_tokens and length > 1:
+                length = max(1, min(length - 1, length * policy.max_tokens // part_tokens))
+                part = line[position : position + length]
+                part_tokens = count(part)
+            pieces.append((offset, part, part_tokens))
+            position += length
+
+    windows: list[TextWindow] = []
+    start = 0
+    while start < len(pieces):
+        end = start
+        used = 0
+        while end < len(pieces) and (end == start or used + pieces[end][2] <= policy.max_tokens):
+            used += pieces[end][2]
+            end += 1
+        windows.append(
+            TextWindow(
+                text="".join(piece[1] for piece in pieces[start:end]),
+                start_line=pieces[start][0],
+                end_line=pieces[end - 1][0],
+                tokens=used,
+            )
+        )
+        if end >= len(pieces):
+            break
+
+        # Step back over trailing pieces for overlap, always making progress
+        next_start = end
+        overlap = 0
+        while (
+            next_start - 1 > start
+            and overlap + pieces[next_start - 1][2] <= policy.overlap_tokens
+        ):
+            next_start -= 1
+            overlap += pieces[next_start][2]
+        start = next_start
+
+    return windows
+
+
+# ==============================================================================
+# Pooling
+# ==============================================================================
+
+
+def pool_embeddings(vectors: Sequence[Sequence[float]], weights: Sequence[int]) -> list[float]:
+    """Combine window embeddings into one vector.
+
+    Token-weighted mean followed by L2 normalization (cosine search is scale
+    invariant, normalization keeps pooled and single vectors comparable).
+
+    Args:
+        vectors: Window embeddings (same dimension)
+        weights: Token count of each window
+
+    Returns:
+        Pooled embedding
+
+    Raises:
+        ValueError: If vectors is empty or lengths mismatch
+    """
+    if not vectors or len(vectors) != len(weights):
+        raise ValueError("vectors and weights must be non-empty and of equal length")
+    if len(vectors) == 1:
+        return list(vectors[0])
+
+    total_weight = sum(max(1, w) for w in weights)
+    pooled = [0.0] * len(vectors[0])
+    for vector, weight in zip(vectors, weights, strict=True):
+        factor = max(1, weight) / total_weight
+        for i, value in enumerate(vector):
+            pooled[i] += value * factor
+
+    norm = math.sqrt(sum(value * value for value in pooled))
+    if norm == 0.0:
+        return pooled
+    return [value / norm for value in pooled]
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "LONG_CHUNK_STRATEGIES",
+    "TextWindow",
+    "WindowPolicy",
+    "estimate_tokens",
+    "get_token_counter",
+    "pool_embeddings",
+    "split_into_windows",
+]
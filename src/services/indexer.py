@@ -17,7 +17,8 @@ Key Features:
 - Incremental updates (only reindex changed files)
 - Batch processing for performance (100 files/batch, 50 embeddings/batch)
 - Comprehensive error tracking with partial success support
-- Performance metrics (files indexed, chunks created, duration)
+- Performance metrics (files indexed, chunks created, duration, per-stage durations)
+- Live progress reports (rate, ETA) while a run is in progress
 - Force reindex option (reindex all files)
 
 Note: Change event and embedding metadata tracking removed in database-per-project
@@ -28,16 +29,17 @@ from __future__ import annotations
 
 import asyncio
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Final, Iterator, Literal, Sequence, TypeVar
+from typing import Awaitable, Callable, Final, Iterator, Literal, Sequence, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config.settings import get_settings
+from src.config.settings import EmbeddingMode, get_settings
 from src.mcp.mcp_logging import get_logger
 from src.models import (
     # ChangeEvent,  # Removed - non-essential analytics not in database-per-project schema
@@ -46,8 +48,19 @@ from src.models import (
     # EmbeddingMetadata,  # Removed - non-essential analytics not in database-per-project schema
     Repository,
 )
+from src.services.chunk_generations import (
+    discard_unfinished_generations,
+    schedule_generation_gc,
+)
 from src.services.chunker import chunk_files_batch, detect_language
 from src.services.embedder import generate_embeddings
+from src.services.embedding_queue import enqueue_chunks, get_embedding_queue_pool
+from src.services.embedding_windows import (
+    TextWindow,
+    WindowPolicy,
+    pool_embeddings,
+    split_into_windows,
+)
 from src.services.scanner import ChangeSet, compute_file_hash, detect_changes, scan_repository
 
 # ==============================================================================
@@ -63,6 +76,9 @@ EMBEDDING_BATCH_SIZE: Final[int] = 5  # Texts per embedding batch - reduced to p
 # Performance targets
 TARGET_INDEXING_TIME_SECONDS: Final[int] = 60  # 60s for 10K files
 
+# Minimum seconds between progress reports
+PROGRESS_INTERVAL_SECONDS: Final[float] = 2.0
+
 T = TypeVar("T")
 
 
@@ -79,20 +95,197 @@ class IndexResult(BaseModel):
         files_indexed: Number of files processed
         chunks_created: Number of code chunks created
         duration_seconds: Total indexing time
-        status: Success status (success/partial/failed)
+        status: Success status (success/partial/failed, stopped when
+            should_stop ended the run early)
         errors: List of error messages encountered
+        embeddings_queued: Chunks stored without an embedding and queued for
+            embedding queue workers (deferred mode or failed batches)
+        stage_seconds: Time spent per stage (scan, detect_changes, chunk,
+            embed, persist, finalize)
     """
 
     repository_id: UUID
     files_indexed: int
     chunks_created: int
     duration_seconds: float
-    status: Literal["success", "partial", "failed"]
+    status: Literal["success", "partial", "failed", "stopped"]
     errors: list[str] = Field(default_factory=list)
+    embeddings_queued: int = 0
+    stage_seconds: dict[str, float] = Field(default_factory=dict)
+
+    model_config = {"frozen": True}
+
+
+class IndexCheckpoint(BaseModel):
+    """Progress of an indexing run after a committed file batch.
+
+    Attributes:
+        repository_id: UUID of repository being indexed
+        generation: Chunk generation being written (resume key for a full reindex)
+        files_total: Files to index in this run (including resumed ones)
+        files_done: Files committed so far
+        chunks_created: Chunks committed so far
+        batches_done: File batches committed so far
+    """
+
+    repository_id: UUID
+    generation: int
+    files_total: int
+    files_done: int
+    chunks_created: int
+    batches_done: int
+
+    model_config = {"frozen": True}
+
+
+# Awaited after every committed file batch (e.g. to persist job progress)
+CheckpointCallback = Callable[[IndexCheckpoint], Awaitable[None]]
+
+
+class IndexProgress(BaseModel):
+    """Live progress of an indexing run.
+
+    Attributes:
+        stage: Stage currently running (scan, detect_changes, chunk, embed,
+            persist, finalize)
+        files_total: Files to index in this run (0 until scanned)
+        files_chunked: Files read and chunked so far
+        files_done: Files committed so far
+        chunks_embedded: Chunks embedded so far (0 in deferred mode)
+        chunks_persisted: Chunks committed so far
+        elapsed_seconds: Time since the run started
+        files_per_second: Files completed per second (the batch being
+            embedded counts in proportion to its embedded chunks)
+        eta_seconds: Estimated time left (None until a rate is known)
+    """
+
+    stage: str
+    files_total: int
+    files_chunked: int
+    files_done: int
+    chunks_embedded: int
+    chunks_persisted: int
+    elapsed_seconds: float
+    files_per_second: float
+    eta_seconds: float | None
 
     model_config = {"frozen": True}
 
 
+# Awaited with live progress at most every PROGRESS_INTERVAL_SECONDS
+ProgressCallback = Callable[[IndexProgress], Awaitable[None]]
+
+# Checked before every file batch; True stops the run (cancel/pause)
+StopCallback = Callable[[], bool]
+
+
+# ==============================================================================
+# Progress Tracking
+# ==============================================================================
+
+
+class _ProgressTracker:
+    """Counters, stage timings and throttled progress reports of one run."""
+
+    def __init__(
+        self,
+        on_progress: ProgressCallback | None,
+        interval: float | None = None,
+    ) -> None:
+        self.on_progress = on_progress
+        self.interval = PROGRESS_INTERVAL_SECONDS if interval is None else interval
+        self.started = time.perf_counter()
+        self.stage_seconds: dict[str, float] = {}
+        self.current_stage = "scan"
+        self.files_total = 0
+        self.files_skipped = 0
+        self.files_chunked = 0
+        self.files_done = 0
+        self.chunks_embedded = 0
+        self.chunks_persisted = 0
+        self._run_started: float | None = None
+        self._batch_files = 0
+        self._batch_chunks = 0
+        self._batch_processed = 0
+        self._last_report: float | None = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage (durations of repeated stages add up)."""
+        self.current_stage = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] = (
+                self.stage_seconds.get(name, 0.0) + time.perf_counter() - start
+            )
+
+    def begin_run(self, files_total: int, files_skipped: int) -> None:
+        """Start the batch loop (files_skipped were done by an earlier run)."""
+        self.files_total = files_total
+        self.files_skipped = files_skipped
+        self.files_chunked = files_skipped
+        self.files_done = files_skipped
+        self._run_started = time.perf_counter()
+
+    def batch_chunked(self, files: int, chunks: int) -> None:
+        """Record a chunked file batch whose chunks are about to be embedded."""
+        self.files_chunked += files
+        self._batch_files = files
+        self._batch_chunks = chunks
+        self._batch_processed = 0
+
+    def expect_chunks(self, chunks: int) -> None:
+        """Update the chunk count of the batch (long chunks may be split)."""
+        self._batch_chunks = chunks
+
+    async def chunks_processed(self, chunks: int, embedded: bool) -> None:
+        """Record an embedding request (embedded=False if it failed)."""
+        self._batch_processed += chunks
+        if embedded:
+            self.chunks_embedded += chunks
+        await self.report()
+
+    async def batch_committed(self, files: int, chunks: int) -> None:
+        """Record a committed file batch."""
+        self.files_done += files
+        self.chunks_persisted += chunks
+        self._batch_files = self._batch_chunks = self._batch_processed = 0
+        await self.report()
+
+    def snapshot(self) -> IndexProgress:
+        """Current progress with rate and ETA."""
+        now = time.perf_counter()
+        done = float(self.files_done - self.files_skipped)
+        if self._batch_chunks:
+            done += self._batch_files * min(1.0, self._batch_processed / self._batch_chunks)
+        run_seconds = now - self._run_started if self._run_started is not None else 0.0
+        rate = done / run_seconds if done > 0 and run_seconds > 0 else 0.0
+        remaining = self.files_total - self.files_skipped - done
+        return IndexProgress(
+            stage=self.current_stage,
+            files_total=self.files_total,
+            files_chunked=self.files_chunked,
+            files_done=self.files_done,
+            chunks_embedded=self.chunks_embedded,
+            chunks_persisted=self.chunks_persisted,
+            elapsed_seconds=round(now - self.started, 3),
+            files_per_second=round(rate, 3),
+            eta_seconds=round(max(remaining, 0.0) / rate, 1) if rate > 0 else None,
+        )
+
+    async def report(self, force: bool = False) -> None:
+        """Send progress if the interval has passed since the last report."""
+        if self.on_progress is None:
+            return
+        now = time.perf_counter()
+        if not force and self._last_report is not None and now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        await self.on_progress(self.snapshot())
+
+
 # ==============================================================================
 # Helper Functions
 # ==============================================================================
@@ -116,6 +309,82 @@ def _batch(items: Sequence[T], batch_size: int) -> Iterator[list[T]]:
         yield list(items[i : i + batch_size])
 
 
+def _batch_windows(
+    chunk_windows: Sequence[Sequence[TextWindow]], batch_size: int
+) -> Iterator[list[int]]:
+    """Group chunk indices into length-bucketed batches, longest first.
+
+    A batch completes when its slowest text does, so chunks are ordered by
+    token count (descending) before grouping: each batch holds texts of
+    similar length, and the longest texts are scheduled first while the
+    model server is otherwise idle. Yielded indices refer to the original
+    positions in chunk_windows.
+
+    All windows of a chunk go into the same embedding request, so a chunk
+    longer than batch_size windows forms its own (larger) group.
+
+    Args:
+        chunk_windows: Embedding windows of each chunk
+        batch_size: Target number of windows per group
+
+    Yields:
+        Lists of chunk indices
+    """
+    order = sorted(
+        range(len(chunk_windows)),
+        key=lambda i: sum(window.tokens for window in chunk_windows[i]),
+        reverse=True,
+    )
+    group: list[int] = []
+    group_windows = 0
+    for i in order:
+        windows = chunk_windows[i]
+        if group and group_windows + len(windows) > batch_size:
+            yield group
+            group, group_windows = [], 0
+        group.append(i)
+        group_windows += len(windows)
+    if group:
+        yield group
+
+
+def _split_long_chunks(
+    chunks: Sequence[tuple[CodeChunk, str]],
+    chunk_windows: Sequence[list[TextWindow]],
+) -> tuple[list[tuple[CodeChunk, str]], list[list[TextWindow]]]:
+    """Replace chunks spanning several windows with one sub-chunk per window.
+
+    Args:
+        chunks: (chunk, embedding_text) pairs
+        chunk_windows: Embedding windows of each chunk
+
+    Returns:
+        Tuple of (chunks, windows) where every chunk has exactly one window
+    """
+    split_chunks: list[tuple[CodeChunk, str]] = []
+    split_windows: list[list[TextWindow]] = []
+    for (chunk, text), windows in zip(chunks, chunk_windows):
+        if len(windows) == 1:
+            split_chunks.append((chunk, text))
+            split_windows.append(windows)
+            continue
+        for window in windows:
+            sub_chunk = CodeChunk(
+                code_file_id=chunk.code_file_id,
+                repository_id=chunk.repository_id,
+                project_id=chunk.project_id,
+                content=window.text,
+                start_line=chunk.start_line + window.start_line,
+                end_line=chunk.start_line + window.end_line,
+                chunk_type=chunk.chunk_type,
+                generation=chunk.generation,
+                embedding=None,
+            )
+            split_chunks.append((sub_chunk, window.text))
+            split_windows.append([window])
+    return split_chunks, split_windows
+
+
 async def _get_or_create_repository(
     db: AsyncSession, path: Path, name: str
 ) -> Repository:
@@ -446,6 +715,213 @@ async def _create_change_events(
     )
 
 
+async def _files_in_generation(
+    db: AsyncSession, repository_id: UUID, generation: int
+) -> set[str]:
+    """Relative paths of files that already have chunks in generation.
+
+    Args:
+        db: Async database session
+        repository_id: UUID of repository
+        generation: Chunk generation to inspect
+
+    Returns:
+        Set of relative file paths
+    """
+    result = await db.execute(
+        select(CodeFile.relative_path)
+        .distinct()
+        .join(CodeChunk, CodeChunk.code_file_id == CodeFile.id)
+        .where(CodeChunk.repository_id == repository_id, CodeChunk.generation == generation)
+    )
+    return set(result.scalars().all())
+
+
+async def _chunk_file_batch(
+    db: AsyncSession,
+    repository_id: UUID,
+    repo_path: Path,
+    file_batch: list[Path],
+    project_id: str,
+    generation: int,
+    replace_existing: bool,
+    errors: list[str],
+) -> list[tuple[CodeChunk, str]]:
+    """Read, register and chunk one batch of files.
+
+    Args:
+        db: Async database session
+        repository_id: UUID of repository
+        repo_path: Root path of repository
+        file_batch: Absolute paths of the files in the batch
+        project_id: Project workspace identifier
+        generation: Generation the new chunks belong to
+        replace_existing: Delete the files' current chunks first (incremental
+            updates; a full reindex leaves the live generation untouched)
+        errors: Error list to append failures to
+
+    Returns:
+        (chunk, embedding_text) pairs without embeddings (empty on failure)
+    """
+    # Read file contents
+    file_contents: list[str] = []
+    for file_path in file_batch:
+        try:
+            content = await _read_file(file_path)
+            file_contents.append(content)
+        except Exception as e:
+            error_msg = f"Failed to read {file_path}: {e}"
+            errors.append(error_msg)
+            logger.error(
+                error_msg,
+                extra={"context": {"file_path": str(file_path), "error": str(e)}},
+            )
+            # Use empty content for failed reads
+            file_contents.append("")
+
+    # Create CodeFile records
+    try:
+        file_ids = await _create_code_files(db, repository_id, repo_path, file_batch)
+    except Exception as e:
+        error_msg = f"Failed to create CodeFile records: {e}"
+        errors.append(error_msg)
+        logger.error(
+            error_msg,
+            extra={"context": {"batch_size": len(file_batch), "error": str(e)}},
+        )
+        return []
+
+    # Delete old chunks for modified files
+    if replace_existing:
+        for file_id in file_ids:
+            try:
+                await _delete_chunks_for_file(db, file_id)
+            except Exception as e:
+                error_msg = f"Failed to delete chunks for file {file_id}: {e}"
+                errors.append(error_msg)
+                logger.warning(error_msg, extra={"context": {"file_id": str(file_id)}})
+
+    # Chunk files
+    try:
+        # Add project_id to each tuple for chunker
+        chunk_files_input = list(
+            zip(file_batch, file_contents, file_ids, [project_id] * len(file_ids))
+        )
+        chunk_lists = await chunk_files_batch(chunk_files_input)
+    except Exception as e:
+        error_msg = f"Failed to chunk files: {e}"
+        errors.append(error_msg)
+        logger.error(
+            error_msg,
+            extra={"context": {"batch_size": len(file_batch), "error": str(e)}},
+        )
+        return []
+
+    # Convert CodeChunkCreate to CodeChunk (without embeddings yet)
+    return [
+        (
+            CodeChunk(
+                code_file_id=chunk_create.code_file_id,
+                repository_id=repository_id,
+                project_id=chunk_create.project_id,
+                content=chunk_create.content,
+                start_line=chunk_create.start_line,
+                end_line=chunk_create.end_line,
+                chunk_type=chunk_create.chunk_type,
+                generation=generation,
+                embedding=None,  # Will be set after embedding generation
+            ),
+            chunk_create.content,
+        )
+        for chunk_list in chunk_lists
+        for chunk_create in chunk_list
+    ]
+
+
+async def _embed_chunks(
+    chunks: list[tuple[CodeChunk, str]],
+    window_policy: WindowPolicy,
+    deferred: bool,
+    errors: list[str],
+    progress: _ProgressTracker | None = None,
+) -> tuple[list[tuple[CodeChunk, str]], list[list[float]], int]:
+    """Generate embeddings for chunks in length-bucketed batches.
+
+    Texts are fitted to the embedding model's context window first (split
+    strategy replaces long chunks with sub-chunks). Chunks of failed batches
+    (and all chunks in deferred mode) get an empty embedding.
+
+    Args:
+        chunks: (chunk, embedding_text) pairs
+        window_policy: Context window policy
+        deferred: Skip embedding (queue workers embed later)
+        errors: Error list to append failures to
+        progress: Tracker notified after every embedding request
+
+    Returns:
+        Tuple of (chunks, embeddings aligned with chunks, embeddings generated)
+    """
+    chunk_windows = [split_into_windows(text, window_policy) for _, text in chunks]
+    long_chunks = sum(1 for windows in chunk_windows if len(windows) > 1)
+    if long_chunks:
+        logger.info(
+            f"{long_chunks} chunks exceed {window_policy.max_tokens} tokens, "
+            f"embedding as windows ({window_policy.strategy})",
+            extra={
+                "context": {
+                    "long_chunk_count": long_chunks,
+                    "window_count": sum(len(w) for w in chunk_windows),
+                    "max_tokens": window_policy.max_tokens,
+                    "strategy": window_policy.strategy,
+                }
+            },
+        )
+        if window_policy.strategy == "split":
+            chunks, chunk_windows = _split_long_chunks(chunks, chunk_windows)
+            if progress is not None:
+                progress.expect_chunks(len(chunks))
+
+    # Generate embeddings in length-bucketed batches, longest first
+    # (windows of a chunk share a batch; results keep chunk positions)
+    embeddings: list[list[float]] = [[] for _ in chunks]
+    generated = 0
+    if deferred:
+        return chunks, embeddings, generated
+
+    for group in _batch_windows(chunk_windows, EMBEDDING_BATCH_SIZE):
+        text_batch = [window.text for i in group for window in chunk_windows[i]]
+        try:
+            batch_embeddings = await generate_embeddings(text_batch)
+            offset = 0
+            for i in group:
+                windows = chunk_windows[i]
+                embeddings[i] = pool_embeddings(
+                    batch_embeddings[offset : offset + len(windows)],
+                    [window.tokens for window in windows],
+                )
+                offset += len(windows)
+            generated += len(batch_embeddings)
+            if progress is not None:
+                await progress.chunks_processed(len(group), embedded=True)
+        except Exception as e:
+            error_msg = f"Failed to generate embeddings: {e}"
+            errors.append(error_msg)
+            logger.error(
+                error_msg,
+                extra={
+                    "context": {
+                        "batch_size": len(text_batch),
+                        "error": str(e),
+                    }
+                },
+            )
+            # Chunks of the failed batch are queued for retry by the caller
+            if progress is not None:
+                await progress.chunks_processed(len(group), embedded=False)
+
+    return chunks, embeddings, generated
+
+
 async def _create_embedding_metadata(
     db: AsyncSession, count: int, duration_ms: float
 ) -> None:
@@ -496,16 +972,41 @@ async def index_repository(
     db: AsyncSession,
     project_id: str,
     force_reindex: bool = False,
+    resume_generation: int | None = None,
+    on_checkpoint: CheckpointCallback | None = None,
+    on_progress: ProgressCallback | None = None,
+    should_stop: StopCallback | None = None,
 ) -> IndexResult:
     """Index or re-index a repository.
 
+    A full reindex (force_reindex=True) builds the next chunk generation next
+    to the live one and switches Repository.active_generation on commit, so
+    searches keep returning the previous index until the new one is complete;
+    superseded chunks are garbage-collected in the background.
+
+    Files are processed in batches that are committed one by one, and
+    on_checkpoint is awaited after each. An interrupted incremental run is
+    resumed by simply running it again (finished files no longer show up as
+    changed); an interrupted full reindex is resumed by passing the
+    checkpointed generation as resume_generation. Any other run discards
+    the unfinished generation first and re-detects the files it touched.
+
+    on_progress is awaited at most every PROGRESS_INTERVAL_SECONDS with
+    files chunked, chunks embedded and persisted, rate and ETA; the time
+    spent per stage is returned in IndexResult.stage_seconds.
+
+    should_stop is checked before every file batch; when it returns True the
+    run ends with status "stopped". Committed batches are kept (like an
+    interruption), and a full reindex does not switch to its unfinished
+    generation.
+
     Orchestrates the complete indexing workflow:
     1. Get or create Repository record
     2. Scan repository for files
     3. Detect changes (or force reindex all)
     4. Chunk files in batches
-    5. Generate embeddings in batches
-    6. Store chunks with embeddings
+    5. Generate embeddings per batch (skipped when EMBEDDING_MODE=deferred)
+    6. Store and commit each batch, queueing chunks without an embedding
     7. Update repository metadata
     8. Create change events
 
@@ -515,6 +1016,11 @@ async def index_repository(
         db: Async database session
         project_id: Project workspace identifier
         force_reindex: If True, reindex all files (default: False)
+        resume_generation: Generation of an interrupted full reindex to
+            continue (files already stored in it are skipped)
+        on_checkpoint: Awaited with progress after every committed batch
+        on_progress: Awaited with live progress while the run is in progress
+        should_stop: Checked before every file batch (cancel/pause requests)
 
     Returns:
         IndexResult with summary statistics
@@ -529,6 +1035,7 @@ async def index_repository(
     """
     start_time = time.perf_counter()
     errors: list[str] = []
+    progress = _ProgressTracker(on_progress)
 
     logger.info(
         f"Starting repository indexing: {repo_path}",
@@ -546,8 +1053,19 @@ async def index_repository(
         # 1. Get or create Repository record
         repository = await _get_or_create_repository(db, repo_path, name)
 
+        # Full reindex writes a shadow generation; incremental updates
+        # replace chunks of changed files in the live generation
+        live_generation = repository.active_generation or 0
+        build_generation = live_generation + 1 if force_reindex else live_generation
+        resumed = force_reindex and resume_generation == build_generation
+        if not resumed:
+            # An interrupted full reindex is dropped together with the file
+            # metadata it stored, so its files are detected as changed again
+            await discard_unfinished_generations(db, repository)
+
         # 2. Scan repository for files
-        all_files = await scan_repository(repo_path)
+        with progress.stage("scan"):
+            all_files = await scan_repository(repo_path)
 
         logger.info(
             f"Scanned repository: {len(all_files)} files found",
@@ -568,7 +1086,8 @@ async def index_repository(
                 extra={"context": {"file_count": len(files_to_index)}},
             )
         else:
-            changeset = await detect_changes(repo_path, db, repository.id)
+            with progress.stage("detect_changes"):
+                changeset = await detect_changes(repo_path, db, repository.id)
             files_to_index = changeset.added + changeset.modified
 
             logger.info(
@@ -621,6 +1140,7 @@ async def index_repository(
                     duration_seconds=duration,
                     status="failed",
                     errors=errors,
+                    stage_seconds=progress.stage_seconds,
                 )
 
             # If we're in force_reindex mode but somehow nothing to index, that's suspicious
@@ -648,6 +1168,7 @@ async def index_repository(
                     duration_seconds=duration,
                     status="failed",
                     errors=errors,
+                    stage_seconds=progress.stage_seconds,
                 )
 
             # Normal incremental update case: no changes detected (this is OK)
@@ -673,179 +1194,184 @@ async def index_repository(
                 duration_seconds=duration,
                 status="success",
                 errors=[],
+                stage_seconds=progress.stage_seconds,
             )
 
-        # 4. Chunk files in batches
-        all_chunks_to_create: list[tuple[CodeChunk, str]] = []  # (chunk, embedding_text)
-        files_processed = 0
+        # Resume an interrupted full reindex: keep its generation and skip
+        # files that already have chunks in it
+        files_skipped = 0
+        if resumed:
+            with progress.stage("detect_changes"):
+                done_paths = await _files_in_generation(db, repository.id, build_generation)
+            remaining = [
+                f for f in files_to_index if str(f.relative_to(repo_path)) not in done_paths
+            ]
+            files_skipped = len(files_to_index) - len(remaining)
+            files_to_index = remaining
+            logger.info(
+                f"Resuming generation {build_generation}: {files_skipped} files already "
+                f"indexed, {len(files_to_index)} remaining",
+                extra={
+                    "context": {
+                        "repository_id": str(repository.id),
+                        "generation": build_generation,
+                        "files_skipped": files_skipped,
+                        "files_remaining": len(files_to_index),
+                    }
+                },
+            )
 
-        for file_batch in _batch(files_to_index, FILE_BATCH_SIZE):
+        # 4-6. Chunk, embed and store files batch by batch. Every batch is
+        # committed on its own, so an interrupted run keeps its progress:
+        # incremental runs re-detect only unfinished files, and a full
+        # reindex resumes its (still invisible) generation.
+        files_total = files_skipped + len(files_to_index)
+        files_processed = files_skipped
+        chunks_created = 0
+        embeddings_generated = 0
+        embeddings_queued = 0
+        embedding_seconds = 0.0
+        window_policy = WindowPolicy.from_settings()
+        deferred = get_settings().embedding_mode == EmbeddingMode.DEFERRED
+        progress.begin_run(files_total, files_skipped)
+        stopped = False
+
+        for batch_number, file_batch in enumerate(
+            _batch(files_to_index, FILE_BATCH_SIZE), start=1
+        ):
+            if should_stop is not None and should_stop():
+                stopped = True
+                break
             batch_start = time.perf_counter()
 
-            # Read file contents
-            file_contents: list[str] = []
-            for file_path in file_batch:
-                try:
-                    content = await _read_file(file_path)
-                    file_contents.append(content)
-                except Exception as e:
-                    error_msg = f"Failed to read {file_path}: {e}"
-                    errors.append(error_msg)
-                    logger.error(
-                        error_msg,
-                        extra={"context": {"file_path": str(file_path), "error": str(e)}},
-                    )
-                    # Use empty content for failed reads
-                    file_contents.append("")
-
-            # Create CodeFile records
-            try:
-                file_ids = await _create_code_files(
-                    db, repository.id, repo_path, file_batch
-                )
-            except Exception as e:
-                error_msg = f"Failed to create CodeFile records: {e}"
-                errors.append(error_msg)
-                logger.error(
-                    error_msg,
-                    extra={"context": {"batch_size": len(file_batch), "error": str(e)}},
-                )
-                continue
-
-            # Delete old chunks for modified files
-            for file_id in file_ids:
-                try:
-                    await _delete_chunks_for_file(db, file_id)
-                except Exception as e:
-                    error_msg = f"Failed to delete chunks for file {file_id}: {e}"
-                    errors.append(error_msg)
-                    logger.warning(error_msg, extra={"context": {"file_id": str(file_id)}})
-
-            # Chunk files
-            try:
-                # Add project_id to each tuple for chunker
-                chunk_files_input = list(
-                    zip(file_batch, file_contents, file_ids, [project_id] * len(file_ids))
-                )
-                chunk_lists = await chunk_files_batch(chunk_files_input)
-            except Exception as e:
-                error_msg = f"Failed to chunk files: {e}"
-                errors.append(error_msg)
-                logger.error(
-                    error_msg,
-                    extra={"context": {"batch_size": len(file_batch), "error": str(e)}},
+            # 4. Chunk files
+            with progress.stage("chunk"):
+                batch_chunks = await _chunk_file_batch(
+                    db,
+                    repository.id,
+                    repo_path,
+                    file_batch,
+                    project_id,
+                    generation=build_generation,
+                    replace_existing=not force_reindex,
+                    errors=errors,
                 )
-                continue
-
-            # Convert CodeChunkCreate to CodeChunk (without embeddings yet)
-            for chunk_list in chunk_lists:
-                for chunk_create in chunk_list:
-                    chunk = CodeChunk(
-                        code_file_id=chunk_create.code_file_id,
-                        project_id=chunk_create.project_id,
-                        content=chunk_create.content,
-                        start_line=chunk_create.start_line,
-                        end_line=chunk_create.end_line,
-                        chunk_type=chunk_create.chunk_type,
-                        embedding=None,  # Will be set after embedding generation
+            progress.batch_chunked(len(file_batch), len(batch_chunks))
+
+            if batch_chunks:
+                # 5. Generate embeddings (deferred mode: queue workers embed)
+                with progress.stage("embed"):
+                    embedding_start = time.perf_counter()
+                    batch_chunks, batch_embeddings, generated = await _embed_chunks(
+                        batch_chunks, window_policy, deferred, errors, progress
                     )
-                    all_chunks_to_create.append((chunk, chunk_create.content))
-
+                    embedding_seconds += time.perf_counter() - embedding_start
+                embeddings_generated += generated
+
+            with progress.stage("persist"):
+                if batch_chunks:
+                    # 6. Store chunks with embeddings; queue the rest for backfill
+                    for (chunk, _), embedding in zip(
+                        batch_chunks, batch_embeddings, strict=True
+                    ):
+                        if embedding:
+                            chunk.embedding = embedding
+                        db.add(chunk)
+
+                    await db.flush()
+                    unembedded = [
+                        chunk.id for chunk, _ in batch_chunks if chunk.embedding is None
+                    ]
+                    if unembedded:
+                        embeddings_queued += await enqueue_chunks(db, unembedded, project_id)
+
+                await db.commit()
             files_processed += len(file_batch)
-            batch_duration = time.perf_counter() - batch_start
+            chunks_created += len(batch_chunks)
+            await progress.batch_committed(len(file_batch), len(batch_chunks))
 
             logger.debug(
-                f"Processed file batch: {len(file_batch)} files, "
-                f"{sum(len(cl) for cl in chunk_lists)} chunks, "
-                f"{batch_duration:.2f}s",
+                f"Indexed file batch {batch_number}: {len(file_batch)} files, "
+                f"{len(batch_chunks)} chunks, {time.perf_counter() - batch_start:.2f}s",
                 extra={
                     "context": {
+                        "batch_number": batch_number,
                         "batch_size": len(file_batch),
-                        "chunk_count": sum(len(cl) for cl in chunk_lists),
-                        "duration_seconds": batch_duration,
+                        "chunk_count": len(batch_chunks),
+                        "files_done": files_processed,
+                        "files_total": files_total,
                     }
                 },
             )
 
-        logger.info(
-            f"Chunking complete: {files_processed} files, {len(all_chunks_to_create)} chunks",
-            extra={
-                "context": {
-                    "files_processed": files_processed,
-                    "chunk_count": len(all_chunks_to_create),
-                }
-            },
-        )
-
-        # 5. Generate embeddings in batches
-        embeddings_generated = 0
-
-        if all_chunks_to_create:
-            embedding_start = time.perf_counter()
-
-            # Extract texts for embedding
-            texts = [text for _, text in all_chunks_to_create]
-
-            # Generate embeddings in batches
-            all_embeddings: list[list[float]] = []
-
-            for text_batch in _batch(texts, EMBEDDING_BATCH_SIZE):
-                try:
-                    batch_embeddings = await generate_embeddings(text_batch)
-                    all_embeddings.extend(batch_embeddings)
-                    embeddings_generated += len(batch_embeddings)
-                except Exception as e:
-                    error_msg = f"Failed to generate embeddings: {e}"
-                    errors.append(error_msg)
-                    logger.error(
-                        error_msg,
-                        extra={
-                            "context": {
-                                "batch_size": len(text_batch),
-                                "error": str(e),
-                            }
-                        },
+            if on_checkpoint is not None:
+                await on_checkpoint(
+                    IndexCheckpoint(
+                        repository_id=repository.id,
+                        generation=build_generation,
+                        files_total=files_total,
+                        files_done=files_processed,
+                        chunks_created=chunks_created,
+                        batches_done=batch_number,
                     )
-                    # Add None for failed embeddings
-                    all_embeddings.extend([[] for _ in text_batch])
-
-            embedding_duration_ms = (time.perf_counter() - embedding_start) * 1000
+                )
 
+        if stopped:
+            if embeddings_queued:
+                get_embedding_queue_pool().notify(project_id)
+            duration = time.perf_counter() - start_time
             logger.info(
-                f"Generated {embeddings_generated} embeddings in {embedding_duration_ms:.0f}ms",
+                f"Repository indexing stopped on request after {files_processed} files",
                 extra={
                     "context": {
-                        "embedding_count": embeddings_generated,
-                        "duration_ms": embedding_duration_ms,
-                        "avg_ms_per_embedding": (
-                            embedding_duration_ms / embeddings_generated
-                            if embeddings_generated > 0
-                            else 0
-                        ),
+                        "repository_id": str(repository.id),
+                        "files_indexed": files_processed,
+                        "files_total": files_total,
+                        "duration_seconds": duration,
                     }
                 },
             )
+            return IndexResult(
+                repository_id=repository.id,
+                files_indexed=files_processed,
+                chunks_created=chunks_created,
+                duration_seconds=duration,
+                status="stopped",
+                errors=errors,
+                embeddings_queued=embeddings_queued,
+                stage_seconds=progress.stage_seconds,
+            )
+
+        embedding_duration_ms = embedding_seconds * 1000
+        logger.info(
+            f"Stored {chunks_created} chunks: {embeddings_generated} embeddings generated "
+            f"in {embedding_duration_ms:.0f}ms, {embeddings_queued} queued for embedding",
+            extra={
+                "context": {
+                    "chunk_count": chunks_created,
+                    "embedding_count": embeddings_generated,
+                    "embeddings_queued": embeddings_queued,
+                    "duration_ms": embedding_duration_ms,
+                }
+            },
+        )
 
+        with progress.stage("finalize"):
             # Create embedding metadata for analytics
             if embeddings_generated > 0:
                 await _create_embedding_metadata(db, embeddings_generated, embedding_duration_ms)
 
-            # 6. Store chunks with embeddings
-            for i, (chunk, _) in enumerate(all_chunks_to_create):
-                if i < len(all_embeddings) and all_embeddings[i]:
-                    chunk.embedding = all_embeddings[i]
-                db.add(chunk)
-
-            logger.info(
-                f"Stored {len(all_chunks_to_create)} chunks in database",
-                extra={"context": {"chunk_count": len(all_chunks_to_create)}},
-            )
-
-        # 7. Update repository metadata
-        repository.last_indexed_at = datetime.utcnow()
+            # 7. Update repository metadata (switch to the new generation)
+            repository.last_indexed_at = datetime.utcnow()
+            repository.active_generation = build_generation
 
-        # 8. Commit transaction
-        await db.commit()
+            # 8. Commit transaction
+            await db.commit()
+            if build_generation != live_generation:
+                schedule_generation_gc(project_id, repository.id)
+            if embeddings_queued:
+                get_embedding_queue_pool().notify(project_id)
+        await progress.report(force=True)
 
         duration = time.perf_counter() - start_time
 
@@ -860,9 +1386,10 @@ async def index_repository(
             extra={
                 "context": {
                     "repository_id": str(repository.id),
-                    "files_indexed": len(files_to_index),
-                    "chunks_created": len(all_chunks_to_create),
+                    "files_indexed": files_processed,
+                    "chunks_created": chunks_created,
                     "duration_seconds": duration,
+                    "stage_seconds": progress.stage_seconds,
                     "status": status,
                     "error_count": len(errors),
                 }
@@ -871,11 +1398,13 @@ async def index_repository(
 
         return IndexResult(
             repository_id=repository.id,
-            files_indexed=len(files_to_index),
-            chunks_created=len(all_chunks_to_create),
+            files_indexed=files_processed,
+            chunks_created=chunks_created,
             duration_seconds=duration,
             status=status,
             errors=errors,
+            embeddings_queued=embeddings_queued,
+            stage_seconds=progress.stage_seconds,
         )
 
     except Exception as e:
@@ -905,6 +1434,7 @@ async def index_repository(
             duration_seconds=duration,
             status="failed",
             errors=errors,
+            stage_seconds=progress.stage_seconds,
         )
 
 
@@ -965,6 +1495,8 @@ async def incremental_update(
 # ==============================================================================
 
 __all__ = [
+    "IndexCheckpoint",
+    "IndexProgress",
     "IndexResult",
     "index_repository",
     "incremental_update",
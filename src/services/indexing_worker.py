@@ -0,0 +1,338 @@
+"""Standalone indexing worker process.
+
+Runs indexing jobs outside the MCP server so chunking, embedding and ORM work
+never compete with search_code for the server's event loop. With
+INDEXING_ENQUEUE_ONLY=true the server only records pending jobs in
+indexing_jobs; any number of worker processes, on any host that can reach the
+databases and the repositories, claim them:
+
+    python -m src.services.indexing_worker [--concurrency N] [--poll-interval S]
+
+(python -m src.services.background_worker starts the same worker.)
+
+Constitutional Compliance:
+- Principle IV: Performance (query serving isolated from indexing load)
+- Principle V: Production quality (graceful shutdown, crash recovery)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Claiming:
+    SELECT ... FOR UPDATE SKIP LOCKED picks the oldest pending job
+    (incremental before full reindex, like the in-process scheduler) and marks
+    it running in the same transaction, so workers never run a job twice or
+    block on each other.
+
+Failure Handling:
+- Jobs whose worker dies keep a stale heartbeat; every worker periodically
+  runs orphaned-job recovery, which returns them to pending
+- On SIGTERM/SIGINT in-flight jobs are cancelled and released to pending
+  immediately; they resume from their checkpoint
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+import sys
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import get_settings
+from src.connection_pool.priority import WorkPriority, priority_scope
+from src.database.session import JobsSessionLocal
+from src.mcp.mcp_logging import get_logger
+from src.models.indexing_job import IndexingJob
+from src.services import background_worker
+from src.services.job_recovery import recover_stale_jobs
+from src.services.job_scheduler import ScheduledJob
+from src.services.job_store import get_job_store
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+
+# ==============================================================================
+# Claiming
+# ==============================================================================
+
+
+async def claim_next_job(session: AsyncSession) -> ScheduledJob | None:
+    """Lock the next pending job and mark it running.
+
+    Args:
+        session: Session of the main database (committed on claim)
+
+    Returns:
+        The claimed job, or None if no pending job is available
+    """
+    result = await session.execute(
+        select(IndexingJob)
+        .where(IndexingJob.status == "pending")
+        # Incremental jobs first (false < true), oldest first
+        .order_by(IndexingJob.force_reindex, IndexingJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    job = result.scalar_one_or_none()
+    if job is None:
+        return None
+
+    claimed = ScheduledJob(
+        job_id=job.id,
+        repo_path=job.repo_path,
+        project_id=job.project_id,
+        config_path=Path(job.config_path) if job.config_path else None,
+        force_reindex=job.force_reindex,
+        resume=job.checkpoint is not None,
+    )
+    job.status = "running"
+    job.heartbeat_at = func.now()
+    await session.commit()
+    return claimed
+
+
+# ==============================================================================
+# Worker
+# ==============================================================================
+
+
+class IndexingWorker:
+    """Claims and runs indexing jobs until stopped.
+
+    Lifecycle:
+        1. start() launches `concurrency` claim loops and periodic recovery
+        2. Each loop claims a job, runs it, and polls again when idle
+        3. stop() cancels in-flight jobs and releases them to pending
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        poll_interval: float | None = None,
+        recovery_interval: float | None = None,
+    ) -> None:
+        """Initialize worker (defaults come from settings).
+
+        Args:
+            concurrency: Jobs run at the same time
+                (default: INDEXING_MAX_CONCURRENT_JOBS)
+            poll_interval: Seconds an idle loop waits before polling again
+                (default: INDEXING_WORKER_POLL_INTERVAL)
+            recovery_interval: Seconds between orphaned-job recovery passes
+                (default: JOB_STALE_AFTER)
+        """
+        settings = get_settings()
+        self.concurrency = (
+            settings.indexing_max_concurrent_jobs if concurrency is None else concurrency
+        )
+        self.poll_interval = (
+            settings.indexing_worker_poll_interval if poll_interval is None else poll_interval
+        )
+        self.recovery_interval = (
+            settings.job_stale_after if recovery_interval is None else recovery_interval
+        )
+        self.jobs_run = 0
+        self._in_flight: set[UUID] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._running = False
+
+    async def run_once(self) -> bool:
+        """Claim and run one job.
+
+        Returns:
+            True if a job was run, False if none was pending
+        """
+        async with JobsSessionLocal() as session:
+            job = await claim_next_job(session)
+        if job is None:
+            return False
+
+        self._in_flight.add(job.job_id)
+        try:
+            with priority_scope(WorkPriority.BULK):
+                await background_worker._background_indexing_worker(
+                    job_id=job.job_id,
+                    repo_path=job.repo_path,
+                    project_id=job.project_id,
+                    config_path=job.config_path,
+                    force_reindex=job.force_reindex,
+                    resume=job.resume,
+                )
+        finally:
+            self._in_flight.discard(job.job_id)
+        self.jobs_run += 1
+        return True
+
+    async def start(self) -> None:
+        """Start claim loops and periodic recovery.
+
+        Idempotent - safe to call multiple times.
+        """
+        if self._running:
+            return
+
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(worker_id))
+            for worker_id in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._recovery_loop()))
+        logger.info(
+            "Indexing worker started",
+            extra={
+                "context": {
+                    "concurrency": self.concurrency,
+                    "poll_interval": self.poll_interval,
+                }
+            },
+        )
+
+    async def stop(self) -> None:
+        """Cancel in-flight jobs and release them to pending.
+
+        Idempotent - safe to call multiple times.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        in_flight = list(self._in_flight)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if in_flight:
+            try:
+                await self._release(in_flight)
+            except Exception as e:
+                # Recovery returns them to pending once their heartbeat is stale
+                logger.warning(
+                    f"Failed to release in-flight jobs: {e}",
+                    extra={"context": {"job_ids": [str(j) for j in in_flight]}},
+                )
+
+        logger.info(
+            "Indexing worker stopped",
+            extra={"context": {"jobs_run": self.jobs_run, "released": len(in_flight)}},
+        )
+
+    async def _release(self, job_ids: list[UUID]) -> None:
+        """Return interrupted jobs to pending so another worker resumes them."""
+        async with JobsSessionLocal() as session:
+            await session.execute(
+                update(IndexingJob)
+                .where(IndexingJob.id.in_(job_ids), IndexingJob.status == "running")
+                .values(status="pending", heartbeat_at=None)
+            )
+            await session.commit()
+
+    async def _worker_loop(self, worker_id: int) -> None:
+        """Run jobs back to back; poll every poll_interval when idle."""
+        while self._running:
+            try:
+                if not await self.run_once():
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(
+                    f"Error in indexing worker loop {worker_id}: {e}",
+                    extra={"context": {"worker_id": worker_id, "error": str(e)}},
+                )
+                await asyncio.sleep(self.poll_interval)
+
+    async def _recovery_loop(self) -> None:
+        """Return jobs of dead workers (stale heartbeat) to pending."""
+        while self._running:
+            try:
+                await recover_stale_jobs(requeue_only=True)
+                await asyncio.sleep(self.recovery_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(
+                    f"Orphaned job recovery failed: {e}",
+                    extra={"context": {"error": str(e)}},
+                )
+                await asyncio.sleep(self.recovery_interval)
+
+
+# ==============================================================================
+# Entry Point
+# ==============================================================================
+
+
+async def run_worker(concurrency: int | None = None, poll_interval: float | None = None) -> None:
+    """Run an indexing worker until SIGINT/SIGTERM.
+
+    Also runs the embedding queue workers, since deferred embeddings of the
+    chunks indexed here are queued for this process.
+
+    Args:
+        concurrency: Jobs run at the same time
+        poll_interval: Seconds an idle loop waits before polling again
+    """
+    from src.database.session import close_db_connection
+    from src.services.embedder import OllamaEmbedder
+    from src.services.embedding_queue import get_embedding_queue_pool
+
+    stop_requested = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_requested.set)
+
+    worker = IndexingWorker(concurrency=concurrency, poll_interval=poll_interval)
+    await get_embedding_queue_pool().start()
+    await worker.start()
+    sys.stderr.write(
+        f"INFO: Indexing worker running ({worker.concurrency} concurrent jobs)\n"
+    )
+    try:
+        await stop_requested.wait()
+    finally:
+        await worker.stop()
+        await get_job_store().stop()
+        await get_embedding_queue_pool().stop()
+        await OllamaEmbedder().close()
+        await close_db_connection()
+        sys.stderr.write("INFO: Indexing worker stopped\n")
+
+
+def main() -> None:
+    """Command-line entry point for the standalone indexing worker."""
+    parser = argparse.ArgumentParser(
+        description="Claim and run codebase-mcp indexing jobs from indexing_jobs."
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=None,
+        help="Jobs run at the same time (default: INDEXING_MAX_CONCURRENT_JOBS)",
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=None,
+        help="Seconds between polls when idle (default: INDEXING_WORKER_POLL_INTERVAL)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run_worker(concurrency=args.concurrency, poll_interval=args.poll_interval))
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "IndexingWorker",
+    "claim_next_job",
+    "main",
+    "run_worker",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Push notifications for indexing job progress (PostgreSQL LISTEN/NOTIFY).
+
+Every job update written by a worker (status change, checkpoint) also sends
+NOTIFY indexing_job_events in the same transaction, so the notification is
+delivered exactly when the change becomes visible - from this process or
+from a standalone worker on another host. The server keeps one LISTEN
+connection to the main database and wakes get_indexing_status calls that
+long-poll a job (wait_seconds), instead of clients opening a new connection
+every couple of seconds.
+
+Constitutional Compliance:
+- Principle IV: Performance (no polling load, completion reported at once)
+- Principle V: Production quality (falls back to polling without LISTEN)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Payload:
+    {"job_id": "<uuid>", "status": "<status>"} (well below the 8000 byte
+    NOTIFY limit)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Final, Iterator
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.database.session import engine
+from src.mcp.mcp_logging import get_logger
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+JOB_EVENTS_CHANNEL: Final[str] = "indexing_job_events"
+
+# Job states after which no further events are sent
+TERMINAL_STATES: Final[tuple[str, ...]] = ("completed", "failed", "cancelled")
+
+# Upper bound for one long-poll (keeps MCP requests well below client timeouts)
+MAX_WAIT_SECONDS: Final[float] = 60.0
+
+# Re-read interval while waiting without a LISTEN connection
+FALLBACK_POLL_INTERVAL: Final[float] = 1.0
+
+# Seconds before connecting the listener is retried after a failure
+RECONNECT_BACKOFF_SECONDS: Final[float] = 30.0
+
+
+# ==============================================================================
+# Sending
+# ==============================================================================
+
+
+async def notify_job_event(session: AsyncSession, job_id: UUID, status: str) -> None:
+    """Queue a job event; PostgreSQL delivers it when session commits.
+
+    Args:
+        session: Session of the main database that is updating the job
+        job_id: UUID of indexing_jobs row
+        status: Job status after the update
+    """
+    payload = json.dumps({"job_id": str(job_id), "status": status})
+    await session.execute(select(func.pg_notify(JOB_EVENTS_CHANNEL, payload)))
+
+
+# ==============================================================================
+# Listening
+# ==============================================================================
+
+
+class JobEventListener:
+    """Single LISTEN connection fanning job events out to waiting requests.
+
+    Lifecycle:
+        1. start() connects lazily on the first long-poll (idempotent)
+        2. subscription(job_id) registers an event before the job is read,
+           so an update between read and wait is never missed
+        3. stop() closes the connection (FastMCP lifespan shutdown)
+    """
+
+    def __init__(self) -> None:
+        """Initialize listener (not connected)."""
+        self._connection: AsyncConnection | None = None
+        self._driver_connection: Any = None
+        self._waiters: dict[UUID, set[asyncio.Event]] = {}
+        self._lock = asyncio.Lock()
+        self._failed_at: float | None = None
+
+    @property
+    def listening(self) -> bool:
+        """Whether notifications are currently being received."""
+        return self._is_listening()
+
+    def _is_listening(self) -> bool:
+        """listening, as a call (re-checked under the lock without type narrowing)."""
+        return self._driver_connection is not None and not self._driver_connection.is_closed()
+
+    async def start(self) -> bool:
+        """Connect and LISTEN (no-op when already listening).
+
+        Returns:
+            True if notifications are being received; False if LISTEN is
+            unavailable (callers fall back to polling)
+        """
+        if self._is_listening():
+            return True
+
+        async with self._lock:
+            if self._is_listening():
+                return True
+            if (
+                self._failed_at is not None
+                and time.monotonic() - self._failed_at < RECONNECT_BACKOFF_SECONDS
+            ):
+                return False
+
+            await self._close()
+            try:
+                self._connection = await engine.connect()
+                raw = await self._connection.get_raw_connection()
+                self._driver_connection = raw.driver_connection
+                await self._driver_connection.add_listener(
+                    JOB_EVENTS_CHANNEL, self._on_notification
+                )
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                await self._close()
+                logger.warning(
+                    f"Job event listener unavailable, long-polls will poll: {e}",
+                    extra={"context": {"channel": JOB_EVENTS_CHANNEL, "error": str(e)}},
+                )
+                return False
+
+            self._failed_at = None
+            logger.info(
+                "Listening for indexing job events",
+                extra={"context": {"channel": JOB_EVENTS_CHANNEL}},
+            )
+            return True
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection.
+
+        Idempotent - safe to call multiple times.
+        """
+        async with self._lock:
+            await self._close()
+
+    async def _close(self) -> None:
+        """Release the connection, ignoring errors of a broken connection."""
+        connection, self._connection, self._driver_connection = self._connection, None, None
+        if connection is not None:
+            try:
+                await connection.close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def subscription(self, job_id: UUID) -> Iterator[asyncio.Event]:
+        """Receive events of job_id while the context is open.
+
+        Yields:
+            Event set whenever a notification for job_id arrives
+        """
+        event = asyncio.Event()
+        self._waiters.setdefault(job_id, set()).add(event)
+        try:
+            yield event
+        finally:
+            waiters = self._waiters.get(job_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[job_id]
+
+    def dispatch(self, job_id: UUID) -> None:
+        """Wake every request waiting for job_id."""
+        for event in self._waiters.get(job_id, ()):
+            event.set()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg listener callback: route a NOTIFY payload to its waiters."""
+        try:
+            job_id = UUID(json.loads(payload)["job_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.debug(f"Ignoring malformed job event payload: {payload!r}")
+            return
+        self.dispatch(job_id)
+
+
+# ==============================================================================
+# Global Instance
+# ==============================================================================
+
+# Global singleton (started on first long-poll, stopped in FastMCP lifespan)
+_job_event_listener: JobEventListener | None = None
+
+
+def get_job_event_listener() -> JobEventListener:
+    """Get global job event listener.
+
+    Creates singleton on first call.
+
+    Returns:
+        Global JobEventListener instance
+    """
+    global _job_event_listener
+    if _job_event_listener is None:
+        _job_event_listener = JobEventListener()
+    return _job_event_listener
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "FALLBACK_POLL_INTERVAL",
+    "JOB_EVENTS_CHANNEL",
+    "MAX_WAIT_SECONDS",
+    "TERMINAL_STATES",
+    "JobEventListener",
+    "get_job_event_listener",
+    "notify_job_event",
+]
@@ -0,0 +1,372 @@
+"""Bounded scheduler for background indexing jobs.
+
+Indexing jobs used to start as soon as they were requested, each in its own
+task, so a burst of requests ran that many indexers concurrently against the
+same Ollama endpoints and databases. The scheduler runs at most
+INDEXING_MAX_CONCURRENT_JOBS jobs at a time and keeps the rest in a priority
+queue: incremental jobs (usually seconds) run before full reindexes (minutes),
+first come first served within a priority.
+
+Duplicate requests are coalesced before they reach the scheduler: the
+indexing_jobs table allows one pending/running job per (project_id, repo_path)
+(unique partial index), and start_indexing_background returns that job's id.
+
+Constitutional Compliance:
+- Principle IV: Performance (bounded Ollama and database load)
+- Principle V: Production quality (queued jobs survive restarts via recovery)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Liveness:
+    Queued jobs are pending rows in indexing_jobs; the scheduler refreshes
+    their heartbeat_at so recovery in another server process does not
+    mistake a long queue for orphaned jobs. On shutdown, running and queued
+    jobs are released (pending, no heartbeat), and recovery runs every
+    JOB_STALE_AFTER seconds, so they are resumed after a restart however
+    soon it follows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+from uuid import UUID
+
+from sqlalchemy import func, update
+
+from src.config.settings import get_settings
+from src.connection_pool.priority import WorkPriority, priority_scope
+from src.database.session import JobsSessionLocal
+from src.mcp.mcp_logging import get_logger
+from src.models.indexing_job import IndexingJob
+from src.services import background_worker
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Queue priorities (lower runs first)
+PRIORITY_INCREMENTAL: Final[int] = 0
+PRIORITY_FULL_REINDEX: Final[int] = 1
+
+
+# ==============================================================================
+# Data Models
+# ==============================================================================
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """Arguments of one queued _background_indexing_worker run.
+
+    Attributes:
+        job_id: UUID of indexing_jobs row
+        repo_path: Absolute path to repository
+        project_id: Resolved project identifier
+        config_path: Optional .codebase-mcp/config.json for auto-creation
+        force_reindex: Full reindex instead of incremental
+        resume: Continue from the job's last checkpoint
+    """
+
+    job_id: UUID
+    repo_path: str
+    project_id: str
+    config_path: Path | None = None
+    force_reindex: bool = False
+    resume: bool = False
+
+    @property
+    def priority(self) -> int:
+        """Queue priority: incremental jobs before full reindexes."""
+        return PRIORITY_FULL_REINDEX if self.force_reindex else PRIORITY_INCREMENTAL
+
+
+# ==============================================================================
+# Scheduler
+# ==============================================================================
+
+
+class IndexingJobScheduler:
+    """Priority queue of indexing jobs drained by a fixed number of workers.
+
+    Lifecycle:
+        1. start() starts workers and periodic orphaned-job recovery
+           (FastMCP lifespan); submit(job) queues a job (workers start on
+           first use)
+        2. Workers run _background_indexing_worker one job at a time
+        3. Call stop() before shutdown (running jobs are cancelled and, like
+           queued ones, released to pending for recovery to resume)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        heartbeat_interval: float | None = None,
+        recovery_interval: float | None = None,
+    ) -> None:
+        """Initialize scheduler (defaults come from settings).
+
+        Args:
+            max_concurrent: Jobs run at the same time
+                (default: INDEXING_MAX_CONCURRENT_JOBS)
+            heartbeat_interval: Seconds between heartbeats of queued jobs
+                (default: JOB_HEARTBEAT_INTERVAL)
+            recovery_interval: Seconds between orphaned-job recovery passes
+                (default: JOB_STALE_AFTER)
+        """
+        settings = get_settings()
+        self.max_concurrent = (
+            settings.indexing_max_concurrent_jobs if max_concurrent is None else max_concurrent
+        )
+        self.heartbeat_interval = (
+            settings.job_heartbeat_interval if heartbeat_interval is None else heartbeat_interval
+        )
+        self.recovery_interval = (
+            settings.job_stale_after if recovery_interval is None else recovery_interval
+        )
+        self._queue: asyncio.PriorityQueue[tuple[int, int, ScheduledJob]] = (
+            asyncio.PriorityQueue()
+        )
+        self._sequence = itertools.count()
+        # Queued job -> sequence of its live queue entry (withdrawn jobs'
+        # entries stay in the heap and are skipped)
+        self._queued: dict[UUID, int] = {}
+        self._in_flight: set[UUID] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._recovery: asyncio.Task[None] | None = None
+        self._running = False
+
+    @property
+    def queued_count(self) -> int:
+        """Jobs waiting for a free worker."""
+        return len(self._queued)
+
+    def submit(self, job: ScheduledJob) -> bool:
+        """Queue a job unless it is already queued or running in this process.
+
+        Args:
+            job: Job to run
+
+        Returns:
+            True if the job was queued
+        """
+        if job.job_id in self._queued or background_worker.is_job_active(job.job_id):
+            return False
+
+        self._start_workers()
+        sequence = next(self._sequence)
+        self._queued[job.job_id] = sequence
+        self._queue.put_nowait((job.priority, sequence, job))
+        logger.info(
+            f"Indexing job {job.job_id} queued",
+            extra={
+                "context": {
+                    "job_id": str(job.job_id),
+                    "priority": job.priority,
+                    "queued": self.queued_count,
+                }
+            },
+        )
+        return True
+
+    def withdraw(self, job_id: UUID) -> bool:
+        """Remove a queued job (cancelled or paused before it started).
+
+        Args:
+            job_id: UUID of indexing_jobs row
+
+        Returns:
+            True if the job was waiting in the queue
+        """
+        return self._queued.pop(job_id, None) is not None
+
+    async def start(self) -> None:
+        """Start worker tasks and periodic recovery of orphaned jobs.
+
+        Idempotent - safe to call multiple times.
+        """
+        self._start_workers()
+        if self._recovery is None:
+            self._recovery = asyncio.create_task(self._recovery_loop())
+
+    async def stop(self) -> None:
+        """Cancel running jobs and release them and queued jobs to pending.
+
+        Idempotent - safe to call multiple times.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        released = [*self._in_flight, *self._queued]
+        tasks = [*self._tasks, *([self._recovery] if self._recovery else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._recovery = None
+        self._queued.clear()
+
+        if released:
+            try:
+                await self._release(released)
+            except Exception as e:
+                # Recovery returns them to pending once their heartbeat is stale
+                logger.warning(
+                    f"Failed to release indexing jobs: {e}",
+                    extra={"context": {"job_ids": [str(j) for j in released]}},
+                )
+
+        logger.info(
+            "Indexing job scheduler stopped",
+            extra={"context": {"released": len(released)}},
+        )
+
+    async def _release(self, job_ids: list[UUID]) -> None:
+        """Return running and queued jobs to pending without a heartbeat."""
+        async with JobsSessionLocal() as session:
+            await session.execute(
+                update(IndexingJob)
+                .where(
+                    IndexingJob.id.in_(job_ids),
+                    IndexingJob.status.in_(("pending", "running")),
+                )
+                .values(status="pending", heartbeat_at=None)
+            )
+            await session.commit()
+
+    def _start_workers(self) -> None:
+        """Create worker and heartbeat tasks (no-op when already running)."""
+        if self._running:
+            return
+
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(worker_id))
+            for worker_id in range(self.max_concurrent)
+        ]
+        self._tasks.append(asyncio.create_task(self._heartbeat_loop()))
+        logger.info(
+            "Indexing job scheduler started",
+            extra={"context": {"max_concurrent": self.max_concurrent}},
+        )
+
+    async def _worker_loop(self, worker_id: int) -> None:
+        """Run queued jobs one at a time, highest priority first."""
+        while self._running:
+            try:
+                _, sequence, job = await self._queue.get()
+            except asyncio.CancelledError:
+                break
+
+            if self._queued.get(job.job_id) != sequence:
+                self._queue.task_done()
+                continue  # Withdrawn (or re-submitted) while queued
+            del self._queued[job.job_id]
+            self._in_flight.add(job.job_id)
+            try:
+                # Looked up at call time so the worker can be replaced in tests
+                # (bulk priority: searches go ahead of indexing)
+                with priority_scope(WorkPriority.BULK):
+                    await background_worker._background_indexing_worker(
+                        job_id=job.job_id,
+                        repo_path=job.repo_path,
+                        project_id=job.project_id,
+                        config_path=job.config_path,
+                        force_reindex=job.force_reindex,
+                        resume=job.resume,
+                    )
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # The worker records its own failures; this only guards the loop
+                logger.error(
+                    f"Error in indexing scheduler worker {worker_id}: {e}",
+                    extra={"context": {"worker_id": worker_id, "job_id": str(job.job_id)}},
+                )
+            finally:
+                self._in_flight.discard(job.job_id)
+                self._queue.task_done()
+
+    async def _recovery_loop(self) -> None:
+        """Resume jobs of stopped or crashed processes (stale heartbeat)."""
+        # Imported here: job_recovery submits recovered jobs to this scheduler
+        from src.services.job_recovery import recover_stale_jobs
+
+        while self._running:
+            try:
+                await recover_stale_jobs()
+                await asyncio.sleep(self.recovery_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Best effort: a missing jobs table must not stop the scheduler
+                logger.warning(
+                    f"Orphaned job recovery failed: {e}",
+                    extra={"context": {"error": str(e)}},
+                )
+                await asyncio.sleep(self.recovery_interval)
+
+    async def _heartbeat_loop(self) -> None:
+        """Keep heartbeats of queued (pending) jobs fresh."""
+        while self._running:
+            try:
+                await asyncio.sleep(self.heartbeat_interval)
+                if self._queued:
+                    await self._touch_queued(list(self._queued))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(
+                    f"Failed to refresh heartbeats of queued jobs: {e}",
+                    extra={"context": {"queued": self.queued_count, "error": str(e)}},
+                )
+
+    async def _touch_queued(self, job_ids: list[UUID]) -> None:
+        """Set heartbeat_at of pending jobs to the database clock."""
+        async with JobsSessionLocal() as session:
+            await session.execute(
+                update(IndexingJob)
+                .where(IndexingJob.id.in_(job_ids), IndexingJob.status == "pending")
+                .values(heartbeat_at=func.now())
+            )
+            await session.commit()
+
+
+# ==============================================================================
+# Global Instance
+# ==============================================================================
+
+# Global singleton (stopped in FastMCP lifespan)
+_indexing_scheduler: IndexingJobScheduler | None = None
+
+
+def get_indexing_scheduler() -> IndexingJobScheduler:
+    """Get global indexing job scheduler.
+
+    Creates singleton on first call.
+
+    Returns:
+        Global IndexingJobScheduler instance
+    """
+    global _indexing_scheduler
+    if _indexing_scheduler is None:
+        _indexing_scheduler = IndexingJobScheduler()
+    return _indexing_scheduler
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "PRIORITY_FULL_REINDEX",
+    "PRIORITY_INCREMENTAL",
+    "IndexingJobScheduler",
+    "ScheduledJob",
+    "get_indexing_scheduler",
+]
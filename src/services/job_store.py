@@ -0,0 +1,255 @@
+"""Write-behind status store for indexing jobs.
+
+Workers report progress after every file batch, and clients read job status
+while they wait. Going to indexing_jobs for each of these costs a connection
+and a round trip per call. The store keeps the status of jobs running in this
+process in memory and writes to indexing_jobs through a small connection
+pool (jobs_engine):
+
+- Progress-only updates (files indexed, checkpoints, status messages) are
+  buffered and written together every JOB_STATUS_FLUSH_INTERVAL seconds
+- Status transitions (pending → running → completed/failed) are written
+  immediately, since recovery and standalone workers act on them
+- Reads of jobs owned by this process are served from memory; other jobs
+  are read through the pool
+
+Constitutional Compliance:
+- Principle IV: Performance (progress updates cost no database round trip)
+- Principle V: Production quality (transitions written through, buffered
+  progress retried after write failures)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Notifications:
+    Every flushed job gets a NOTIFY (job_events) in the flush transaction,
+    and local long-polls are woken as soon as the update reaches memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Final
+from uuid import UUID
+
+from sqlalchemy import update
+
+from src.config.settings import get_settings
+from src.database.session import JobsSessionLocal
+from src.mcp.mcp_logging import get_logger
+from src.models.indexing_job import IndexingJob
+from src.services.job_events import get_job_event_listener, notify_job_event
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Columns that can be updated through the store
+JOB_COLUMNS: Final[frozenset[str]] = frozenset(IndexingJob.__table__.columns.keys())
+
+
+def job_values(job: IndexingJob) -> dict[str, Any]:
+    """Column values of a job row as a plain dict."""
+    return {column: getattr(job, column) for column in JOB_COLUMNS}
+
+
+# ==============================================================================
+# Store
+# ==============================================================================
+
+
+class JobStatusStore:
+    """In-memory status of owned jobs with batched writes to indexing_jobs.
+
+    Lifecycle:
+        1. update(job_id, status="running") marks the job as owned by this
+           process; its row is cached on the next read
+        2. update(job_id, **fields) for every status or progress change
+        3. The job is dropped from memory once it stops running (finished,
+           paused or released)
+        4. stop() flushes buffered updates (FastMCP lifespan shutdown)
+    """
+
+    def __init__(self, flush_interval: float | None = None) -> None:
+        """Initialize store.
+
+        Args:
+            flush_interval: Seconds between batched writes
+                (default: JOB_STATUS_FLUSH_INTERVAL)
+        """
+        self.flush_interval = (
+            get_settings().job_status_flush_interval
+            if flush_interval is None
+            else flush_interval
+        )
+        self.flushes = 0
+        self._owned: set[UUID] = set()
+        self._jobs: dict[UUID, dict[str, Any]] = {}
+        self._dirty: dict[UUID, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+
+    def get(self, job_id: UUID) -> dict[str, Any] | None:
+        """Cached column values of an owned job (None if not cached)."""
+        values = self._jobs.get(job_id)
+        return dict(values) if values is not None else None
+
+    async def load(self, job_id: UUID) -> dict[str, Any] | None:
+        """Column values of a job, from memory when this process runs it.
+
+        Returns:
+            Column values including buffered updates (None if no such job)
+        """
+        values = self.get(job_id)
+        if values is not None:
+            return values
+
+        async with JobsSessionLocal() as session:
+            job = await session.get(IndexingJob, job_id)
+            if job is None:
+                return None
+            values = job_values(job)
+        values.update(self._dirty.get(job_id, {}))
+        if job_id in self._owned:
+            self._jobs[job_id] = values
+        return dict(values)
+
+    async def update(self, job_id: UUID, **fields: Any) -> None:
+        """Record job changes; status transitions are written immediately.
+
+        Args:
+            job_id: UUID of indexing_jobs row
+            **fields: Column names and values (unknown names are ignored
+                with a warning)
+        """
+        for key in [key for key in fields if key not in JOB_COLUMNS]:
+            logger.warning(f"Invalid field for job update: {key}")
+            del fields[key]
+        if not fields:
+            return
+
+        if fields.get("status") == "running":
+            self._owned.add(job_id)
+        if job_id in self._jobs:
+            self._jobs[job_id].update(fields)
+        self._dirty.setdefault(job_id, {}).update(fields)
+        get_job_event_listener().dispatch(job_id)
+
+        if "status" in fields:
+            await self.flush([job_id])
+        else:
+            self._ensure_flusher()
+
+    async def flush(self, job_ids: list[UUID] | None = None) -> int:
+        """Write buffered updates in one transaction.
+
+        Args:
+            job_ids: Jobs to write (default: every job with buffered updates)
+
+        Returns:
+            Number of jobs written
+
+        Raises:
+            Exception: Database errors (the updates stay buffered)
+        """
+        async with self._flush_lock:
+            batch = {
+                job_id: self._dirty.pop(job_id)
+                for job_id in (list(self._dirty) if job_ids is None else job_ids)
+                if job_id in self._dirty
+            }
+            if not batch:
+                return 0
+
+            try:
+                async with JobsSessionLocal() as session:
+                    for job_id, fields in batch.items():
+                        await session.execute(
+                            update(IndexingJob).where(IndexingJob.id == job_id).values(**fields)
+                        )
+                        status = fields.get("status") or self._jobs.get(job_id, {}).get("status")
+                        await notify_job_event(session, job_id, status or "unknown")
+                    await session.commit()
+            except Exception:
+                # Keep the updates (newer values written meanwhile win)
+                for job_id, fields in batch.items():
+                    self._dirty[job_id] = {**fields, **self._dirty.get(job_id, {})}
+                raise
+
+            self.flushes += 1
+            for job_id, fields in batch.items():
+                if fields.get("status", "running") != "running":
+                    self._owned.discard(job_id)
+                    self._jobs.pop(job_id, None)
+            return len(batch)
+
+    async def stop(self) -> None:
+        """Stop the flusher and write everything still buffered.
+
+        Idempotent - safe to call multiple times.
+        """
+        if self._task is not None:
+            self._running = False
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._dirty:
+            await self.flush()
+
+    def _ensure_flusher(self) -> None:
+        """Start the periodic flusher on first buffered update."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush buffered updates every flush_interval seconds."""
+        while self._running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(
+                    f"Failed to flush job status updates: {e}",
+                    extra={"context": {"pending_jobs": len(self._dirty), "error": str(e)}},
+                )
+
+
+# ==============================================================================
+# Global Instance
+# ==============================================================================
+
+# Global singleton (flushed in FastMCP lifespan shutdown)
+_job_store: JobStatusStore | None = None
+
+
+def get_job_store() -> JobStatusStore:
+    """Get global job status store.
+
+    Creates singleton on first call.
+
+    Returns:
+        Global JobStatusStore instance
+    """
+    global _job_store
+    if _job_store is None:
+        _job_store = JobStatusStore()
+    return _job_store
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "JobStatusStore",
+    "get_job_store",
+    "job_values",
+]
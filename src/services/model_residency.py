@@ -0,0 +1,233 @@
+"""Ollama model residency manager (warm-up and keep-warm).
+
+Ollama unloads an idle model after its keep_alive expires, and the next
+request pays the model load (several seconds) - enough to break the 500ms
+search p95 target. This manager loads the embedding model on every endpoint
+at server startup and refreshes it periodically so interactive searches
+never hit a cold model.
+
+Constitutional Compliance:
+- Principle IV: Performance (no cold-start latency on search_code)
+- Principle V: Production quality (background lifecycle, metrics)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Metrics (MetricsService):
+- codebase_mcp_ollama_cold_starts_total: warm-ups that found the model unloaded
+- codebase_mcp_ollama_cold_start_seconds: latency of those warm-ups (model load)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Final
+
+from src.config.settings import EmbeddingBackendName, get_settings
+from src.mcp.mcp_logging import get_logger
+from src.services.embedder import OllamaEmbedder
+from src.services.metrics_service import get_metrics_service
+from src.services.ollama_endpoints import OllamaEndpoint
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Prompt used for warm-up requests
+WARM_UP_PROMPT: Final[str] = "warm-up"
+
+# Warm-up latency treated as a model load when /api/ps is unavailable
+COLD_START_THRESHOLD_SECONDS: Final[float] = 1.0
+
+# Timeout for warm-up requests (a model load can take a while)
+WARM_UP_TIMEOUT: Final[float] = 120.0  # seconds
+
+# Histogram buckets for model load latency
+COLD_START_BUCKETS: Final[list[float]] = [0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0]
+
+COLD_STARTS_METRIC: Final[str] = "codebase_mcp_ollama_cold_starts_total"
+COLD_START_LATENCY_METRIC: Final[str] = "codebase_mcp_ollama_cold_start_seconds"
+
+
+# ==============================================================================
+# Residency Manager
+# ==============================================================================
+
+
+class ModelResidencyManager:
+    """Keeps the embedding model loaded on every Ollama endpoint.
+
+    Lifecycle:
+        1. Call start() from the server lifespan (warm-up runs in background)
+        2. Every OLLAMA_KEEP_WARM_INTERVAL seconds, each endpoint is pinged
+           with a tiny embedding request carrying keep_alive
+        3. Call stop() before shutdown
+    """
+
+    def __init__(self, interval: float | None = None) -> None:
+        """Initialize manager.
+
+        Args:
+            interval: Seconds between keep-warm rounds
+                (default: OLLAMA_KEEP_WARM_INTERVAL; 0 = warm up once only)
+        """
+        settings = get_settings()
+        self.interval = settings.ollama_keep_warm_interval if interval is None else interval
+        self.enabled = settings.embedding_backend == EmbeddingBackendName.OLLAMA
+        self.cold_starts = 0
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+
+    async def start(self) -> None:
+        """Start warm-up and the keep-warm loop.
+
+        Idempotent - safe to call multiple times. Does not block on the
+        warm-up itself (model loads can take seconds).
+        """
+        if self._running or not self.enabled:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._keep_warm_loop())
+        logger.info(
+            "Model residency manager started",
+            extra={"context": {"interval_seconds": self.interval}},
+        )
+
+    async def stop(self) -> None:
+        """Stop the keep-warm loop.
+
+        Idempotent - safe to call multiple times.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        logger.info("Model residency manager stopped")
+
+    async def _keep_warm_loop(self) -> None:
+        """Warm up immediately, then every interval seconds while running."""
+        while self._running:
+            try:
+                await self.warm_up()
+                if self.interval <= 0:
+                    break
+                await asyncio.sleep(self.interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in keep-warm loop: {e}")
+                await asyncio.sleep(max(self.interval, 1.0))
+
+    async def warm_up(self) -> None:
+        """Load (or refresh) the model on every endpoint concurrently."""
+        embedder = OllamaEmbedder()
+        await asyncio.gather(
+            *(self._warm_endpoint(embedder, e) for e in embedder.endpoints.endpoints)
+        )
+
+    async def _warm_endpoint(self, embedder: OllamaEmbedder, endpoint: OllamaEndpoint) -> None:
+        """Send one keep_alive embedding request to endpoint and record cold starts."""
+        client = embedder.client
+        loaded = await self._is_model_loaded(embedder, endpoint)
+        payload: dict[str, Any] = {"model": embedder.model, "prompt": WARM_UP_PROMPT}
+        if embedder.keep_alive is not None:
+            payload["keep_alive"] = embedder.keep_alive
+
+        start = time.perf_counter()
+        try:
+            response = await client.post(
+                f"{endpoint.url}/api/embeddings", json=payload, timeout=WARM_UP_TIMEOUT
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(
+                f"Warm-up failed for {endpoint.url}",
+                extra={"context": {"endpoint": endpoint.url, "error": str(e)}},
+            )
+            return
+        elapsed = time.perf_counter() - start
+
+        cold = not loaded if loaded is not None else elapsed >= COLD_START_THRESHOLD_SECONDS
+        if cold:
+            self.record_cold_start(endpoint.url, elapsed)
+
+    async def _is_model_loaded(
+        self, embedder: OllamaEmbedder, endpoint: OllamaEndpoint
+    ) -> bool | None:
+        """Check GET /api/ps for the model (None if the endpoint cannot tell)."""
+        try:
+            response = await embedder.client.get(f"{endpoint.url}/api/ps", timeout=5.0)
+            response.raise_for_status()
+            models = response.json().get("models", [])
+        except Exception:
+            return None
+
+        names = {m.get("name", "") for m in models} | {m.get("model", "") for m in models}
+        return any(name.split(":")[0] == embedder.model.split(":")[0] for name in names)
+
+    def record_cold_start(self, endpoint_url: str, seconds: float) -> None:
+        """Record a model load observed by a warm-up request.
+
+        Args:
+            endpoint_url: Endpoint that had to load the model
+            seconds: Latency of the request that loaded it
+        """
+        self.cold_starts += 1
+        metrics = get_metrics_service()
+        metrics.increment_counter(
+            COLD_STARTS_METRIC, "Embedding model loads observed by warm-up requests"
+        )
+        metrics.observe_histogram(
+            COLD_START_LATENCY_METRIC,
+            "Latency of warm-up requests that loaded the embedding model",
+            seconds,
+            buckets=COLD_START_BUCKETS,
+        )
+        logger.info(
+            f"Embedding model was cold on {endpoint_url}, loaded in {seconds:.2f}s",
+            extra={"context": {"endpoint": endpoint_url, "load_seconds": seconds}},
+        )
+
+
+# ==============================================================================
+# Global Instance
+# ==============================================================================
+
+# Global singleton (started in FastMCP lifespan)
+_model_residency_manager: ModelResidencyManager | None = None
+
+
+def get_model_residency_manager() -> ModelResidencyManager:
+    """Get global model residency manager instance.
+
+    Creates singleton on first call.
+
+    Returns:
+        Global ModelResidencyManager instance
+    """
+    global _model_residency_manager
+    if _model_residency_manager is None:
+        _model_residency_manager = ModelResidencyManager()
+    return _model_residency_manager
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "COLD_STARTS_METRIC",
+    "COLD_START_LATENCY_METRIC",
+    "ModelResidencyManager",
+    "get_model_residency_manager",
+]
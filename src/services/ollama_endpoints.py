@@ -0,0 +1,279 @@
+"""Load balancing across multiple Ollama endpoints.
+
+OllamaEmbedder routes each embedding request to one of the configured Ollama
+servers (OLLAMA_BASE_URLS) so indexing throughput scales with the number of
+model servers.
+
+Constitutional Compliance:
+- Principle IV: Performance (least-outstanding-requests routing)
+- Principle V: Production quality (failure ejection, health checks)
+- Principle VIII: Type safety (full mypy --strict compliance)
+
+Routing:
+- Least outstanding requests among healthy endpoints, ties broken round-robin
+- An endpoint is ejected for OLLAMA_EJECT_SECONDS after
+  OLLAMA_FAILURE_THRESHOLD consecutive failures (connection errors, timeouts,
+  5xx); it rejoins when the ejection expires or a health check succeeds
+- If every endpoint is ejected, the one closest to rejoining is used
+  (fail open rather than refuse all work)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Final, Iterator, Sequence
+
+import httpx
+
+from src.mcp.mcp_logging import get_logger
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+logger = get_logger(__name__)
+
+# Timeout for a single health probe
+HEALTH_CHECK_TIMEOUT: Final[float] = 5.0  # seconds
+
+
+# ==============================================================================
+# Endpoint State
+# ==============================================================================
+
+
+@dataclass
+class OllamaEndpoint:
+    """Routing state of one Ollama server.
+
+    Attributes:
+        url: Base URL (no trailing slash)
+        outstanding: Requests currently in flight
+        consecutive_failures: Failures since the last success
+        ejected_until: Monotonic time the endpoint rejoins rotation (0 = healthy)
+        total_requests: Requests routed to the endpoint
+        total_failures: Failed requests
+    """
+
+    url: str
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    total_requests: int = 0
+    total_failures: int = 0
+
+    def is_ejected(self, now: float) -> bool:
+        """Check whether the endpoint is out of rotation."""
+        return self.ejected_until > now
+
+
+class EndpointPool:
+    """Least-outstanding-requests router with temporary ejection.
+
+    Lifecycle (health checks are optional):
+        1. Create pool with endpoint URLs
+        2. Call start_health_checks(client) to probe endpoints periodically
+        3. select() / track() / record_success() / record_failure() per request
+        4. Call stop_health_checks() before shutdown
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        eject_seconds: float = 30.0,
+        failure_threshold: int = 2,
+    ) -> None:
+        """Initialize pool.
+
+        Args:
+            urls: Endpoint base URLs (at least one)
+            eject_seconds: How long a failing endpoint stays out of rotation
+            failure_threshold: Consecutive failures before ejection
+
+        Raises:
+            ValueError: If urls is empty
+        """
+        if not urls:
+            raise ValueError("At least one Ollama endpoint is required")
+        self.endpoints = [OllamaEndpoint(url.rstrip("/")) for url in urls]
+        self.eject_seconds = eject_seconds
+        self.failure_threshold = failure_threshold
+        self._rotation = itertools.count()
+        self._health_task: asyncio.Task[None] | None = None
+        self._running = False
+
+    def __len__(self) -> int:
+        """Number of endpoints."""
+        return len(self.endpoints)
+
+    # --------------------------------------------------------------------------
+    # Routing
+    # --------------------------------------------------------------------------
+
+    def select(self) -> OllamaEndpoint:
+        """Pick the endpoint for the next request.
+
+        Returns:
+            Healthy endpoint with the fewest outstanding requests, or the
+            ejected endpoint closest to rejoining if none is healthy
+        """
+        if len(self.endpoints) == 1:
+            return self.endpoints[0]
+
+        now = time.monotonic()
+        healthy = [e for e in self.endpoints if not e.is_ejected(now)]
+        if not healthy:
+            return min(self.endpoints, key=lambda e: e.ejected_until)
+
+        # Rotate the starting point so ties spread evenly
+        offset = next(self._rotation) % len(healthy)
+        rotated = healthy[offset:] + healthy[:offset]
+        return min(rotated, key=lambda e: e.outstanding)
+
+    @contextmanager
+    def track(self, endpoint: OllamaEndpoint) -> Iterator[OllamaEndpoint]:
+        """Count a request as outstanding on endpoint while the block runs."""
+        endpoint.outstanding += 1
+        endpoint.total_requests += 1
+        try:
+            yield endpoint
+        finally:
+            endpoint.outstanding -= 1
+
+    def record_success(self, endpoint: OllamaEndpoint) -> None:
+        """Reset the failure streak of endpoint."""
+        endpoint.consecutive_failures = 0
+        endpoint.ejected_until = 0.0
+
+    def record_failure(self, endpoint: OllamaEndpoint, reason: str) -> None:
+        """Count a failure and eject endpoint once the threshold is reached.
+
+        Args:
+            endpoint: Endpoint that failed
+            reason: Short failure description for logs
+        """
+        endpoint.consecutive_failures += 1
+        endpoint.total_failures += 1
+        if len(self.endpoints) == 1 or endpoint.consecutive_failures < self.failure_threshold:
+            return
+
+        endpoint.ejected_until = time.monotonic() + self.eject_seconds
+        logger.warning(
+            f"Ejecting Ollama endpoint {endpoint.url} for {self.eject_seconds:.0f}s",
+            extra={
+                "context": {
+                    "endpoint": endpoint.url,
+                    "consecutive_failures": endpoint.consecutive_failures,
+                    "reason": reason,
+                    "eject_seconds": self.eject_seconds,
+                }
+            },
+        )
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Routing state of every endpoint (for status reporting)."""
+        now = time.monotonic()
+        return [
+            {
+                "url": e.url,
+                "healthy": not e.is_ejected(now),
+                "outstanding": e.outstanding,
+                "total_requests": e.total_requests,
+                "total_failures": e.total_failures,
+            }
+            for e in self.endpoints
+        ]
+
+    # --------------------------------------------------------------------------
+    # Health Checks
+    # --------------------------------------------------------------------------
+
+    async def check_health(self, client: httpx.AsyncClient) -> None:
+        """Probe every endpoint with GET /api/tags.
+
+        Successful probes return ejected endpoints to rotation; failed probes
+        count as failures (and may eject).
+
+        Args:
+            client: HTTP client used for probes
+        """
+        async def probe(endpoint: OllamaEndpoint) -> None:
+            try:
+                response = await client.get(
+                    f"{endpoint.url}/api/tags", timeout=HEALTH_CHECK_TIMEOUT
+                )
+                response.raise_for_status()
+            except Exception as e:
+                self.record_failure(endpoint, f"health check: {e}")
+                return
+            if endpoint.consecutive_failures or endpoint.ejected_until:
+                logger.info(
+                    f"Ollama endpoint {endpoint.url} healthy again",
+                    extra={"context": {"endpoint": endpoint.url}},
+                )
+            self.record_success(endpoint)
+
+        await asyncio.gather(*(probe(e) for e in self.endpoints))
+
+    async def start_health_checks(self, client: httpx.AsyncClient, interval: float) -> None:
+        """Start periodic health checks.
+
+        Idempotent - safe to call multiple times.
+
+        Args:
+            client: HTTP client used for probes
+            interval: Seconds between checks
+        """
+        if self._running:
+            return
+
+        self._running = True
+        self._health_task = asyncio.create_task(self._health_loop(client, interval))
+        logger.info(
+            "Ollama endpoint health checks started",
+            extra={"context": {"endpoints": len(self.endpoints), "interval": interval}},
+        )
+
+    async def stop_health_checks(self) -> None:
+        """Stop periodic health checks.
+
+        Idempotent - safe to call multiple times.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+        logger.info("Ollama endpoint health checks stopped")
+
+    async def _health_loop(self, client: httpx.AsyncClient, interval: float) -> None:
+        """Run check_health every interval seconds while running."""
+        while self._running:
+            try:
+                await asyncio.sleep(interval)
+                await self.check_health(client)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in Ollama health check loop: {e}")
+
+
+# ==============================================================================
+# Module Exports
+# ==============================================================================
+
+__all__ = [
+    "EndpointPool",
+    "OllamaEndpoint",
+]
@@ -0,0 +1,13 @@
+; Tree-sitter chunk query for Go
+;
+; Capture names map to chunk types:
+;   @function, @method -> function
+;   @class             -> class (struct and interface type declarations)
+
+(function_declaration) @function
+
+(method_declaration) @method
+
+(type_declaration
+  (type_spec
+    type: [(struct_type) (interface_type)])) @class
@@ -0,0 +1,17 @@
+; Tree-sitter chunk query for Java
+;
+; Capture names map to chunk types:
+;   @function, @method -> function
+;   @class             -> class (classes, interfaces, enums, records)
+
+(method_declaration) @method
+
+(constructor_declaration) @method
+
+(class_declaration) @class
+
+(interface_declaration) @class
+
+(enum_declaration) @class
+
+(record_declaration) @class
@@ -0,0 +1,25 @@
+; Tree-sitter chunk query for JavaScript (.js, .jsx)
+;
+; Capture names map to chunk types:
+;   @function, @method -> function
+;   @class             -> class
+; Export wrappers are captured as a whole; the wrapped declaration is then
+; skipped as redundant.
+
+(method_definition) @method
+
+(function_declaration) @function
+
+(generator_function_declaration) @function
+
+(lexical_declaration
+  (variable_declarator
+    value: [(arrow_function) (function_expression)])) @function
+
+(export_statement
+  declaration: [(function_declaration) (generator_function_declaration)]) @function
+
+(export_statement
+  declaration: (class_declaration)) @class
+
+(class_declaration) @class
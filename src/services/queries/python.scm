@@ -0,0 +1,21 @@
+; Tree-sitter chunk query for Python
+;
+; Capture names map to chunk types:
+;   @function, @method -> function
+;   @class             -> class
+; Decorated definitions are captured as a whole so decorators stay with the
+; code they modify; the wrapped definition is then skipped as redundant.
+
+(class_definition
+  body: (block
+    [(function_definition) (decorated_definition)] @method))
+
+(decorated_definition
+  definition: (function_definition)) @function
+
+(decorated_definition
+  definition: (class_definition)) @class
+
+(function_definition) @function
+
+(class_definition) @class
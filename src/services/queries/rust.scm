@@ -0,0 +1,19 @@
+; Tree-sitter chunk query for Rust
+;
+; Capture names map to chunk types:
+;   @function, @method -> function
+;   @class             -> class (structs, enums, traits, impl blocks)
+
+(impl_item
+  body: (declaration_list
+    (function_item) @method))
+
+(function_item) @function
+
+(struct_item) @class
+
+(enum_item) @class
+
+(trait_item) @class
+
+(impl_item) @class
@@ -0,0 +1,31 @@
+; Tree-sitter chunk query for TSX (.tsx)
+;
+; Capture names map to chunk types:
+;   @function, @method -> function
+;   @class             -> class (classes, interfaces, enums)
+; Export wrappers are captured as a whole; the wrapped declaration is then
+; skipped as redundant.
+
+(method_definition) @method
+
+(function_declaration) @function
+
+(generator_function_declaration) @function
+
+(lexical_declaration
+  (variable_declarator
+    value: [(arrow_function) (function_expression)])) @function
+
+(export_statement
+  declaration: [(function_declaration) (generator_function_declaration)]) @function
+
+(export_statement
+  declaration: [(class_declaration) (abstract_class_declaration) (interface_declaration) (enum_declaration)]) @class
+
+(class_declaration) @class
+
+(abstract_class_declaration) @class
+
+(interface_declaration) @class
+
+(enum_declaration) @class
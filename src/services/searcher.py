@@ -31,7 +31,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.settings import get_settings
 from src.mcp.mcp_logging import get_logger
-from src.models import CodeChunk, CodeFile
+from src.models import CodeChunk, CodeFile, Repository
 from src.services.embedder import generate_embedding
 
 # ==============================================================================
@@ -292,12 +292,18 @@ async def search_code(
             (1 - (CodeChunk.embedding.cosine_distance(query_embedding) / 2)).label("similarity"),
         )
         .join(CodeFile, CodeChunk.code_file_id == CodeFile.id)
+        .join(Repository, CodeFile.repository_id == Repository.id)
         .where(CodeChunk.embedding.isnot(None))  # Only chunks with embeddings
+        # Only the live generation (a full reindex builds the next one alongside)
+        .where(CodeChunk.generation == Repository.active_generation)
         .where(CodeFile.is_deleted == False)  # Exclude soft-deleted files
     )
 
     # Apply filters
     if filters.repository_id is not None:
+        # Filter on the chunk's own repository_id as well so the partitioned
+        # code_chunks layout can prune to a single partition (and HNSW index)
+        stmt = stmt.where(CodeChunk.repository_id == filters.repository_id)
         stmt = stmt.where(CodeFile.repository_id == filters.repository_id)
 
     if filters.file_type is not None:
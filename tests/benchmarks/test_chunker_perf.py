@@ -0,0 +1,206 @@
+"""AST chunk extraction microbenchmarks for codebase-mcp.
+
+Compares extract_chunks_from_ast (precompiled chunk query, falling back to an
+iterative TreeCursor walk) against the previous recursive ``node.children``
+traversal on large generated files, and checks that chunking survives
+nesting deeper than Python's recursion limit.
+
+**Constitutional Compliance**:
+- Principle VIII: Type Safety (full mypy --strict compliance)
+- Principle IV: Performance Guarantees (chunking is on the indexing hot path)
+- Principle VII: TDD (benchmarks serve as performance regression tests)
+
+**Usage**:
+    # Run chunker benchmarks only (no database or Ollama required)
+    pytest tests/benchmarks/test_chunker_perf.py --benchmark-only
+
+    # Group output by file shape to read the speedup directly
+    pytest tests/benchmarks/test_chunker_perf.py --benchmark-only \
+        --benchmark-group-by=param:shape
+"""
+
+from __future__ import annotations
+
+import sys
+import uuid
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from tree_sitter import Node, Tree
+
+from src.models import CodeChunkCreate
+from src.services.chunker import (
+    CHUNK_NODE_TYPES,
+    ChunkSizePolicy,
+    ParserCache,
+    _normalize_chunk_type,
+    extract_chunks_from_ast,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore[import-untyped]
+
+
+# ==============================================================================
+# Constants
+# ==============================================================================
+
+FILE_ID: uuid.UUID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+PROJECT_ID: str = "benchmark"
+
+# Nesting that the recursive baseline cannot traverse
+DEEPER_THAN_RECURSION_LIMIT: int = sys.getrecursionlimit() + 500
+
+
+# ==============================================================================
+# Source Generators
+# ==============================================================================
+
+
+def _wide_python_source(classes: int = 200, methods: int = 10) -> str:
+    """Generate a large, flat Python module (many classes and methods)."""
+    parts: list[str] = []
+    for c in range(classes):
+        parts.append(f"class Service{c}:\n")
+        for m in range(methods):
+            parts.append(
+                f"    def method_{m}(self, value: int) -> int:\n"
+                f"        total = value * {m}\n"
+                f"        for i in range(value):\n"
+                f"            total += i\n"
+                f"        return total\n\n"
+            )
+    return "".join(parts)
+
+
+def _deep_javascript_source(depth: int = 150) -> str:
+    """Generate deeply nested JavaScript (bundler/generated-code shape)."""
+    opening = "".join(f"function f{i}() {{\n" for i in range(depth))
+    closing = "}\n" * depth
+    return f"{opening}return 1;\n{closing}"
+
+
+# ==============================================================================
+# Reference Implementation
+# ==============================================================================
+
+
+def _extract_chunks_recursive(
+    tree: Tree, language: str, content: str
+) -> list[CodeChunkCreate]:
+    """Previous recursive traversal, kept here as the comparison baseline."""
+    chunks: list[CodeChunkCreate] = []
+    content_bytes = content.encode("utf-8")
+    chunk_types = CHUNK_NODE_TYPES[language]
+
+    def visit_node(node: Node) -> None:
+        if node.type in chunk_types:
+            chunks.append(
+                CodeChunkCreate(
+                    code_file_id=FILE_ID,
+                    project_id=PROJECT_ID,
+                    content=content_bytes[node.start_byte : node.end_byte].decode("utf-8"),
+                    start_line=node.start_point[0] + 1,
+                    end_line=node.end_point[0] + 1,
+                    chunk_type=_normalize_chunk_type(node.type),
+                )
+            )
+        for child in node.children:
+            visit_node(child)
+
+    visit_node(tree.root_node)
+    return chunks
+
+
+# ==============================================================================
+# Benchmarks
+# ==============================================================================
+
+SHAPES: dict[str, tuple[str, str]] = {
+    "wide_python": ("python", _wide_python_source()),
+    "deep_javascript": ("javascript", _deep_javascript_source()),
+}
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_extract_chunks_iterative(benchmark: BenchmarkFixture, shape: str) -> None:
+    """Benchmark extract_chunks_from_ast on pre-encoded bytes."""
+    language, content = SHAPES[shape]
+    content_bytes = content.encode("utf-8")
+    parser = ParserCache().get_parser(language)
+    assert parser is not None
+    tree = parser.parse(content_bytes)
+
+    chunks = benchmark(
+        extract_chunks_from_ast,
+        tree,
+        language,
+        content,
+        FILE_ID,
+        PROJECT_ID,
+        content_bytes=content_bytes,
+    )
+
+    # Same output as the recursive baseline
+    baseline = _extract_chunks_recursive(tree, language, content)
+    assert [(c.start_line, c.end_line, c.chunk_type) for c in chunks] == [
+        (c.start_line, c.end_line, c.chunk_type) for c in baseline
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_extract_chunks_recursive_baseline(benchmark: BenchmarkFixture, shape: str) -> None:
+    """Benchmark the previous recursive traversal for comparison."""
+    language, content = SHAPES[shape]
+    parser = ParserCache().get_parser(language)
+    assert parser is not None
+    tree = parser.parse(content.encode("utf-8"))
+
+    chunks = benchmark(_extract_chunks_recursive, tree, language, content)
+
+    assert chunks
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("traversal", ["query", "cursor"])
+def test_extract_chunks_deeper_than_recursion_limit(
+    benchmark: BenchmarkFixture, traversal: str
+) -> None:
+    """Chunk nesting deeper than sys.getrecursionlimit() (recursive walk fails)."""
+    content = _deep_javascript_source(DEEPER_THAN_RECURSION_LIMIT)
+    content_bytes = content.encode("utf-8")
+    parser = ParserCache().get_parser("javascript")
+    assert parser is not None
+    tree = parser.parse(content_bytes)
+
+    with pytest.raises(RecursionError):
+        _extract_chunks_recursive(tree, "javascript", content)
+
+    # "cursor" disables the chunk query to exercise the TreeCursor fallback
+    query = ParserCache().get_query("javascript") if traversal == "query" else None
+    with patch.object(ParserCache, "get_query", return_value=query):
+        chunks = benchmark(
+            extract_chunks_from_ast,
+            tree,
+            "javascript",
+            content,
+            FILE_ID,
+            PROJECT_ID,
+            content_bytes=content_bytes,
+        )
+        bounded = extract_chunks_from_ast(
+            tree,
+            "javascript",
+            content,
+            FILE_ID,
+            PROJECT_ID,
+            content_bytes=content_bytes,
+            policy=ChunkSizePolicy(),
+        )
+
+    assert len(chunks) == DEEPER_THAN_RECURSION_LIMIT
+    assert bounded
+    assert all(len(c.content.encode("utf-8")) <= ChunkSizePolicy().max_bytes for c in bounded)
@@ -0,0 +1,100 @@
+"""Session setup latency benchmarks for get_session().
+
+Compares opening a session and running one query through the cached, pooled
+per-project engine (get_project_session_factory) against the previous
+approach: a NullPool engine and session factory created for every session
+and disposed afterwards, which pays the connect/auth handshake each time.
+
+**Constitutional Compliance**:
+- Principle VIII: Type Safety (full mypy --strict compliance)
+- Principle IV: Performance Guarantees (session setup is on the search hot path)
+- Principle VII: TDD (benchmarks serve as performance regression tests)
+
+**Usage**:
+    # Requires PostgreSQL (TEST_DATABASE_URL)
+    pytest tests/benchmarks/test_session_setup_perf.py --benchmark-only
+
+    # Read the difference directly
+    pytest tests/benchmarks/test_session_setup_perf.py --benchmark-only \
+        --benchmark-group-by=group
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.database.session import create_project_engine
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore[import-untyped]
+
+
+# Test database URL (use test database)
+TEST_DB_URL = os.getenv(
+    "TEST_DATABASE_URL",
+    "postgresql+asyncpg://localhost:5432/codebase_mcp_test"
+)
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Event loop driving the async code under benchmark."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def _per_call_engine_query() -> None:
+    """Previous get_session(): new NullPool engine per session, disposed after."""
+    engine = create_async_engine(TEST_DB_URL, poolclass=NullPool)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with factory() as session:
+            await session.execute(text("SELECT 1"))
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="session_setup")
+def test_session_setup_per_call_engine_baseline(
+    benchmark: BenchmarkFixture, loop: asyncio.AbstractEventLoop
+) -> None:
+    """Benchmark the previous per-session engine for comparison."""
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(_per_call_engine_query()),
+        iterations=1,
+        rounds=50,
+        warmup_rounds=2,
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="session_setup")
+def test_session_setup_cached_engine(
+    benchmark: BenchmarkFixture, loop: asyncio.AbstractEventLoop
+) -> None:
+    """Benchmark a session from the cached, pooled project engine."""
+    engine = create_project_engine(TEST_DB_URL)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def cached_engine_query() -> None:
+        async with factory() as session:
+            await session.execute(text("SELECT 1"))
+
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(cached_engine_query()),
+            iterations=1,
+            rounds=50,
+            warmup_rounds=2,
+        )
+    finally:
+        loop.run_until_complete(engine.dispose())
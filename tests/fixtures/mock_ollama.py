@@ -0,0 +1,192 @@
+"""Local stand-in for the Ollama embedding API.
+
+Imitates the endpoints codebase-mcp uses so pipeline benchmarks run offline
+and repeatably, with configurable latency and failure injection:
+
+- POST /api/embeddings  {"model", "prompt"}        -> {"embedding": [...]}
+- POST /api/embed       {"model", "input": str|[]} -> {"model", "embeddings": [[...]]}
+- GET  /api/tags                                   -> {"models": [...]}
+
+Vectors come from hash_embedding(), identical to EMBEDDING_BACKEND=hash.
+
+Constitutional Compliance:
+- Principle VIII: Type Safety (mypy --strict compliance, complete annotations)
+- Principle IV: Performance (offline, repeatable embedding benchmarks)
+- Principle II: Local-first (no model download required)
+
+Usage:
+    # Standalone server (point OLLAMA_BASE_URL at it)
+    python -m tests.fixtures.mock_ollama --port 11435 --latency-ms 25 --failure-rate 0.01
+
+    # In-process (no sockets)
+    from tests.fixtures.mock_ollama import MockOllamaConfig, create_mock_ollama_app
+
+    app = create_mock_ollama_app(MockOllamaConfig(latency_ms=5.0))
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://mock-ollama"
+    )
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+from src.services.embedding_backends import DEFAULT_DIMENSIONS, hash_embedding
+
+
+# ==============================================================================
+# Configuration
+# ==============================================================================
+
+
+@dataclass
+class MockOllamaConfig:
+    """Behaviour knobs for the mock server.
+
+    Attributes:
+        latency_ms: Base latency added to every embedding request
+        jitter_ms: Uniform random latency added on top of latency_ms
+        per_input_ms: Extra latency per input text (/api/embed batches)
+        failure_rate: Probability (0-1) of answering 503 instead of embedding
+        dimensions: Embedding vector size
+        models: Model names reported by /api/tags
+        seed: Random seed for jitter and failures (repeatable runs)
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    per_input_ms: float = 0.0
+    failure_rate: float = 0.0
+    dimensions: int = DEFAULT_DIMENSIONS
+    models: list[str] = field(default_factory=lambda: ["nomic-embed-text"])
+    seed: int = 0
+
+
+@dataclass
+class MockOllamaStats:
+    """Request counters exposed as app.state.stats."""
+
+    requests: int = 0
+    inputs: int = 0
+    failures: int = 0
+
+
+class _EmbeddingsRequest(BaseModel):
+    model: str
+    prompt: str
+
+
+class _EmbedRequest(BaseModel):
+    model: str
+    input: str | list[str]
+
+
+# ==============================================================================
+# Application Factory
+# ==============================================================================
+
+
+def create_mock_ollama_app(config: MockOllamaConfig | None = None) -> FastAPI:
+    """Create the mock Ollama ASGI application.
+
+    Args:
+        config: Behaviour knobs (defaults: no latency, no failures)
+
+    Returns:
+        FastAPI application; request counters in app.state.stats
+    """
+    cfg = config or MockOllamaConfig()
+    rng = random.Random(cfg.seed)
+    stats = MockOllamaStats()
+    app = FastAPI(title="mock-ollama")
+    app.state.stats = stats
+    app.state.config = cfg
+
+    async def _simulate(input_count: int) -> None:
+        stats.requests += 1
+        stats.inputs += input_count
+        delay_ms = cfg.latency_ms + cfg.per_input_ms * input_count
+        if cfg.jitter_ms:
+            delay_ms += rng.uniform(0.0, cfg.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+        if cfg.failure_rate and rng.random() < cfg.failure_rate:
+            stats.failures += 1
+            raise HTTPException(status_code=503, detail="injected failure")
+
+    def _check_model(model: str) -> None:
+        if model not in cfg.models:
+            raise HTTPException(status_code=404, detail=f"model '{model}' not found")
+
+    @app.post("/api/embeddings")
+    async def embeddings(request: _EmbeddingsRequest) -> dict[str, Any]:
+        _check_model(request.model)
+        await _simulate(1)
+        return {"embedding": hash_embedding(request.prompt, request.model, cfg.dimensions)}
+
+    @app.post("/api/embed")
+    async def embed(request: _EmbedRequest) -> dict[str, Any]:
+        _check_model(request.model)
+        inputs = [request.input] if isinstance(request.input, str) else request.input
+        await _simulate(len(inputs))
+        return {
+            "model": request.model,
+            "embeddings": [
+                hash_embedding(text, request.model, cfg.dimensions) for text in inputs
+            ],
+        }
+
+    @app.get("/api/tags")
+    async def tags() -> dict[str, Any]:
+        return {
+            "models": [
+                {"name": name, "modified_at": "2024-01-01T00:00:00Z", "size": 0}
+                for name in cfg.models
+            ]
+        }
+
+    return app
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+
+def main() -> None:
+    """Run the mock server with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Mock Ollama embedding server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--per-input-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--dimensions", type=int, default=DEFAULT_DIMENSIONS)
+    parser.add_argument("--model", action="append", dest="models")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = MockOllamaConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        per_input_ms=args.per_input_ms,
+        failure_rate=args.failure_rate,
+        dimensions=args.dimensions,
+        models=args.models or ["nomic-embed-text"],
+        seed=args.seed,
+    )
+    uvicorn.run(create_mock_ollama_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -252,7 +252,8 @@ async def cleanup_connection_pools() -> AsyncGenerator[None, None]:
     across test function boundaries.
 
     Problem:
-        - session.py maintains module-level globals: _registry_pool and _project_pools
+        - session.py maintains module-level globals: _registry_pool and
+          _pool_registry
         - These pools are bound to the event loop that created them
         - pytest-asyncio creates a NEW event loop for each function-scoped test
         - Old pools become invalid when their event loop closes
@@ -261,7 +262,7 @@ async def cleanup_connection_pools() -> AsyncGenerator[None, None]:
     Solution:
         - Run after EVERY test (autouse=True)
         - Close all active connection pools
-        - Reset module-level globals to None/empty dict
+        - Reset module-level globals to None
         - Next test creates fresh pools with new event loop
 
     Fixture Pattern:
@@ -278,7 +279,7 @@ async def cleanup_connection_pools() -> AsyncGenerator[None, None]:
     Note:
         This fixture is REQUIRED for any test that uses:
         - src.database.session._initialize_registry_pool()
-        - src.database.session.get_or_create_project_pool()
+        - src.database.session.get_session()
         - Any MCP tool that creates database connections
     """
     # Run test first (yield allows test to execute)
@@ -286,15 +287,16 @@ async def cleanup_connection_pools() -> AsyncGenerator[None, None]:
 
     # Cleanup after test completes
     import src.database.session as session_module
+    from src.database.project_cache import get_project_cache
+
+    # Release the cache's LISTEN connection and forget cached projects
+    await get_project_cache().stop()
+    get_project_cache().clear()
 
     # Close registry pool if it exists
     if session_module._registry_pool is not None:
         await session_module._registry_pool.close()
         session_module._registry_pool = None
 
-    # Close all project pools
-    for pool in session_module._project_pools.values():
-        await pool.close()
-
-    # Reset project pools dict
-    session_module._project_pools.clear()
+    # Close project pools (bound to this test's event loop)
+    await session_module.dispose_project_engines()
@@ -141,10 +141,10 @@ async def test_auto_provision_missing_database(tmp_path: Path) -> None:
     )
 
     # Step 7: Verify schema initialized (tables exist)
-    from src.database.session import get_or_create_project_pool
+    from src.database.provisioning import create_connection
 
-    project_pool = await get_or_create_project_pool(database_name)
-    async with project_pool.acquire() as conn:
+    conn = await create_connection(database_name)
+    try:
         tables = await conn.fetch("""
             SELECT tablename
             FROM pg_tables
@@ -153,6 +153,8 @@ async def test_auto_provision_missing_database(tmp_path: Path) -> None:
         """)
 
         table_names = {row['tablename'] for row in tables}
+    finally:
+        await conn.close()
 
     assert len(table_names) >= 3, (
         f"Schema not initialized correctly. Expected repositories, code_files, code_chunks. "
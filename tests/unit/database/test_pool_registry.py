@@ -0,0 +1,186 @@
+"""Unit tests for project pools under a global connection budget (pool_registry.py).
+
+Test Coverage Areas:
+- Sessions across all projects never exceed the budget
+- Active projects share the budget fairly
+- Least recently used idle pools are closed when the budget is reached
+- Pools unused for idle_timeout are closed; busy pools never are
+- Pools with connections checked out outside acquire() are never closed
+- close() disposes every pool
+
+Constitutional Compliance:
+- Principle V: Production quality (no connection exhaustion with many projects)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.database.pool_registry import ProjectPoolRegistry
+
+
+class _FakePool:
+    """Connection counts of a fake engine's pool."""
+
+    def __init__(self) -> None:
+        self.idle = 0
+        self.in_use = 0
+
+    def checkedin(self) -> int:
+        return self.idle
+
+    def checkedout(self) -> int:
+        return self.in_use
+
+
+def _registry(**kwargs: float) -> tuple[ProjectPoolRegistry, dict[str, MagicMock]]:
+    engines: dict[str, MagicMock] = {}
+
+    def create_engine(database_name: str) -> MagicMock:
+        engines[database_name] = MagicMock(pool=_FakePool(), dispose=AsyncMock())
+        return engines[database_name]
+
+    options = {"budget": 4, "max_per_project": 4, "idle_timeout": 60.0, **kwargs}
+    registry = ProjectPoolRegistry(
+        create_engine,
+        budget=int(options["budget"]),
+        max_per_project=int(options["max_per_project"]),
+        idle_timeout=options["idle_timeout"],
+    )
+    return registry, engines
+
+
+async def _hold(registry: ProjectPoolRegistry, name: str, release: asyncio.Event) -> None:
+    async with registry.acquire(name):
+        await release.wait()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sessions_never_exceed_budget() -> None:
+    """Sessions of many projects wait once the budget is in use."""
+    registry, _ = _registry(budget=3)
+    release = asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_hold(registry, f"cb_proj_{i % 3}", release)) for i in range(7)
+    ]
+    await asyncio.sleep(0)
+    assert registry.sessions_in_use() == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert registry.sessions_in_use() == 0
+    await registry.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_active_projects_share_budget() -> None:
+    """A busy project gives up its excess share when another becomes active."""
+    registry, _ = _registry(budget=4)
+    release_a = asyncio.Event()
+    release_b = asyncio.Event()
+
+    busy = [asyncio.create_task(_hold(registry, "cb_proj_a", release_a)) for _ in range(6)]
+    await asyncio.sleep(0)
+    pool_a = registry.get("cb_proj_a")
+    assert (pool_a.slots.in_use, pool_a.slots.waiting) == (4, 2)
+
+    other = asyncio.create_task(_hold(registry, "cb_proj_b", release_b))
+    await asyncio.sleep(0)
+    assert pool_a.slots.limit == 2 and registry.get("cb_proj_b").slots.limit == 2
+
+    # The first session released by A goes to B, not to A's waiters
+    release_a.set()
+    await asyncio.sleep(0)
+    assert registry.get("cb_proj_b").slots.in_use == 1
+    assert pool_a.slots.in_use <= 2  # A's waiters are held to its share
+
+    release_b.set()
+    await asyncio.gather(*busy, other)
+    assert registry.sessions_in_use() == 0
+    await registry.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lru_idle_pools_are_closed_for_new_connections() -> None:
+    """Idle pools are closed least recently used first until there is room."""
+    registry, engines = _registry(budget=4)
+    for name in ("cb_proj_a", "cb_proj_b", "cb_proj_c"):
+        registry.get(name)
+        engines[name].pool.idle = 2
+    registry.get("cb_proj_a")  # Most recently used
+
+    async with registry.acquire("cb_proj_d"):
+        pass
+
+    assert "cb_proj_b" not in registry and "cb_proj_c" not in registry
+    assert "cb_proj_a" in registry and "cb_proj_d" in registry
+    engines["cb_proj_b"].dispose.assert_awaited_once()
+    engines["cb_proj_a"].dispose.assert_not_awaited()
+    assert registry.evictions == 2
+    await registry.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_idle_pools_are_reaped() -> None:
+    """Pools unused for idle_timeout are closed; pools in use are kept."""
+    registry, engines = _registry(idle_timeout=60)
+    registry.get("cb_proj_cold").last_used = time.monotonic() - 120
+    registry.get("cb_proj_warm")
+    release = asyncio.Event()
+    busy = asyncio.create_task(_hold(registry, "cb_proj_busy", release))
+    await asyncio.sleep(0)
+    registry.get("cb_proj_busy").last_used = time.monotonic() - 120
+
+    assert await registry.reap_idle() == 1
+    assert "cb_proj_cold" not in registry
+    assert "cb_proj_warm" in registry and "cb_proj_busy" in registry
+    engines["cb_proj_cold"].dispose.assert_awaited_once()
+
+    release.set()
+    await busy
+    await registry.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pools_with_checked_out_connections_are_kept() -> None:
+    """Sessions opened on the session factory directly keep their pool open."""
+    registry, engines = _registry(budget=2, idle_timeout=60)
+    registry.get("cb_proj_bypass").last_used = time.monotonic() - 120
+    engines["cb_proj_bypass"].pool.in_use = 2  # Sessions without a slot
+
+    assert await registry.reap_idle() == 0
+    async with registry.acquire("cb_proj_other"):
+        pass
+
+    assert "cb_proj_bypass" in registry
+    engines["cb_proj_bypass"].dispose.assert_not_awaited()
+    assert registry.evictions == 0
+    await registry.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_close_disposes_every_pool() -> None:
+    """close() stops the reaper and disposes all pools (idempotent)."""
+    registry, engines = _registry()
+    async with registry.acquire("cb_proj_a"):
+        pass
+    registry.get("cb_proj_b")
+
+    await registry.close()
+    await registry.close()
+
+    assert all(engine.dispose.await_count == 1 for engine in engines.values())
+    assert registry._reaper is None
@@ -0,0 +1,221 @@
+"""Unit tests for the in-process registry lookup cache (project_cache.py).
+
+Test Coverage Areas:
+- Cached projects are found by id and by name until the TTL expires
+- Invalidation drops every entry of a project
+- Rows looked up before a concurrent invalidation are not stored
+- Registry change notifications invalidate entries of other processes' writes
+- resolve_project_id() queries the registry by primary key once, then hits the cache
+- Registry writes invalidate the cache and send NOTIFY
+
+Constitutional Compliance:
+- Principle IV: Performance (project resolution without a registry query)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+import src.database.project_cache as cache_module
+from src.database.project_cache import (
+    PROJECT_REGISTRY_CHANNEL,
+    ProjectLookupCache,
+    get_project_cache,
+    notify_project_change,
+)
+from src.database.session import resolve_project_id
+
+PROJECT_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache() -> Iterator[ProjectLookupCache]:
+    """Run each test with its own cache (not listening)."""
+    cache = ProjectLookupCache(ttl=60.0)
+    cache.listen = AsyncMock(return_value=False)  # type: ignore[method-assign]
+    with patch.object(cache_module, "_project_cache", cache):
+        yield cache
+
+
+def _registry_pool(row: dict[str, Any] | None) -> tuple[MagicMock, MagicMock]:
+    conn = MagicMock(fetchrow=AsyncMock(return_value=row), execute=AsyncMock())
+
+    @asynccontextmanager
+    async def acquire() -> AsyncIterator[MagicMock]:
+        yield conn
+
+    return MagicMock(acquire=acquire), conn
+
+
+@pytest.mark.unit
+def test_lookup_by_id_and_name_until_ttl_expires(isolated_cache: ProjectLookupCache) -> None:
+    """A stored row is served by id and by name until the TTL expires."""
+    with patch.object(cache_module.time, "monotonic", return_value=1000.0):
+        isolated_cache.put(PROJECT_ID, "client-a", "cb_proj_client_a_550e8400")
+
+        expected = (PROJECT_ID, "cb_proj_client_a_550e8400")
+        assert isolated_cache.get(str(PROJECT_ID)) == expected
+        assert isolated_cache.get("client-a") == expected
+        assert isolated_cache.get("client-b") is None
+
+    with patch.object(cache_module.time, "monotonic", return_value=1060.0):
+        assert isolated_cache.get("client-a") is None
+
+    assert (isolated_cache.hits, isolated_cache.misses) == (2, 2)
+
+
+@pytest.mark.unit
+def test_invalidate_drops_every_entry_of_project(isolated_cache: ProjectLookupCache) -> None:
+    """Invalidating by id also drops the name entry (and vice versa)."""
+    other = uuid4()
+    isolated_cache.put(PROJECT_ID, "client-a", "cb_proj_client_a_550e8400")
+    isolated_cache.put(other, "client-b", "cb_proj_client_b_00000000")
+
+    isolated_cache.invalidate(PROJECT_ID)
+    assert isolated_cache.get("client-a") is None
+    assert isolated_cache.get(str(PROJECT_ID)) is None
+
+    isolated_cache.invalidate(name="client-b")
+    assert isolated_cache.get(str(other)) is None
+
+
+@pytest.mark.unit
+def test_put_skips_rows_read_before_invalidation(isolated_cache: ProjectLookupCache) -> None:
+    """A lookup racing with a registry write does not store the stale row."""
+    generation = isolated_cache.generation
+    isolated_cache.invalidate(PROJECT_ID, "client-a")  # Write lands mid-lookup
+
+    isolated_cache.put(PROJECT_ID, "client-a", "cb_proj_client_a_550e8400", generation)
+    assert isolated_cache.get("client-a") is None
+
+    isolated_cache.put(
+        PROJECT_ID, "client-a", "cb_proj_client_a_550e8400", isolated_cache.generation
+    )
+    assert isolated_cache.get("client-a") is not None
+
+
+@pytest.mark.unit
+def test_notifications_invalidate_entries(isolated_cache: ProjectLookupCache) -> None:
+    """Changes announced by other processes drop entries; bad payloads clear all."""
+    isolated_cache.put(PROJECT_ID, "client-a", "cb_proj_client_a_550e8400")
+    isolated_cache.put(uuid4(), "client-b", "cb_proj_client_b_00000000")
+
+    payload = json.dumps({"project_id": str(PROJECT_ID), "name": "client-a"})
+    isolated_cache._on_notification(None, 1, PROJECT_REGISTRY_CHANNEL, payload)
+    assert isolated_cache.get("client-a") is None
+    assert isolated_cache.get("client-b") is not None
+
+    isolated_cache._on_notification(None, 1, PROJECT_REGISTRY_CHANNEL, "not json")
+    assert isolated_cache.get("client-b") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resolve_project_id_hits_cache() -> None:
+    """Repeated explicit lookups query the registry once, by primary key."""
+    row = {"id": PROJECT_ID, "name": "client-a", "database_name": "cb_proj_client_a_550e8400"}
+    pool, conn = _registry_pool(row)
+
+    with patch(
+        "src.database.session._initialize_registry_pool", AsyncMock(return_value=pool)
+    ):
+        for identifier in (str(PROJECT_ID), str(PROJECT_ID), "client-a"):
+            assert await resolve_project_id(explicit_id=identifier) == (
+                PROJECT_ID,
+                "cb_proj_client_a_550e8400",
+            )
+
+    conn.fetchrow.assert_awaited_once()
+    query, project_uuid, name = conn.fetchrow.await_args.args
+    assert "id::text" not in query
+    assert (project_uuid, name) == (PROJECT_ID, str(PROJECT_ID))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resolve_project_id_by_name_skips_uuid_match() -> None:
+    """A name is matched by the name index only; unknown projects are not cached."""
+    pool, conn = _registry_pool(None)
+
+    with patch(
+        "src.database.session._initialize_registry_pool", AsyncMock(return_value=pool)
+    ):
+        for _ in range(2):
+            with pytest.raises(ValueError, match="not found in registry"):
+                await resolve_project_id(explicit_id="client-a")
+
+    assert conn.fetchrow.await_count == 2
+    assert conn.fetchrow.await_args.args[1:] == (None, "client-a")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resolve_project_id_does_not_cache_row_invalidated_mid_lookup(
+    isolated_cache: ProjectLookupCache,
+) -> None:
+    """A registry write during the query keeps the row it raced with out of the cache."""
+    row = {"id": PROJECT_ID, "name": "client-a", "database_name": "cb_proj_client_a_550e8400"}
+    pool, conn = _registry_pool(row)
+
+    async def fetchrow(*args: Any) -> dict[str, Any]:
+        isolated_cache.invalidate(PROJECT_ID, "client-a")
+        return row
+
+    conn.fetchrow = AsyncMock(side_effect=fetchrow)
+
+    with patch(
+        "src.database.session._initialize_registry_pool", AsyncMock(return_value=pool)
+    ):
+        await resolve_project_id(explicit_id="client-a")
+
+    assert isolated_cache.get("client-a") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_notify_project_change_invalidates_and_notifies(
+    isolated_cache: ProjectLookupCache,
+) -> None:
+    """Registry writers drop the local entries and NOTIFY other processes."""
+    isolated_cache.put(PROJECT_ID, "client-a", "cb_proj_client_a_550e8400")
+    conn = MagicMock(execute=AsyncMock())
+
+    await notify_project_change(conn, PROJECT_ID, "client-a")
+
+    assert get_project_cache().get("client-a") is None
+    query, channel, payload = conn.execute.await_args.args
+    assert "pg_notify" in query and channel == PROJECT_REGISTRY_CHANNEL
+    assert json.loads(payload) == {"project_id": str(PROJECT_ID), "name": "client-a"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_listen_holds_one_connection() -> None:
+    """listen() subscribes once on a dedicated connection; stop() closes it."""
+    cache = ProjectLookupCache(ttl=60.0)
+    conn = MagicMock(
+        add_listener=AsyncMock(),
+        remove_listener=AsyncMock(),
+        is_closed=MagicMock(return_value=False),
+        close=AsyncMock(),
+    )
+    connect = AsyncMock(return_value=conn)
+
+    assert await cache.listen(connect)
+    assert await cache.listen(connect)
+
+    connect.assert_awaited_once()
+    conn.add_listener.assert_awaited_once_with(PROJECT_REGISTRY_CHANNEL, cache._on_notification)
+
+    await cache.stop()
+    await cache.stop()
+    conn.close.assert_awaited_once()
+    assert not cache.listening
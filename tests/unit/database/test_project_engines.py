@@ -0,0 +1,107 @@
+"""Unit tests for cached per-project engines in get_session().
+
+Test Coverage Areas:
+- One pooled engine and session factory per project database
+- get_session() reuses the cached engine instead of creating and disposing one
+- dispose_project_engines() closes and forgets every cached engine
+
+Constitutional Compliance:
+- Principle IV: Performance (no connection setup per session)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.database.session as session_module
+from src.database.session import (
+    POOL_MAX_SIZE,
+    POOL_MIN_SIZE,
+    dispose_project_engines,
+    get_pool_registry,
+    get_project_session_factory,
+    get_session,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_engines() -> Iterator[None]:
+    """Run each test with its own pool registry."""
+    with patch.object(session_module, "_pool_registry", None):
+        yield
+
+
+@pytest.mark.unit
+def test_engine_is_pooled_and_cached_per_database() -> None:
+    """Each database gets one pooled engine; repeated lookups reuse it."""
+    factory = get_project_session_factory("cb_proj_alpha_00000001")
+
+    assert get_project_session_factory("cb_proj_alpha_00000001") is factory
+    assert get_project_session_factory("cb_proj_beta_00000002") is not factory
+
+    engine = get_pool_registry().get("cb_proj_alpha_00000001").engine
+    assert engine.url.database == "cb_proj_alpha_00000001"
+    assert engine.pool.size() == POOL_MIN_SIZE
+    assert engine.pool._max_overflow == max(POOL_MAX_SIZE - POOL_MIN_SIZE, 0)  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_session_reuses_engine() -> None:
+    """Sessions share the cached engine; it is not disposed after each session."""
+    engine = MagicMock(dispose=AsyncMock())
+    sessions: list[Any] = []
+
+    def sessionmaker(bind: Any, **kwargs: Any) -> Any:
+        @asynccontextmanager
+        async def factory() -> AsyncIterator[Any]:
+            session = AsyncMock(spec=AsyncSession)
+            sessions.append(session)
+            yield session
+
+        return factory
+
+    with (
+        patch(
+            "src.database.session.resolve_project_id",
+            AsyncMock(return_value=("proj", "cb_proj_proj_00000001")),
+        ),
+        patch("src.database.session.create_project_engine", return_value=engine) as create,
+        patch("src.database.pool_registry.async_sessionmaker", sessionmaker),
+    ):
+        for _ in range(3):
+            async with get_session(project_id="proj"):
+                pass
+
+    await dispose_project_engines()  # Stops the idle reaper
+
+    create.assert_called_once()
+    engine.dispose.assert_awaited_once()  # At shutdown only
+    assert len(sessions) == 3
+    assert all(s.commit.await_count == 1 and s.close.await_count == 1 for s in sessions)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_dispose_project_engines() -> None:
+    """Shutdown disposes every cached engine, even when one fails."""
+    failing = MagicMock(dispose=AsyncMock(side_effect=OSError("closed")))
+    healthy = MagicMock(dispose=AsyncMock())
+    engines = iter([failing, healthy])
+
+    with patch("src.database.session.create_project_engine", side_effect=lambda url: next(engines)):
+        get_project_session_factory("cb_proj_a")
+        get_project_session_factory("cb_proj_b")
+        await dispose_project_engines()
+
+    failing.dispose.assert_awaited_once()
+    healthy.dispose.assert_awaited_once()
+    assert "cb_proj_a" not in get_pool_registry()
+    assert "cb_proj_b" not in get_pool_registry()
@@ -0,0 +1,128 @@
+"""Unit tests for generation-based atomic reindexing (chunk_generations.py).
+
+Test Coverage Areas:
+- Search only returns chunks of the repository's active generation
+- Interrupted builds (generation above active) are discarded and their
+  files re-detected as modified
+- Superseded generations are garbage-collected in batches
+- Background garbage collection never raises
+
+Constitutional Compliance:
+- Principle IV: Performance (no large DELETE on the search path)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models import Repository
+from src.services.chunk_generations import (
+    collect_stale_generations,
+    discard_unfinished_generations,
+    schedule_generation_gc,
+)
+from src.services.searcher import search_code
+
+
+class _FakeSession:
+    """Records statements and reports scripted DELETE row counts."""
+
+    def __init__(self, rowcounts: list[int]) -> None:
+        self.rowcounts = rowcounts
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any) -> Any:
+        self.statements.append(statement)
+        return SimpleNamespace(rowcount=self.rowcounts.pop(0), fetchall=lambda: [])
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_filters_active_generation() -> None:
+    """Chunks of a build in progress are invisible to search."""
+    db = _FakeSession([0])
+
+    with patch(
+        "src.services.searcher.generate_embedding", new=AsyncMock(return_value=[0.1] * 768)
+    ):
+        await search_code("parse config", db)  # type: ignore[arg-type]
+
+    search_sql = _sql(db.statements[0])
+    assert "JOIN repositories ON code_files.repository_id = repositories.id" in search_sql
+    assert "code_chunks.generation = repositories.active_generation" in search_sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_discard_unfinished_generations() -> None:
+    """Chunks above the active generation (an interrupted build) are deleted."""
+    repository = Repository(
+        id=uuid4(), path="/repo", name="repo", active_generation=3,
+        last_indexed_at=datetime(2026, 1, 1),
+    )
+    db = _FakeSession([42, 7])
+
+    assert await discard_unfinished_generations(db, repository) == 42  # type: ignore[arg-type]
+    assert "code_chunks.generation >" in _sql(db.statements[0])
+
+    # Files stored by the interrupted build are re-detected as modified
+    reset_sql = _sql(db.statements[1])
+    assert reset_sql.startswith("UPDATE code_files SET modified_at=")
+    assert "code_files.indexed_at >" in reset_sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_nothing_to_discard_keeps_file_metadata() -> None:
+    """Without an unfinished build, file metadata is left alone."""
+    repository = Repository(id=uuid4(), path="/repo", name="repo", active_generation=3)
+    db = _FakeSession([0])
+
+    assert await discard_unfinished_generations(db, repository) == 0  # type: ignore[arg-type]
+    assert len(db.statements) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_collect_stale_generations_in_batches() -> None:
+    """Old generations are deleted one bounded transaction at a time."""
+    db = _FakeSession([100, 100, 7])
+
+    @asynccontextmanager
+    async def fake_session(project_id: str | None = None) -> AsyncIterator[_FakeSession]:
+        yield db
+
+    with patch("src.services.chunk_generations.get_session", fake_session):
+        total = await collect_stale_generations("proj", uuid4(), batch_size=100)
+
+    assert total == 207
+    assert len(db.statements) == 3
+    gc_sql = _sql(db.statements[0])
+    assert "code_chunks.generation < (SELECT repositories.active_generation" in gc_sql
+    assert "LIMIT" in gc_sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scheduled_gc_logs_failures() -> None:
+    """A failing background collection is logged, not raised."""
+    with patch(
+        "src.services.chunk_generations.collect_stale_generations",
+        new=AsyncMock(side_effect=RuntimeError("db down")),
+    ):
+        task = schedule_generation_gc("proj", uuid4())
+        assert await task == 0
@@ -0,0 +1,185 @@
+"""Unit tests for query-based chunk extraction (src/services/chunker.py).
+
+Test Coverage Areas:
+- Chunk query compilation and caching in ParserCache
+- Python: functions, classes, methods, decorated definitions
+- JavaScript: methods, arrow functions, export wrappers, generators
+- Wrapper de-duplication (decorators/exports are not emitted twice)
+
+Constitutional Compliance:
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models import CodeChunkCreate
+from src.services.chunker import ParserCache, detect_language, extract_chunks_from_ast
+
+PROJECT_ID = "test-project"
+
+
+@pytest.fixture
+def test_file_id() -> UUID:
+    """Generate a test file UUID."""
+    return uuid4()
+
+
+def _spans(chunks: list[CodeChunkCreate]) -> list[tuple[str, int, int]]:
+    return [(c.chunk_type, c.start_line, c.end_line) for c in chunks]
+
+
+def _extract(filename: str, content: str, file_id: UUID) -> list[CodeChunkCreate]:
+    """Run query extraction without a size policy (every match, whole)."""
+    language = detect_language(Path(filename))
+    assert language is not None
+    parser = ParserCache().get_parser(language)
+    assert parser is not None
+    content_bytes = content.encode("utf-8")
+    return extract_chunks_from_ast(
+        parser.parse(content_bytes),
+        language,
+        content,
+        file_id,
+        PROJECT_ID,
+        content_bytes=content_bytes,
+    )
+
+
+# ==============================================================================
+# Query Cache Tests
+# ==============================================================================
+
+
+def test_get_query_compiled_once() -> None:
+    """Test chunk queries are compiled once and cached per language."""
+    cache = ParserCache()
+    cache.clear()
+
+    query1 = cache.get_query("python")
+    query2 = cache.get_query("python")
+
+    assert query1 is not None
+    assert query1 is query2
+
+
+def test_get_query_unknown_language() -> None:
+    """Test languages without a grammar or query file return None."""
+    assert ParserCache().get_query("cobol") is None
+
+
+# ==============================================================================
+# Python Query Tests
+# ==============================================================================
+
+
+def test_python_decorated_definitions_include_decorators(test_file_id: UUID) -> None:
+    """Test decorators stay attached and the wrapped definition is not duplicated."""
+    content = """import functools
+
+@functools.cache
+def cached():
+    return 1
+
+@dataclass
+class Point:
+    x: int
+"""
+
+    chunks = _extract("deco.py", content, test_file_id)
+
+    assert _spans(chunks) == [("function", 3, 5), ("class", 7, 9)]
+    assert chunks[0].content.startswith("@functools.cache")
+    assert chunks[1].content.startswith("@dataclass")
+
+
+def test_python_methods_captured(test_file_id: UUID) -> None:
+    """Test class methods (plain and decorated) are extracted once each."""
+    content = """class Service:
+    @property
+    def name(self):
+        return "svc"
+
+    def run(self):
+        pass
+"""
+
+    chunks = _extract("svc.py", content, test_file_id)
+
+    assert _spans(chunks) == [("class", 1, 7), ("function", 2, 4), ("function", 6, 7)]
+
+
+# ==============================================================================
+# JavaScript Query Tests
+# ==============================================================================
+
+
+def test_javascript_query_captures(test_file_id: UUID) -> None:
+    """Test arrow functions, exports, generators and methods are extracted."""
+    content = """export function exported() {}
+const arrow = () => 1;
+class Widget { render() {} }
+export class Panel {}
+function* gen() {}
+"""
+
+    chunks = _extract("app.js", content, test_file_id)
+
+    assert _spans(chunks) == [
+        ("function", 1, 1),
+        ("function", 2, 2),
+        ("class", 3, 3),
+        ("function", 3, 3),
+        ("class", 4, 4),
+        ("function", 5, 5),
+    ]
+    assert chunks[0].content.startswith("export function")
+    assert chunks[4].content.startswith("export class")
+
+
+# ==============================================================================
+# Optional Grammar Tests
+# ==============================================================================
+
+OPTIONAL_LANGUAGE_SAMPLES: dict[str, tuple[str, str, str, list[tuple[str, int, int]]]] = {
+    "typescript": (
+        "tree_sitter_typescript",
+        "svc.ts",
+        "interface Shape {\n  area(): number;\n}\nexport class Sq {\n  side = 1;\n  area(): number { return 1; }\n}\n",
+        [("class", 1, 3), ("class", 4, 7), ("function", 6, 6)],
+    ),
+    "go": (
+        "tree_sitter_go",
+        "main.go",
+        "package main\n\ntype T struct {\n\tx int\n}\n\nfunc (t T) M() int {\n\treturn t.x\n}\n",
+        [("class", 3, 5), ("function", 7, 9)],
+    ),
+    "rust": (
+        "tree_sitter_rust",
+        "lib.rs",
+        "struct S;\n\nimpl S {\n    fn new() -> S {\n        S\n    }\n}\n",
+        [("class", 1, 1), ("class", 3, 7), ("function", 4, 6)],
+    ),
+    "java": (
+        "tree_sitter_java",
+        "App.java",
+        "class App {\n  App() {}\n  void run() {}\n}\n",
+        [("class", 1, 4), ("function", 2, 2), ("function", 3, 3)],
+    ),
+}
+
+
+@pytest.mark.parametrize("language", sorted(OPTIONAL_LANGUAGE_SAMPLES))
+def test_optional_grammar_chunking(test_file_id: UUID, language: str) -> None:
+    """Test AST chunking for optional grammars when they are installed."""
+    module, filename, content, expected = OPTIONAL_LANGUAGE_SAMPLES[language]
+    pytest.importorskip(module)
+
+    chunks = _extract(filename, content, test_file_id)
+
+    assert _spans(chunks) == expected
@@ -0,0 +1,188 @@
+"""Unit tests for size-bounded chunking (src/services/chunker.py).
+
+Test Coverage Areas:
+- ChunkSizePolicy validation and unit conversion
+- Oversized nodes split at child boundaries
+- Small adjacent siblings merged
+- Decorators and class header carried into the first slice of a split class
+- No nested duplicates when an enclosing chunk fits
+- Oversized leaf nodes split at line breaks
+
+Constitutional Compliance:
+- Principle IV: Performance (predictable embedding cost per chunk)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models import CodeChunkCreate
+from src.services.chunker import ChunkSizePolicy, chunk_file
+
+PROJECT_ID = "test-project"
+
+
+@pytest.fixture
+def test_file_id() -> UUID:
+    """Generate a test file UUID."""
+    return uuid4()
+
+
+def _assert_lines_match(content: str, chunks: list[CodeChunkCreate]) -> None:
+    """Each chunk's first/last lines are the source lines it claims to span."""
+    lines = content.splitlines()
+    for chunk in chunks:
+        chunk_lines = chunk.content.rstrip("\n").splitlines()
+        assert chunk_lines[0].strip() == lines[chunk.start_line - 1].strip()
+        assert chunk_lines[-1].strip() == lines[chunk.end_line - 1].strip()
+
+
+# ==============================================================================
+# ChunkSizePolicy Tests
+# ==============================================================================
+
+
+def test_policy_token_units_convert_to_bytes() -> None:
+    """Test token limits use the chars-per-token estimate."""
+    policy = ChunkSizePolicy(max_size=100, min_size=10, unit="tokens")
+
+    assert policy.max_bytes == 400
+    assert policy.min_bytes == 40
+
+
+def test_policy_char_units() -> None:
+    """Test character limits are used as-is."""
+    policy = ChunkSizePolicy(max_size=100, min_size=10, unit="chars")
+
+    assert policy.max_bytes == 100
+    assert policy.min_bytes == 10
+
+
+@pytest.mark.parametrize(
+    ("max_size", "min_size", "unit"),
+    [(100, 100, "chars"), (0, 0, "chars"), (100, -1, "chars"), (100, 10, "lines")],
+)
+def test_policy_rejects_invalid_limits(max_size: int, min_size: int, unit: str) -> None:
+    """Test invalid limits fail fast."""
+    with pytest.raises(ValueError):
+        ChunkSizePolicy(max_size=max_size, min_size=min_size, unit=unit)
+
+
+# ==============================================================================
+# Split / Merge Tests
+# ==============================================================================
+
+
+@pytest.mark.asyncio
+async def test_oversized_class_split_at_method_boundaries(test_file_id: UUID) -> None:
+    """Test a class larger than max size becomes several bounded chunks."""
+    content = "class Big:\n" + "".join(
+        f"    def method_{i}(self):\n        value = {i}\n        return value * 2\n\n"
+        for i in range(40)
+    )
+    policy = ChunkSizePolicy(max_size=300, min_size=100, unit="chars")
+
+    chunks = await chunk_file(Path("big.py"), content, test_file_id, PROJECT_ID, policy=policy)
+
+    assert len(chunks) > 1
+    assert all(len(chunk.content.encode("utf-8")) <= 300 for chunk in chunks)
+    assert all(chunk.chunk_type == "class" for chunk in chunks)
+    # Class header is merged into the first slice, not left as a tiny chunk
+    assert chunks[0].content.startswith("class Big:\n    def method_0")
+    # Chunks are in order and do not overlap
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.end_line < current.start_line
+    _assert_lines_match(content, chunks)
+
+
+@pytest.mark.asyncio
+async def test_decorated_class_header_joins_packed_first_slice(test_file_id: UUID) -> None:
+    """Test decorators and class header get room in the first slice when body packs tightly."""
+    content = "@dec\nclass Big:\n" + "".join(
+        f"    def m{i}(self):\n        return {i:03d}\n\n" for i in range(40)
+    )
+    policy = ChunkSizePolicy(max_size=300, min_size=100, unit="chars")
+
+    chunks = await chunk_file(Path("big.py"), content, test_file_id, PROJECT_ID, policy=policy)
+
+    assert all(len(chunk.content.encode("utf-8")) <= 300 for chunk in chunks)
+    assert chunks[0].content.startswith("@dec\nclass Big:\n    def m0")
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.end_line < current.start_line
+    _assert_lines_match(content, chunks)
+
+
+@pytest.mark.asyncio
+async def test_small_siblings_merged(test_file_id: UUID) -> None:
+    """Test tiny adjacent helpers are merged into one chunk."""
+    content = "def a():\n    return 1\n\ndef b():\n    return 2\n\ndef c():\n    return 3\n"
+    policy = ChunkSizePolicy(max_size=1000, min_size=200, unit="chars")
+
+    chunks = await chunk_file(Path("helpers.py"), content, test_file_id, PROJECT_ID, policy=policy)
+
+    assert len(chunks) == 1
+    assert chunks[0].chunk_type == "function"
+    assert (chunks[0].start_line, chunks[0].end_line) == (1, 8)
+
+
+@pytest.mark.asyncio
+async def test_merge_respects_max_size(test_file_id: UUID) -> None:
+    """Test merging stops before a chunk would exceed max size."""
+    content = "".join(f"def f{i}():\n    return {i}\n\n" for i in range(30))
+    policy = ChunkSizePolicy(max_size=120, min_size=100, unit="chars")
+
+    chunks = await chunk_file(Path("many.py"), content, test_file_id, PROJECT_ID, policy=policy)
+
+    assert len(chunks) > 1
+    assert all(len(chunk.content.encode("utf-8")) <= 120 for chunk in chunks)
+    _assert_lines_match(content, chunks)
+
+
+@pytest.mark.asyncio
+async def test_no_nested_duplicates(test_file_id: UUID) -> None:
+    """Test methods are not emitted separately when their class fits."""
+    content = (
+        "class Small:\n"
+        "    def one(self):\n"
+        "        return 1\n"
+        "\n"
+        "    def two(self):\n"
+        "        return 2\n"
+    )
+    policy = ChunkSizePolicy(max_size=1000, min_size=0, unit="chars")
+
+    chunks = await chunk_file(Path("small.py"), content, test_file_id, PROJECT_ID, policy=policy)
+
+    assert [(c.chunk_type, c.start_line, c.end_line) for c in chunks] == [("class", 1, 6)]
+
+
+@pytest.mark.asyncio
+async def test_oversized_leaf_split_at_lines(test_file_id: UUID) -> None:
+    """Test a huge string literal is split at line breaks."""
+    content = "def template():\n    return '''\n" + "line of text here\n" * 100 + "'''\n"
+    policy = ChunkSizePolicy(max_size=500, min_size=100, unit="chars")
+
+    chunks = await chunk_file(Path("tpl.py"), content, test_file_id, PROJECT_ID, policy=policy)
+
+    assert len(chunks) >= 4
+    assert all(len(chunk.content.encode("utf-8")) <= 500 for chunk in chunks)
+    assert chunks[0].start_line == 1
+    assert chunks[-1].end_line == 103
+
+
+@pytest.mark.asyncio
+async def test_deeply_nested_oversized_no_recursion_error(test_file_id: UUID) -> None:
+    """Test splitting deep oversized nesting uses no Python recursion."""
+    depth = 800
+    content = "".join(f"function f{i}() {{\n" for i in range(depth)) + "}\n" * depth
+    policy = ChunkSizePolicy(max_size=2000, min_size=500, unit="chars")
+
+    chunks = await chunk_file(Path("deep.js"), content, test_file_id, PROJECT_ID, policy=policy)
+
+    assert chunks
+    assert all(len(chunk.content.encode("utf-8")) <= 2000 for chunk in chunks)
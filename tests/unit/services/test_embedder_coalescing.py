@@ -0,0 +1,170 @@
+"""Unit tests for single-flight embedding coalescing in OllamaEmbedder.
+
+Test Coverage Areas:
+- Concurrent callers with the same text share one backend call
+- Duplicates inside one batch are embedded once
+- Failures propagate to every waiting caller
+- A cancelled caller does not cancel work other callers wait on
+- Interactive callers do not wait on bulk requests for the same text
+- Finished requests are not cached (no stale results)
+
+Constitutional Compliance:
+- Principle IV: Performance (no redundant model work under bursty traffic)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterator, Sequence
+
+import pytest
+
+from src.connection_pool.priority import WorkPriority, current_priority
+from src.services.embedder import OllamaEmbedder
+
+
+class _SlowBackend:
+    """Backend that records calls and blocks until released."""
+
+    name = "fake"
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.priorities: list[WorkPriority] = []
+        self.release = asyncio.Event()
+        self.fail = fail
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        self.priorities.append(current_priority())
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("backend down")
+        return [[float(len(text))] for text in texts]
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def embedder() -> Iterator[OllamaEmbedder]:
+    """Fresh embedder instance."""
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+    yield OllamaEmbedder()
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+
+
+def _install(embedder: OllamaEmbedder, backend: _SlowBackend) -> None:
+    embedder._backend = backend  # type: ignore[assignment]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_backend_call(embedder: OllamaEmbedder) -> None:
+    """Callers asking for the same text while it is pending share its result."""
+    backend = _SlowBackend()
+    _install(embedder, backend)
+
+    first = asyncio.create_task(embedder.generate_embedding("query"))
+    second = asyncio.create_task(embedder.generate_embeddings(["query", "other"]))
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    assert await first == [5.0]
+    assert await second == [[5.0], [5.0]]
+    assert backend.calls == [["query"], ["other"]]
+    assert embedder.coalesced_count == 1
+    assert embedder._inflight == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_duplicates_in_batch_embedded_once(embedder: OllamaEmbedder) -> None:
+    """Repeated texts in one batch result in one backend input."""
+    backend = _SlowBackend()
+    backend.release.set()
+    _install(embedder, backend)
+
+    embeddings = await embedder.generate_embeddings(["a", "bb", "a"])
+
+    assert embeddings == [[1.0], [2.0], [1.0]]
+    assert backend.calls == [["a", "bb"]]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failure_propagates_to_all_waiters(embedder: OllamaEmbedder) -> None:
+    """Every caller waiting on a failed request sees the error."""
+    backend = _SlowBackend(fail=True)
+    _install(embedder, backend)
+
+    callers = [asyncio.create_task(embedder.generate_embedding("x")) for _ in range(3)]
+    await asyncio.sleep(0)
+    backend.release.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(backend.calls) == 1
+    assert embedder._inflight == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work(embedder: OllamaEmbedder) -> None:
+    """Cancelling the first caller leaves the shared request running."""
+    backend = _SlowBackend()
+    _install(embedder, backend)
+
+    leader = asyncio.create_task(embedder.generate_embedding("text"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(embedder.generate_embedding("text"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    backend.release.set()
+
+    assert await follower == [4.0]
+    assert leader.cancelled()
+    assert len(backend.calls) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interactive_caller_does_not_wait_on_bulk_request(
+    embedder: OllamaEmbedder,
+) -> None:
+    """A search for a text an indexing batch is embedding gets its own interactive call."""
+    backend = _SlowBackend()
+    _install(embedder, backend)
+
+    bulk = asyncio.create_task(embedder.generate_embeddings(["query"]))
+    await asyncio.sleep(0)
+    search = asyncio.create_task(embedder.generate_embedding("query"))
+    await asyncio.sleep(0)
+    later_bulk = asyncio.create_task(embedder.generate_embeddings(["query"]))
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    assert await search == [5.0]
+    assert await bulk == [[5.0]]
+    assert await later_bulk == [[5.0]]
+    assert backend.priorities == [WorkPriority.BULK, WorkPriority.INTERACTIVE]
+    assert embedder.coalesced_count == 1  # Later bulk caller joined the search
+    assert embedder._inflight == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_completed_requests_are_not_cached(embedder: OllamaEmbedder) -> None:
+    """Sequential calls each reach the backend (coalescing is in-flight only)."""
+    backend = _SlowBackend()
+    backend.release.set()
+    _install(embedder, backend)
+
+    await embedder.generate_embedding("text")
+    await embedder.generate_embedding("text")
+
+    assert len(backend.calls) == 2
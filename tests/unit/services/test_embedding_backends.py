@@ -0,0 +1,185 @@
+"""Unit tests for embedding backends and the mock Ollama server.
+
+Test Coverage Areas:
+- Deterministic hash embeddings
+- Record / replay round trip and replay misses
+- Backend selection through settings
+- OllamaEmbedder using an offline backend
+- OllamaEmbedder against the mock Ollama server (latency, failures, retries)
+
+Constitutional Compliance:
+- Principle II: Local-first (no Ollama required)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any, Iterator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.config.settings import EmbeddingBackendName, Settings, get_settings
+from src.services.embedder import OllamaEmbedder, OllamaError
+from src.services.embedding_backends import (
+    EmbeddingReplayMissError,
+    HashEmbeddingBackend,
+    RecordingEmbeddingBackend,
+    ReplayEmbeddingBackend,
+    create_embedding_backend,
+    hash_embedding,
+)
+from tests.fixtures.mock_ollama import MockOllamaConfig, create_mock_ollama_app
+
+MODEL = "nomic-embed-text"
+
+
+def _settings(**overrides: Any) -> Settings:
+    """Copy of the current settings with overrides."""
+    return get_settings().model_copy(update=overrides)
+
+
+@pytest.fixture
+def reset_embedder() -> Iterator[None]:
+    """Reset the OllamaEmbedder singleton around a test."""
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+    yield
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+
+
+# ==============================================================================
+# Backend Tests
+# ==============================================================================
+
+
+@pytest.mark.unit
+def test_hash_embedding_deterministic_unit_vectors() -> None:
+    """Same input gives the same unit vector; model and text change it."""
+    vector = hash_embedding("def f(): pass", MODEL)
+
+    assert len(vector) == 768
+    assert math.isclose(math.sqrt(sum(v * v for v in vector)), 1.0)
+    assert vector == hash_embedding("def f(): pass", MODEL)
+    assert vector != hash_embedding("def g(): pass", MODEL)
+    assert vector != hash_embedding("def f(): pass", "other-model")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_record_then_replay(tmp_path: Path) -> None:
+    """Recorded embeddings are served by the replay backend."""
+    recording = tmp_path / "embeddings.jsonl"
+    recorder = RecordingEmbeddingBackend(HashEmbeddingBackend(MODEL), recording, MODEL)
+    recorded = await recorder.embed(["alpha", "beta"])
+
+    replay = ReplayEmbeddingBackend(recording, MODEL)
+
+    assert await replay.embed(["beta", "alpha"]) == [recorded[1], recorded[0]]
+    with pytest.raises(EmbeddingReplayMissError):
+        await replay.embed(["gamma"])
+
+
+@pytest.mark.unit
+def test_create_embedding_backend_selection(tmp_path: Path) -> None:
+    """EMBEDDING_BACKEND and EMBEDDING_RECORD_FILE choose the backend."""
+    http_backend = HashEmbeddingBackend(MODEL)
+    http_backend.name = "ollama"
+
+    assert create_embedding_backend(_settings(), http_backend) is http_backend
+
+    recording = create_embedding_backend(
+        _settings(embedding_record_file=str(tmp_path / "rec.jsonl")), http_backend
+    )
+    assert isinstance(recording, RecordingEmbeddingBackend)
+    assert recording.inner is http_backend
+
+    hashed = create_embedding_backend(
+        _settings(embedding_backend=EmbeddingBackendName.HASH), http_backend
+    )
+    assert isinstance(hashed, HashEmbeddingBackend)
+    assert hashed is not http_backend
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_embedder_uses_hash_backend(reset_embedder: None) -> None:
+    """OllamaEmbedder makes no HTTP calls with the hash backend."""
+    settings = _settings(embedding_backend=EmbeddingBackendName.HASH)
+    with patch("src.services.embedder.get_settings", return_value=settings):
+        embedder = OllamaEmbedder()
+
+    assert embedder._client is not None
+    with patch.object(embedder._client, "post", new_callable=AsyncMock) as mock_post:
+        embeddings = await embedder.generate_embeddings(["a", "b"])
+        single = await embedder.generate_embedding("a")
+
+    mock_post.assert_not_called()
+    assert embeddings == [hash_embedding("a", MODEL), hash_embedding("b", MODEL)]
+    assert single == embeddings[0]
+    await embedder.close()
+
+
+# ==============================================================================
+# Mock Ollama Server Tests
+# ==============================================================================
+
+
+def _use_mock_server(embedder: OllamaEmbedder, config: MockOllamaConfig) -> Any:
+    """Point the embedder's HTTP client at an in-process mock server."""
+    app = create_mock_ollama_app(config)
+    embedder._client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://mock-ollama"
+    )
+    return app
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_embedder_against_mock_server(reset_embedder: None) -> None:
+    """HTTP backend returns the mock server's deterministic vectors."""
+    embedder = OllamaEmbedder()
+    app = _use_mock_server(embedder, MockOllamaConfig(latency_ms=1.0))
+
+    embeddings = await embedder.generate_embeddings(["x", "y", "z"])
+
+    assert embeddings[1] == hash_embedding("y", MODEL)
+    assert app.state.stats.requests == 3
+    await embedder.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_mock_server_failures_exercise_retries(reset_embedder: None) -> None:
+    """Injected 503s are retried; a failure rate of 1 exhausts retries."""
+    embedder = OllamaEmbedder()
+    app = _use_mock_server(embedder, MockOllamaConfig(failure_rate=1.0))
+
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        with pytest.raises(OllamaError, match="HTTP error"):
+            await embedder.generate_embedding("x")
+
+    assert app.state.stats.failures == 3
+    await embedder.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_mock_server_batch_endpoint() -> None:
+    """/api/embed accepts a string or a list of inputs."""
+    app = create_mock_ollama_app()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://mock-ollama"
+    ) as client:
+        response = await client.post("/api/embed", json={"model": MODEL, "input": ["a", "b"]})
+        single = await client.post("/api/embed", json={"model": MODEL, "input": "a"})
+        missing = await client.post("/api/embed", json={"model": "nope", "input": "a"})
+
+    assert response.json()["embeddings"] == [hash_embedding("a", MODEL), hash_embedding("b", MODEL)]
+    assert len(single.json()["embeddings"]) == 1
+    assert missing.status_code == 404
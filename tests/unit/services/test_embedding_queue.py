@@ -0,0 +1,223 @@
+"""Unit tests for the embedding backfill queue (embedding_queue.py).
+
+Test Coverage Areas:
+- Claims use FOR UPDATE SKIP LOCKED on embedding_queue rows
+- Successful batches write vectors and remove queue rows
+- Failed batches are rescheduled with backoff instead of lost
+- Rows of deleted chunks are dropped
+- Worker pool draining, wake-up on notify() and lifecycle
+- Schema init backfills the queue only when it creates the table
+
+Constitutional Compliance:
+- Principle V: Production quality (no silently missing embeddings)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Sequence
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Delete, Select, Update
+
+from src.services.embedding_queue import (
+    EmbeddingQueueWorkerPool,
+    QueueBatchResult,
+    claim_and_embed,
+)
+
+
+class _FakeSession:
+    """Records executed statements; SELECTs return the scripted claim rows."""
+
+    def __init__(self, rows: Sequence[tuple[UUID, str | None]]) -> None:
+        self.rows = [SimpleNamespace(chunk_id=c, content=t) for c, t in rows]
+        self.statements: list[tuple[Any, Any]] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> Any:
+        self.statements.append((statement, params))
+        return SimpleNamespace(all=lambda: self.rows)
+
+    def of_type(self, kind: type) -> list[tuple[Any, Any]]:
+        return [(s, p) for s, p in self.statements if isinstance(s, kind)]
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_claim_uses_skip_locked() -> None:
+    """Workers lock queue rows without blocking on each other."""
+    db = _FakeSession([])
+
+    result = await claim_and_embed(db, batch_size=10, max_attempts=3)  # type: ignore[arg-type]
+
+    assert result == QueueBatchResult()
+    claim_sql = _sql(db.statements[0][0])
+    assert "FOR UPDATE OF embedding_queue SKIP LOCKED" in claim_sql
+    assert "LIMIT" in claim_sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_successful_batch_writes_vectors() -> None:
+    """Embedded chunks get their vector and leave the queue."""
+    ids = [uuid4(), uuid4()]
+    db = _FakeSession([(ids[0], "def a(): pass"), (ids[1], "def b(): pass")])
+
+    with patch(
+        "src.services.embedding_queue.generate_embeddings",
+        new=AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]]),
+    ):
+        result = await claim_and_embed(db, batch_size=10, max_attempts=3)  # type: ignore[arg-type]
+
+    assert result == QueueBatchResult(claimed=2, embedded=2)
+    (_, chunk_params), = db.of_type(Update)
+    assert [p["id"] for p in chunk_params] == ids
+    assert [p["embedding"] for p in chunk_params] == [[1.0, 0.0], [0.0, 1.0]]
+    (delete_stmt, _), = db.of_type(Delete)
+    assert "DELETE FROM embedding_queue" in _sql(delete_stmt)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_batch_is_rescheduled() -> None:
+    """An embedding failure bumps attempts with backoff; nothing is written."""
+    db = _FakeSession([(uuid4(), "def a(): pass")])
+
+    with patch(
+        "src.services.embedding_queue.generate_embeddings",
+        new=AsyncMock(side_effect=RuntimeError("ollama down")),
+    ):
+        result = await claim_and_embed(db, batch_size=10, max_attempts=3)  # type: ignore[arg-type]
+
+    assert result == QueueBatchResult(claimed=1, failed=1)
+    (update_stmt, params), = db.of_type(Update)
+    assert params is None
+    update_sql = _sql(update_stmt)
+    assert "UPDATE embedding_queue" in update_sql
+    assert "attempts=(embedding_queue.attempts +" in update_sql
+    assert "least(" in update_sql
+    assert not db.of_type(Delete)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rows_of_deleted_chunks_are_dropped() -> None:
+    """Queue rows whose chunk no longer exists are removed without embedding."""
+    db = _FakeSession([(uuid4(), None)])
+    embed = AsyncMock()
+
+    with patch("src.services.embedding_queue.generate_embeddings", new=embed):
+        result = await claim_and_embed(db, batch_size=10, max_attempts=3)  # type: ignore[arg-type]
+
+    assert result == QueueBatchResult(claimed=1, dropped=1)
+    assert len(db.of_type(Delete)) == 1
+    embed.assert_not_called()
+
+
+@asynccontextmanager
+async def _no_session(project_id: str | None = None) -> AsyncIterator[None]:
+    yield None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_drain_stops_when_queue_empty_or_failing() -> None:
+    """drain() keeps claiming until nothing is ready (or everything fails)."""
+    pool = EmbeddingQueueWorkerPool(workers=1, batch_size=2, max_attempts=3)
+    outcomes = [
+        QueueBatchResult(claimed=2, embedded=2),
+        QueueBatchResult(claimed=1, embedded=1),
+        QueueBatchResult(),
+    ]
+
+    with (
+        patch("src.services.embedding_queue.get_session", _no_session),
+        patch(
+            "src.services.embedding_queue.claim_and_embed",
+            new=AsyncMock(side_effect=outcomes),
+        ),
+    ):
+        assert await pool.drain("proj") == 3
+
+    with (
+        patch("src.services.embedding_queue.get_session", _no_session),
+        patch(
+            "src.services.embedding_queue.claim_and_embed",
+            new=AsyncMock(return_value=QueueBatchResult(claimed=2, failed=2)),
+        ) as claim,
+    ):
+        assert await pool.drain("proj") == 0
+        assert claim.await_count == 1
+
+    assert pool.embedded_total == 3
+    assert pool.failed_total == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_workers_wake_on_notify_and_forget_empty_projects() -> None:
+    """notify() wakes idle workers; drained projects stop being polled."""
+    pool = EmbeddingQueueWorkerPool(workers=2, batch_size=5, max_attempts=3, poll_interval=60)
+    outcomes = iter([QueueBatchResult(claimed=5, embedded=5)])
+
+    async def fake_claim(db: Any, batch_size: int, max_attempts: int) -> QueueBatchResult:
+        return next(outcomes, QueueBatchResult())
+
+    with (
+        patch("src.services.embedding_queue.get_session", _no_session),
+        patch("src.services.embedding_queue.claim_and_embed", new=fake_claim),
+        patch(
+            "src.services.embedding_queue.queue_depth",
+            new=AsyncMock(return_value={"pending": 0, "parked": 0}),
+        ),
+    ):
+        await pool.start()
+        await pool.start()  # Idempotent
+        await asyncio.sleep(0)
+        pool.notify("proj")
+        for _ in range(50):
+            if pool.embedded_total and not pool._projects:
+                break
+            await asyncio.sleep(0.01)
+        await pool.stop()
+        await pool.stop()  # Idempotent
+
+    assert pool.embedded_total == 5
+    assert pool._projects == set()
+    assert pool._tasks == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_disabled_with_zero_workers() -> None:
+    """EMBEDDING_QUEUE_WORKERS=0 leaves backfill to other processes."""
+    pool = EmbeddingQueueWorkerPool(workers=0)
+
+    await pool.start()
+
+    assert pool._tasks == []
+
+
+@pytest.mark.unit
+def test_schema_init_backfills_queue_only_on_creation() -> None:
+    """Re-running init_project_schema.sql does not rescan code_chunks."""
+    script = Path(__file__).parents[3] / "scripts" / "init_project_schema.sql"
+    sql = script.read_text()
+
+    guard = sql.index("IF to_regclass('embedding_queue') IS NULL THEN")
+    backfill = sql.index("INSERT INTO embedding_queue")
+    assert guard < sql.index("CREATE TABLE embedding_queue") < backfill
+    assert backfill < sql.index("END IF;", guard)
+    assert sql.count("INSERT INTO embedding_queue") == 1
@@ -0,0 +1,169 @@
+"""Unit tests for embedding context windows (src/services/embedding_windows.py).
+
+Test Coverage Areas:
+- Token estimation
+- WindowPolicy validation
+- Overlapping, line-aligned windows within the context limit
+- Over-long single lines
+- Token-weighted pooling
+- Indexer window batching (length-bucketed, longest first) and sub-chunk splitting
+
+Constitutional Compliance:
+- Principle IV: Performance (bounded embedding input size)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import math
+from uuid import uuid4
+
+import pytest
+
+from src.models import CodeChunk
+from src.services.embedding_windows import (
+    TextWindow,
+    WindowPolicy,
+    estimate_tokens,
+    pool_embeddings,
+    split_into_windows,
+)
+from src.services.indexer import _batch_windows, _split_long_chunks
+
+
+def _source(lines: int) -> str:
+    """Generate a source text with numbered lines of similar size."""
+    return "".join(f"value_{i} = compute(value_{i - 1}, {i})\n" for i in range(lines))
+
+
+@pytest.mark.unit
+def test_estimate_tokens_counts_pieces_and_punctuation() -> None:
+    """Words cost one token per 4 characters, punctuation one each."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("def f():") == 5  # def, f, (, ), :
+    assert estimate_tokens("identifier") == 3  # 10 chars -> 3 pieces
+
+
+@pytest.mark.unit
+def test_window_policy_validation() -> None:
+    """Invalid strategies and overlaps are rejected."""
+    with pytest.raises(ValueError, match="strategy"):
+        WindowPolicy(strategy="truncate")
+    with pytest.raises(ValueError, match="window limits"):
+        WindowPolicy(max_tokens=256, overlap_tokens=128)
+
+
+@pytest.mark.unit
+def test_short_text_is_single_window() -> None:
+    """Text within the context is returned whole."""
+    text = _source(5)
+    windows = split_into_windows(text, WindowPolicy(max_tokens=2048, overlap_tokens=0))
+
+    assert len(windows) == 1
+    assert windows[0].text == text
+    assert (windows[0].start_line, windows[0].end_line) == (0, 4)
+
+
+@pytest.mark.unit
+def test_long_text_windows_fit_and_overlap() -> None:
+    """Windows respect max_tokens, cover every line and overlap their neighbours."""
+    text = _source(400)
+    lines = text.splitlines(keepends=True)
+    policy = WindowPolicy(max_tokens=256, overlap_tokens=32)
+
+    windows = split_into_windows(text, policy, count_tokens=estimate_tokens)
+
+    assert len(windows) > 1
+    assert all(w.tokens <= policy.max_tokens for w in windows)
+    assert windows[0].start_line == 0
+    assert windows[-1].end_line == len(lines) - 1
+    for window in windows:
+        assert window.text == "".join(lines[window.start_line : window.end_line + 1])
+    for previous, current in zip(windows, windows[1:], strict=False):
+        assert previous.start_line < current.start_line <= previous.end_line
+
+
+@pytest.mark.unit
+def test_over_long_line_is_sliced() -> None:
+    """A single line longer than the context is cut into fitting slices."""
+    text = "x = [" + ", ".join(str(i) for i in range(3000)) + "]\n"
+    policy = WindowPolicy(max_tokens=256, overlap_tokens=0)
+
+    windows = split_into_windows(text, policy, count_tokens=estimate_tokens)
+
+    assert len(windows) > 1
+    assert all(w.tokens <= policy.max_tokens for w in windows)
+    assert "".join(w.text for w in windows) == text
+    assert all(w.start_line == w.end_line == 0 for w in windows)
+
+
+@pytest.mark.unit
+def test_pool_embeddings_weighted_and_normalized() -> None:
+    """Pooling weights windows by tokens and returns a unit vector."""
+    pooled = pool_embeddings([[1.0, 0.0], [0.0, 1.0]], [300, 100])
+
+    assert math.isclose(math.hypot(*pooled), 1.0)
+    assert math.isclose(pooled[0] / pooled[1], 3.0)
+    assert pool_embeddings([[2.0, 0.0]], [10]) == [2.0, 0.0]
+    with pytest.raises(ValueError, match="non-empty"):
+        pool_embeddings([], [])
+
+
+@pytest.mark.unit
+def test_batch_windows_keeps_chunk_windows_together() -> None:
+    """Groups hold about batch_size windows and never split a chunk."""
+    window = TextWindow("x", 0, 0, 1)
+    chunk_windows = [[window], [window] * 7, [window], [window], [window]]
+
+    groups = list(_batch_windows(chunk_windows, 5))
+
+    assert groups == [[1], [0, 2, 3, 4]]
+
+
+@pytest.mark.unit
+def test_batch_windows_buckets_by_length_longest_first() -> None:
+    """Batches hold similar-length texts, longest scheduled first."""
+    tokens = [10, 800, 12, 790, 11, 805, 9, 795]
+    chunk_windows = [[TextWindow("x", 0, 0, t)] for t in tokens]
+
+    groups = list(_batch_windows(chunk_windows, 4))
+
+    assert groups == [[5, 1, 7, 3], [2, 4, 0, 6]]
+    assert sorted(i for group in groups for i in group) == list(range(len(tokens)))
+
+    # Total time when a batch costs as much as its longest text
+    def cost(batches: list[list[int]]) -> int:
+        return sum(max(tokens[i] for i in batch) for batch in batches)
+
+    file_order = [list(range(0, 4)), list(range(4, 8))]
+    assert cost(groups) < cost(file_order)
+
+
+@pytest.mark.unit
+def test_split_long_chunks_creates_line_ranged_sub_chunks() -> None:
+    """Split strategy replaces long chunks with one sub-chunk per window."""
+    text = _source(400)
+    chunk = CodeChunk(
+        code_file_id=uuid4(),
+        repository_id=uuid4(),
+        project_id="test-project",
+        content=text,
+        start_line=10,
+        end_line=409,
+        chunk_type="block",
+    )
+    windows = split_into_windows(
+        text, WindowPolicy(max_tokens=256, overlap_tokens=32), count_tokens=estimate_tokens
+    )
+
+    chunks, chunk_windows = _split_long_chunks([(chunk, text)], [windows])
+
+    assert len(chunks) == len(windows)
+    assert all(len(w) == 1 for w in chunk_windows)
+    assert chunks[0][0].start_line == 10
+    assert chunks[-1][0].end_line == 409
+    for sub_chunk, sub_text in chunks:
+        assert sub_chunk.content == sub_text
+        assert sub_chunk.repository_id == chunk.repository_id
+        assert sub_chunk.end_line - sub_chunk.start_line + 1 == len(sub_text.splitlines())
@@ -0,0 +1,254 @@
+"""Unit tests for checkpointed, resumable indexing jobs.
+
+Test Coverage Areas:
+- index_repository commits and checkpoints after every file batch
+- Resuming a full reindex continues its generation and skips stored files
+- Incremental runs discard an interrupted full reindex first
+- Checkpoints are persisted on the job row (failures never abort indexing)
+- The background worker resumes from the job's checkpoint
+
+Constitutional Compliance:
+- Principle V: Production quality (interrupted jobs keep their progress)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models import CodeChunk, IndexingJob, Repository
+from src.services.background_worker import _background_indexing_worker, record_checkpoint
+from src.services.indexer import IndexCheckpoint, index_repository
+from src.services.job_store import JobStatusStore
+from src.services.scanner import ChangeSet
+
+
+def _repo_files(tmp_path: Path, count: int) -> list[Path]:
+    files = []
+    for i in range(count):
+        path = tmp_path / f"mod{i}.py"
+        path.write_text(f"def f{i}():\n    return {i}\n")
+        files.append(path)
+    return files
+
+
+def _fake_chunks(
+    db: Any,
+    repository_id: Any,
+    repo_path: Path,
+    file_batch: list[Path],
+    project_id: str,
+    generation: int,
+    replace_existing: bool,
+    errors: list[str],
+) -> list[tuple[CodeChunk, str]]:
+    """Stand-in for _chunk_file_batch: one chunk per file."""
+    return [
+        (
+            CodeChunk(
+                id=uuid4(), code_file_id=uuid4(), repository_id=repository_id,
+                project_id=project_id, content=path.name, start_line=1, end_line=2,
+                chunk_type="function", generation=generation,
+            ),
+            path.name,
+        )
+        for path in file_batch
+    ]
+
+
+def _fake_db() -> MagicMock:
+    db = MagicMock()
+    db.commit = AsyncMock()
+    db.flush = AsyncMock()
+    db.rollback = AsyncMock()
+    return db
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_index_repository_checkpoints_every_batch(tmp_path: Path) -> None:
+    """Each file batch is committed and reported before the next starts."""
+    files = _repo_files(tmp_path, 5)
+    repository = Repository(id=uuid4(), path=str(tmp_path), name="repo", active_generation=0)
+    checkpoints: list[IndexCheckpoint] = []
+    db = _fake_db()
+
+    async def on_checkpoint(checkpoint: IndexCheckpoint) -> None:
+        checkpoints.append(checkpoint)
+
+    with (
+        patch("src.services.indexer.FILE_BATCH_SIZE", 2),
+        patch("src.services.indexer._get_or_create_repository", AsyncMock(return_value=repository)),
+        patch("src.services.indexer.scan_repository", AsyncMock(return_value=files)),
+        patch("src.services.indexer.discard_unfinished_generations", AsyncMock()),
+        patch("src.services.indexer._chunk_file_batch", side_effect=_fake_chunks),
+        patch(
+            "src.services.indexer.generate_embeddings",
+            AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts]),
+        ),
+        patch("src.services.indexer.schedule_generation_gc") as gc,
+    ):
+        result = await index_repository(
+            tmp_path, "repo", db, "proj", force_reindex=True, on_checkpoint=on_checkpoint
+        )
+
+    assert result.status == "success"
+    assert result.files_indexed == 5
+    assert [(c.files_done, c.batches_done) for c in checkpoints] == [(2, 1), (4, 2), (5, 3)]
+    assert {c.generation for c in checkpoints} == {1}
+    assert db.commit.await_count == 4  # Three batches plus the generation switch
+    assert repository.active_generation == 1
+    gc.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resumed_full_reindex_skips_stored_files(tmp_path: Path) -> None:
+    """Resuming keeps the build generation and only indexes remaining files."""
+    files = _repo_files(tmp_path, 4)
+    repository = Repository(id=uuid4(), path=str(tmp_path), name="repo", active_generation=2)
+    chunked: list[str] = []
+    checkpoints: list[IndexCheckpoint] = []
+
+    def record_chunking(*args: Any, **kwargs: Any) -> list[tuple[CodeChunk, str]]:
+        chunked.extend(path.name for path in args[3])
+        return _fake_chunks(*args, **kwargs)
+
+    async def on_checkpoint(checkpoint: IndexCheckpoint) -> None:
+        checkpoints.append(checkpoint)
+
+    with (
+        patch("src.services.indexer._get_or_create_repository", AsyncMock(return_value=repository)),
+        patch("src.services.indexer.scan_repository", AsyncMock(return_value=files)),
+        patch("src.services.indexer.discard_unfinished_generations", AsyncMock()) as discard,
+        patch(
+            "src.services.indexer._files_in_generation",
+            AsyncMock(return_value={"mod0.py", "mod1.py"}),
+        ),
+        patch("src.services.indexer._chunk_file_batch", side_effect=record_chunking),
+        patch(
+            "src.services.indexer.generate_embeddings",
+            AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts]),
+        ),
+        patch("src.services.indexer.schedule_generation_gc"),
+    ):
+        result = await index_repository(
+            tmp_path, "repo", _fake_db(), "proj", force_reindex=True,
+            resume_generation=3, on_checkpoint=on_checkpoint,
+        )
+
+    discard.assert_not_called()
+    assert chunked == ["mod2.py", "mod3.py"]
+    assert checkpoints[-1].files_done == checkpoints[-1].files_total == 4
+    assert result.files_indexed == 4
+    assert repository.active_generation == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_incremental_run_discards_unfinished_build(tmp_path: Path) -> None:
+    """An incremental run drops an interrupted full reindex before detecting changes."""
+    files = _repo_files(tmp_path, 2)
+    repository = Repository(id=uuid4(), path=str(tmp_path), name="repo", active_generation=2)
+    calls: list[str] = []
+
+    async def discard(db: Any, repo: Repository) -> int:
+        calls.append("discard")
+        return 10
+
+    async def detect(*args: Any) -> ChangeSet:
+        calls.append("detect_changes")
+        return ChangeSet(added=[], modified=files, deleted=[])
+
+    with (
+        patch("src.services.indexer._get_or_create_repository", AsyncMock(return_value=repository)),
+        patch("src.services.indexer.scan_repository", AsyncMock(return_value=files)),
+        patch("src.services.indexer.discard_unfinished_generations", side_effect=discard),
+        patch("src.services.indexer.detect_changes", side_effect=detect),
+        patch("src.services.indexer._chunk_file_batch", side_effect=_fake_chunks),
+        patch(
+            "src.services.indexer.generate_embeddings",
+            AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts]),
+        ),
+        patch("src.services.indexer.schedule_generation_gc") as gc,
+    ):
+        result = await index_repository(tmp_path, "repo", _fake_db(), "proj")
+
+    assert calls == ["discard", "detect_changes"]
+    assert result.files_indexed == 2
+    assert repository.active_generation == 2
+    gc.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_record_checkpoint_updates_job() -> None:
+    """Progress is written to the job row; write failures are swallowed."""
+    job_id = uuid4()
+    checkpoint = IndexCheckpoint(
+        repository_id=uuid4(), generation=1, files_total=10,
+        files_done=4, chunks_created=40, batches_done=2,
+    )
+
+    with patch("src.services.background_worker.update_job", AsyncMock()) as update:
+        await record_checkpoint(job_id, checkpoint)
+
+    fields = update.await_args.kwargs
+    assert fields["files_indexed"] == 4
+    assert fields["files_total"] == 10
+    assert fields["checkpoint"]["generation"] == 1
+    assert fields["status_message"] == "Indexing in progress: 4/10 files, 40 chunks"
+
+    with patch("src.services.background_worker.update_job", AsyncMock(side_effect=OSError)):
+        await record_checkpoint(job_id, checkpoint)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_worker_resumes_from_checkpoint(tmp_path: Path) -> None:
+    """A resumed force reindex passes the latest checkpointed generation to the indexer."""
+    job_id = uuid4()
+    job = IndexingJob(
+        id=job_id, repo_path=str(tmp_path), project_id="proj", status="failed",
+        force_reindex=True, checkpoint={"generation": 4},
+    )
+    job_session = MagicMock()
+    job_session.get = AsyncMock(return_value=job)
+
+    @asynccontextmanager
+    async def fake_job_session() -> AsyncIterator[MagicMock]:
+        yield job_session
+
+    # The newest checkpoint is still buffered in the store, not yet flushed
+    store = JobStatusStore(flush_interval=60)
+    store._dirty[job_id] = {"checkpoint": {"generation": 5}}
+
+    @asynccontextmanager
+    async def fake_session(**kwargs: Any) -> AsyncIterator[MagicMock]:
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(scalar=lambda: 3))
+        yield session
+
+    indexer = AsyncMock(side_effect=RuntimeError("stop after call"))
+    with (
+        patch("src.services.job_store.JobsSessionLocal", fake_job_session),
+        patch("src.services.background_worker.get_job_store", return_value=store),
+        patch("src.services.background_worker.get_session", fake_session),
+        patch("src.services.background_worker.update_job", AsyncMock()) as update,
+        patch("src.services.background_worker.index_repository", indexer),
+    ):
+        await _background_indexing_worker(
+            job_id, str(tmp_path), "proj", force_reindex=True, resume=True
+        )
+
+    assert indexer.await_args.kwargs["resume_generation"] == 5
+    assert update.await_args_list[0].kwargs == {
+        "job_id": job_id, "status": "running", "error_message": None, "completed_at": None
+    }
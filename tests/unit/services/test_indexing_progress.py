@@ -0,0 +1,169 @@
+"""Unit tests for live indexing progress and stage timings.
+
+Test Coverage Areas:
+- index_repository reports files chunked, chunks embedded/persisted, rate and ETA
+- Progress reports are throttled (final report always sent)
+- Per-stage durations are returned with the result
+- Progress is written to the job row (failures never abort indexing)
+
+Constitutional Compliance:
+- Principle IV: Performance (stalls distinguishable from slow progress)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models import CodeChunk, Repository
+from src.services.background_worker import record_progress
+from src.services.indexer import IndexProgress, _ProgressTracker, index_repository
+
+
+def _repo_files(tmp_path: Path, count: int) -> list[Path]:
+    files = []
+    for i in range(count):
+        path = tmp_path / f"mod{i}.py"
+        path.write_text(f"def f{i}():\n    return {i}\n")
+        files.append(path)
+    return files
+
+
+def _fake_chunks(
+    db: Any,
+    repository_id: Any,
+    repo_path: Path,
+    file_batch: list[Path],
+    project_id: str,
+    generation: int,
+    replace_existing: bool,
+    errors: list[str],
+) -> list[tuple[CodeChunk, str]]:
+    """Stand-in for _chunk_file_batch: one chunk per file."""
+    return [
+        (
+            CodeChunk(
+                id=uuid4(), code_file_id=uuid4(), repository_id=repository_id,
+                project_id=project_id, content=path.name, start_line=1, end_line=2,
+                chunk_type="function", generation=generation,
+            ),
+            path.name,
+        )
+        for path in file_batch
+    ]
+
+
+async def _index(tmp_path: Path, files: int, interval: float) -> tuple[Any, list[IndexProgress]]:
+    repository = Repository(id=uuid4(), path=str(tmp_path), name="repo", active_generation=0)
+    db = MagicMock(commit=AsyncMock(), flush=AsyncMock(), rollback=AsyncMock())
+    reports: list[IndexProgress] = []
+
+    async def on_progress(progress: IndexProgress) -> None:
+        reports.append(progress)
+
+    with (
+        patch("src.services.indexer.FILE_BATCH_SIZE", 2),
+        patch("src.services.indexer.PROGRESS_INTERVAL_SECONDS", interval),
+        patch("src.services.indexer._get_or_create_repository", AsyncMock(return_value=repository)),
+        patch("src.services.indexer.scan_repository", AsyncMock(return_value=_repo_files(tmp_path, files))),
+        patch("src.services.indexer.discard_unfinished_generations", AsyncMock()),
+        patch("src.services.indexer._chunk_file_batch", side_effect=_fake_chunks),
+        patch(
+            "src.services.indexer.generate_embeddings",
+            AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts]),
+        ),
+        patch("src.services.indexer.schedule_generation_gc"),
+    ):
+        result = await index_repository(
+            tmp_path, "repo", db, "proj", force_reindex=True, on_progress=on_progress
+        )
+    return result, reports
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_index_repository_reports_progress(tmp_path: Path) -> None:
+    """Counters advance through the run and the final report is complete."""
+    result, reports = await _index(tmp_path, files=5, interval=0)
+
+    assert result.status == "success"
+    assert len(reports) > 3
+    files_done = [r.files_done for r in reports]
+    assert files_done == sorted(files_done)
+
+    final = reports[-1]
+    assert final.stage == "finalize"
+    assert (final.files_total, final.files_chunked, final.files_done) == (5, 5, 5)
+    assert (final.chunks_embedded, final.chunks_persisted) == (5, 5)
+    assert final.files_per_second > 0
+    assert final.eta_seconds == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_progress_reports_are_throttled(tmp_path: Path) -> None:
+    """Within one interval only the first and the final report are sent."""
+    _, reports = await _index(tmp_path, files=5, interval=60)
+
+    assert len(reports) == 2
+    assert reports[-1].files_done == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stage_durations_are_returned(tmp_path: Path) -> None:
+    """Every stage of the run is timed."""
+    result, _ = await _index(tmp_path, files=3, interval=60)
+
+    assert set(result.stage_seconds) == {"scan", "chunk", "embed", "persist", "finalize"}
+    assert all(seconds >= 0 for seconds in result.stage_seconds.values())
+    assert sum(result.stage_seconds.values()) <= result.duration_seconds
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_eta_counts_partially_embedded_batch() -> None:
+    """A half-embedded batch counts as half its files towards rate and ETA."""
+    tracker = _ProgressTracker(on_progress=None)
+    tracker.begin_run(files_total=12, files_skipped=2)
+    tracker._run_started = time.perf_counter() - 10  # Run started 10s ago
+    tracker.batch_chunked(files=4, chunks=10)
+    await tracker.chunks_processed(5, embedded=True)
+
+    progress = tracker.snapshot()
+    assert (progress.files_chunked, progress.files_done, progress.chunks_embedded) == (6, 2, 5)
+    # 2 of 10 files of this run done in 10s, 8 remaining
+    assert progress.files_per_second == pytest.approx(0.2, rel=0.01)
+    assert progress.eta_seconds == pytest.approx(40, rel=0.01)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_record_progress_updates_job() -> None:
+    """Progress and a readable message are written; write failures are swallowed."""
+    job_id = uuid4()
+    progress = IndexProgress(
+        stage="embed", files_total=100, files_chunked=40, files_done=30,
+        chunks_embedded=350, chunks_persisted=300, elapsed_seconds=20.0,
+        files_per_second=1.5, eta_seconds=125.0,
+    )
+
+    with patch("src.services.background_worker.update_job", AsyncMock()) as update:
+        await record_progress(job_id, progress)
+
+    fields = update.await_args.kwargs
+    assert fields["progress"]["chunks_embedded"] == 350
+    assert fields["status_message"] == (
+        "Indexing in progress (embed): 30/100 files, 300 chunks, 1.5 files/s, ETA 2m 05s"
+    )
+    assert "status" not in fields  # Buffered by the job store
+
+    with patch("src.services.background_worker.update_job", AsyncMock(side_effect=OSError)):
+        await record_progress(job_id, progress)
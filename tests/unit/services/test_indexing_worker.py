@@ -0,0 +1,223 @@
+"""Unit tests for the standalone indexing worker (indexing_worker.py).
+
+Test Coverage Areas:
+- Jobs are claimed with FOR UPDATE SKIP LOCKED, incremental jobs first
+- Claimed jobs are marked running and resume from their checkpoint
+- Workers run claimed jobs and release in-flight jobs on shutdown
+- run_worker() closes every database pool on SIGTERM
+- Recovery with standalone workers only returns stale running jobs to pending
+- INDEXING_ENQUEUE_ONLY servers record jobs without running them
+
+Constitutional Compliance:
+- Principle IV: Performance (indexing isolated from query serving)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.config.settings import get_settings
+from src.models import IndexingJob
+from src.services import background_worker
+from src.services.indexing_worker import IndexingWorker, claim_next_job, run_worker
+from src.services.job_recovery import recover_stale_jobs
+from src.services.job_scheduler import ScheduledJob
+
+
+def _session(job: IndexingJob | None) -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(
+        return_value=MagicMock(
+            scalar_one_or_none=lambda: job,
+            scalars=lambda: MagicMock(all=lambda: [job] if job else []),
+        )
+    )
+    session.commit = AsyncMock()
+    return session
+
+
+def _factory(session: MagicMock) -> Any:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[MagicMock]:
+        yield session
+
+    return factory
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_claim_locks_next_pending_job() -> None:
+    """The oldest incremental job is locked with SKIP LOCKED and marked running."""
+    job = IndexingJob(
+        id=uuid4(), repo_path="/repo", project_id="proj", status="pending",
+        force_reindex=True, config_path="/repo/.codebase-mcp/config.json",
+        checkpoint={"generation": 2},
+    )
+    session = _session(job)
+
+    claimed = await claim_next_job(session)  # type: ignore[arg-type]
+
+    claim_sql = _sql(session.execute.await_args.args[0])
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql
+    assert "ORDER BY indexing_jobs.force_reindex, indexing_jobs.created_at" in claim_sql
+    assert job.status == "running"
+    session.commit.assert_awaited_once()
+    assert claimed == ScheduledJob(
+        job_id=job.id, repo_path="/repo", project_id="proj",
+        config_path=Path("/repo/.codebase-mcp/config.json"),
+        force_reindex=True, resume=True,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_claim_returns_none_when_queue_empty() -> None:
+    """Nothing is committed when no job is pending."""
+    session = _session(None)
+
+    assert await claim_next_job(session) is None  # type: ignore[arg-type]
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_once_runs_claimed_job() -> None:
+    """A claimed job is executed by the background worker."""
+    job = ScheduledJob(job_id=uuid4(), repo_path="/repo", project_id="proj")
+    runner = AsyncMock()
+    worker = IndexingWorker(concurrency=1, poll_interval=60, recovery_interval=60)
+
+    with (
+        patch("src.services.indexing_worker.JobsSessionLocal", _factory(_session(None))),
+        patch("src.services.indexing_worker.claim_next_job", AsyncMock(side_effect=[job, None])),
+        patch.object(background_worker, "_background_indexing_worker", runner),
+    ):
+        assert await worker.run_once() is True
+        assert await worker.run_once() is False
+
+    assert runner.await_args.kwargs["job_id"] == job.job_id
+    assert worker.jobs_run == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stop_releases_in_flight_jobs() -> None:
+    """Jobs interrupted by shutdown go back to pending right away."""
+    job = ScheduledJob(job_id=uuid4(), repo_path="/repo", project_id="proj")
+    claims = iter([job])
+    started = asyncio.Event()
+
+    async def never_finishes(**kwargs: Any) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    async def claim(session: Any) -> ScheduledJob | None:
+        return next(claims, None)
+
+    worker = IndexingWorker(concurrency=2, poll_interval=60, recovery_interval=60)
+    with (
+        patch("src.services.indexing_worker.JobsSessionLocal", _factory(_session(None))),
+        patch("src.services.indexing_worker.claim_next_job", claim),
+        patch("src.services.indexing_worker.recover_stale_jobs", AsyncMock()) as recover,
+        patch.object(background_worker, "_background_indexing_worker", never_finishes),
+        patch.object(IndexingWorker, "_release", AsyncMock()) as release,
+    ):
+        await worker.start()
+        await worker.start()  # Idempotent
+        await asyncio.wait_for(started.wait(), timeout=1)
+        await worker.stop()
+        await worker.stop()  # Idempotent
+
+    release.assert_awaited_once_with([job.job_id])
+    assert recover.await_args.kwargs == {"requeue_only": True}
+    assert worker._tasks == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_worker_closes_database_pools_on_sigterm() -> None:
+    """Shutdown disposes project pools, the cache listener and the jobs engine."""
+    services = MagicMock(start=AsyncMock(), stop=AsyncMock(), close=AsyncMock())
+
+    with (
+        patch.object(IndexingWorker, "start", AsyncMock()),
+        patch.object(IndexingWorker, "stop", AsyncMock()) as stop,
+        patch("src.services.indexing_worker.get_job_store", return_value=services),
+        patch("src.services.embedding_queue.get_embedding_queue_pool", return_value=services),
+        patch("src.services.embedder.OllamaEmbedder", return_value=services),
+        patch("src.database.session.close_db_connection", AsyncMock()) as close_db,
+    ):
+        asyncio.get_running_loop().call_later(0.05, os.kill, os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(run_worker(concurrency=1), timeout=5)
+
+    stop.assert_awaited_once()
+    close_db.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_requeue_only_recovery_ignores_pending_jobs() -> None:
+    """With standalone workers only stale running jobs are recovered."""
+    job = IndexingJob(
+        id=uuid4(), repo_path="/repo", project_id="proj", status="running",
+        force_reindex=False, recovery_count=0,
+    )
+    session = _session(job)
+    scheduler = MagicMock()
+
+    with (
+        patch("src.services.job_recovery.JobsSessionLocal", _factory(session)),
+        patch("src.services.job_recovery.get_indexing_scheduler", return_value=scheduler),
+    ):
+        result = await recover_stale_jobs(stale_after=60, max_recoveries=3, requeue_only=True)
+
+    claim_sql = _sql(session.execute.await_args.args[0])
+    assert "indexing_jobs.status IN (__[POSTCOMPILE_status_1])" in claim_sql
+    assert session.execute.await_args.args[0].compile().params["status_1"] == ["running"]
+    assert result.requeued == [str(job.id)]
+    assert job.status == "pending"
+    scheduler.submit.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_enqueue_only_server_does_not_run_jobs(tmp_path: Path) -> None:
+    """INDEXING_ENQUEUE_ONLY servers leave pending jobs to standalone workers."""
+    from src.mcp.tools.background_indexing import start_indexing_background
+
+    session = _session(None)
+    session.add = MagicMock()
+    session.refresh = AsyncMock()
+    scheduler = MagicMock()
+    settings = get_settings().model_copy(update={"indexing_enqueue_only": True})
+
+    with (
+        patch(
+            "src.mcp.tools.background_indexing.resolve_project_id",
+            AsyncMock(return_value=("proj", "cb_proj_proj")),
+        ),
+        patch("src.mcp.tools.background_indexing.JobsSessionLocal", _factory(session)),
+        patch("src.mcp.tools.background_indexing.get_settings", return_value=settings),
+        patch("src.mcp.tools.background_indexing.get_indexing_scheduler", return_value=scheduler),
+    ):
+        result = await start_indexing_background(repo_path=str(tmp_path))
+
+    assert result["status"] == "pending"
+    assert session.add.call_args.args[0].status == "pending"
+    scheduler.submit.assert_not_called()
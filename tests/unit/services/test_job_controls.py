@@ -0,0 +1,324 @@
+"""Unit tests for cancelling and pausing indexing jobs.
+
+Test Coverage Areas:
+- index_repository stops at a file batch boundary when asked
+- Stopped jobs are recorded as paused (checkpoint kept) or cancelled
+- cancel/pause of queued jobs takes effect at once; running jobs are flagged
+- Requests reach jobs through the in-process registry and heartbeats
+- Withdrawn jobs are skipped by the scheduler; recovery honours requests
+- Jobs running in a live worker elsewhere cannot be resumed
+
+Constitutional Compliance:
+- Principle V: Production quality (cooperative stop, resources released)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models import CodeChunk, IndexingJob, Repository
+from src.services import background_worker
+from src.services.background_worker import _background_indexing_worker, _heartbeat_loop
+from src.services.indexer import IndexResult, index_repository
+from src.services.job_recovery import recover_stale_jobs
+from src.services.job_scheduler import IndexingJobScheduler, ScheduledJob
+
+
+def _fake_chunks(
+    db: Any,
+    repository_id: Any,
+    repo_path: Path,
+    file_batch: list[Path],
+    project_id: str,
+    generation: int,
+    replace_existing: bool,
+    errors: list[str],
+) -> list[tuple[CodeChunk, str]]:
+    """Stand-in for _chunk_file_batch: one chunk per file."""
+    return [
+        (
+            CodeChunk(
+                id=uuid4(), code_file_id=uuid4(), repository_id=repository_id,
+                project_id=project_id, content=path.name, start_line=1, end_line=2,
+                chunk_type="function", generation=generation,
+            ),
+            path.name,
+        )
+        for path in file_batch
+    ]
+
+
+def _job_session(job: IndexingJob) -> tuple[Any, MagicMock]:
+    session = MagicMock()
+    session.get = AsyncMock(return_value=job)
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[MagicMock]:
+        yield session
+
+    return factory, session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_index_repository_stops_at_batch_boundary(tmp_path: Path) -> None:
+    """Committed batches are kept; a full reindex does not switch generations."""
+    files = []
+    for i in range(5):
+        path = tmp_path / f"mod{i}.py"
+        path.write_text(f"def f{i}():\n    return {i}\n")
+        files.append(path)
+    repository = Repository(id=uuid4(), path=str(tmp_path), name="repo", active_generation=0)
+    db = MagicMock(commit=AsyncMock(), flush=AsyncMock(), rollback=AsyncMock())
+    checks = iter([False, True])
+
+    with (
+        patch("src.services.indexer.FILE_BATCH_SIZE", 2),
+        patch("src.services.indexer._get_or_create_repository", AsyncMock(return_value=repository)),
+        patch("src.services.indexer.scan_repository", AsyncMock(return_value=files)),
+        patch("src.services.indexer.discard_unfinished_generations", AsyncMock()),
+        patch("src.services.indexer._chunk_file_batch", side_effect=_fake_chunks),
+        patch(
+            "src.services.indexer.generate_embeddings",
+            AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts]),
+        ),
+        patch("src.services.indexer.schedule_generation_gc") as gc,
+    ):
+        result = await index_repository(
+            tmp_path, "repo", db, "proj", force_reindex=True, should_stop=lambda: next(checks)
+        )
+
+    assert result.status == "stopped"
+    assert (result.files_indexed, result.chunks_created) == (2, 2)
+    assert db.commit.await_count == 1  # First batch only
+    assert repository.active_generation == 0
+    gc.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("action", ["pause", "cancel"])
+async def test_worker_records_stopped_job(tmp_path: Path, action: str) -> None:
+    """A requested stop ends the run; pause keeps the checkpoint, cancel drops it."""
+    job_id = uuid4()
+
+    async def index_until_stopped(**kwargs: Any) -> IndexResult:
+        assert kwargs["should_stop"]() is False
+        assert background_worker.request_control(job_id, action)
+        assert kwargs["should_stop"]() is True
+        return IndexResult(
+            repository_id=uuid4(), files_indexed=200, chunks_created=900,
+            duration_seconds=1.0, status="stopped", stage_seconds={"chunk": 0.5},
+        )
+
+    @asynccontextmanager
+    async def fake_session(**kwargs: Any) -> AsyncIterator[MagicMock]:
+        yield MagicMock()
+
+    with (
+        patch("src.services.background_worker.send_heartbeat", AsyncMock(return_value=None)),
+        patch("src.services.background_worker.get_session", fake_session),
+        patch("src.services.background_worker.update_job", AsyncMock()) as update,
+        patch("src.services.background_worker.index_repository", index_until_stopped),
+    ):
+        await _background_indexing_worker(job_id, str(tmp_path), "proj")
+
+    final = update.await_args.kwargs
+    assert final["status"] == ("paused" if action == "pause" else "cancelled")
+    assert final["control_request"] is None
+    assert ("checkpoint" in final) == (action == "cancel")
+    assert final["stage_durations"] == {"chunk": 0.5}
+    assert job_id not in background_worker._control_requests
+    assert not background_worker.is_job_active(job_id)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancel_queued_job_takes_effect_at_once() -> None:
+    """A queued job is withdrawn and cancelled in one transaction."""
+    from src.mcp.tools.background_indexing import cancel_indexing_job
+
+    job = IndexingJob(id=uuid4(), repo_path="/repo", project_id="proj", status="pending")
+    job.checkpoint = {"generation": 1}
+    factory, session = _job_session(job)
+    scheduler = MagicMock()
+
+    with (
+        patch("src.mcp.tools.background_indexing.JobsSessionLocal", factory),
+        patch("src.mcp.tools.background_indexing.get_indexing_scheduler", return_value=scheduler),
+    ):
+        result = await cancel_indexing_job(job_id=str(job.id))
+
+    assert result["status"] == "cancelled"
+    assert job.status == "cancelled" and job.checkpoint is None
+    assert job.completed_at is not None
+    scheduler.withdraw.assert_called_once_with(job.id)
+    assert session.get.await_args.kwargs == {"with_for_update": True}
+    session.execute.assert_awaited_once()  # NOTIFY
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pause_running_job_is_requested() -> None:
+    """A running job is flagged and told directly if it runs in this process."""
+    from src.mcp.tools.background_indexing import pause_indexing_job
+
+    job = IndexingJob(id=uuid4(), repo_path="/repo", project_id="proj", status="running")
+    factory, _ = _job_session(job)
+
+    with (
+        patch("src.mcp.tools.background_indexing.JobsSessionLocal", factory),
+        patch("src.mcp.tools.background_indexing.request_control") as request,
+    ):
+        result = await pause_indexing_job(job_id=str(job.id))
+
+    assert result["status"] == "running"
+    assert job.status == "running" and job.control_request == "pause"
+    request.assert_called_once_with(job.id, "pause")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_jobs_are_final() -> None:
+    """Finished jobs reject cancel/pause; cancelled jobs cannot be resumed."""
+    from src.mcp.tools.background_indexing import (
+        cancel_indexing_job,
+        pause_indexing_job,
+        resume_indexing_job,
+    )
+
+    job = IndexingJob(id=uuid4(), repo_path="/repo", project_id="proj", status="cancelled")
+    factory, session = _job_session(job)
+
+    with patch("src.mcp.tools.background_indexing.JobsSessionLocal", factory):
+        with pytest.raises(ValueError, match="already cancelled"):
+            await cancel_indexing_job(job_id=str(job.id))
+        with pytest.raises(ValueError, match="already cancelled"):
+            await pause_indexing_job(job_id=str(job.id))
+        with pytest.raises(ValueError, match="was cancelled"):
+            await resume_indexing_job(job_id=str(job.id))
+
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stale", [False, True])
+async def test_resume_running_job_requires_stale_heartbeat(stale: bool) -> None:
+    """A job another worker runs is not resumed unless that worker went silent."""
+    from src.mcp.tools.background_indexing import resume_indexing_job
+
+    job = IndexingJob(
+        id=uuid4(), repo_path="/repo", project_id="proj", status="running",
+        force_reindex=False, files_indexed=0, files_total=0,
+    )
+    factory, session = _job_session(job)
+    session.scalar = AsyncMock(return_value=stale)
+
+    with (
+        patch("src.mcp.tools.background_indexing.JobsSessionLocal", factory),
+        patch("src.mcp.tools.background_indexing._dispatch") as dispatch,
+    ):
+        if stale:
+            result = await resume_indexing_job(job_id=str(job.id))
+            assert result["status"] == job.status == "pending"
+            dispatch.assert_called_once()
+        else:
+            with pytest.raises(ValueError, match="still running"):
+                await resume_indexing_job(job_id=str(job.id))
+            assert job.status == "running"
+            session.commit.assert_not_awaited()
+
+    assert session.get.await_args.kwargs == {"with_for_update": True}
+    session.scalar.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_heartbeat_delivers_remote_requests() -> None:
+    """Requests made through another process arrive with the next heartbeat."""
+    job_id = uuid4()
+
+    with (
+        patch("src.services.background_worker.send_heartbeat", AsyncMock(return_value="cancel")),
+        patch.object(background_worker, "_active_jobs", {job_id}),
+        patch.object(background_worker, "_control_requests", {}) as requests,
+    ):
+        task = asyncio.create_task(_heartbeat_loop(job_id, 60))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert requests == {job_id: "cancel"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_withdrawn_jobs_are_skipped() -> None:
+    """A job withdrawn from the queue never reaches a worker."""
+    scheduler = IndexingJobScheduler(max_concurrent=1, heartbeat_interval=60)
+    blocker = asyncio.Event()
+    started: list[Any] = []
+
+    async def worker(**kwargs: Any) -> None:
+        started.append(kwargs["job_id"])
+        await blocker.wait()
+
+    first = ScheduledJob(job_id=uuid4(), repo_path="/a", project_id="proj")
+    second = ScheduledJob(job_id=uuid4(), repo_path="/b", project_id="proj")
+    with patch.object(background_worker, "_background_indexing_worker", worker):
+        scheduler.submit(first)
+        scheduler.submit(second)
+        await asyncio.sleep(0)
+        assert scheduler.withdraw(second.job_id)
+        assert not scheduler.withdraw(second.job_id)
+        blocker.set()
+        await asyncio.wait_for(scheduler._queue.join(), timeout=1)
+        await scheduler.stop()
+
+    assert started == [first.job_id]
+    assert scheduler.queued_count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_recovery_honours_stop_requests() -> None:
+    """An orphaned job with a pending cancel is cancelled, not resumed."""
+    job = IndexingJob(
+        id=uuid4(), repo_path="/repo", project_id="proj", status="running",
+        force_reindex=False, recovery_count=0, control_request="cancel",
+        checkpoint={"generation": 1},
+    )
+    session = MagicMock()
+    session.execute = AsyncMock(
+        return_value=MagicMock(scalars=lambda: MagicMock(all=lambda: [job]))
+    )
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[MagicMock]:
+        yield session
+
+    scheduler = MagicMock()
+    with (
+        patch("src.services.job_recovery.JobsSessionLocal", factory),
+        patch("src.services.job_recovery.get_indexing_scheduler", return_value=scheduler),
+    ):
+        result = await recover_stale_jobs(stale_after=60, max_recoveries=3)
+
+    assert result.stopped == [str(job.id)] and result.requeued == []
+    assert job.status == "cancelled" and job.checkpoint is None
+    assert job.control_request is None
+    scheduler.submit.assert_not_called()
@@ -0,0 +1,175 @@
+"""Unit tests for push-based job progress (job_events.py).
+
+Test Coverage Areas:
+- Job updates send NOTIFY in the same transaction
+- Notifications wake subscribers of their job only
+- Listener connection failures fall back to polling (with backoff)
+- get_indexing_status long-polls until progress, completion or timeout
+
+Constitutional Compliance:
+- Principle IV: Performance (no polling load on the database)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.background_worker import update_job
+from src.services.job_events import JOB_EVENTS_CHANNEL, JobEventListener
+
+
+def _status(status: str, files_indexed: int = 0) -> dict[str, Any]:
+    return {"status": status, "files_indexed": files_indexed}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_job_notifies_in_same_transaction() -> None:
+    """The event is queued before commit, so it is delivered with the change."""
+    job_id = uuid4()
+    calls: list[Any] = []
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=lambda stmt: calls.append(stmt))
+    session.commit = AsyncMock(side_effect=lambda: calls.append("commit"))
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[MagicMock]:
+        yield session
+
+    with patch("src.services.job_store.JobsSessionLocal", factory):
+        await update_job(job_id=job_id, status="completed")
+
+    _, notify, commit = calls
+    assert commit == "commit"
+    compiled = notify.compile(dialect=postgresql.dialect())
+    assert "pg_notify" in str(compiled)
+    channel, payload = compiled.params.values()
+    assert channel == JOB_EVENTS_CHANNEL
+    assert json.loads(payload) == {
+        "job_id": str(job_id), "status": "completed"
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_notifications_wake_only_their_job() -> None:
+    """Subscribers are woken by events of their job; bad payloads are ignored."""
+    listener = JobEventListener()
+    watched, other = uuid4(), uuid4()
+
+    with listener.subscription(watched) as event:
+        listener._on_notification(None, 1, JOB_EVENTS_CHANNEL, "not json")
+        listener._on_notification(None, 1, JOB_EVENTS_CHANNEL, json.dumps({"job_id": str(other)}))
+        assert not event.is_set()
+        listener._on_notification(
+            None, 1, JOB_EVENTS_CHANNEL, json.dumps({"job_id": str(watched), "status": "running"})
+        )
+        assert event.is_set()
+
+    assert listener._waiters == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_listener_failure_backs_off() -> None:
+    """Without LISTEN, start() reports False and does not reconnect every call."""
+    listener = JobEventListener()
+    connect = AsyncMock(side_effect=OSError("connection refused"))
+
+    with patch("src.services.job_events.engine", MagicMock(connect=connect)):
+        assert await listener.start() is False
+        assert await listener.start() is False
+
+    assert connect.await_count == 1
+    assert not listener.listening
+
+
+def _patch_status_tool(
+    listener: JobEventListener, reads: list[dict[str, Any]]
+) -> tuple[Any, AsyncMock]:
+    read = AsyncMock(side_effect=reads)
+    patches = (
+        patch(
+            "src.mcp.tools.background_indexing.resolve_project_id",
+            AsyncMock(return_value=("proj", "cb_proj_proj")),
+        ),
+        patch("src.mcp.tools.background_indexing.get_job_event_listener", return_value=listener),
+        patch("src.mcp.tools.background_indexing._read_job_status", read),
+    )
+    return patches, read
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_long_poll_returns_on_notification() -> None:
+    """A waiting status call returns as soon as the job's event arrives."""
+    from src.mcp.tools.background_indexing import get_indexing_status
+
+    job_id = uuid4()
+    listener = JobEventListener()
+    (p1, p2, p3), read = _patch_status_tool(
+        listener, [_status("running"), _status("completed", 10)]
+    )
+
+    async def complete_soon() -> None:
+        await asyncio.sleep(0.02)
+        listener.dispatch(job_id)
+
+    with p1, p2, p3, patch.object(JobEventListener, "start", AsyncMock(return_value=True)):
+        started = time.monotonic()
+        notifier = asyncio.create_task(complete_soon())
+        result = await get_indexing_status(job_id=str(job_id), wait_seconds=30)
+        await notifier
+
+    assert result["status"] == "completed"
+    assert time.monotonic() - started < 5
+    assert read.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_long_poll_skips_wait_for_finished_jobs() -> None:
+    """Completed or failed jobs are returned immediately."""
+    from src.mcp.tools.background_indexing import get_indexing_status
+
+    listener = JobEventListener()
+    (p1, p2, p3), read = _patch_status_tool(listener, [_status("failed")])
+
+    with p1, p2, p3, patch.object(JobEventListener, "start", AsyncMock(return_value=True)):
+        result = await get_indexing_status(job_id=str(uuid4()), wait_seconds=30)
+
+    assert result["status"] == "failed"
+    assert read.await_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_long_poll_falls_back_to_polling() -> None:
+    """Without LISTEN the call re-reads until the job changes."""
+    from src.mcp.tools.background_indexing import get_indexing_status
+
+    listener = JobEventListener()
+    (p1, p2, p3), read = _patch_status_tool(
+        listener, [_status("running", 5), _status("running", 5), _status("running", 8)]
+    )
+
+    with (
+        p1, p2, p3,
+        patch.object(JobEventListener, "start", AsyncMock(return_value=False)),
+        patch("src.mcp.tools.background_indexing.FALLBACK_POLL_INTERVAL", 0.01),
+    ):
+        result = await get_indexing_status(job_id=str(uuid4()), wait_seconds=30)
+
+    assert result["files_indexed"] == 8
+    assert read.await_count == 3
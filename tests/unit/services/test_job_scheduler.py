@@ -0,0 +1,281 @@
+"""Unit tests for the bounded indexing job scheduler (job_scheduler.py).
+
+Test Coverage Areas:
+- No more than max_concurrent jobs run at once
+- Incremental jobs run before queued full reindexes
+- Queued or running jobs are not submitted twice
+- Requests for a repository with an active job return that job's id (and report
+  a force reindex merged into an incremental job)
+- Scheduler lifecycle (stop is idempotent and releases running and queued jobs)
+- Orphaned jobs are recovered periodically, not only at startup
+
+Constitutional Compliance:
+- Principle IV: Performance (bounded Ollama and database load)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.models import IndexingJob
+from src.services import background_worker
+from src.services.job_scheduler import IndexingJobScheduler, ScheduledJob
+
+
+def _scheduled(force_reindex: bool = False) -> ScheduledJob:
+    return ScheduledJob(
+        job_id=uuid4(), repo_path="/repo", project_id="proj", force_reindex=force_reindex
+    )
+
+
+class _RecordingWorker:
+    """Stand-in for _background_indexing_worker that blocks until released."""
+
+    def __init__(self) -> None:
+        self.started: list[UUID] = []
+        self.running = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, **kwargs: Any) -> None:
+        self.started.append(kwargs["job_id"])
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await self.release.wait()
+        self.running -= 1
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded() -> None:
+    """Only max_concurrent jobs run; the rest wait in the queue."""
+    scheduler = IndexingJobScheduler(max_concurrent=2, heartbeat_interval=60)
+    worker = _RecordingWorker()
+    jobs = [_scheduled() for _ in range(5)]
+
+    with patch.object(background_worker, "_background_indexing_worker", worker):
+        for job in jobs:
+            assert scheduler.submit(job)
+        await _settle()
+        assert worker.running == 2
+        assert scheduler.queued_count == 3
+
+        worker.release.set()
+        await asyncio.wait_for(scheduler._queue.join(), timeout=1)
+        await scheduler.stop()
+        await scheduler.stop()  # Idempotent
+
+    assert worker.peak == 2
+    assert worker.started == [job.job_id for job in jobs]
+    assert scheduler._tasks == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_incremental_jobs_run_before_full_reindexes() -> None:
+    """Queued incremental jobs overtake full reindexes, FIFO within a priority."""
+    scheduler = IndexingJobScheduler(max_concurrent=1, heartbeat_interval=60)
+    worker = _RecordingWorker()
+    first, full, incremental_a, incremental_b = (
+        _scheduled(), _scheduled(force_reindex=True), _scheduled(), _scheduled()
+    )
+
+    with patch.object(background_worker, "_background_indexing_worker", worker):
+        scheduler.submit(first)
+        await _settle()
+        for job in (full, incremental_a, incremental_b):
+            scheduler.submit(job)
+        worker.release.set()
+        await asyncio.wait_for(scheduler._queue.join(), timeout=1)
+        await scheduler.stop()
+
+    assert worker.started == [
+        first.job_id, incremental_a.job_id, incremental_b.job_id, full.job_id
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_duplicate_submissions_are_ignored() -> None:
+    """A job already queued, or running in this process, is not queued again."""
+    scheduler = IndexingJobScheduler(max_concurrent=1, heartbeat_interval=60)
+    worker = _RecordingWorker()
+    running, queued = _scheduled(), _scheduled()
+
+    with patch.object(background_worker, "_background_indexing_worker", worker):
+        scheduler.submit(running)
+        await _settle()
+        scheduler.submit(queued)
+
+        assert not scheduler.submit(queued)
+        with patch.object(background_worker, "_active_jobs", {running.job_id}):
+            assert not scheduler.submit(running)
+        assert scheduler.queued_count == 1
+
+        await scheduler.stop()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stop_releases_running_and_queued_jobs() -> None:
+    """Shutdown returns running and queued jobs to pending for recovery."""
+    scheduler = IndexingJobScheduler(max_concurrent=1, heartbeat_interval=60)
+    worker = _RecordingWorker()
+    running, queued = _scheduled(), _scheduled()
+
+    with (
+        patch.object(background_worker, "_background_indexing_worker", worker),
+        patch.object(scheduler, "_release", AsyncMock()) as release,
+    ):
+        scheduler.submit(running)
+        await _settle()
+        scheduler.submit(queued)
+        await scheduler.stop()
+
+    release.assert_awaited_once()
+    assert set(release.await_args.args[0]) == {running.job_id, queued.job_id}
+    assert scheduler.queued_count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_start_recovers_orphaned_jobs_periodically() -> None:
+    """start() runs recovery at once and again every recovery_interval."""
+    scheduler = IndexingJobScheduler(
+        max_concurrent=1, heartbeat_interval=60, recovery_interval=0.01
+    )
+
+    with patch("src.services.job_recovery.recover_stale_jobs", AsyncMock()) as recover:
+        await scheduler.start()
+        await scheduler.start()  # Idempotent
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+    assert recover.await_count >= 2
+    assert scheduler._recovery is None
+
+
+def _job_session(active: IndexingJob | None, commit: AsyncMock) -> Any:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=lambda: active))
+    session.commit = commit
+    session.rollback = AsyncMock()
+    session.refresh = AsyncMock()
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[MagicMock]:
+        yield session
+
+    return factory
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_request_for_active_repository_returns_existing_job(tmp_path: Any) -> None:
+    """Indexing a repository with a pending/running job coalesces into it."""
+    from src.mcp.tools.background_indexing import start_indexing_background
+
+    active = IndexingJob(
+        id=uuid4(), repo_path=str(tmp_path), project_id="proj", status="running",
+        force_reindex=False,
+    )
+    scheduler = MagicMock()
+    commit = AsyncMock()
+
+    with (
+        patch(
+            "src.mcp.tools.background_indexing.resolve_project_id",
+            AsyncMock(return_value=("proj", "cb_proj_proj")),
+        ),
+        patch("src.mcp.tools.background_indexing.JobsSessionLocal", _job_session(active, commit)),
+        patch("src.mcp.tools.background_indexing.get_indexing_scheduler", return_value=scheduler),
+    ):
+        result = await start_indexing_background(repo_path=str(tmp_path))
+
+    assert result["job_id"] == str(active.id)
+    assert result["status"] == "running"
+    assert result["coalesced"] is True
+    commit.assert_not_awaited()
+    scheduler.submit.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_force_reindex_merged_into_incremental_job_is_reported(tmp_path: Any) -> None:
+    """A force reindex coalesced into an incremental job does not claim to be queued."""
+    from src.mcp.tools.background_indexing import start_indexing_background
+
+    active = IndexingJob(
+        id=uuid4(), repo_path=str(tmp_path), project_id="proj", status="pending",
+        force_reindex=False,
+    )
+    scheduler = MagicMock()
+
+    with (
+        patch(
+            "src.mcp.tools.background_indexing.resolve_project_id",
+            AsyncMock(return_value=("proj", "cb_proj_proj")),
+        ),
+        patch(
+            "src.mcp.tools.background_indexing.JobsSessionLocal",
+            _job_session(active, AsyncMock()),
+        ),
+        patch("src.mcp.tools.background_indexing.get_indexing_scheduler", return_value=scheduler),
+    ):
+        result = await start_indexing_background(repo_path=str(tmp_path), force_reindex=True)
+
+    assert result["job_id"] == str(active.id)
+    assert result["coalesced"] is True
+    assert result["force_reindex"] is False
+    assert "incremental" in result["message"] and "not applied" in result["message"]
+    scheduler.submit.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_insert_conflict_returns_winning_job(tmp_path: Any) -> None:
+    """Losing the race on the unique active-job index returns the winner's id."""
+    from src.mcp.tools.background_indexing import start_indexing_background
+
+    winner = IndexingJob(
+        id=uuid4(), repo_path=str(tmp_path), project_id="proj", status="pending",
+        force_reindex=True,
+    )
+    lookups = iter([None, winner])
+    session_factory = _job_session(
+        None, AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("duplicate")))
+    )
+    scheduler = MagicMock()
+
+    with (
+        patch(
+            "src.mcp.tools.background_indexing.resolve_project_id",
+            AsyncMock(return_value=("proj", "cb_proj_proj")),
+        ),
+        patch("src.mcp.tools.background_indexing.JobsSessionLocal", session_factory),
+        patch(
+            "src.mcp.tools.background_indexing._find_active_job",
+            AsyncMock(side_effect=lambda *args: next(lookups)),
+        ),
+        patch("src.mcp.tools.background_indexing.get_indexing_scheduler", return_value=scheduler),
+    ):
+        result = await start_indexing_background(repo_path=str(tmp_path))
+
+    assert result["job_id"] == str(winner.id)
+    assert result["coalesced"] is True
+    assert result["force_reindex"] is True
+    scheduler.submit.assert_not_called()
@@ -0,0 +1,174 @@
+"""Unit tests for the write-behind job status store (job_store.py).
+
+Test Coverage Areas:
+- Progress updates are buffered until the next flush
+- Status transitions are written immediately
+- A flush writes every buffered job (with NOTIFY) in one transaction
+- Failed flushes keep the updates buffered
+- Jobs running in this process are read from memory until they finish
+
+Constitutional Compliance:
+- Principle IV: Performance (no database round trip per progress update)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models import IndexingJob
+from src.services.job_store import JobStatusStore
+
+
+def _session(job: IndexingJob | None = None) -> MagicMock:
+    session = MagicMock()
+    session.get = AsyncMock(return_value=job)
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+def _factory(session: MagicMock) -> Any:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[MagicMock]:
+        yield session
+
+    return factory
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_progress_updates_are_buffered() -> None:
+    """Progress-only updates reach the database at the next flush."""
+    store = JobStatusStore(flush_interval=60)
+    session = _session()
+    job_id = uuid4()
+
+    with patch("src.services.job_store.JobsSessionLocal", _factory(session)):
+        await store.update(job_id, files_indexed=10)
+        await store.update(job_id, files_indexed=20, chunks_created=200)
+        session.execute.assert_not_awaited()
+
+        assert await store.flush() == 1
+        await store.stop()
+
+    update_stmt = session.execute.await_args_list[0].args[0]
+    assert "UPDATE indexing_jobs" in _sql(update_stmt)
+    assert update_stmt.compile().params["files_indexed"] == 20
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_status_transitions_are_written_immediately() -> None:
+    """A status change flushes the job's buffered progress with it."""
+    store = JobStatusStore(flush_interval=60)
+    session = _session()
+    job_id = uuid4()
+
+    with patch("src.services.job_store.JobsSessionLocal", _factory(session)):
+        await store.update(job_id, files_indexed=5)
+        await store.update(job_id, status="failed", error_message="boom")
+
+        params = session.execute.await_args_list[0].args[0].compile().params
+        assert (params["status"], params["files_indexed"]) == ("failed", 5)
+        session.commit.assert_awaited_once()
+        await store.stop()
+
+    assert store._dirty == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_flush_batches_jobs_in_one_transaction() -> None:
+    """Every buffered job gets an UPDATE and a NOTIFY before a single commit."""
+    store = JobStatusStore(flush_interval=60)
+    calls: list[str] = []
+    session = _session()
+    session.execute = AsyncMock(side_effect=lambda stmt: calls.append(_sql(stmt)))
+    session.commit = AsyncMock(side_effect=lambda: calls.append("commit"))
+
+    with patch("src.services.job_store.JobsSessionLocal", _factory(session)):
+        for _ in range(3):
+            await store.update(uuid4(), files_indexed=1)
+        assert await store.flush() == 3
+        await store.stop()
+
+    assert sum("UPDATE indexing_jobs" in call for call in calls) == 3
+    assert sum("pg_notify" in call for call in calls) == 3
+    assert calls[-1] == "commit" and calls.count("commit") == 1
+    assert store.flushes == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_updates() -> None:
+    """Updates survive a failed write; newer values win on retry."""
+    store = JobStatusStore(flush_interval=60)
+    session = _session()
+    session.commit = AsyncMock(side_effect=[OSError("connection lost"), None])
+    job_id = uuid4()
+
+    with patch("src.services.job_store.JobsSessionLocal", _factory(session)):
+        await store.update(job_id, files_indexed=10, chunks_created=100)
+        with pytest.raises(OSError):
+            await store.flush()
+        await store.update(job_id, files_indexed=30)
+        assert store._dirty[job_id] == {"files_indexed": 30, "chunks_created": 100}
+
+        assert await store.flush() == 1
+        await store.stop()
+
+    assert store._dirty == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_owned_jobs_are_read_from_memory() -> None:
+    """Jobs running in this process are read once, then served from memory."""
+    store = JobStatusStore(flush_interval=60)
+    job_id = uuid4()
+    job = IndexingJob(
+        id=job_id, repo_path="/repo", project_id="proj", status="running", files_indexed=0
+    )
+    session = _session(job)
+
+    with patch("src.services.job_store.JobsSessionLocal", _factory(session)):
+        await store.update(job_id, status="running")
+        assert (await store.load(job_id))["repo_path"] == "/repo"
+        await store.update(job_id, files_indexed=42, bogus=1)
+        assert (await store.load(job_id))["files_indexed"] == 42
+        assert session.get.await_count == 1
+
+        # Finished jobs are no longer cached
+        await store.update(job_id, status="completed")
+        assert store.get(job_id) is None
+        await store.stop()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_other_jobs_are_read_from_database() -> None:
+    """Jobs not run by this process are not cached; missing jobs return None."""
+    store = JobStatusStore(flush_interval=60)
+    job_id = uuid4()
+    job = IndexingJob(id=job_id, repo_path="/repo", project_id="proj", status="pending")
+    session = _session(job)
+
+    with patch("src.services.job_store.JobsSessionLocal", _factory(session)):
+        assert (await store.load(job_id))["status"] == "pending"
+        assert await store.load(job_id) is not None
+        assert session.get.await_count == 2
+        session.get = AsyncMock(return_value=None)
+        assert await store.load(uuid4()) is None
@@ -0,0 +1,147 @@
+"""Unit tests for multi-endpoint Ollama load balancing.
+
+Test Coverage Areas:
+- OLLAMA_BASE_URLS parsing
+- Least-outstanding-requests selection with round-robin tie breaking
+- Ejection after consecutive failures and fail-open when all are ejected
+- Health checks returning endpoints to rotation
+- OllamaEmbedder routing around a failing endpoint
+
+Constitutional Compliance:
+- Principle IV: Performance (throughput scales with model servers)
+- Principle V: Production quality (failure isolation)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from typing import Iterator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.config.settings import get_settings
+from src.services.embedder import OllamaEmbedder
+from src.services.ollama_endpoints import EndpointPool
+
+
+@pytest.fixture
+def reset_embedder() -> Iterator[None]:
+    """Reset the OllamaEmbedder singleton around a test."""
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+    yield
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+
+
+@pytest.mark.unit
+def test_settings_ollama_endpoints() -> None:
+    """OLLAMA_BASE_URLS overrides OLLAMA_BASE_URL and is normalized."""
+    settings = get_settings()
+    assert settings.model_copy(update={"ollama_base_urls": None}).ollama_endpoints == [
+        str(settings.ollama_base_url).rstrip("/")
+    ]
+
+    multi = settings.model_copy(
+        update={"ollama_base_urls": "http://a:11434/, http://b:11434,http://a:11434"}
+    )
+    assert multi.ollama_endpoints == ["http://a:11434", "http://b:11434"]
+
+
+@pytest.mark.unit
+def test_select_least_outstanding_with_rotation() -> None:
+    """Busy endpoints are avoided; idle ones share load evenly."""
+    pool = EndpointPool(["http://a", "http://b", "http://c"])
+    a, b, c = pool.endpoints
+
+    with pool.track(a), pool.track(b):
+        assert pool.select() is c
+
+    picks = Counter(pool.select().url for _ in range(30))
+    assert picks == {"http://a": 10, "http://b": 10, "http://c": 10}
+
+
+@pytest.mark.unit
+def test_ejection_and_recovery() -> None:
+    """Endpoints are ejected after the threshold and rejoin on success."""
+    pool = EndpointPool(["http://a", "http://b"], eject_seconds=60, failure_threshold=2)
+    a, b = pool.endpoints
+
+    pool.record_failure(a, "timeout")
+    assert any(pool.select() is a for _ in range(4))  # One failure: still in rotation
+
+    pool.record_failure(a, "timeout")
+    assert all(pool.select() is b for _ in range(4))
+    assert pool.snapshot()[0]["healthy"] is False
+
+    # Everything ejected: fail open to the endpoint closest to rejoining
+    pool.record_failure(b, "timeout")
+    pool.record_failure(b, "timeout")
+    assert pool.select() is a
+
+    pool.record_success(a)
+    assert pool.snapshot()[0]["healthy"] is True
+
+
+@pytest.mark.unit
+def test_single_endpoint_never_ejected() -> None:
+    """With one endpoint there is nothing to fail over to."""
+    pool = EndpointPool(["http://a"], failure_threshold=1)
+    pool.record_failure(pool.endpoints[0], "timeout")
+
+    assert pool.snapshot()[0]["healthy"] is True
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_health_check_readmits_endpoint() -> None:
+    """A successful probe returns an ejected endpoint to rotation."""
+    pool = EndpointPool(["http://a", "http://b"], failure_threshold=1)
+    a, b = pool.endpoints
+    pool.record_failure(a, "timeout")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "b":
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, json={"models": []})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await pool.check_health(client)
+
+    assert [e["healthy"] for e in pool.snapshot()] == [True, False]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_embedder_routes_around_failing_endpoint(reset_embedder: None) -> None:
+    """Requests succeed and spread over healthy endpoints when one is down."""
+    settings = get_settings().model_copy(
+        update={
+            "ollama_base_urls": "http://gpu1:11434,http://gpu2:11434,http://down:11434",
+            "ollama_failure_threshold": 1,
+        }
+    )
+    hosts: Counter[str] = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts[request.url.host] += 1
+        if request.url.host == "down":
+            raise httpx.ConnectError("refused")
+        prompt = json.loads(request.content)["prompt"]
+        return httpx.Response(200, json={"embedding": [float(len(prompt))] * 768})
+
+    with patch("src.services.embedder.get_settings", return_value=settings):
+        embedder = OllamaEmbedder()
+    embedder._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        embeddings = await embedder.generate_embeddings([f"text {i}" for i in range(30)])
+
+    assert len(embeddings) == 30
+    assert hosts["down"] == 1  # Ejected after its first failure
+    assert hosts["gpu1"] > 5 and hosts["gpu2"] > 5
+    await embedder.close()
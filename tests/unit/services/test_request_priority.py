@@ -0,0 +1,220 @@
+"""Unit tests for search-priority arbitration (connection_pool/priority.py).
+
+Test Coverage Areas:
+- Interactive waiters are admitted ahead of earlier bulk waiters
+- Reserved slots are never taken by bulk work
+- Cancelled waiters do not leak slots
+- Priority is inherited by tasks; indexing jobs run at bulk priority
+- OllamaEmbedder answers a query while an indexing batch is queued
+- Project databases get one set of session slots each
+
+Constitutional Compliance:
+- Principle IV: Performance (search latency independent of indexing load)
+- Principle VII: TDD (comprehensive test coverage)
+- Principle VIII: Type safety (type hints on all test functions)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Iterator
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.config.settings import get_settings
+from src.connection_pool.priority import (
+    PrioritySlots,
+    WorkPriority,
+    current_priority,
+    priority_scope,
+)
+import src.database.session as session_module
+from src.database.session import (
+    POOL_CONNECTION_BUDGET,
+    POOL_INTERACTIVE_RESERVED,
+    POOL_MAX_SIZE,
+    get_session_slots,
+)
+from src.services import background_worker
+from src.services.embedder import OllamaEmbedder
+from src.services.job_scheduler import IndexingJobScheduler, ScheduledJob
+
+
+@pytest.fixture
+def reset_embedder() -> Iterator[None]:
+    """Reset the OllamaEmbedder singleton around a test."""
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+    yield
+    OllamaEmbedder._instance = None
+    OllamaEmbedder._client = None
+
+
+async def _hold(
+    slots: PrioritySlots, priority: WorkPriority, label: str,
+    order: list[str], release: asyncio.Event,
+) -> None:
+    async with slots.acquire(priority):
+        order.append(label)
+        await release.wait()
+
+
+async def _priority() -> WorkPriority:
+    return current_priority()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interactive_waiters_go_first() -> None:
+    """Queued bulk work yields to interactive work that arrives later."""
+    slots = PrioritySlots(limit=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async with slots.acquire(WorkPriority.BULK):
+        tasks = [
+            asyncio.create_task(_hold(slots, WorkPriority.BULK, "bulk-1", order, release)),
+            asyncio.create_task(_hold(slots, WorkPriority.BULK, "bulk-2", order, release)),
+        ]
+        await asyncio.sleep(0)
+        tasks.append(
+            asyncio.create_task(_hold(slots, WorkPriority.INTERACTIVE, "query", order, release))
+        )
+        await asyncio.sleep(0)
+        assert slots.waiting == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["query", "bulk-1", "bulk-2"]
+    assert slots.in_use == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reserved_slots_are_kept_for_interactive_work() -> None:
+    """Bulk work stops at limit - reserved; interactive work is admitted at once."""
+    slots = PrioritySlots(limit=3, reserved=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_hold(slots, WorkPriority.BULK, f"bulk-{i}", order, release))
+        for i in range(4)
+    ]
+    await asyncio.sleep(0)
+    assert (slots.in_use, slots.waiting) == (2, 2)
+
+    query = asyncio.create_task(_hold(slots, WorkPriority.INTERACTIVE, "query", order, release))
+    await asyncio.sleep(0)
+    assert order[-1] == "query" and slots.in_use == 3
+
+    release.set()
+    await asyncio.gather(*tasks, query)
+    assert slots.in_use == 0
+    assert PrioritySlots(limit=1, reserved=5).reserved == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_waiters_release_nothing() -> None:
+    """A waiter cancelled before or after admission leaves the count intact."""
+    slots = PrioritySlots(limit=1)
+
+    async with slots.acquire():
+        waiter = asyncio.create_task(_hold(slots, WorkPriority.BULK, "x", [], asyncio.Event()))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+    assert (slots.in_use, slots.waiting) == (0, 0)
+
+    # Admitted by the release, cancelled before it resumed
+    async with slots.acquire():
+        waiter = asyncio.create_task(_hold(slots, WorkPriority.BULK, "x", [], asyncio.Event()))
+        await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert slots.in_use == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_priority_is_inherited_by_tasks() -> None:
+    """Tasks created in a bulk scope run at bulk priority; the scope is restored."""
+    assert current_priority() == WorkPriority.INTERACTIVE
+    with priority_scope(WorkPriority.BULK):
+        inherited = await asyncio.create_task(_priority())
+    assert inherited == WorkPriority.BULK
+    assert current_priority() == WorkPriority.INTERACTIVE
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_indexing_jobs_run_at_bulk_priority() -> None:
+    """The scheduler runs indexing workers (and what they call) as bulk work."""
+    scheduler = IndexingJobScheduler(max_concurrent=1, heartbeat_interval=60)
+    seen: list[WorkPriority] = []
+
+    async def worker(**kwargs: Any) -> None:
+        seen.append(current_priority())
+
+    with patch.object(background_worker, "_background_indexing_worker", worker):
+        scheduler.submit(ScheduledJob(job_id=uuid4(), repo_path="/a", project_id="proj"))
+        await asyncio.wait_for(scheduler._queue.join(), timeout=1)
+        await scheduler.stop()
+
+    assert seen == [WorkPriority.BULK]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_embedding_skips_queued_batch(reset_embedder: None) -> None:
+    """A search query is embedded while an indexing batch waits for slots."""
+    settings = get_settings().model_copy(
+        update={
+            "ollama_base_urls": None,
+            "embedding_max_concurrency": 3,
+            "embedding_interactive_slots": 1,
+        }
+    )
+    unblock = asyncio.Event()
+    started: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["prompt"]
+        started.append(prompt)
+        if prompt != "query":
+            await unblock.wait()
+        return httpx.Response(200, json={"embedding": [0.5] * 768})
+
+    with patch("src.services.embedder.get_settings", return_value=settings):
+        embedder = OllamaEmbedder()
+    embedder._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    batch = asyncio.create_task(embedder.generate_embeddings([f"chunk {i}" for i in range(10)]))
+    await asyncio.sleep(0.01)
+    assert len(started) == 2 and embedder.slots.waiting == 8
+
+    query = await asyncio.wait_for(embedder.generate_embedding("query"), timeout=1)
+    assert len(query) == 768
+    assert not batch.done()
+
+    unblock.set()
+    assert len(await batch) == 10
+    assert embedder.slots.in_use == 0
+    await embedder.close()
+
+
+@pytest.mark.unit
+def test_session_slots_per_database() -> None:
+    """Each project database gets its own slots sized from the pool settings."""
+    with patch.object(session_module, "_pool_registry", None):
+        slots = get_session_slots("cb_proj_test_00000001")
+
+        assert get_session_slots("cb_proj_test_00000001") is slots
+        assert get_session_slots("cb_proj_test_00000002") is not slots
+    assert slots.limit == min(POOL_MAX_SIZE, POOL_CONNECTION_BUDGET)
+    assert slots.reserved == min(POOL_INTERACTIVE_RESERVED, slots.limit - 1)
@@ -0,0 +1,117 @@
+"""Unit tests for the optional partitioned code_chunks layout.
+
+Tests validate that project schema initialization applies the partitioning
+script only when CODE_CHUNKS_LAYOUT=partitioned, that Settings rejects unknown
+layouts, and that the ORM model matches the partitioned table.
+
+Constitutional Compliance:
+- Principle VII: TDD (validates feature with comprehensive tests)
+- Principle V: Production Quality (comprehensive error scenarios)
+- Principle VIII: Type Safety (type-annotated test functions)
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import Table
+
+from src.config.settings import Settings
+from src.database import provisioning
+from src.models.code_chunk import CodeChunk
+
+
+def _mock_connection() -> MagicMock:
+    """Create an asyncpg connection mock supporting conn.transaction()."""
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.close = AsyncMock()
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=None)
+    transaction.__aexit__ = AsyncMock(return_value=None)
+    conn.transaction = MagicMock(return_value=transaction)
+    return conn
+
+
+def _settings(code_chunks_layout: str) -> Settings:
+    """Create Settings with the given code_chunks layout."""
+    return Settings(code_chunks_layout=code_chunks_layout)  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_flat_layout_runs_only_base_schema() -> None:
+    """Verify the default layout does not partition code_chunks."""
+    conn = _mock_connection()
+
+    with patch.object(
+        provisioning, "get_settings", return_value=_settings("flat")
+    ), patch("asyncpg.connect", AsyncMock(return_value=conn)):
+        await provisioning.initialize_project_schema("cb_proj_test_12345678")
+
+    assert conn.execute.await_count == 1
+    assert "PARTITION BY LIST" not in conn.execute.await_args_list[0].args[0]
+    conn.transaction.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_partitioned_layout_applies_partition_script() -> None:
+    """Verify the partitioned layout runs the partition script in a transaction."""
+    conn = _mock_connection()
+
+    with patch.object(
+        provisioning, "get_settings", return_value=_settings("partitioned")
+    ), patch("asyncpg.connect", AsyncMock(return_value=conn)):
+        await provisioning.initialize_project_schema("cb_proj_test_12345678")
+
+    assert conn.execute.await_count == 2
+    partition_sql = conn.execute.await_args_list[1].args[0]
+    assert "PARTITION BY LIST (repository_id)" in partition_sql
+    assert "hnsw" in partition_sql
+    conn.transaction.assert_called_once()
+
+
+@pytest.mark.unit
+def test_unknown_layout_rejected() -> None:
+    """Verify an unknown CODE_CHUNKS_LAYOUT fails settings validation."""
+    with pytest.raises(ValidationError, match="code_chunks_layout"):
+        _settings("sharded")
+
+
+@pytest.mark.unit
+def test_layout_read_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify CODE_CHUNKS_LAYOUT is loaded through Settings."""
+    monkeypatch.setenv("CODE_CHUNKS_LAYOUT", "partitioned")
+    assert Settings().code_chunks_layout == "partitioned"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_partition_code_chunks_migrates_existing_database() -> None:
+    """Verify the migration path backfills repository_id before partitioning."""
+    conn = _mock_connection()
+
+    with patch("asyncpg.connect", AsyncMock(return_value=conn)):
+        await provisioning.partition_code_chunks("cb_proj_test_12345678")
+
+    base_sql = conn.execute.await_args_list[0].args[0]
+    partition_sql = conn.execute.await_args_list[1].args[0]
+    assert "ADD COLUMN IF NOT EXISTS repository_id" in base_sql
+    assert "code_chunks_flat" in partition_sql
+    conn.close.assert_awaited_once()
+
+
+@pytest.mark.unit
+def test_model_matches_partitioned_layout() -> None:
+    """Verify the ORM declares repository_id as the partitioned table does."""
+    table = CodeChunk.__table__
+    assert isinstance(table, Table)
+    assert not table.c.repository_id.nullable
+    index_names = {index.name for index in table.indexes if "repository_id" in index.columns}
+    assert index_names == {"idx_code_chunks_repository"}
+
+    partition_sql = (provisioning._PROJECT_ROOT / "scripts" / "partition_code_chunks.sql").read_text()
+    assert "CREATE INDEX idx_code_chunks_repository ON code_chunks(repository_id)" in partition_sql